@@ -0,0 +1,57 @@
+"""Shared plumbing for the ``bench_*.py`` scripts and ``run_suite.py``.
+
+Importing this module points ``CAO_HOME_DIR`` at a throwaway directory (unless
+the caller already set one) so a benchmark never reads or writes the
+developer's real database, memory wiki or FIFOs. It must therefore be imported
+BEFORE anything from ``cli_agent_orchestrator``: ``constants`` resolves every
+on-disk path from ``CAO_HOME_DIR`` at import time.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import shutil
+import statistics
+import tempfile
+from typing import Dict, Iterable, List
+
+if not os.environ.get("CAO_HOME_DIR", "").strip():
+    _HOME = tempfile.mkdtemp(prefix="cao-bench-")
+    os.environ["CAO_HOME_DIR"] = _HOME
+    atexit.register(shutil.rmtree, _HOME, ignore_errors=True)
+
+# The benchmarks drive MockCliProvider by writing what the mock_cli binary
+# (test/providers/fixtures/bin/mock_cli) would print, so they need neither the
+# binary on PATH nor a tmux server.
+MOCK_PROMPT = "❯ "
+
+
+def mock_cli_echo(message: str) -> str:
+    """Bytes the pane shows when ``message`` is typed at the mock_cli prompt."""
+    return f"{message}\r\n"
+
+
+def mock_cli_reply(message: str) -> str:
+    """Bytes mock_cli prints once it has "worked" on ``message``."""
+    return f"> MOCK: {message}\r\n{MOCK_PROMPT}"
+
+
+def latency_summary(samples: Iterable[float], unit: str = "ms") -> Dict[str, float]:
+    """p50/p90/p99/max of ``samples`` (seconds), scaled to ``unit`` (ms or us)."""
+    scale = {"ms": 1e3, "us": 1e6}[unit]
+    ordered: List[float] = sorted(samples)
+    if not ordered:
+        return {}
+    return {
+        f"p50_{unit}": round(statistics.median(ordered) * scale, 2),
+        f"p90_{unit}": round(_percentile(ordered, 0.90) * scale, 2),
+        f"p99_{unit}": round(_percentile(ordered, 0.99) * scale, 2),
+        f"max_{unit}": round(ordered[-1] * scale, 2),
+    }
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(int(len(ordered) * q + 0.5) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
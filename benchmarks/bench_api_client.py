@@ -0,0 +1,142 @@
+"""Benchmark: 10k terminal status calls, one-shot requests vs the pooled API client.
+
+Serves a canned ``GET /terminals/{id}`` response from a local HTTP/1.1 server and
+times ``--calls`` sequential status polls three ways:
+
+- ``oneshot``: ``requests.get`` per call (new TCP connection each time; the
+  behaviour before ``clients/api_client.py``);
+- ``pooled_tcp``: ``api_client.get`` over a keep-alive connection;
+- ``pooled_uds``: ``api_client.get`` routed over a Unix domain socket
+  (``CAO_API_SOCKET``).
+
+Runs offline with no cao-server, tmux or database. Results are printed as JSON::
+
+    python benchmarks/bench_api_client.py --calls 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+import requests
+
+from cli_agent_orchestrator.clients import api_client
+
+_BODY = json.dumps(
+    {
+        "id": "abcd1234",
+        "name": "developer-abcd",
+        "provider": "kiro_cli",
+        "session_name": "cao-bench",
+        "agent_profile": "developer",
+        "status": "processing",
+        "last_active": "2026-01-01T00:00:00",
+    }
+).encode()
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY)
+)
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        # One write per response: separate header/body writes on a keep-alive
+        # connection stall on Nagle + delayed ACK and would swamp the measurement.
+        self.wfile.write(_RESPONSE)
+
+    def address_string(self):
+        return "local"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _serve(server: socketserver.BaseServer) -> None:
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+
+def _time_calls(get: Callable[[str], requests.Response], url: str, calls: int) -> Dict:
+    latencies: List[float] = []
+    start = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        get(url).raise_for_status()
+        latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "calls": calls,
+        "wall_s": round(wall, 3),
+        "calls_per_s": round(calls / wall, 1),
+        "p50_us": round(statistics.median(latencies) * 1e6, 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def run(calls: int) -> Dict:
+    tcp = ThreadingHTTPServer(("127.0.0.1", 0), _StatusHandler)
+    tcp.daemon_threads = True
+    _serve(tcp)
+    base = f"http://127.0.0.1:{tcp.server_address[1]}"
+    url = f"{base}/terminals/abcd1234"
+    results: Dict[str, Dict] = {}
+
+    results["oneshot"] = _time_calls(lambda u: requests.get(u, timeout=5), url, calls)
+
+    api_client.close_session()
+    results["pooled_tcp"] = _time_calls(lambda u: api_client.get(u, timeout=5), url, calls)
+
+    if hasattr(socketserver, "UnixStreamServer"):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cao.sock")
+            uds = _UnixHTTPServer(path, _StatusHandler)
+            _serve(uds)
+            with (
+                patch.object(api_client, "API_SOCKET_PATH", path),
+                patch.object(api_client, "API_BASE_URL", base),
+            ):
+                api_client.close_session()
+                results["pooled_uds"] = _time_calls(
+                    lambda u: api_client.get(u, timeout=5), url, calls
+                )
+            api_client.close_session()
+            uds.shutdown()
+            uds.server_close()
+
+    tcp.shutdown()
+    tcp.server_close()
+    oneshot = results["oneshot"]["wall_s"]
+    for name, result in results.items():
+        result["speedup_vs_oneshot"] = round(oneshot / result["wall_s"], 2)
+    return {"benchmark": "api_client_status_calls", "results": results}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000, help="status calls per mode")
+    args = parser.parse_args(argv)
+    json.dump(run(args.calls), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Benchmark: cao-server API latency (p50/p99) under concurrent clients.
+
+Serves the real FastAPI app with uvicorn on a loopback port (lifespan off, so
+no tmux, plugins or background consumers start) over a scratch database seeded
+with ``--terminals`` mock_cli terminals. For each ``--concurrency`` level, that
+many client threads, each with its own keep-alive session, issue
+``--requests`` requests apiece, cycling through the read endpoints a
+supervisor polls hardest:
+
+- ``GET /health``
+- ``GET /terminals/{id}`` (status poll)
+- ``GET /terminals/{id}/inbox/messages``
+
+Reports throughput and p50/p99 latency per endpoint and overall at each level.
+Runs offline with no tmux::
+
+    python benchmarks/bench_api_concurrency.py --concurrency 1,8,32 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+import requests
+import uvicorn
+
+from cli_agent_orchestrator.api.main import app
+from cli_agent_orchestrator.clients.database import create_terminal, init_db
+from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.providers.mock_cli import MockCliProvider
+from cli_agent_orchestrator.services.status_monitor import status_monitor
+
+
+def _seed(terminals: int) -> List[str]:
+    init_db()
+    ids = [f"{i:08x}" for i in range(terminals)]
+    for tid in ids:
+        create_terminal(tid, "cao-bench", f"win-{tid}", "mock_cli")
+        provider_manager._providers[tid] = MockCliProvider(tid, "cao-bench", f"win-{tid}")
+        status_monitor._apply_detection(tid, TerminalStatus.IDLE)
+    return ids
+
+
+def _serve() -> Tuple[uvicorn.Server, str]:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    config = uvicorn.Config(app, lifespan="off", log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True).start()
+    deadline = time.monotonic() + 10.0
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("uvicorn did not start")
+        time.sleep(0.01)
+    return server, f"http://127.0.0.1:{port}"
+
+
+def _level(base: str, ids: List[str], clients: int, per_client: int) -> Dict:
+    paths = [("health", "/health")]
+    for tid in ids:
+        paths.append(("terminal", f"/terminals/{tid}"))
+        paths.append(("inbox", f"/terminals/{tid}/inbox/messages"))
+    samples: Dict[str, List[float]] = defaultdict(list)
+    lock = threading.Lock()
+    errors = [0]
+    start = threading.Barrier(clients + 1)
+
+    def client(index: int) -> None:
+        session = requests.Session()
+        local: Dict[str, List[float]] = defaultdict(list)
+        failed = 0
+        start.wait()
+        for n in range(per_client):
+            name, path = paths[(index + n) % len(paths)]
+            t0 = time.perf_counter()
+            response = session.get(base + path, timeout=30)
+            local[name].append(time.perf_counter() - t0)
+            failed += response.status_code != 200
+        session.close()
+        with lock:
+            for name, values in local.items():
+                samples[name].extend(values)
+            errors[0] += failed
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    wall0 = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall0
+
+    total = clients * per_client
+    overall = [value for values in samples.values() for value in values]
+    return {
+        "requests": total,
+        "errors": errors[0],
+        "requests_per_s": round(total / wall, 1),
+        "overall": _harness.latency_summary(overall),
+        **{name: _harness.latency_summary(values) for name, values in sorted(samples.items())},
+    }
+
+
+def run(concurrency: List[int], per_client: int, terminals: int) -> Dict:
+    ids = _seed(terminals)
+    server, base = _serve()
+    try:
+        requests.get(base + "/health", timeout=30).raise_for_status()
+        results = {str(level): _level(base, ids, level, per_client) for level in concurrency}
+    finally:
+        server.should_exit = True
+    return {
+        "benchmark": "api_concurrency",
+        "terminals": terminals,
+        "requests_per_client": per_client,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated client counts")
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--terminals", type=int, default=20, help="seeded mock_cli terminals")
+    args = parser.parse_args(argv)
+    levels = [int(level) for level in args.concurrency.split(",") if level]
+    json.dump(run(levels, args.requests, args.terminals), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
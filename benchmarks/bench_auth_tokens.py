@@ -0,0 +1,146 @@
+"""Benchmark: per-request bearer-token auth overhead, uncached vs cached.
+
+Serves a JWKS from a loopback HTTP server, enables auth against it
+(``CAO_AUTH_JWKS_URI``), and replays ``--rate`` requests per second for
+``--seconds`` through ``get_current_scopes``, the dependency every gated route
+runs. The requests carry ``--tokens`` distinct RS256 bearers (one per polling
+worker) round-robin, as the MCP servers and CLI do when each polls status at
+1 Hz. Each mode reports the per-request latency distribution and the share of
+one core spent authenticating:
+
+- ``uncached``: every request pays a full ``jwt.decode`` signature check and
+  JWKS key lookup (the verified-token cache is disabled);
+- ``cached``: only the first request per token is verified.
+
+Runs offline::
+
+    python benchmarks/bench_auth_tokens.py --rate 1000 --seconds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+from _harness import latency_summary
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from cli_agent_orchestrator.security import auth
+
+_AUDIENCE = "cao-bench"
+_KID = "bench"
+
+
+def _serve_jwks(public_key) -> ThreadingHTTPServer:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(public_key))
+    body = json.dumps({"keys": [{**jwk, "kid": _KID, "use": "sig", "alg": "RS256"}]}).encode()
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:  # noqa: ANN002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _mint(private_key, issuer: str, n: int) -> List[str]:
+    now = datetime.now(timezone.utc)
+    return [
+        jwt.encode(
+            {
+                "sub": f"worker-{i}",
+                "aud": _AUDIENCE,
+                "iss": issuer,
+                "exp": now + timedelta(hours=1),
+                "iat": now,
+                "scope": "cao:read cao:write",
+            },
+            private_key,
+            algorithm="RS256",
+            headers={"kid": _KID},
+        )
+        for i in range(n)
+    ]
+
+
+async def _replay(headers: List[str], rate: int, seconds: float) -> Dict[str, float]:
+    """Issue ``rate`` auth checks per second on a fixed schedule."""
+    total = int(rate * seconds)
+    interval = 1.0 / rate
+    samples: List[float] = []
+    start = time.perf_counter()
+    for i in range(total):
+        delay = start + i * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        t0 = time.perf_counter()
+        await auth.get_current_scopes(authorization=headers[i % len(headers)])
+        samples.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+    busy = sum(samples)
+    return {
+        "requests": total,
+        "achieved_rps": round(total / wall, 1),
+        "mean_us": round(busy / total * 1e6, 1),
+        **latency_summary(samples, unit="us"),
+        "core_share_pct": round(busy / wall * 100, 2),
+    }
+
+
+def run(rate: int, seconds: float, tokens: int) -> Dict:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    server = _serve_jwks(private_key.public_key())
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["CAO_AUTH_JWKS_URI"] = f"{base}/.well-known/jwks.json"
+    os.environ["CAO_AUTH_AUDIENCE"] = _AUDIENCE
+    headers = [f"Bearer {t}" for t in _mint(private_key, base, tokens)]
+
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for mode, size in (("uncached", 0), ("cached", auth._TOKEN_CACHE_SIZE)):
+            auth.get_jwks_cache().clear()
+            auth._token_cache = auth._VerifiedTokenCache(max_entries=size)
+            results[mode] = asyncio.run(_replay(headers, rate, seconds))
+    finally:
+        server.shutdown()
+    return {
+        "benchmark": "auth_tokens",
+        "rate": rate,
+        "seconds": seconds,
+        "tokens": tokens,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=int, default=1000, help="auth checks per second")
+    parser.add_argument("--seconds", type=float, default=5.0, help="duration per mode")
+    parser.add_argument("--tokens", type=int, default=50, help="distinct bearer tokens")
+    args = parser.parse_args(argv)
+    json.dump(run(args.rate, args.seconds, args.tokens), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""Benchmark: FIFO output readers at fleet scale, thread-per-terminal vs the multiplexer.
+
+Creates ``--terminals`` FIFOs, attaches one reader per terminal and drives a
+synthetic ``pipe-pane`` writer against them two ways:
+
+- ``thread_per_terminal``: one ``select`` + coalescing loop per FIFO (the
+  reader design before the multiplexer, reproduced here so the comparison
+  keeps working after the old code is gone);
+- ``multiplexer``: ``FifoManager`` with its single ``fifo-multiplexer`` thread.
+
+For each mode it reports the threads added, process CPU while every terminal is
+idle, process CPU for ``--rounds`` rounds of one write per terminal, and the
+write-to-publish latency (p50/p99) seen by the event bus. Latency includes the
+50ms coalescing window by design. Runs offline with no cao-server or tmux::
+
+    python benchmarks/bench_fifo_mux.py --terminals 100 --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import select
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from unittest.mock import patch
+
+from cli_agent_orchestrator.services import fifo_reader
+from cli_agent_orchestrator.services.fifo_reader import FifoManager
+
+_LEGACY_POLL_INTERVAL = 0.5
+
+
+class _Recorder:
+    """Collects write-to-publish latencies from whichever bus API a reader uses."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._written: Dict[str, float] = {}
+        self.latencies: List[float] = []
+        self.received = threading.Semaphore(0)
+
+    def mark_written(self, topic: str) -> None:
+        with self._lock:
+            self._written[topic] = time.perf_counter()
+
+    def publish(self, topic: str, data: dict) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            written = self._written.pop(topic, None)
+            if written is not None:
+                self.latencies.append(now - written)
+        self.received.release()
+
+    def publish_batch(self, events) -> None:
+        for topic, data in events:
+            self.publish(topic, data)
+
+
+class _ThreadPerTerminal:
+    """Minimal replica of the pre-multiplexer reader: one coalescing loop per FIFO."""
+
+    def __init__(self, publish: Callable[[str, dict], None]) -> None:
+        self._publish = publish
+        self._stops: List[threading.Event] = []
+        self._threads: List[threading.Thread] = []
+
+    def create_reader(self, fifo_path: Path, terminal_id: str) -> None:
+        os.mkfifo(fifo_path)
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self._loop, args=(fifo_path, terminal_id, stop), daemon=True
+        )
+        thread.start()
+        self._stops.append(stop)
+        self._threads.append(thread)
+
+    def stop_all(self) -> None:
+        for stop in self._stops:
+            stop.set()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+
+    def _loop(self, fifo_path: Path, terminal_id: str, stop: threading.Event) -> None:
+        topic = f"terminal.{terminal_id}.output"
+        read_fd = os.open(fifo_path, os.O_RDONLY | os.O_NONBLOCK)
+        keepalive_fd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+        pending = bytearray()
+        batch_start = 0.0
+        try:
+            while not stop.is_set():
+                timeout = fifo_reader._COALESCE_WINDOW if pending else _LEGACY_POLL_INTERVAL
+                readable, _, _ = select.select([read_fd], [], [], timeout)
+                if readable:
+                    try:
+                        raw = os.read(read_fd, fifo_reader.CHUNK_SIZE)
+                    except BlockingIOError:
+                        raw = b""
+                    if raw:
+                        if not pending:
+                            batch_start = time.monotonic()
+                        pending.extend(raw)
+                if pending and (
+                    time.monotonic() - batch_start >= fifo_reader._COALESCE_WINDOW
+                    or len(pending) >= fifo_reader._COALESCE_MAX_BYTES
+                    or not readable
+                ):
+                    self._publish(topic, {"data": pending.decode("utf-8", errors="replace")})
+                    pending.clear()
+        finally:
+            os.close(read_fd)
+            os.close(keepalive_fd)
+
+
+def _drive(fifo_dir: Path, ids: List[str], recorder: _Recorder, idle: float, rounds: int) -> Dict:
+    """Measure idle CPU, then ``rounds`` bursts of one write per terminal."""
+    writers = {tid: os.open(fifo_dir / f"{tid}.fifo", os.O_WRONLY | os.O_NONBLOCK) for tid in ids}
+    try:
+        cpu0 = time.process_time()
+        time.sleep(idle)
+        idle_cpu = time.process_time() - cpu0
+
+        payload = b"\x1b[2K\r\xe2\xa0\x8b Thinking... " * 8
+        cpu0 = time.process_time()
+        wall0 = time.perf_counter()
+        for _ in range(rounds):
+            for tid in ids:
+                recorder.mark_written(f"terminal.{tid}.output")
+                os.write(writers[tid], payload)
+            for _ in ids:
+                if not recorder.received.acquire(timeout=5.0):
+                    raise RuntimeError("reader stopped publishing")
+        burst_cpu = time.process_time() - cpu0
+        burst_wall = time.perf_counter() - wall0
+    finally:
+        for fd in writers.values():
+            os.close(fd)
+
+    latencies = sorted(recorder.latencies)
+    return {
+        "idle_cpu_ms_per_s": round(idle_cpu / idle * 1e3, 2),
+        "burst_cpu_ms": round(burst_cpu * 1e3, 1),
+        "burst_wall_s": round(burst_wall, 3),
+        "publishes": len(latencies),
+        "publish_latency_p50_ms": round(statistics.median(latencies) * 1e3, 2),
+        "publish_latency_p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1e3, 2),
+    }
+
+
+def _run_thread_per_terminal(terminals: int, idle: float, rounds: int) -> Dict:
+    recorder = _Recorder()
+    ids = [f"bench{i:04d}" for i in range(terminals)]
+    with tempfile.TemporaryDirectory() as tmp:
+        fifo_dir = Path(tmp)
+        threads_before = threading.active_count()
+        readers = _ThreadPerTerminal(recorder.publish)
+        for tid in ids:
+            readers.create_reader(fifo_dir / f"{tid}.fifo", tid)
+        threads_added = threading.active_count() - threads_before
+        try:
+            result = _drive(fifo_dir, ids, recorder, idle, rounds)
+        finally:
+            readers.stop_all()
+    return {"threads_added": threads_added, **result}
+
+
+def _run_multiplexer(terminals: int, idle: float, rounds: int) -> Dict:
+    recorder = _Recorder()
+    ids = [f"bench{i:04d}" for i in range(terminals)]
+    with tempfile.TemporaryDirectory() as tmp:
+        fifo_dir = Path(tmp)
+        manager = FifoManager()
+        with (
+            patch.object(fifo_reader, "FIFO_DIR", fifo_dir),
+            patch.object(fifo_reader.bus, "publish_batch", recorder.publish_batch),
+        ):
+            threads_before = threading.active_count()
+            for tid in ids:
+                manager.create_reader(tid)
+            threads_added = threading.active_count() - threads_before
+            try:
+                result = _drive(fifo_dir, ids, recorder, idle, rounds)
+            finally:
+                for tid in ids:
+                    manager.stop_reader(tid)
+                manager.stop_multiplexer()
+    return {"threads_added": threads_added, **result}
+
+
+def run(terminals: int, idle: float, rounds: int) -> Dict:
+    results = {
+        "thread_per_terminal": _run_thread_per_terminal(terminals, idle, rounds),
+        "multiplexer": _run_multiplexer(terminals, idle, rounds),
+    }
+    return {
+        "benchmark": "fifo_readers",
+        "terminals": terminals,
+        "rounds": rounds,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terminals", type=int, default=100, help="FIFOs to read concurrently")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds of idle CPU sampling")
+    parser.add_argument("--rounds", type=int, default=20, help="write rounds across all FIFOs")
+    args = parser.parse_args(argv)
+    json.dump(run(args.terminals, args.idle, args.rounds), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""Benchmark: inbox fan-in, many senders queueing work for one mock_cli receiver.
+
+Creates one MockCliProvider receiver terminal in a scratch database and runs
+the real ``StatusMonitor`` and ``InboxService`` consumers on the real event bus.
+``--senders`` threads then each queue ``--messages`` inbox messages the way
+``POST /terminals/{id}/inbox/messages`` does (insert, then try an immediate
+delivery). The tmux backend is replaced by a synthetic pane: ``send_keys``
+echoes the paste into the output stream and, ``--delay-ms`` later, writes the
+mock_cli reply, so every delivery goes through the real PROCESSING ->
+COMPLETED -> deliver-next cycle.
+
+Reports enqueue latency (sqlite insert under sender contention), the
+enqueue-to-paste latency of every message, delivery throughput and whether any
+message was pasted twice. Runs offline with no cao-server or tmux::
+
+    python benchmarks/bench_inbox_fanin.py --senders 4 --messages 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.clients.database import create_inbox_message, create_terminal, init_db
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.providers.mock_cli import MockCliProvider
+from cli_agent_orchestrator.services import terminal_service
+from cli_agent_orchestrator.services.event_bus import bus
+from cli_agent_orchestrator.services.inbox_service import InboxService
+from cli_agent_orchestrator.services.status_monitor import status_monitor
+
+_RECEIVER = "benchrcv"
+_TOKEN = re.compile(r"bench-msg-\d+-\d+")
+
+
+class _MockCliPane:
+    """Stands in for the tmux backend: a pane running mock_cli."""
+
+    def __init__(self, delay: float) -> None:
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.pasted: Dict[str, float] = {}
+        self.duplicates = 0
+        self.all_delivered = threading.Event()
+        self.expected = 0
+
+    def send_keys(self, session: str, window: str, message: str, **kwargs: Any) -> None:
+        now = time.perf_counter()
+        tokens = _TOKEN.findall(message)
+        with self._lock:
+            for token in tokens:
+                if token in self.pasted:
+                    self.duplicates += 1
+                else:
+                    self.pasted[token] = now
+            if len(self.pasted) >= self.expected:
+                self.all_delivered.set()
+        topic = f"terminal.{_RECEIVER}.output"
+        bus.publish(topic, {"data": _harness.mock_cli_echo(message)})
+        reply = _harness.mock_cli_reply(" ".join(tokens))
+        threading.Timer(self._delay, bus.publish, (topic, {"data": reply})).start()
+
+    def get_pane_working_directory(self, session: str, window: str) -> None:
+        return None
+
+
+async def _run(senders: int, messages: int, delay: float) -> Dict:
+    init_db()
+    create_terminal(_RECEIVER, "cao-bench", "receiver", "mock_cli")
+    provider_manager._providers[_RECEIVER] = MockCliProvider(_RECEIVER, "cao-bench", "receiver")
+    pane = _MockCliPane(delay)
+    pane.expected = senders * messages
+    inbox = InboxService()
+
+    bus.set_loop(asyncio.get_running_loop())
+    tasks = [asyncio.create_task(status_monitor.run()), asyncio.create_task(inbox.run())]
+    ready = bus.subscribe(f"terminal.{_RECEIVER}.status")
+    bus.publish(f"terminal.{_RECEIVER}.output", {"data": "MockCli ready.\r\n❯ "})
+    await asyncio.wait_for(ready.get(), 5.0)
+    bus.unsubscribe(f"terminal.{_RECEIVER}.status", ready)
+
+    enqueued: Dict[str, float] = {}
+    enqueue_latencies: List[float] = []
+    lock = threading.Lock()
+
+    def sender(index: int) -> None:
+        for n in range(messages):
+            token = f"bench-msg-{index}-{n}"
+            t0 = time.perf_counter()
+            create_inbox_message(f"sender{index}", _RECEIVER, f"please handle {token}")
+            t1 = time.perf_counter()
+            with lock:
+                enqueued[token] = t0
+                enqueue_latencies.append(t1 - t0)
+            inbox.deliver_pending(_RECEIVER)
+
+    wall0 = time.perf_counter()
+    try:
+        with patch.object(terminal_service, "get_backend", lambda: pane):
+            threads = [threading.Thread(target=sender, args=(i,)) for i in range(senders)]
+            for thread in threads:
+                thread.start()
+            timeout = 30.0 + pane.expected * (delay + 1.0)
+            delivered = await asyncio.to_thread(pane.all_delivered.wait, timeout)
+            for thread in threads:
+                thread.join()
+        wall = time.perf_counter() - wall0
+    finally:
+        for task in tasks:
+            task.cancel()
+        provider_manager._providers.pop(_RECEIVER, None)
+        status_monitor.clear_terminal(_RECEIVER)
+        bus.set_loop(None)
+    if not delivered:
+        raise RuntimeError(f"only {len(pane.pasted)}/{pane.expected} messages were delivered")
+
+    return {
+        "messages": pane.expected,
+        "wall_s": round(wall, 3),
+        "delivered_per_s": round(pane.expected / wall, 2),
+        "duplicate_deliveries": pane.duplicates,
+        "enqueue_latency": _harness.latency_summary(enqueue_latencies),
+        "delivery_latency": _harness.latency_summary(
+            pane.pasted[token] - enqueued[token] for token in pane.pasted
+        ),
+    }
+
+
+def run(senders: int, messages: int, delay_ms: int) -> Dict:
+    return {
+        "benchmark": "inbox_fanin",
+        "senders": senders,
+        "messages_per_sender": messages,
+        "delay_ms": delay_ms,
+        "results": asyncio.run(_run(senders, messages, delay_ms / 1e3)),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--senders", type=int, default=4, help="concurrent sender threads")
+    parser.add_argument("--messages", type=int, default=10, help="messages queued per sender")
+    parser.add_argument("--delay-ms", type=int, default=50, help="mock_cli reply delay")
+    args = parser.parse_args(argv)
+    json.dump(run(args.senders, args.messages, args.delay_ms), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Benchmark: memory recall latency and ``/graph/memory`` projection time vs corpus size.
+
+Grows one global-scope corpus in a scratch memory wiki + database through
+``MemoryService.store`` to each ``--sizes`` size in turn, linking every topic to
+its predecessor with a ``relates_to`` relationship. At each size it times:
+
+- ``recall`` in each search mode (``metadata``, ``bm25``, ``hybrid``) over
+  ``--queries`` queries (p50/p99);
+- the uncached ``/graph/memory`` projection (``MemoryGraphProvider._build``,
+  lint disabled so the number reflects CAO, not an LLM or ripgrep) and a
+  cache hit through ``project()``.
+
+Store throughput is reported too, since it bounds how fast a corpus grows.
+Runs offline with no cao-server::
+
+    python benchmarks/bench_memory.py --sizes 100,1000 --queries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.clients.database import init_db
+from cli_agent_orchestrator.graph.providers.memory import MemoryGraphProvider
+from cli_agent_orchestrator.services.memory_relationship_service import MemoryRelationshipService
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+_MODES = ("metadata", "bm25", "hybrid")
+_WORDS = (
+    "cache retry queue index shard lease token budget schema worker pane fifo "
+    "latency throughput journal replay snapshot cursor backoff quorum"
+).split()
+
+
+def _content(rng: random.Random, i: int) -> str:
+    words = " ".join(rng.choice(_WORDS) for _ in range(40))
+    return f"Finding {i}: the {rng.choice(_WORDS)} path {words}."
+
+
+async def _bench_size(
+    svc: MemoryService, start: int, size: int, queries: int, rng: random.Random
+) -> Dict:
+    relationships = MemoryRelationshipService()
+    t0 = time.perf_counter()
+    for i in range(start, size):
+        await svc.store(
+            _content(rng, i), scope="global", memory_type="project", key=f"topic-{i}", tags="bench"
+        )
+    store_wall = time.perf_counter() - t0
+    for i in range(max(start, 1), size):
+        relationships.create("global", None, f"topic-{i}", f"topic-{i - 1}", "relates_to", "human")
+
+    recall: Dict[str, Dict[str, float]] = {}
+    for mode in _MODES:
+        samples = []
+        for _ in range(queries):
+            query = " ".join(rng.sample(_WORDS, 2))
+            t0 = time.perf_counter()
+            await svc.recall(query, scope="global", search_mode=mode)
+            samples.append(time.perf_counter() - t0)
+        recall[mode] = _harness.latency_summary(samples)
+
+    provider = MemoryGraphProvider(svc, lint_enabled=lambda: False)
+    builds = []
+    for _ in range(max(queries // 10, 3)):
+        t0 = time.perf_counter()
+        view = await provider._build("global", None, False)
+        builds.append(time.perf_counter() - t0)
+    # Warm the module-level view cache; every timed project() below is a hit.
+    await provider.project(scope="global")
+    hits = []
+    for _ in range(queries):
+        t0 = time.perf_counter()
+        await provider.project(scope="global")
+        hits.append(time.perf_counter() - t0)
+
+    return {
+        "stores_per_s": round((size - start) / store_wall, 1),
+        "recall": recall,
+        "graph_projection": {
+            "nodes": len(view.nodes),
+            "edges": len(view.edges),
+            "build": _harness.latency_summary(builds),
+            "cache_hit": _harness.latency_summary(hits, unit="us"),
+        },
+    }
+
+
+async def _run(sizes: List[int], queries: int) -> Dict:
+    init_db()
+    svc = MemoryService()
+    rng = random.Random(0)
+    results: Dict[str, Dict] = {}
+    start = 0
+    for size in sorted(sizes):
+        results[str(size)] = await _bench_size(svc, start, size, queries, rng)
+        start = size
+    return results
+
+
+def run(sizes: List[int], queries: int) -> Dict:
+    return {
+        "benchmark": "memory",
+        "sizes": sizes,
+        "queries": queries,
+        "results": asyncio.run(_run(sizes, queries)),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", default="100,1000", help="comma-separated corpus sizes (memories)"
+    )
+    parser.add_argument("--queries", type=int, default=50, help="recalls timed per search mode")
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    json.dump(run(sizes, args.queries), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
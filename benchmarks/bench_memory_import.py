@@ -0,0 +1,112 @@
+"""Benchmark: OKF bundle import/export wall time, per-topic vs bulk session.
+
+Writes a ``--topics`` OKF bundle of hand-written topics to a scratch dir and
+imports it into an empty global scope (fresh memory wiki + SQLite database
+per mode), then exports the imported scope back out. Two modes:
+
+- ``per_topic``: every ``store()`` does its own wiki write, ``index.md``
+  rewrite and metadata commit, as imports did before bulk sessions (the
+  session still exists but never defers a write);
+- ``bulk``: ``import_bundle`` as shipped: index, metadata and wiki writes
+  batched until the session exits, parsing and secret scans on the session
+  workers.
+
+Each mode reports import and export wall time and topics per second. Runs
+offline with no cao-server::
+
+    python benchmarks/bench_memory_import.py --topics 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from sqlalchemy import create_engine
+
+from cli_agent_orchestrator.clients.database import Base
+from cli_agent_orchestrator.services.memory_archive.okf import OkfArchiveBackend
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+_MODES = ("per_topic", "bulk")
+_WORDS = (
+    "cache retry queue index shard lease token budget schema worker pane fifo "
+    "latency throughput journal replay snapshot cursor backoff quorum"
+).split()
+
+
+def _write_bundle(path: Path, topics: int) -> None:
+    rng = random.Random(0)
+    path.mkdir(parents=True)
+    for i in range(topics):
+        words = " ".join(rng.choice(_WORDS) for _ in range(60))
+        (path / f"topic-{i}.md").write_text(
+            f"---\ntype: reference\ntitle: topic-{i}\ntags: [bench]\n"
+            f"timestamp: 2026-01-01T00:00:00Z\n---\n\n# topic-{i}\n\nFinding {i}: {words}.\n",
+            encoding="utf-8",
+        )
+
+
+def _service(root: Path, mode: str) -> MemoryService:
+    engine = create_engine(
+        f"sqlite:///{root / f'{mode}.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    svc = MemoryService(base_dir=root / f"{mode}-memory", db_engine=engine)
+    if mode == "per_topic":
+        svc._bulk_session = lambda: None  # type: ignore[method-assign]
+    return svc
+
+
+def _bench_mode(root: Path, bundle: Path, mode: str, topics: int) -> Dict:
+    backend = OkfArchiveBackend(_service(root, mode))
+    t0 = time.perf_counter()
+    report = backend.import_bundle(bundle, "global", "skip", False)
+    import_wall = time.perf_counter() - t0
+    if report.imported != topics:
+        raise RuntimeError(f"{mode}: imported {report.imported} of {topics} ({report.errors})")
+
+    t0 = time.perf_counter()
+    exported = backend.export_bundle("global", None, root / f"{mode}-export", False, False)
+    export_wall = time.perf_counter() - t0
+    return {
+        "import_s": round(import_wall, 3),
+        "import_topics_per_s": round(topics / import_wall, 1),
+        "export_s": round(export_wall, 3),
+        "export_topics_per_s": round(exported.exported / export_wall, 1),
+    }
+
+
+def run(topics: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="cao-bench-import-") as tmp:
+        root = Path(tmp)
+        bundle = root / "bundle"
+        _write_bundle(bundle, topics)
+        for mode in _MODES:
+            results[mode] = _bench_mode(root, bundle, mode, topics)
+    results["import_speedup"] = round(
+        results["per_topic"]["import_s"] / results["bulk"]["import_s"], 2
+    )
+    return {"benchmark": "memory_import", "topics": topics, "results": results}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--topics", type=int, default=5000, help="topics in the bundle")
+    args = parser.parse_args(argv)
+    json.dump(run(args.topics), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
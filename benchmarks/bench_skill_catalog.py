@@ -0,0 +1,105 @@
+"""Benchmark: skill catalog build and skill load cost per terminal spawn.
+
+Installs ``--skills`` skills in a scratch skill store and simulates spawning a
+``--workers`` team: each spawn builds the filtered catalog (as
+``create_terminal`` does) and loads one skill body (as the MCP ``load_skill``
+tool does through cao-server). Two modes:
+
+- ``uncached``: the skill cache is cleared before every spawn, which is what
+  every spawn paid before parsed skills were cached;
+- ``cached``: ``utils.skills`` as shipped, reusing parses and the rendered
+  catalog while the files are unchanged.
+
+Reports per-spawn latency (p50/p99) and SKILL.md parses per spawn. Runs
+offline with no cao-server::
+
+    python benchmarks/bench_skill_catalog.py --skills 200 --workers 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+from unittest.mock import patch
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.utils import skills
+
+_MODES = ("uncached", "cached")
+
+
+def _install(store: Path, count: int) -> None:
+    past = time.time() - 60
+    for i in range(count):
+        folder = store / f"skill-{i:04d}"
+        folder.mkdir(parents=True)
+        skill_file = folder / "SKILL.md"
+        skill_file.write_text(
+            f"---\nname: skill-{i:04d}\ndescription: Benchmark skill number {i}\n---\n\n"
+            f"# Skill {i}\n\n" + "Follow these steps carefully.\n" * 40,
+            encoding="utf-8",
+        )
+        # Past the cache's racy window, as any skill installed before startup is.
+        os.utime(skill_file, (past, past))
+        os.utime(folder, (past, past))
+    os.utime(store, (past, past))
+
+
+def _bench_mode(mode: str, skills_count: int, workers: int) -> Dict:
+    skills.clear_skill_cache()
+    samples: List[float] = []
+    with patch.object(skills, "_read_skill_file", wraps=skills._read_skill_file) as read:
+        for worker in range(workers):
+            if mode == "uncached":
+                skills.clear_skill_cache()
+            t0 = time.perf_counter()
+            skills.build_skill_catalog(["skill-00*", "skill-01*"])
+            skills.load_skill_content(f"skill-{worker % skills_count:04d}")
+            samples.append(time.perf_counter() - t0)
+    return {
+        **_harness.latency_summary(samples),
+        "parses_per_spawn": round(read.call_count / workers, 1),
+    }
+
+
+def run(skills_count: int, workers: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="cao-bench-skills-") as tmp:
+        store = Path(tmp) / "skills"
+        _install(store, skills_count)
+        with (
+            patch.object(skills, "SKILLS_DIR", store),
+            patch(
+                "cli_agent_orchestrator.services.settings_service.get_extra_skill_dirs",
+                return_value=[],
+            ),
+        ):
+            for mode in _MODES:
+                results[mode] = _bench_mode(mode, skills_count, workers)
+    return {
+        "benchmark": "skill_catalog",
+        "skills": skills_count,
+        "workers": workers,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=200, help="installed skills")
+    parser.add_argument("--workers", type=int, default=20, help="terminal spawns")
+    args = parser.parse_args(argv)
+    json.dump(run(args.skills, args.workers), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
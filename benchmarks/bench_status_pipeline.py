@@ -0,0 +1,165 @@
+"""Benchmark: FIFO -> EventBus -> StatusMonitor at fleet scale with mock_cli terminals.
+
+Registers ``--terminals`` MockCliProvider terminals, attaches a real FIFO reader
+to each and runs the real ``StatusMonitor.run`` consumer on the real event bus.
+A synthetic writer then plays ``--turns`` mock_cli turns into every FIFO at
+once: the echoed input, ``--spinner-chunks`` redraw frames while the "agent"
+works, and finally the ``> MOCK:`` reply and prompt.
+
+Reports the chunk throughput the pipeline sustained, the write-to-event
+latency of the PROCESSING and COMPLETED transitions (COMPLETED includes the
+200ms quiescence debounce by design) and how many events the bus dropped
+because a subscriber queue was full. Runs offline with no cao-server or tmux::
+
+    python benchmarks/bench_status_pipeline.py --terminals 50 --turns 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.providers.mock_cli import MockCliProvider
+from cli_agent_orchestrator.services.event_bus import bus
+from cli_agent_orchestrator.services.fifo_reader import FIFO_DIR, FifoManager
+from cli_agent_orchestrator.services.status_monitor import status_monitor
+from cli_agent_orchestrator.utils.event import terminal_id_from_topic
+
+_SPINNER = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+_EVENT_TIMEOUT = 10.0
+
+
+async def _await_status(
+    queue: asyncio.Queue, ids: List[str], wanted: TerminalStatus, written: Dict[str, float]
+) -> List[float]:
+    """Wait until every terminal reports ``wanted``; return write-to-event latencies."""
+    pending = set(ids)
+    latencies: List[float] = []
+    deadline = time.monotonic() + _EVENT_TIMEOUT
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(f"{len(pending)} terminals never reported {wanted.value}")
+        event = await asyncio.wait_for(queue.get(), remaining)
+        terminal_id = terminal_id_from_topic(event["topic"])
+        if terminal_id in pending and event["data"]["status"] == wanted.value:
+            latencies.append(time.perf_counter() - written[terminal_id])
+            pending.discard(terminal_id)
+    return latencies
+
+
+async def _run(terminals: int, turns: int, spinner_chunks: int) -> Dict:
+    loop = asyncio.get_running_loop()
+    bus.set_loop(loop)
+    statuses = bus.subscribe("terminal.*.status")
+    monitor = asyncio.create_task(status_monitor.run())
+    manager = FifoManager()
+    # The bus only keeps rate-limited drop counters; count every drop here.
+    drops = [0]
+    record_drop = bus._record_drop
+
+    def count_drop(topic: str) -> None:
+        drops[0] += 1
+        record_drop(topic)
+
+    drop_counter = patch.object(bus, "_record_drop", count_drop)
+    drop_counter.start()
+    ids = [f"bench{i:04d}" for i in range(terminals)]
+    for tid in ids:
+        provider_manager._providers[tid] = MockCliProvider(tid, "cao-bench", f"win-{tid}")
+        manager.create_reader(tid)
+    writers = {tid: os.open(FIFO_DIR / f"{tid}.fifo", os.O_WRONLY) for tid in ids}
+
+    def write(tid: str, text: str) -> None:
+        os.write(writers[tid], text.encode())
+
+    processing: List[float] = []
+    completed: List[float] = []
+    chunks = 0
+    written: Dict[str, float] = {}
+    wall0 = time.perf_counter()
+    cpu0 = time.process_time()
+    try:
+        for turn in range(turns):
+            message = f"benchmark turn {turn}"
+            for tid in ids:
+                status_monitor.notify_input_sent(tid)
+                written[tid] = time.perf_counter()
+                write(tid, _harness.mock_cli_echo(message))
+            chunks += terminals
+            processing += await _await_status(statuses, ids, TerminalStatus.PROCESSING, written)
+
+            for frame in range(spinner_chunks):
+                glyph = _SPINNER[frame % len(_SPINNER)]
+                for tid in ids:
+                    write(tid, f"\x1b[2K\r{glyph} Working...")
+                chunks += terminals
+                await asyncio.sleep(0.01)
+
+            for tid in ids:
+                written[tid] = time.perf_counter()
+                # Clear the spinner line so the reply starts a line of its own.
+                write(tid, "\x1b[2K\r\n" + _harness.mock_cli_reply(message))
+            chunks += terminals
+            completed += await _await_status(statuses, ids, TerminalStatus.COMPLETED, written)
+        wall = time.perf_counter() - wall0
+        cpu = time.process_time() - cpu0
+    finally:
+        for fd in writers.values():
+            os.close(fd)
+        for tid in ids:
+            manager.stop_reader(tid)
+            provider_manager._providers.pop(tid, None)
+            status_monitor.clear_terminal(tid)
+        manager.stop_multiplexer()
+        monitor.cancel()
+        bus.unsubscribe("terminal.*.status", statuses)
+        bus.set_loop(None)
+        drop_counter.stop()
+
+    return {
+        "chunks_written": chunks,
+        "chunks_per_s": round(chunks / wall, 1),
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "processing_latency": _harness.latency_summary(processing),
+        "completed_latency": _harness.latency_summary(completed),
+        "dropped_events": drops[0],
+    }
+
+
+def run(terminals: int, turns: int, spinner_chunks: int) -> Dict:
+    return {
+        "benchmark": "status_pipeline",
+        "terminals": terminals,
+        "turns": turns,
+        "spinner_chunks": spinner_chunks,
+        "results": asyncio.run(_run(terminals, turns, spinner_chunks)),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terminals", type=int, default=50, help="mock_cli terminals")
+    parser.add_argument("--turns", type=int, default=5, help="turns played into every terminal")
+    parser.add_argument(
+        "--spinner-chunks", type=int, default=20, help="redraw frames written per turn"
+    )
+    args = parser.parse_args(argv)
+    json.dump(run(args.terminals, args.turns, args.spinner_chunks), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Benchmark: provider status detection cost and accuracy on replayed terminal streams.
+
+Replays terminal stream recordings through ``StatusMonitor`` with
+``services/stream_replay.py`` and reports, per recording and per provider,
+how many detections ran, their CPU time, the latched status timeline and the
+latency from the last output frame to the final COMPLETED.
+
+Recordings come from a cao-server started with ``CAO_STREAM_RECORD_DIR`` set
+(one ``{terminal_id}.cast.gz`` per terminal) and are passed with
+``--recordings``. Without it, one turn per provider is synthesized from the
+provider fixtures in ``test/providers/fixtures`` (idle screen, input, the
+processing screen streamed in small chunks, then the completed screen), so the
+scenario runs offline with nothing recorded. Synthesized turns measure detection
+cost; judge accuracy on real recordings::
+
+    python benchmarks/bench_status_replay.py --repeat 5
+    python benchmarks/bench_status_replay.py --recordings ~/cao-recordings --speed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.services.stream_recorder import (
+    INPUT,
+    OUTPUT,
+    Recording,
+    load_recording,
+)
+from cli_agent_orchestrator.services.stream_replay import replay
+
+_FIXTURES = Path(__file__).resolve().parent.parent / "test" / "providers" / "fixtures"
+
+# provider -> (idle, processing, completed) fixture screens.
+_TURNS: Dict[str, Tuple[str, str, str]] = {
+    "codex": ("codex_idle_output.txt", "codex_processing_output.txt", "codex_completed_output.txt"),
+    "kiro_cli": (
+        "kiro_cli_tui_idle_output.txt",
+        "kiro_cli_tui_processing_output.txt",
+        "kiro_cli_tui_completed_output.txt",
+    ),
+    "grok_cli": ("grok_cli_idle.raw.ansi.txt", "grok_cli_processing.txt", "grok_cli_completed.txt"),
+}
+
+# Synthesized pacing: chunk size and gap inside a screen, and the think time
+# between screens (well past the 200ms quiescence debounce).
+_CHUNK = 256
+_CHUNK_GAP = 0.01
+_STAGE_GAP = 0.5
+_REPAINT = "\x1b[H\x1b[2J"
+
+
+def _stream(frames: List[Tuple[float, str, str]], t: float, text: str) -> float:
+    # Each fixture is a whole captured screen: home + clear before painting it.
+    text = _REPAINT + text.replace("\r\n", "\n").replace("\n", "\r\n")
+    for i in range(0, len(text), _CHUNK):
+        frames.append((round(t, 6), OUTPUT, text[i : i + _CHUNK]))
+        t += _CHUNK_GAP
+    return t
+
+
+def synthesize(provider: str, idle: str, processing: str, completed: str) -> Recording:
+    """One turn: idle screen, input, processing screen, completed screen."""
+    frames: List[Tuple[float, str, str]] = []
+    t = _stream(frames, 0.0, idle) + _STAGE_GAP
+    frames.append((round(t, 6), INPUT, "benchmark turn"))
+    t = _stream(frames, t + _CHUNK_GAP, processing) + _STAGE_GAP
+    _stream(frames, t, completed)
+    return Recording(
+        terminal_id=f"synthetic-{provider}", provider=provider, agent_profile=None, frames=frames
+    )
+
+
+def _fixture_recordings() -> List[Recording]:
+    recordings = []
+    for provider, names in _TURNS.items():
+        idle, processing, completed = ((_FIXTURES / name).read_text() for name in names)
+        recordings.append(synthesize(provider, idle, processing, completed))
+    spinner = "".join(f"\x1b[2K\r{g} Working..." for g in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
+    recordings.append(
+        synthesize(
+            "mock_cli",
+            "MockCli ready.\r\n" + _harness.MOCK_PROMPT,
+            _harness.mock_cli_echo("benchmark turn") + spinner,
+            "\x1b[2K\r\n" + _harness.mock_cli_reply("benchmark turn"),
+        )
+    )
+    return recordings
+
+
+def _load(paths: List[Path]) -> List[Recording]:
+    files: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.cast*")))
+        else:
+            files.append(path)
+    return [load_recording(path) for path in files]
+
+
+async def _run(recordings: List[Recording], speed: Optional[float], repeat: int) -> Dict:
+    per_recording = {}
+    cpu_by_provider: Dict[str, List[float]] = defaultdict(list)
+    detections_by_provider: Dict[str, int] = defaultdict(int)
+    for recording in recordings:
+        reports = [await replay(recording, speed=speed) for _ in range(repeat)]
+        first = reports[0]
+        cpu = [report.detection_cpu_ms for report in reports]
+        cpu_by_provider[first.provider].extend(cpu)
+        detections_by_provider[first.provider] += first.detections
+        per_recording[recording.terminal_id] = {
+            "provider": first.provider,
+            "detection_path": first.detection_path,
+            "frames": first.frames,
+            "detections": first.detections,
+            "detection_cpu_ms": round(min(cpu), 3),
+            "detection_cpu_per_call_us": round(min(cpu) * 1e3 / max(first.detections, 1), 1),
+            "completed_latency_ms": first.completed_latency_ms,
+            "final_status": first.final_status,
+            "timeline": first.timeline,
+            "stable_timeline": all(report.timeline == first.timeline for report in reports),
+        }
+    return {
+        "recordings": per_recording,
+        "providers": {
+            provider: {
+                "detections": detections_by_provider[provider],
+                "detection_cpu_ms": round(min(values), 3),
+            }
+            for provider, values in sorted(cpu_by_provider.items())
+        },
+    }
+
+
+def run(paths: List[Path], speed: Optional[float], repeat: int) -> Dict:
+    recordings = _load(paths) if paths else _fixture_recordings()
+    return {
+        "benchmark": "status_replay",
+        "source": "recordings" if paths else "fixtures",
+        "speed": speed or "max",
+        "repeat": repeat,
+        "results": asyncio.run(_run(recordings, speed, repeat)),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--recordings", type=Path, nargs="*", default=[], help="recording files or directories"
+    )
+    parser.add_argument(
+        "--speed", default="max", help="'max' (virtual clock) or a wall-clock speed-up, e.g. 1"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="replays per recording (CPU is the minimum)"
+    )
+    args = parser.parse_args(argv)
+    speed = None if args.speed == "max" else float(args.speed)
+    json.dump(run(args.recordings, speed, args.repeat), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""Benchmark: terminal log range reads, JSON-decoded vs raw streamed bytes.
+
+Writes a ``--mb`` MiB terminal log through ``TerminalLogStore`` (default
+segment size, so a 100 MiB log is one sealed, compressed segment plus the live
+file) and times two read paths over it:
+
+- ``json``: what ``GET /terminals/{id}/output/range`` does per request —
+  ``read_range`` + ``decode(errors="replace")`` + JSON encoding, in 1 MiB
+  windows (the route's cap);
+- ``raw``: what ``GET /terminals/{id}/output/raw`` does — one snapshot and
+  ``iter_range`` chunks handed to the response as-is.
+
+Each path runs a full sequential read and ``--scrubs`` random overlapping
+1 MiB windows (a playback UI scrubbing). The HTTP layer is left out so the
+numbers isolate the read path. Runs offline::
+
+    python benchmarks/bench_terminal_output_range.py --mb 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.services.terminal_log_store import TerminalLogStore
+
+TID = "bench000"
+_WINDOW = 1024 * 1024
+_LINE = b"\x1b[32m[worker]\x1b[0m compiling module %06d ... ok (%d ms)\r\n"
+
+
+def _write_log(store: TerminalLogStore, log_dir: Path, total: int) -> int:
+    written, i = 0, 0
+    batch: List[bytes] = []
+    while written < total:
+        line = _LINE % (i, i % 997)
+        batch.append(line)
+        written += len(line)
+        i += 1
+        if len(batch) == 512:
+            store.append(log_dir, TID, b"".join(batch))
+            batch.clear()
+    if batch:
+        store.append(log_dir, TID, b"".join(batch))
+    return written
+
+
+def _json_window(store: TerminalLogStore, log_dir: Path, offset: int) -> int:
+    data = store.read_range(log_dir, TID, offset, _WINDOW).decode("utf-8", errors="replace")
+    body = json.dumps({"terminal_id": TID, "offset": offset, "length": _WINDOW, "data": data})
+    return len(body.encode("utf-8"))
+
+
+def _raw_window(store: TerminalLogStore, log_dir: Path, offset: int) -> int:
+    with store.snapshot(log_dir, TID) as snap:
+        return sum(len(chunk) for chunk in snap.iter_range(offset, _WINDOW))
+
+
+def _raw_full(store: TerminalLogStore, log_dir: Path, size: int) -> int:
+    with store.snapshot(log_dir, TID) as snap:
+        return sum(len(chunk) for chunk in snap.iter_range(0, size))
+
+
+def _timed(fn: Callable[[], int], payload: int) -> Dict[str, float]:
+    start = time.perf_counter()
+    sent = fn()
+    wall = time.perf_counter() - start
+    return {
+        "wall_s": round(wall, 3),
+        "mb_per_s": round(payload / wall / 1e6, 1),
+        "response_bytes": sent,
+    }
+
+
+def run(mb: int, scrubs: int) -> Dict:
+    rng = random.Random(0)
+    store = TerminalLogStore()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        t0 = time.perf_counter()
+        size = _write_log(store, log_dir, mb * 1024 * 1024)
+        write_s = time.perf_counter() - t0
+        store.close_all()
+        windows = list(range(0, size, _WINDOW))
+        offsets = [rng.randrange(0, max(size - _WINDOW, 1)) for _ in range(scrubs)]
+        scrubbed = scrubs * _WINDOW
+
+        results = {
+            "json_sequential": _timed(
+                lambda: sum(_json_window(store, log_dir, o) for o in windows), size
+            ),
+            "raw_sequential": _timed(lambda: _raw_full(store, log_dir, size), size),
+            "json_scrub": _timed(
+                lambda: sum(_json_window(store, log_dir, o) for o in offsets), scrubbed
+            ),
+            "raw_scrub": _timed(
+                lambda: sum(_raw_window(store, log_dir, o) for o in offsets), scrubbed
+            ),
+        }
+        segments = len(list(log_dir.glob(f"{TID}.*.seg.*")))
+    return {
+        "benchmark": "terminal_output_range",
+        "log_bytes": size,
+        "sealed_segments": segments,
+        "write_s": round(write_s, 3),
+        "scrubs": scrubs,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=int, default=100, help="log size in MiB")
+    parser.add_argument("--scrubs", type=int, default=200, help="random 1 MiB windows read")
+    args = parser.parse_args(argv)
+    json.dump(run(args.mb, args.scrubs), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Benchmark: workflow retention sweep wall time, per-run vs set-based deletes.
+
+Seeds ``--runs`` journaled runs (run row, one step, ``--events`` events and a
+seq row each) into a scratch database per mode, then sweeps with a count
+bound of ``--keep`` so all but the newest ``--keep`` runs are pruned. Two
+modes:
+
+- ``per_run``: the sweep as it was before set-based retention — enumerate
+  every run with ``list_run_ids_by_age``, filter in Python, then one
+  ``delete_run`` (own connection, own transaction) per pruned run;
+- ``set``: ``workflow_retention.sweep_runs`` as shipped — the prune set in
+  one query, chunked ``DELETE ... WHERE run_id IN (...)`` on one connection,
+  then ``PRAGMA incremental_vacuum``.
+
+Reports sweep wall time, runs pruned per second and the database file size
+before and after. Both databases are created ``auto_vacuum=INCREMENTAL``, as
+``init_db`` creates a fresh one; only the ``set`` sweep vacuums, so only it
+shrinks. Runs offline with
+no cao-server::
+
+    python benchmarks/bench_workflow_retention.py --runs 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator import constants
+from cli_agent_orchestrator.clients.database import (
+    _enable_incremental_auto_vacuum,
+    _migrate_workflow_run,
+    _migrate_workflow_run_event,
+    _migrate_workflow_run_seq,
+    _migrate_workflow_run_step,
+)
+from cli_agent_orchestrator.services import workflow_journal, workflow_retention
+
+_MODES = ("per_run", "set")
+
+
+def _seed(db: Path, runs: int, events: int) -> None:
+    stamp = "2026-01-01T00:00:{:02d}Z"
+    run_rows = []
+    step_rows = []
+    event_rows = []
+    seq_rows = []
+    for i in range(runs):
+        run_id = f"run-{i:06d}"
+        started = stamp.format(i % 60)
+        run_rows.append((run_id, "bench", "{}", "{}", "completed", started))
+        step_rows.append((run_id, "s1", "completed", 1, started))
+        event_rows.extend(
+            (run_id, seq, "step.completed", 1, started) for seq in range(1, events + 1)
+        )
+        seq_rows.append((run_id, events))
+    with sqlite3.connect(str(db)) as conn:
+        conn.executemany(
+            "INSERT INTO workflow_run (run_id, workflow_name, spec_snapshot, inputs_json, "
+            "state, started_at) VALUES (?, ?, ?, ?, ?, ?)",
+            run_rows,
+        )
+        conn.executemany(
+            "INSERT INTO workflow_run_step (run_id, step_id, state, attempts, updated_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            step_rows,
+        )
+        conn.executemany(
+            "INSERT INTO workflow_run_event (run_id, seq, event_type, event_schema_version, ts) "
+            "VALUES (?, ?, ?, ?, ?)",
+            event_rows,
+        )
+        conn.executemany(
+            "INSERT INTO workflow_run_seq (run_id, high_water) VALUES (?, ?)", seq_rows
+        )
+
+
+def _sweep_per_run(keep: int) -> int:
+    rows = workflow_journal.list_run_ids_by_age()
+    pruned = 0
+    for run_id, _started in rows[keep:]:
+        workflow_journal.delete_run(run_id)
+        pruned += 1
+    return pruned
+
+
+def _bench_mode(root: Path, mode: str, runs: int, events: int, keep: int) -> Dict:
+    constants.DATABASE_FILE = root / f"{mode}.db"
+    # The startup order: a fresh file is made INCREMENTAL before any table.
+    _enable_incremental_auto_vacuum()
+    for migrate in (
+        _migrate_workflow_run,
+        _migrate_workflow_run_step,
+        _migrate_workflow_run_event,
+        _migrate_workflow_run_seq,
+    ):
+        migrate()
+    _seed(constants.DATABASE_FILE, runs, events)
+    size_before = constants.DATABASE_FILE.stat().st_size
+
+    t0 = time.perf_counter()
+    if mode == "per_run":
+        pruned = _sweep_per_run(keep)
+    else:
+        pruned = workflow_retention.sweep_runs(retention_days=0, retention_count=keep)
+    wall = time.perf_counter() - t0
+    if pruned != runs - keep:
+        raise RuntimeError(f"{mode}: pruned {pruned} of {runs - keep}")
+    return {
+        "sweep_s": round(wall, 3),
+        "runs_pruned_per_s": round(pruned / wall, 1),
+        "db_mb_before": round(size_before / 2**20, 2),
+        "db_mb_after": round(constants.DATABASE_FILE.stat().st_size / 2**20, 2),
+    }
+
+
+def run(runs: int, events: int, keep: int) -> Dict:
+    results: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory(prefix="cao-bench-retention-") as tmp:
+        for mode in _MODES:
+            results[mode] = _bench_mode(Path(tmp), mode, runs, events, keep)
+    results["speedup"] = round(results["per_run"]["sweep_s"] / results["set"]["sweep_s"], 2)
+    return {
+        "benchmark": "workflow_retention",
+        "runs": runs,
+        "events_per_run": events,
+        "keep": keep,
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50000, help="journaled runs to seed")
+    parser.add_argument("--events", type=int, default=5, help="events per run")
+    parser.add_argument("--keep", type=int, default=100, help="count bound (newest runs kept)")
+    args = parser.parse_args(argv)
+    json.dump(run(args.runs, args.events, args.keep), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
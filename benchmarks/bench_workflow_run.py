@@ -0,0 +1,122 @@
+"""Benchmark: workflow run wall time and per-step engine overhead with mock_cli steps.
+
+Runs ``--runs`` sequential workflows of ``--steps`` mock_cli steps each through
+the real run engine (``workflow_service.start_run``) with journal write-through
+into a scratch database. Every step declares an output schema and feeds its
+answer into the next step's prompt, so templating, structured-output
+validation and the journal are all on the measured path. The agent itself is
+simulated: ``run_agent_step`` sleeps ``--delay-ms`` (the mock_cli reply delay)
+and records the step's validated return, exactly as the return tool would.
+
+Reports run wall time (p50/p99) and the engine's own overhead per step, i.e.
+wall time minus the simulated agent time. Runs offline with no cao-server or
+tmux::
+
+    python benchmarks/bench_workflow_run.py --runs 10 --steps 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import _harness  # noqa: F401  (isolates CAO_HOME_DIR; must precede cao imports)
+
+from cli_agent_orchestrator.clients.database import init_db
+from cli_agent_orchestrator.models.terminal import AgentStepResult, TerminalStatus
+from cli_agent_orchestrator.models.workflow import (
+    RunState,
+    StepOutputRecord,
+    StepState,
+    WorkflowSpec,
+    WorkflowStep,
+)
+from cli_agent_orchestrator.services import workflow_service
+
+_SCHEMA = {"type": "object", "properties": {"answer": {"type": "string"}}, "required": ["answer"]}
+
+
+def _spec(steps: int) -> WorkflowSpec:
+    chain = []
+    for i in range(steps):
+        prompt = "start" if i == 0 else f"continue from {{{{steps.s{i - 1}.output.answer}}}}"
+        chain.append(
+            WorkflowStep(
+                id=f"s{i}", provider="mock_cli", agent="bench", prompt=prompt, output_schema=_SCHEMA
+            )
+        )
+    return WorkflowSpec(name="bench", mode="sequential", steps=chain)
+
+
+def _mock_agent_step(delay: float) -> Any:
+    async def run_agent_step(*, prompt: str, env_vars: Dict[str, str], **kwargs: Any):
+        await asyncio.sleep(delay)
+        run_id = env_vars["CAO_WORKFLOW_RUN_ID"]
+        step_id = env_vars["CAO_WORKFLOW_STEP_ID"]
+        workflow_service.step_output_store.put(
+            run_id,
+            step_id,
+            StepOutputRecord(
+                run_id=run_id,
+                step_id=step_id,
+                output={"answer": f"{step_id} done"},
+                validated=True,
+                errors=[],
+                state=StepState.COMPLETED,
+            ),
+        )
+        return AgentStepResult(
+            terminal_id=f"t-{step_id}",
+            last_message=_harness.mock_cli_reply(prompt),
+            status=TerminalStatus.COMPLETED,
+        )
+
+    return run_agent_step
+
+
+async def _run(runs: int, steps: int, delay: float) -> Dict:
+    init_db()
+    spec = _spec(steps)
+    walls: List[float] = []
+    with patch.object(workflow_service, "run_agent_step", _mock_agent_step(delay)):
+        for n in range(runs):
+            t0 = time.perf_counter()
+            result = await workflow_service.start_run(spec, {}, f"bench-run-{n}")
+            walls.append(time.perf_counter() - t0)
+            if result.state != RunState.COMPLETED:
+                raise RuntimeError(f"run {n} finished {result.state.value}")
+    overhead = [(wall - steps * delay) / steps for wall in walls]
+    return {
+        "run_wall": _harness.latency_summary(walls),
+        "engine_overhead_per_step": _harness.latency_summary(overhead),
+    }
+
+
+def run(runs: int, steps: int, delay_ms: int) -> Dict:
+    return {
+        "benchmark": "workflow_run",
+        "runs": runs,
+        "steps": steps,
+        "delay_ms": delay_ms,
+        "results": asyncio.run(_run(runs, steps, delay_ms / 1e3)),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="workflow runs, one after another")
+    parser.add_argument("--steps", type=int, default=10, help="chained steps per run")
+    parser.add_argument("--delay-ms", type=int, default=50, help="simulated agent time per step")
+    args = parser.parse_args(argv)
+    json.dump(run(args.runs, args.steps, args.delay_ms), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+"""Run the benchmark suite, write one JSON report, optionally gate on a baseline.
+
+Every ``bench_*.py`` scenario runs in its own subprocess (and therefore its own
+scratch ``CAO_HOME_DIR``, see ``_harness``) with the arguments of the chosen
+``--profile``: ``quick`` is sized for a CI smoke run, ``full`` for comparing
+changes on a quiet machine. Nothing needs a cao-server, tmux or credentials.
+
+Record a baseline, then compare a later run against it::
+
+    python benchmarks/run_suite.py --profile full --output baseline.json
+    python benchmarks/run_suite.py --profile full --baseline baseline.json
+
+In comparison mode every timing, rate and error counter in the two reports is
+paired up; the run exits 1 when any of them got worse by more than
+``--tolerance`` (timings also need to move by more than a small absolute floor,
+so microsecond jitter on fast paths is not reported as a regression).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_HERE = Path(__file__).resolve().parent
+
+# name -> (script, {profile: argv})
+SCENARIOS: Dict[str, Tuple[str, Dict[str, List[str]]]] = {
+    "status_pipeline": (
+        "bench_status_pipeline.py",
+        {
+            "quick": ["--terminals", "20", "--turns", "3"],
+            "full": ["--terminals", "100", "--turns", "5"],
+        },
+    ),
+    "status_replay": (
+        "bench_status_replay.py",
+        {
+            "quick": ["--repeat", "3"],
+            "full": ["--repeat", "10"],
+        },
+    ),
+    "fifo_readers": (
+        "bench_fifo_mux.py",
+        {
+            "quick": ["--terminals", "50", "--idle", "1", "--rounds", "5"],
+            "full": ["--terminals", "100", "--idle", "2", "--rounds", "20"],
+        },
+    ),
+    "inbox_fanin": (
+        "bench_inbox_fanin.py",
+        {
+            "quick": ["--senders", "4", "--messages", "5"],
+            "full": ["--senders", "8", "--messages", "10"],
+        },
+    ),
+    "workflow_run": (
+        "bench_workflow_run.py",
+        {
+            "quick": ["--runs", "5", "--steps", "5"],
+            "full": ["--runs", "10", "--steps", "20"],
+        },
+    ),
+    "memory": (
+        "bench_memory.py",
+        {
+            "quick": ["--sizes", "100,300", "--queries", "20"],
+            "full": ["--sizes", "100,1000,2000", "--queries", "50"],
+        },
+    ),
+    "memory_import": (
+        "bench_memory_import.py",
+        {
+            "quick": ["--topics", "500"],
+            "full": ["--topics", "5000"],
+        },
+    ),
+    "skill_catalog": (
+        "bench_skill_catalog.py",
+        {
+            "quick": ["--skills", "50", "--workers", "10"],
+            "full": ["--skills", "500", "--workers", "50"],
+        },
+    ),
+    "workflow_retention": (
+        "bench_workflow_retention.py",
+        {
+            "quick": ["--runs", "2000"],
+            "full": ["--runs", "50000"],
+        },
+    ),
+    "api_concurrency": (
+        "bench_api_concurrency.py",
+        {
+            "quick": ["--concurrency", "1,8", "--requests", "50"],
+            "full": ["--concurrency", "1,8,32", "--requests", "200"],
+        },
+    ),
+    "api_client": (
+        "bench_api_client.py",
+        {
+            "quick": ["--calls", "1000"],
+            "full": ["--calls", "10000"],
+        },
+    ),
+    "terminal_output_range": (
+        "bench_terminal_output_range.py",
+        {
+            "quick": ["--mb", "16", "--scrubs", "50"],
+            "full": ["--mb", "100", "--scrubs", "200"],
+        },
+    ),
+    "auth_tokens": (
+        "bench_auth_tokens.py",
+        {
+            "quick": ["--rate", "1000", "--seconds", "2"],
+            "full": ["--rate", "1000", "--seconds", "10"],
+        },
+    ),
+}
+
+# Counters that must never grow, whatever their magnitude.
+_COUNTERS = frozenset({"errors", "dropped_events", "duplicate_deliveries", "threads_added"})
+
+# Timings below these absolute moves are noise, not regressions.
+_TIME_FLOORS = (("_us", 1000.0), ("_ms", 1.0), ("_s", 0.001))
+
+
+def _environment() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_HERE,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "commit": commit or None,
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def run_scenario(name: str, profile: str) -> Dict[str, Any]:
+    """Run one scenario in a subprocess and return its JSON (or an ``error`` entry)."""
+    script, profiles = SCENARIOS[name]
+    env = {k: v for k, v in os.environ.items() if k != "CAO_HOME_DIR"}
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(_HERE / script), *profiles[profile]],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    elapsed = round(time.perf_counter() - t0, 1)
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.strip().splitlines()[-20:])
+        return {"error": f"exit {proc.returncode}", "stderr": tail, "elapsed_s": elapsed}
+    try:
+        result: Dict[str, Any] = json.loads(proc.stdout)
+    except json.JSONDecodeError as e:
+        return {"error": f"unparseable output: {e}", "elapsed_s": elapsed}
+    result["elapsed_s"] = elapsed
+    return result
+
+
+def _metrics(result: Dict[str, Any]) -> Iterator[Tuple[str, float]]:
+    """Yield ``(dotted.path, value)`` for every numeric leaf under ``results``."""
+
+    def walk(node: Any, path: str) -> Iterator[Tuple[str, float]]:
+        if isinstance(node, dict):
+            for key, value in node.items():
+                yield from walk(value, f"{path}.{key}" if path else str(key))
+        elif isinstance(node, (int, float)) and not isinstance(node, bool):
+            yield path, float(node)
+
+    yield from walk(result.get("results", {}), "")
+
+
+def _direction(path: str) -> Optional[str]:
+    """``"lower"``/``"higher"`` is better, or None for informational values."""
+    leaf = path.rsplit(".", 1)[-1]
+    if leaf in _COUNTERS:
+        return "counter"
+    if "cpu" in leaf:
+        return "lower"
+    if leaf.endswith("_per_s") or leaf.startswith("speedup"):
+        return "higher"
+    if leaf.endswith(("_ms", "_us", "_s")):
+        return "lower"
+    return None
+
+
+def _time_floor(leaf: str) -> float:
+    for suffix, floor in _TIME_FLOORS:
+        if leaf.endswith(suffix):
+            return floor
+    return 0.0
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Dict[str, Any]:
+    """Pair each scenario metric with the baseline's and flag regressions."""
+    regressions: List[Dict[str, Any]] = []
+    improvements: List[Dict[str, Any]] = []
+    compared = 0
+    for name, result in report["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or "error" in base or "error" in result:
+            continue
+        base_metrics = dict(_metrics(base))
+        for path, value in _metrics(result):
+            direction = _direction(path)
+            previous = base_metrics.get(path)
+            if direction is None or previous is None:
+                continue
+            compared += 1
+            entry = {"metric": f"{name}.{path}", "baseline": previous, "current": value}
+            if direction == "counter":
+                if value > previous:
+                    regressions.append(entry)
+                continue
+            change = (value - previous) / previous if previous else 0.0
+            worse = change > tolerance if direction == "lower" else change < -tolerance
+            better = change < -tolerance if direction == "lower" else change > tolerance
+            if direction == "lower" and abs(value - previous) < _time_floor(path):
+                worse = better = False
+            entry["change"] = round(change, 3)
+            if worse:
+                regressions.append(entry)
+            elif better:
+                improvements.append(entry)
+    return {
+        "baseline_commit": baseline.get("environment", {}).get("commit"),
+        "tolerance": tolerance,
+        "compared": compared,
+        "regressions": regressions,
+        "improvements": improvements,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=("quick", "full"), default="quick")
+    parser.add_argument(
+        "--only", default="", help=f"comma-separated subset of: {', '.join(SCENARIOS)}"
+    )
+    parser.add_argument("--output", type=Path, help="write the report here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="earlier report to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="relative change counted as a regression"
+    )
+    args = parser.parse_args(argv)
+
+    names = [n for n in args.only.split(",") if n] or list(SCENARIOS)
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    report: Dict[str, Any] = {
+        "suite": "cao-benchmarks",
+        "profile": args.profile,
+        "environment": _environment(),
+        "scenarios": {},
+    }
+    for name in names:
+        print(f"[{name}] running ({args.profile})...", file=sys.stderr, flush=True)
+        result = run_scenario(name, args.profile)
+        report["scenarios"][name] = result
+        status = result.get("error", "ok")
+        print(f"[{name}] {status} in {result['elapsed_s']}s", file=sys.stderr, flush=True)
+
+    failed = any("error" in result for result in report["scenarios"].values())
+    regressed = False
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("profile") != args.profile:
+            print(
+                f"warning: baseline profile {baseline.get('profile')!r} != {args.profile!r}",
+                file=sys.stderr,
+            )
+        report["comparison"] = compare(report, baseline, args.tolerance)
+        for entry in report["comparison"]["regressions"]:
+            print(
+                f"REGRESSION {entry['metric']}: {entry['baseline']} -> {entry['current']}",
+                file=sys.stderr,
+            )
+        regressed = bool(report["comparison"]["regressions"])
+
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is not None:
+        args.output.write_text(text)
+    else:
+        sys.stdout.write(text)
+    return 1 if failed or regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,14 +8,27 @@ import os
 import pty
 import re
 import signal
+import socket
+import stat
 import struct
 import subprocess
 import termios
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Optional, Tuple, cast
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
 
 import yaml
 from fastapi import (
@@ -35,7 +48,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from cli_agent_orchestrator.backends import TerminalBackendError, TerminalNotFoundError
@@ -51,6 +64,7 @@ from cli_agent_orchestrator.clients.database import (
 from cli_agent_orchestrator.constants import (
     ALLOWED_HOSTS,
     API_BASE_URL,
+    API_SOCKET_PATH,
     CAO_HOME_DIR,
     CORS_ORIGINS,
     DEFAULT_PROVIDER,
@@ -59,9 +73,11 @@ from cli_agent_orchestrator.constants import (
     MODEL_ID_MAX_LEN,
     MODEL_ID_RE,
     OTEL_SERVICE_NAME,
+    PROFILE_CATALOG_POLL_INTERVAL,
     SERVER_HOST,
     SERVER_PORT,
     SERVER_VERSION,
+    SETTINGS_WATCH_INTERVAL,
     TERMINAL_GROUP_ELEMENT_MAX_LEN,
     TERMINAL_GROUP_MAX_ELEMENTS,
     TERMINAL_METADATA_MAX_BYTES,
@@ -128,27 +144,39 @@ from cli_agent_orchestrator.services.herdr_inbox_service import HerdrInboxServic
 from cli_agent_orchestrator.services.inbox_service import inbox_service
 from cli_agent_orchestrator.services.install_service import InstallResult, install_agent
 from cli_agent_orchestrator.services.log_writer import log_writer
+from cli_agent_orchestrator.services.memory_prefetch import get_memory_prefetcher
 from cli_agent_orchestrator.services.profile_search import (
     DEFAULT_LIMIT as PROFILE_SEARCH_DEFAULT_LIMIT,
 )
 from cli_agent_orchestrator.services.status_monitor import status_monitor
 from cli_agent_orchestrator.services.step_output_store import _validate_key_part
+from cli_agent_orchestrator.services.stream_recorder import stream_recorder
+from cli_agent_orchestrator.services.terminal_search import (
+    DEFAULT_SEARCH_LIMIT as TERMINAL_SEARCH_DEFAULT_LIMIT,
+)
+from cli_agent_orchestrator.services.terminal_search import (
+    MAX_SEARCH_LIMIT as TERMINAL_SEARCH_MAX_LIMIT,
+)
+from cli_agent_orchestrator.services.terminal_search import terminal_search_index
 from cli_agent_orchestrator.services.terminal_service import (
     TERMINAL_RANGE_MAX_LENGTH,
+    OutputCursorError,
     OutputMode,
     TerminalInputBlockedError,
 )
 from cli_agent_orchestrator.services.workflow_journal import (
     _TERMINAL_RUN_STATES as _JOURNAL_TERMINAL_RUN_STATES,
 )
-from cli_agent_orchestrator.services.workflow_journal import (
-    EventRow,
-    GapMarker,
-    StepRow,
-)
+from cli_agent_orchestrator.services.workflow_journal import EventRow, GapMarker, StepRow
+from cli_agent_orchestrator.services.worktree_pool import shutdown_worktree_pool
 from cli_agent_orchestrator.services.worktree_service import WorktreeError
 from cli_agent_orchestrator.telemetry import init_telemetry, shutdown_telemetry
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile, resolve_provider
+from cli_agent_orchestrator.utils.http_range import (
+    RangeNotSatisfiable,
+    etag_matches,
+    parse_byte_range,
+)
 from cli_agent_orchestrator.utils.logging import install_access_log_redaction, setup_logging
 from cli_agent_orchestrator.utils.skills import (
     SkillNameError,
@@ -197,6 +225,55 @@ async def opencode_inbox_delivery_daemon(registry: PluginRegistry) -> None:
             logger.exception("OpenCode inbox delivery poller error")
 
 
+async def settings_watcher_daemon(interval: float = SETTINGS_WATCH_INTERVAL) -> None:
+    """Background task that keeps the settings snapshot fresh.
+
+    The single settings.json watcher: every ``interval`` seconds it re-checks
+    the file (one stat; re-parsed only when it changed) and notifies
+    ``subscribe_settings`` listeners on change. Between ticks, hot-path reads
+    (StatusMonitor per chunk, memory enable checks) use the snapshot without
+    a stat(). The trust lapses on its own if the watcher stops ticking.
+    """
+    from cli_agent_orchestrator.services.settings_service import refresh_settings_snapshot
+
+    logger.info("Settings watcher started (every %ss)", interval)
+    version = None
+    try:
+        while True:
+            try:
+                snapshot = await asyncio.to_thread(refresh_settings_snapshot, interval * 3)
+                if version is not None and snapshot.version != version:
+                    logger.info("Settings changed (snapshot version %d)", snapshot.version)
+                version = snapshot.version
+            except Exception:
+                logger.exception("Settings watcher error")
+            await asyncio.sleep(interval)
+    finally:
+        # Hand hot paths back to stat-checked reads once nobody is watching.
+        refresh_settings_snapshot(trust_for=0)
+
+
+async def profile_catalog_daemon(interval: float) -> None:
+    """Background task that keeps the agent profile catalog and search index warm.
+
+    Rescans every ``interval`` seconds (only changed files are re-parsed) and
+    publishes the result as the snapshot ``list_agent_profiles()`` serves, so
+    ``/agents/profiles`` and ``find_profiles`` never scan on the request path.
+    The snapshot outlives one missed tick but expires if the daemon stops.
+    """
+    from cli_agent_orchestrator.services.profile_search import warm_profile_index
+    from cli_agent_orchestrator.utils.agent_profiles import refresh_profile_catalog
+
+    logger.info("Profile catalog daemon started (every %ss)", interval)
+    while True:
+        try:
+            profiles = await asyncio.to_thread(refresh_profile_catalog, interval * 3)
+            await asyncio.to_thread(warm_profile_index, profiles)
+        except Exception:
+            logger.exception("Profile catalog daemon error")
+        await asyncio.sleep(interval)
+
+
 async def inbox_reconciliation_daemon(registry: PluginRegistry) -> None:
     """Background task that recovers inbox messages the fast paths missed.
 
@@ -219,6 +296,16 @@ async def inbox_reconciliation_daemon(registry: PluginRegistry) -> None:
 class TerminalOutputResponse(BaseModel):
     output: str
     mode: str
+    # Opaque position in the terminal's on-disk log; pass it back as ``since``
+    # to receive only what was appended after this read.
+    cursor: Optional[str] = None
+    # ``max_chars`` (or the read cap) cut older output from the front.
+    truncated: bool = False
+    # Characters before ``max_chars`` was applied (not reported for ``since``).
+    total_chars: Optional[int] = None
+    # ``since`` named an earlier log (removed, or before a server restart), so
+    # the read started from the first retained byte instead.
+    reset: bool = False
 
 
 class TerminalOutputRange(BaseModel):
@@ -235,6 +322,21 @@ class TerminalOutputRange(BaseModel):
     data: str
 
 
+class TerminalSearchHit(BaseModel):
+    """One match from ``GET /search/terminal-output``.
+
+    For ``source == "log"`` the ``offset`` is a logical log offset to pass to
+    ``GET /terminals/{terminal_id}/output/range``; for ``"scrollback"`` it is a
+    byte offset into the terminal's delete-time ``{id}.scrollback`` snapshot.
+    """
+
+    terminal_id: str
+    source: Literal["log", "scrollback"]
+    offset: int
+    snippet: str
+    logged_at: Optional[datetime] = None
+
+
 class CreateTerminalBody(BaseModel):
     """Optional JSON body for POST /sessions/{name}/terminals.
 
@@ -1046,7 +1148,7 @@ def _sweep_workflow_runs_at_startup() -> None:
     """Run the workflow run-journal retention sweep once at startup (NFR-SEC-3).
 
     ``sweep_runs`` is already best-effort internally (enumeration failures return
-    0, a per-run delete failure is logged and the sweep continues), so this only
+    0, a failing delete chunk is logged and the sweep continues), so this only
     adds a defensive outer guard: a maintenance sweep must never prevent the
     server from starting.
     """
@@ -1090,16 +1192,23 @@ async def lifespan(app: FastAPI):
     # had NO production caller and the advertised age/run-count retention never
     # ran, so the event log grew without bound. Startup-time and best-effort,
     # matching cleanup_old_data above: sweep_runs never raises (read failures
-    # degrade to a 0-run no-op) and bounds are read from settings.
+    # degrade to a 0-run no-op) and bounds are read from settings. Off the
+    # event loop on a worker thread, so a large prune never delays readiness.
     asyncio.create_task(asyncio.to_thread(_sweep_workflow_runs_at_startup))
 
     # Start flow daemon as background task
     daemon_task = asyncio.create_task(flow_daemon())
 
+    # Single watcher for settings.json; hot paths read its snapshot.
+    settings_watcher_task = asyncio.create_task(settings_watcher_daemon())
+
     # Register event loop with event bus for thread-safe publishing
     loop = asyncio.get_running_loop()
     bus.set_loop(loop)
 
+    # One batched tmux capture per pipe-pane watchdog tick, for every terminal.
+    fifo_manager.set_batch_probe(terminal_service.probe_panes)
+
     # Start event bus consumers as background tasks
     status_monitor_task = asyncio.create_task(status_monitor.run())
     log_writer_task = asyncio.create_task(log_writer.run())
@@ -1139,6 +1248,13 @@ async def lifespan(app: FastAPI):
     # the immediate and event-driven status paths missed (issue #131).
     inbox_reconcile_task = asyncio.create_task(inbox_reconciliation_daemon(registry))
 
+    # Opt-in profile catalog rescans (CAO_PROFILE_CATALOG_POLL_INTERVAL).
+    profile_catalog_task: Optional[asyncio.Task] = None
+    if PROFILE_CATALOG_POLL_INTERVAL > 0:
+        profile_catalog_task = asyncio.create_task(
+            profile_catalog_daemon(PROFILE_CATALOG_POLL_INTERVAL)
+        )
+
     # Herdr delivers inbox via its own socket events; the tmux backend uses the
     # FIFO -> EventBus pipeline (StatusMonitor / LogWriter / InboxService) started
     # above. Start the herdr inbox service only when the herdr backend is active
@@ -1209,10 +1325,32 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    if profile_catalog_task is not None:
+        profile_catalog_task.cancel()
+        try:
+            await profile_catalog_task
+        except asyncio.CancelledError:
+            pass
+
+    settings_watcher_task.cancel()
+    try:
+        await settings_watcher_task
+    except asyncio.CancelledError:
+        pass
+
     # Stop the pipe-pane liveness watchdog thread (issue #388). It is a plain
     # threading.Thread (not asyncio), so join it directly rather than via
     # asyncio.gather with the tasks above.
     fifo_manager.stop_watchdog()
+    fifo_manager.set_batch_probe(None)
+    # Likewise the FIFO multiplexer thread: flushes pending output and closes
+    # every FIFO fd.
+    fifo_manager.stop_multiplexer()
+    # Finish any open stream recordings so their gzip trailers are written.
+    stream_recorder.stop_all()
+    # Let queued worktree scrubs finish (a daemon thread killed mid-recycle
+    # leaves half-scrubbed checkouts), then remove every parked worktree.
+    await asyncio.to_thread(shutdown_worktree_pool)
 
     await registry.teardown()
     # OpenTelemetry (ported): flush + shut down exporters (no-op when disabled).
@@ -1353,6 +1491,32 @@ async def health_check():
     }
 
 
+@app.get("/health/event-bus")
+async def event_bus_stats(
+    _scopes: List[str] = Depends(require_any_scope(SCOPE_READ, SCOPE_WRITE, SCOPE_ADMIN)),
+) -> Dict:
+    """Per-subscriber lag and loss counters of the in-process event bus.
+
+    ``lag`` is how many events a subscriber has not consumed yet; a growing
+    lag or a non-zero ``dropped`` points at a consumer that cannot keep up
+    with terminal output.
+    """
+    return {"subscribers": bus.subscriber_stats()}
+
+
+@app.get("/health/memory-injection")
+async def memory_injection_stats(
+    _scopes: List[str] = Depends(require_any_scope(SCOPE_READ, SCOPE_WRITE, SCOPE_ADMIN)),
+) -> Dict:
+    """First-message memory injection counters (``services/memory_prefetch.py``).
+
+    ``hit_rate`` is the share of injections served from a block prefetched at
+    terminal creation; ``timeout`` counts first messages sent without memory
+    because the block was not ready within the deadline.
+    """
+    return get_memory_prefetcher().stats()
+
+
 def _mcp_apps_enabled() -> bool:
     """Whether the MCP Apps HTTP surface (event stream + widget) is enabled.
 
@@ -1575,35 +1739,15 @@ async def agui_stream(
                 detail=f"Invalid ISO-8601 timestamp for 'since': {since!r}",
             )
 
-    from fastapi.responses import StreamingResponse
-
-    from cli_agent_orchestrator.clients.database import list_terminals_by_session
-    from cli_agent_orchestrator.services import session_service
     from cli_agent_orchestrator.services.agui.lifecycle_tracker import ToolCallLifecycleTracker
     from cli_agent_orchestrator.services.agui_stream import (
-        state_delta_frame,
+        state_patch_frame,
         state_snapshot_frame,
         to_agui_event,
     )
     from cli_agent_orchestrator.services.event_log_service import get_event_log
+    from cli_agent_orchestrator.services.fleet_state import get_fleet_state
     from cli_agent_orchestrator.services.sse_bus import get_bus
-    from cli_agent_orchestrator.services.ui_state_service import build_dashboard_snapshot
-
-    def _fleet_snapshot() -> Dict:
-        """Build the current DashboardSnapshot from live session/terminal state.
-
-        Failure-isolated: any backend hiccup yields an empty snapshot rather
-        than tearing down the stream. ``list_sessions`` already returns ``[]``
-        on error, so an unavailable tmux/herdr backend degrades gracefully.
-        """
-        sessions = session_service.list_sessions()
-        terminals: List[Dict] = []
-        for sess in sessions:
-            try:
-                terminals.extend(list_terminals_by_session(sess["id"]))
-            except Exception:
-                logger.debug("agui_stream: terminal listing failed for %s", sess.get("id"))
-        return build_dashboard_snapshot(sessions, terminals, list(scopes))
 
     def _sse(event_id: Optional[str], agui_type: str, data: Dict) -> str:
         """Format one SSE frame, with an ``id:`` cursor when the event has one."""
@@ -1655,6 +1799,8 @@ async def agui_stream(
         # events on an open connection) so the client reconnects with
         # Last-Event-ID and replays the dropped records exactly once (F2).
         sub = bus.register(overflow_close=True)
+        fleet = get_fleet_state()
+        watch = fleet.attach()
         tracker = ToolCallLifecycleTracker()
         try:
             replayed_ids: set = set()
@@ -1684,51 +1830,81 @@ async def agui_stream(
 
             # AG-UI shared-state: emit a full STATE_SNAPSHOT on connect so any
             # client hydrates its projection, then keep it current with minimal
-            # RFC-6902 STATE_DELTA patches after each fleet event.
-            prev_snapshot: Optional[Dict] = None
+            # RFC-6902 STATE_DELTA patches. The projection is process-wide
+            # (services/fleet_state.py): each change is computed once and every
+            # stream forwards the ops since the version it last sent.
+            sent_version: Optional[int] = None
+
+            def _state_frames() -> List[str]:
+                nonlocal sent_version
+                version, snapshot = fleet.current()
+                if snapshot is None or version == sent_version:
+                    return []
+                ops = fleet.deltas_since(sent_version) if sent_version is not None else None
+                sent_version = version
+                if ops is None:
+                    agui_type, data = state_snapshot_frame({**snapshot, "scopes": list(scopes)})
+                    return [_sse(None, agui_type, data)]
+                delta = state_patch_frame(ops)
+                return [_sse(None, delta[0], delta[1])] if delta is not None else []
+
             try:
-                prev_snapshot = _fleet_snapshot()
-                agui_type, data = state_snapshot_frame(prev_snapshot)
-                yield _sse(None, agui_type, data)
+                await fleet.refresh()
+                for frame in _state_frames():
+                    yield frame
             except Exception:
                 logger.warning("agui_stream: initial STATE_SNAPSHOT failed", exc_info=True)
 
             # Drain the subscriber registered above (buffered handoff events
             # first, then live), via the bus's drain seam so a fake can terminate
-            # the stream cleanly in tests. On overflow the drain closes so the
-            # client reconnects (F2); cancellation on client disconnect
-            # propagates through the ``finally`` that unregisters the subscriber.
-            async for event in bus.drain(sub):
-                rid = event.get("id")
-                # Skip the replay/live overlap so a reconnecting client that
-                # passed ``?since=`` never sees an event twice.
-                if rid is not None and rid in replayed_ids:
-                    replayed_ids.discard(rid)
-                    continue
-                agui_type, data = to_agui_event(event)
-                for frame in _sse_frames(rid, list(tracker.feed(event, (agui_type, data)))):
-                    yield frame
-
-                # Recompute the fleet snapshot and emit a STATE_DELTA when it
-                # moved. NB: recomputes on every event; a debounce/cache is a
-                # natural follow-up for high event rates (this is the opt-in L2
-                # dashboard surface, not the orchestration hot path).
-                try:
-                    curr = _fleet_snapshot()
-                    if prev_snapshot is not None:
-                        delta = state_delta_frame(prev_snapshot, curr)
-                        if delta is not None:
-                            dtype, ddata = delta
-                            yield _sse(None, dtype, ddata)
-                    prev_snapshot = curr
-                except Exception:
-                    logger.warning("agui_stream: STATE_DELTA computation failed", exc_info=True)
+            # the stream cleanly in tests, while also waking on fleet changes
+            # that arrive without a bus record (status transitions). On overflow
+            # the drain closes so the client reconnects (F2); cancellation on
+            # client disconnect propagates through the ``finally`` below.
+            events = bus.drain(sub).__aiter__()
+            next_event: Optional[asyncio.Future] = None
+            changed: Optional[asyncio.Future] = None
+            try:
+                next_event = asyncio.ensure_future(events.__anext__())
+                while True:
+                    changed = asyncio.ensure_future(watch.changed.wait())
+                    await asyncio.wait({next_event, changed}, return_when=asyncio.FIRST_COMPLETED)
+                    changed.cancel()
+                    watch.changed.clear()
+                    if next_event.done():
+                        try:
+                            event = next_event.result()
+                        except StopAsyncIteration:
+                            break
+                        next_event = asyncio.ensure_future(events.__anext__())
+                        rid = event.get("id")
+                        # Skip the replay/live overlap so a reconnecting client
+                        # that passed ``?since=`` never sees an event twice.
+                        if rid is not None and rid in replayed_ids:
+                            replayed_ids.discard(rid)
+                        else:
+                            agui_type, data = to_agui_event(event)
+                            fed = list(tracker.feed(event, (agui_type, data)))
+                            for frame in _sse_frames(rid, fed):
+                                yield frame
+                            fleet.observe(event)
+                    try:
+                        await fleet.refresh()
+                        for frame in _state_frames():
+                            yield frame
+                    except Exception:
+                        logger.warning("agui_stream: STATE_DELTA computation failed", exc_info=True)
+            finally:
+                for pending in (next_event, changed):
+                    if pending is not None and not pending.done():
+                        pending.cancel()
 
             # Session end: synthesize closers for any remaining open tool calls.
             for ftype, fdata in tracker.close_all():
                 yield _sse(None, ftype, fdata)
         finally:
             bus.unregister(sub)
+            fleet.detach(watch)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -3043,14 +3219,61 @@ async def send_terminal_key(
 async def get_terminal_output(
     terminal_id: TerminalId,
     mode: OutputMode = OutputMode.FULL,
+    since: Optional[str] = Query(
+        None,
+        description="Cursor from a previous response: return only output logged after it "
+        "(mode=full only)",
+    ),
+    max_chars: Optional[int] = Query(
+        None, ge=1, description="Return at most this many characters, from the tail"
+    ),
     _scopes: List[str] = Depends(require_any_scope(SCOPE_READ, SCOPE_WRITE, SCOPE_ADMIN)),
 ) -> TerminalOutputResponse:
+    """Read a terminal's output, whole or incrementally.
+
+    Without ``since`` this returns the rolling buffer (``full``) or the
+    provider-extracted last response (``last``), plus a ``cursor``. With
+    ``since`` it returns only what the terminal logged after that cursor, read
+    from the on-disk log, so a supervisor polling a chatty worker transfers
+    just the new output. ``max_chars`` trims either answer to its tail on the
+    server.
+    """
+    if since is not None and mode != OutputMode.FULL:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="since is only supported with mode=full",
+        )
     try:
+        if since is not None:
+            delta = await asyncio.to_thread(
+                terminal_service.read_output_since, terminal_id, since, max_chars
+            )
+            return TerminalOutputResponse(
+                output=delta.output,
+                mode=mode,
+                cursor=delta.cursor,
+                truncated=delta.truncated,
+                reset=delta.reset,
+            )
+        # The cursor is taken first so the next ``since`` read can repeat a
+        # few bytes of this output but never miss any.
+        cursor = await asyncio.to_thread(terminal_service.output_cursor, terminal_id)
         # get_output does a blocking tmux capture-pane plus provider regex
         # extraction over the scrollback — run it off the loop so a large
         # transcript can't stall the whole server.
         output = await asyncio.to_thread(terminal_service.get_output, terminal_id, mode)
-        return TerminalOutputResponse(output=output, mode=mode)
+        total_chars = len(output)
+        if max_chars is not None and total_chars > max_chars:
+            output = output[-max_chars:]
+        return TerminalOutputResponse(
+            output=output,
+            mode=mode,
+            cursor=cursor,
+            truncated=len(output) < total_chars,
+            total_chars=total_chars,
+        )
+    except OutputCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
@@ -3105,6 +3328,140 @@ async def get_terminal_output_range(
         )
 
 
+@app.get(
+    "/terminals/{terminal_id}/output/raw",
+    response_class=StreamingResponse,
+    responses={206: {"description": "Partial content"}, 304: {}, 416: {}},
+)
+async def stream_terminal_output_raw(
+    terminal_id: TerminalId,
+    request: Request,
+    _scopes: List[str] = Depends(require_any_scope(SCOPE_READ, SCOPE_WRITE, SCOPE_ADMIN)),
+) -> Response:
+    """Stream a terminal's on-disk log as raw bytes, honoring HTTP ``Range``.
+
+    The byte-level sibling of ``GET /terminals/{id}/output/range`` for
+    playback UIs that scrub through large logs: no JSON wrapping, no UTF-8
+    decode, no per-request length cap. Offsets are the same logical log
+    offsets. Without a ``Range`` header the whole retained log is streamed;
+    a single ``bytes=`` range is answered with 206 and ``Content-Range``.
+
+    The ``ETag`` is derived from the log's generation, the live segment's
+    inode and the log's size, so an unchanged log revalidates with 304 and
+    ``If-Range`` resumes only against the same bytes (a log removed and
+    recreated on a reused inode gets a new generation). The snapshot holds
+    every segment open, so the body is exactly the announced range; if a
+    segment is unreadable anyway the stream is aborted, never shortened in
+    place. Bytes already pruned by retention are not served;
+    ``X-Log-Start`` reports the first retained offset. Same read scope as the
+    other output routes.
+    """
+    try:
+        snap = await asyncio.to_thread(terminal_service.open_output_log, terminal_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to open output log: {str(e)}",
+        )
+
+    log_start, size = (snap.start, snap.size) if snap is not None else (0, 0)
+    generation, inode = (snap.generation, snap.inode) if snap is not None else ("0", 0)
+    etag = f'"{generation}-{inode:x}-{log_start:x}-{size:x}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "X-Log-Start": str(log_start),
+    }
+
+    def _bodyless(status_code: int, extra: Optional[Dict[str, str]] = None) -> Response:
+        if snap is not None:
+            snap.close()
+        return Response(status_code=status_code, headers={**headers, **(extra or {})})
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return _bodyless(status.HTTP_304_NOT_MODIFIED)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range is not None and if_range.strip() != etag:
+        range_header = None  # the client's partial copy is stale: send it all
+    try:
+        window = parse_byte_range(range_header, size)
+    except RangeNotSatisfiable:
+        window = (0, 0)
+    if window is not None:
+        lo, hi = max(window[0], log_start), window[1]
+        if lo >= hi:
+            return _bodyless(
+                status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                {"Content-Range": f"bytes */{size}"},
+            )
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {lo}-{hi - 1}/{size}"
+    else:
+        lo, hi = log_start, size
+        status_code = status.HTTP_200_OK
+    headers["Content-Length"] = str(hi - lo)
+    if snap is None:
+        return Response(
+            status_code=status_code, headers=headers, media_type="application/octet-stream"
+        )
+
+    def _body() -> Iterator[bytes]:
+        # A sync generator: Starlette drains it in its threadpool, so the
+        # pread / frame inflation never runs on the event loop.
+        try:
+            yield from snap.iter_range(lo, hi - lo)
+        finally:
+            snap.close()
+
+    return StreamingResponse(
+        _body(), status_code=status_code, headers=headers, media_type="application/octet-stream"
+    )
+
+
+@app.get("/search/terminal-output", response_model=List[TerminalSearchHit])
+async def search_terminal_output(
+    q: str = Query(min_length=1, max_length=512, description="Case-insensitive text to find"),
+    terminal_id: Optional[TerminalId] = Query(default=None, description="Only this terminal"),
+    since: Optional[datetime] = Query(
+        default=None, description="ISO-8601 lower bound on when the output was logged"
+    ),
+    limit: int = Query(default=TERMINAL_SEARCH_DEFAULT_LIMIT, ge=1, le=TERMINAL_SEARCH_MAX_LIMIT),
+    _scopes: List[str] = Depends(require_any_scope(SCOPE_READ, SCOPE_WRITE, SCOPE_ADMIN)),
+) -> List[TerminalSearchHit]:
+    """Find which terminals printed ``q``, newest log output first.
+
+    Searches the in-memory index LogWriter maintains (output logged since this
+    server started), then scans scrollback snapshots of deleted terminals. Log
+    hits carry an ``offset`` that ``GET /terminals/{id}/output/range`` accepts.
+    Gated like the output range route, since snippets are terminal output.
+    """
+    try:
+        # Confirming hits reads log segments back off disk — off the loop.
+        hits = await asyncio.to_thread(terminal_search_index.search, q, terminal_id, since, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search terminal output: {str(e)}",
+        )
+    return [
+        TerminalSearchHit(
+            terminal_id=hit.terminal_id,
+            source=hit.source,
+            offset=hit.offset,
+            snippet=hit.snippet,
+            logged_at=hit.logged_at,
+        )
+        for hit in hits
+    ]
+
+
 @app.post("/terminals/{terminal_id}/exit")
 async def exit_terminal(
     terminal_id: TerminalId,
@@ -6617,6 +6974,12 @@ def main():
         default=None,
         help="Terminal backend to use, overriding terminal_backend in config.json",
     )
+    parser.add_argument(
+        "--uds",
+        type=str,
+        default=API_SOCKET_PATH,
+        help="Also listen on this Unix domain socket (defaults to CAO_API_SOCKET)",
+    )
     args = parser.parse_args()
 
     if args.agents_dir:
@@ -6658,13 +7021,55 @@ def main():
     # Credential query params (``?access_token=``) are scrubbed from uvicorn's
     # access log by ``install_access_log_redaction()``, installed in the app
     # lifespan so both ``cao-server`` and ``uvicorn ...:app`` are covered.
-    uvicorn.run(
+    if not args.uds:
+        uvicorn.run(
+            app,
+            host=host,
+            port=port,
+            proxy_headers=True,
+            forwarded_allow_ips=forwarded_ips,
+        )
+        return
+
+    # With --uds / CAO_API_SOCKET the same server also accepts local clients on
+    # a Unix socket, which the pooled client in clients/api_client.py prefers
+    # over loopback TCP. Both listeners share one event loop and one app.
+    config = uvicorn.Config(
         app,
         host=host,
         port=port,
         proxy_headers=True,
         forwarded_allow_ips=forwarded_ips,
     )
+    sockets = [config.bind_socket(), _bind_unix_socket(args.uds)]
+    logger.info(f"Also listening on Unix socket {args.uds}")
+    try:
+        uvicorn.Server(config).run(sockets=sockets)
+    finally:
+        with suppress(FileNotFoundError):
+            os.unlink(args.uds)
+
+
+def _bind_unix_socket(path: str) -> socket.socket:
+    """Bind a listening Unix socket at ``path`` readable only by this user.
+
+    A stale socket file left by a crashed server is replaced; any other file
+    at that path is refused rather than deleted.
+    """
+    if os.path.exists(path):
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise FileExistsError(f"Refusing to replace non-socket file at {path}")
+        os.unlink(path)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(old_umask)
+    os.chmod(path, 0o600)
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ Core services depend only on this ABC, never on a concrete backend directly.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 
@@ -208,6 +208,35 @@ class TerminalBackend(ABC):
         """
         ...
 
+    def get_histories(
+        self,
+        targets: Sequence[Tuple[str, str]],
+        tail_lines: Optional[int] = None,
+    ) -> Dict[Tuple[str, str], str]:
+        """Capture the tails of many windows at once.
+
+        Used by the FIFO pipe-liveness watchdog, which probes every enrolled
+        terminal on each tick. The default calls ``get_history`` per target;
+        backends that can capture several panes in one round-trip override it.
+
+        Args:
+            targets: ``(session_name, window_name)`` pairs
+            tail_lines: Number of lines from the end (None = backend default)
+
+        Returns:
+            Map of target to output. Targets that could not be captured are
+            omitted rather than raising, so one gone pane never hides the rest.
+        """
+        histories: Dict[Tuple[str, str], str] = {}
+        for session_name, window_name in targets:
+            try:
+                histories[(session_name, window_name)] = self.get_history(
+                    session_name, window_name, tail_lines=tail_lines
+                )
+            except Exception:
+                continue
+        return histories
+
     @abstractmethod
     def get_pane_working_directory(self, session_name: str, window_name: str) -> Optional[str]:
         """Get the current working directory of a pane.
@@ -323,6 +352,16 @@ class TerminalBackend(ABC):
         """
         raise NotImplementedError(f"{type(self).__name__} does not support get_pane_id()")
 
+    def get_pane_pid(self, session_name: str, window_name: str) -> Optional[int]:
+        """PID of the process the backend spawned in the pane (normally the shell).
+
+        Lets ``services/pane_process_tracker.py`` answer "has the CLI exited"
+        from ``/proc`` instead of a ``get_pane_current_command`` round-trip.
+        Default returns None (unsupported) — callers keep using
+        ``get_pane_current_command``.
+        """
+        return None
+
     def get_native_status(self, session_name: str, window_name: str) -> Optional[TerminalStatus]:
         """Query native agent status if the backend has agent awareness.
 
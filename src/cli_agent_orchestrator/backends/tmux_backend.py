@@ -6,7 +6,7 @@ no alternative is configured.
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from cli_agent_orchestrator.backends.base import TerminalBackend, TerminalBackendError
 from cli_agent_orchestrator.clients.tmux import TmuxClient
@@ -120,12 +120,22 @@ class TmuxBackend(TerminalBackend):
             full_history=full_history,
         )
 
+    def get_histories(
+        self,
+        targets: Sequence[Tuple[str, str]],
+        tail_lines: Optional[int] = None,
+    ) -> Dict[Tuple[str, str], str]:
+        return self._client.get_histories(targets, tail_lines=tail_lines)
+
     def get_pane_working_directory(self, session_name: str, window_name: str) -> Optional[str]:
         return self._client.get_pane_working_directory(session_name, window_name)
 
     def get_pane_current_command(self, session_name: str, window_name: str) -> Optional[str]:
         return self._client.get_pane_current_command(session_name, window_name)
 
+    def get_pane_pid(self, session_name: str, window_name: str) -> Optional[int]:
+        return self._client.get_pane_pid(session_name, window_name)
+
     # --- Attach ---
 
     def attach_session(self, session_name: str) -> None:
@@ -4,9 +4,9 @@ import os
 import time
 
 import click
-import requests
 
 from cli_agent_orchestrator.backends.registry import get_backend
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import (
     API_BASE_URL,
     DEFAULT_PROVIDER,
@@ -6,8 +6,8 @@ import time
 from urllib.parse import quote
 
 import click
-import requests
 
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.utils.terminal import poll_until_done
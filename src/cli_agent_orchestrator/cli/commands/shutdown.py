@@ -1,8 +1,8 @@
 """Shutdown command for CLI Agent Orchestrator."""
 
 import click
-import requests
 
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL
 
 
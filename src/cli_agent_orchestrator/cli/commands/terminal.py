@@ -4,10 +4,10 @@ import json
 import os
 
 import click
-import requests
 
 from cli_agent_orchestrator.backends.registry import get_backend
-from cli_agent_orchestrator.constants import API_BASE_URL, TERMINAL_LOG_DIR
+from cli_agent_orchestrator.clients import api_client as requests
+from cli_agent_orchestrator.constants import API_BASE_URL, MCP_REQUEST_TIMEOUT, TERMINAL_LOG_DIR
 from cli_agent_orchestrator.utils.terminal import sync_backend_from_server
 
 
@@ -82,3 +82,45 @@ def restore(terminal_id: str):
     )
     if working_directory:
         click.echo(f"Working directory: {working_directory}")
+
+
+@terminal.command("search")
+@click.argument("query")
+@click.option("--terminal", "terminal_id", default=None, help="Only search this terminal.")
+@click.option("--since", default=None, help="Only output logged after this ISO-8601 time.")
+@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
+@click.option("--json", "as_json", is_flag=True, default=False, help="Emit the hits as JSON.")
+def search(query: str, terminal_id, since, limit: int, as_json: bool):
+    """Find which terminals printed QUERY (case-insensitive), newest first.
+
+    Log hits print an offset for GET /terminals/{id}/output/range; scrollback
+    hits come from deleted terminals' snapshots.
+    """
+    params = {"q": query, "limit": limit}
+    if terminal_id is not None:
+        params["terminal_id"] = terminal_id
+    if since is not None:
+        params["since"] = since
+    try:
+        response = requests.get(
+            f"{API_BASE_URL}/search/terminal-output", params=params, timeout=MCP_REQUEST_TIMEOUT
+        )
+    except requests.exceptions.ConnectionError:
+        raise click.ClickException("Failed to connect to cao-server")
+
+    if response.status_code != 200:
+        try:
+            detail = response.json().get("detail", response.text)
+        except ValueError:
+            detail = response.text
+        raise click.ClickException(f"Search failed: {detail}")
+
+    hits = response.json()
+    if as_json:
+        click.echo(json.dumps(hits, indent=2))
+        return
+    if not hits:
+        click.echo("No matches.")
+        return
+    for hit in hits:
+        click.echo(f"{hit['terminal_id']}  {hit['source']}@{hit['offset']}  {hit['snippet']}")
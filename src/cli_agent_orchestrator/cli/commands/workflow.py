@@ -22,8 +22,8 @@ import sys
 import time
 
 import click
-import requests
 
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import (
     API_BASE_URL,
     MCP_REQUEST_TIMEOUT,
@@ -1,59 +1,166 @@
-"""Main CLI entry point for CLI Agent Orchestrator."""
+"""Main CLI entry point for CLI Agent Orchestrator.
 
+Command modules are imported lazily: ``cao --version`` or ``cao terminal send``
+must not pay for FastAPI models, SQLAlchemy, libtmux or FastMCP that other
+commands pull in. Each subcommand is registered in ``LAZY_COMMANDS`` with its
+import path and a one-line summary, so ``cao --help`` lists every command
+without importing any of them. ``test/cli/test_main.py`` asserts the summaries
+stay in sync with the real command docstrings.
+"""
+
+import importlib
 from importlib.metadata import PackageNotFoundError, version
+from typing import Dict, List, NamedTuple, Optional
 
 import click
 
-from cli_agent_orchestrator.cli.commands.config import config
-from cli_agent_orchestrator.cli.commands.env import env
-from cli_agent_orchestrator.cli.commands.info import info
-from cli_agent_orchestrator.cli.commands.init import init
-from cli_agent_orchestrator.cli.commands.install import install
-from cli_agent_orchestrator.cli.commands.launch import launch
-from cli_agent_orchestrator.cli.commands.mcp_server import mcp_server
-from cli_agent_orchestrator.cli.commands.memory import memory
-from cli_agent_orchestrator.cli.commands.profile import profile
-from cli_agent_orchestrator.cli.commands.schedule import flow, schedule
-from cli_agent_orchestrator.cli.commands.session import session
-from cli_agent_orchestrator.cli.commands.shutdown import shutdown
-from cli_agent_orchestrator.cli.commands.skills import skills
-from cli_agent_orchestrator.cli.commands.terminal import terminal
-from cli_agent_orchestrator.cli.commands.tui import tui
-from cli_agent_orchestrator.cli.commands.update import update
-from cli_agent_orchestrator.cli.commands.workflow import workflow
-
 try:
     __version__ = version("cli-agent-orchestrator")
 except PackageNotFoundError:
     __version__ = "unknown"
 
 
-@click.group()
+class LazyCommand(NamedTuple):
+    """Where a subcommand lives and how it is summarised in ``cao --help``."""
+
+    import_path: str
+    summary: str
+    hidden: bool = False
+
+
+# Register commands. Keep the summary equal to the first line of the command's
+# docstring (or its short_help), and the import path as "module:attribute".
+LAZY_COMMANDS: Dict[str, LazyCommand] = {
+    "profile": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.profile:profile", "Manage agent profiles."
+    ),
+    "launch": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.launch:launch",
+        "Launch cao session with specified agent profile.",
+    ),
+    "config": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.config:config",
+        "Inspect and edit unified CAO configuration (settings.json).",
+    ),
+    "init": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.init:init",
+        "Initialize CLI Agent Orchestrator database.",
+    ),
+    "install": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.install:install",
+        "Install an agent from local store, built-in store, URL, or file path.",
+    ),
+    "shutdown": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.shutdown:shutdown",
+        "Shutdown tmux sessions and cleanup terminal records.",
+    ),
+    "schedule": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.schedule:schedule", "Manage scheduled agent flows."
+    ),
+    # deprecated alias for 'schedule' (issue #378)
+    "flow": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.schedule:flow",
+        "[Deprecated] Alias for 'cao schedule'.",
+        hidden=True,
+    ),
+    "env": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.env:env", "Manage CAO environment variables."
+    ),
+    "mcp-server": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.mcp_server:mcp_server", "Start the CAO MCP server."
+    ),
+    "info": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.info:info",
+        "Display information about the current session.",
+    ),
+    "memory": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.memory:memory", "Manage CAO memories."
+    ),
+    "skills": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.skills:skills", "Manage installed skills."
+    ),
+    "session": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.session:session", "Manage CAO sessions."
+    ),
+    "terminal": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.terminal:terminal", "Manage CAO terminals."
+    ),
+    "workflow": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.workflow:workflow",
+        "Author and inspect CAO workflow specs.",
+    ),
+    "update": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.update:update", "Update CAO to the latest version."
+    ),
+    # bundled Rust terminal UI (issue #321)
+    "tui": LazyCommand(
+        "cli_agent_orchestrator.cli.commands.tui:tui",
+        "Launch the terminal UI (bundled Rust binary).",
+    ),
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is resolved.
+
+    ``get_command`` imports and caches the real command on first use, so
+    dispatch, ``cao <cmd> --help`` and programmatic tree walks see the genuine
+    Click objects. ``format_commands`` renders the top-level listing from the
+    static summaries, so ``cao --help`` stays import-free too.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, LazyCommand]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, LazyCommand] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+        command = self._load(cmd_name)
+        # Cache on the group so later lookups skip the import machinery.
+        self.add_command(command, cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, _, attr = self.lazy_commands[cmd_name].import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command {cmd_name!r} resolved to a non-Click object")
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        visible = []
+        for name in self.list_commands(ctx):
+            loaded = self.commands.get(name)
+            if loaded is not None:
+                if not loaded.hidden:
+                    visible.append((name, loaded))
+            elif not self.lazy_commands[name].hidden:
+                visible.append((name, self.lazy_commands[name].summary))
+        if not visible:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name, _ in visible)
+        rows = []
+        for name, source in visible:
+            if isinstance(source, click.Command):
+                rows.append((name, source.get_short_help_str(limit)))
+            else:
+                summary = click.Command(name, help=source).get_short_help_str(limit)
+                rows.append((name, summary))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.version_option(__version__, "-V", "--version", prog_name="cao")
 def cli():
     """CLI Agent Orchestrator."""
 
 
-# Register commands
-cli.add_command(profile)
-cli.add_command(launch)
-cli.add_command(config)
-cli.add_command(init)
-cli.add_command(install)
-cli.add_command(shutdown)
-cli.add_command(schedule)
-cli.add_command(flow)  # deprecated alias for 'schedule' (issue #378)
-cli.add_command(env)
-cli.add_command(mcp_server)
-cli.add_command(info)
-cli.add_command(memory)
-cli.add_command(skills)
-cli.add_command(session)
-cli.add_command(terminal)
-cli.add_command(workflow)
-cli.add_command(update)
-cli.add_command(tui)  # bundled Rust terminal UI (issue #321)
-
-
 if __name__ == "__main__":
     cli()
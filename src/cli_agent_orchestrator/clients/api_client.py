@@ -0,0 +1,202 @@
+"""Pooled HTTP client for calls from CAO processes to ``cao-server``.
+
+The MCP servers, the CLI and ``utils/terminal.py`` talk to the API in tight
+sequences (create -> poll -> input -> poll -> output). One-shot
+``requests.get``/``requests.post`` calls open a fresh TCP connection for every
+call; under heavy fan-out that costs a handshake per request and leaves
+thousands of loopback sockets in TIME_WAIT.
+
+This module exposes the subset of the ``requests`` module API that call sites
+use (``get``/``post``/``put``/``patch``/``delete``/``request`` plus the
+exception types), backed by one keep-alive :class:`requests.Session` per
+process. Call sites import it under the ``requests`` name so their
+``except requests.HTTPError`` clauses and existing test patch points keep
+working unchanged::
+
+    from cli_agent_orchestrator.clients import api_client as requests
+
+When ``CAO_API_SOCKET`` names an existing Unix domain socket, requests to
+``API_BASE_URL`` are routed over it instead of TCP (``cao-server`` listens on
+the same path when the variable is set).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+from cli_agent_orchestrator.constants import API_BASE_URL, API_POOL_MAXSIZE, API_SOCKET_PATH
+
+logger = logging.getLogger(__name__)
+
+# Re-exported so ``api_client`` is a drop-in for the ``requests`` module at call sites.
+exceptions = requests.exceptions
+Response = requests.Response
+RequestException = requests.RequestException
+HTTPError = requests.HTTPError
+ConnectionError = requests.ConnectionError
+Timeout = requests.Timeout
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+class _UnixSocketConnection(HTTPConnection):
+    """urllib3 connection that dials a Unix domain socket instead of host:port."""
+
+    def __init__(self, *args: Any, socket_path: str, **kwargs: Any) -> None:
+        self._socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixSocketConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixSocketConnection  # type: ignore[assignment]
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Transport adapter sending every request through one Unix-socket pool.
+
+    Mounted on ``API_BASE_URL`` only, so the URL (and therefore the ``Host``
+    header the server validates) is unchanged; only the transport differs.
+    """
+
+    def __init__(self, socket_path: str, base_url: str = API_BASE_URL, **kwargs: Any) -> None:
+        self.socket_path = socket_path
+        # The pool's host/port only feed the Host header; the socket path is dialled.
+        parsed = urlsplit(base_url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port
+        self._unix_pool: Optional[_UnixSocketConnectionPool] = None
+        self._unix_pool_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _get_unix_pool(self) -> _UnixSocketConnectionPool:
+        with self._unix_pool_lock:
+            if self._unix_pool is None:
+                self._unix_pool = _UnixSocketConnectionPool(
+                    self._host,
+                    self._port,
+                    maxsize=self._pool_maxsize,
+                    socket_path=self.socket_path,
+                )
+            return self._unix_pool
+
+    def get_connection_with_tls_context(
+        self, request: Any, verify: Any, proxies: Any = None, cert: Any = None
+    ) -> _UnixSocketConnectionPool:
+        return self._get_unix_pool()
+
+    def get_connection(self, url: Any, proxies: Any = None) -> _UnixSocketConnectionPool:
+        return self._get_unix_pool()
+
+    def request_url(self, request: Any, proxies: Any) -> str:
+        # Never send an absolute-form target: a proxy never sits on a local socket.
+        return str(request.path_url)
+
+    def close(self) -> None:
+        super().close()
+        with self._unix_pool_lock:
+            if self._unix_pool is not None:
+                self._unix_pool.close()
+                self._unix_pool = None
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    # One-shot requests.get() never carried cookies between calls; keep it that way
+    # so a shared session cannot leak one caller's cookies into another's request.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=API_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if API_SOCKET_PATH and os.path.exists(API_SOCKET_PATH):
+        session.mount(
+            API_BASE_URL,
+            UnixSocketAdapter(API_SOCKET_PATH, API_BASE_URL, pool_maxsize=API_POOL_MAXSIZE),
+        )
+        logger.debug("Routing %s over Unix socket %s", API_BASE_URL, API_SOCKET_PATH)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    session = _session
+    if session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+            session = _session
+    return session
+
+
+def close_session() -> None:
+    """Close pooled connections; the next call builds a fresh session."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+
+
+def _reset_after_fork() -> None:
+    # A forked child must not share the parent's sockets; drop them without
+    # closing (closing would tear down the parent's connections too).
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.request`."""
+    return get_session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.get`."""
+    return get_session().get(url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.post`."""
+    return get_session().post(url, **kwargs)
+
+
+def put(url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.put`."""
+    return get_session().put(url, **kwargs)
+
+
+def patch(url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.patch`."""
+    return get_session().patch(url, **kwargs)
+
+
+def delete(url: str, **kwargs: Any) -> requests.Response:
+    """Pooled equivalent of :func:`requests.delete`."""
+    return get_session().delete(url, **kwargs)
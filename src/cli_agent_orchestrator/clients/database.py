@@ -295,6 +295,7 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def init_db() -> None:
     """Initialize database tables and apply schema migrations."""
+    _enable_incremental_auto_vacuum()
     _migrate_project_aliases_schema()
     Base.metadata.create_all(bind=engine)
     _restrict_db_file_permissions()
@@ -339,6 +340,28 @@ def _restrict_db_file_permissions() -> None:
             logger.warning(f"Could not restrict DB file permissions on {path}: {e}")
 
 
+def _enable_incremental_auto_vacuum() -> None:
+    """Create a brand-new database file with ``auto_vacuum=INCREMENTAL``.
+
+    Lets the workflow retention sweep hand freed pages back to the filesystem
+    with ``PRAGMA incremental_vacuum`` instead of leaving them on the freelist.
+    SQLite only accepts the mode before the first table is created, so this
+    runs first in ``init_db`` and touches only an empty file; an existing
+    database keeps its mode (switching it would need a full ``VACUUM``).
+    Failure is logged at debug and never raised.
+    """
+    import sqlite3
+
+    from cli_agent_orchestrator.constants import DATABASE_FILE
+
+    try:
+        with sqlite3.connect(str(DATABASE_FILE)) as conn:
+            if conn.execute("SELECT count(*) FROM sqlite_master").fetchone()[0] == 0:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    except Exception as e:  # noqa: BLE001 — a missing mode only keeps freed pages
+        logger.debug(f"auto_vacuum setup skipped: {e}")
+
+
 def _migrate_project_aliases_schema() -> None:
     """Rebuild project_aliases if it predates the alias-only primary key.
 
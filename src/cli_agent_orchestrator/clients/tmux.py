@@ -7,7 +7,7 @@ import shlex
 import subprocess
 import time
 import uuid
-from typing import Callable, Dict, List, Optional, TypeVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 import libtmux
 from libtmux.pane import Pane
@@ -847,6 +847,137 @@ class TmuxClient:
             logger.error(f"Failed to get history from {session_name}:{window_name}: {e}")
             raise
 
+    def get_histories(
+        self,
+        targets: Sequence[Tuple[str, str]],
+        tail_lines: Optional[int] = None,
+    ) -> Dict[Tuple[str, str], str]:
+        """Capture the tails of many windows in one ``tmux`` invocation.
+
+        ``get_history`` costs a session, window and pane listing plus a
+        ``capture-pane`` per window; the pipe-liveness watchdog probes every
+        enrolled terminal on each tick, so with dozens of terminals that is
+        hundreds of forks per tick. Here every window's ``capture-pane`` is
+        chained into a single ``tmux`` command line, each followed by a
+        ``display-message`` printing a per-call end marker that splits the
+        combined output back into per-window captures. Like
+        ``_kill_via_cli`` it goes straight through the tmux CLI rather than
+        libtmux.
+
+        Each window is captured at its first pane, the pane ``get_history``
+        reads, not at tmux's default target (the active pane), so both paths
+        read the same pane in a split window. One ``list-panes -a`` resolves
+        every window's first pane id up front; a window it does not list is
+        captured through ``get_history`` instead.
+
+        A target tmux cannot resolve fails the chain. When that happens every
+        target without a non-empty capture is retried through
+        ``get_history``, which tells a gone window (omitted) from a live one.
+
+        Returns:
+            Map of ``(session_name, window_name)`` to output, formatted exactly
+            as ``get_history`` formats it. Targets that could not be captured
+            are omitted.
+        """
+        lines = tail_lines if tail_lines is not None else TMUX_HISTORY_LINES
+        marker = f"__cao_capture_{uuid.uuid4().hex}__"
+        keys: List[Tuple[str, str]] = []
+        for session_name, window_name in dict.fromkeys(targets):
+            try:
+                validate_tmux_name(session_name, "session_name")
+                validate_tmux_name(window_name, "window_name")
+            except ValueError as e:
+                logger.error("Cannot build tmux capture target: %s", e)
+                continue
+            keys.append((session_name, window_name))
+        if not keys:
+            return {}
+
+        first_panes = self._first_pane_ids()
+        histories: Dict[Tuple[str, str], str] = {}
+        batch: List[Tuple[str, str]] = []
+        args: List[str] = ["tmux"]
+        for key in keys:
+            pane_id = first_panes.get(key)
+            if pane_id is None:
+                # Not listed: gone, or created after the listing.
+                try:
+                    histories[key] = self.get_history(*key, tail_lines=lines)
+                except Exception:
+                    pass
+                continue
+            if batch:
+                args.append(";")
+            args += ["capture-pane", "-e", "-p", "-S", f"-{lines}", "-t", pane_id]
+            args += [";", "display-message", "-p", marker]
+            batch.append(key)
+        if not batch:
+            return histories
+
+        try:
+            result = subprocess.run(
+                args, capture_output=True, text=True, errors="replace", check=False
+            )
+        except OSError as e:
+            logger.error("Failed to run batched tmux capture-pane: %s", e)
+            return histories
+
+        section: List[str] = []
+        pending = iter(batch)
+        for line in result.stdout.split("\n"):
+            if line != marker:
+                section.append(line)
+                continue
+            key = next(pending, None)
+            if key is None:
+                break
+            # libtmux drops trailing empty lines from command output; match
+            # it so batched and single captures of a pane compare equal.
+            while section and section[-1] == "":
+                section.pop()
+            histories[key] = "\n".join(section)
+            section = []
+
+        if result.returncode != 0:
+            for key in batch:
+                if histories.get(key):
+                    continue
+                histories.pop(key, None)
+                try:
+                    histories[key] = self.get_history(*key, tail_lines=lines)
+                except Exception:
+                    continue
+        return histories
+
+    @staticmethod
+    def _first_pane_ids() -> Dict[Tuple[str, str], str]:
+        """Map every ``(session_name, window_name)`` to its first pane's id.
+
+        ``list-panes -a`` lists windows in index order and their panes in
+        pane-index order, so the first row per window is ``Window.panes[0]``
+        (and, for a duplicated window name, the window
+        ``windows.get(window_name=...)`` returns). Returns an empty map when
+        tmux cannot be run.
+        """
+        try:
+            result = subprocess.run(
+                ["tmux", "list-panes", "-a", "-F", "#{session_name}:#{window_name}:#{pane_id}"],
+                capture_output=True,
+                text=True,
+                errors="replace",
+                check=False,
+            )
+        except OSError as e:
+            logger.error("Failed to list tmux panes: %s", e)
+            return {}
+        first: Dict[Tuple[str, str], str] = {}
+        for line in result.stdout.splitlines():
+            # Validated names cannot contain ':', so the split is unambiguous.
+            parts = line.split(":")
+            if len(parts) == 3:
+                first.setdefault((parts[0], parts[1]), parts[2])
+        return first
+
     def list_sessions(self) -> List[Dict[str, str]]:
         """List all tmux sessions.
 
@@ -1043,6 +1174,28 @@ class TmuxClient:
             logger.error(f"Failed to get pane command for {session_name}:{window_name}: {e}")
             return None
 
+    def get_pane_pid(self, session_name: str, window_name: str) -> Optional[int]:
+        """Get the PID of the process tmux spawned in a pane (its shell).
+
+        ``pane_pid`` comes with the pane listing itself, so unlike
+        ``get_pane_current_command`` no ``display-message`` is needed. Returns
+        None when it cannot be determined; callers treat that as "unknown".
+        """
+        try:
+            session = self._find_session(session_name)
+            if not session:
+                return None
+            window = self._find_window(session, session_name, window_name)
+            if not window:
+                return None
+            pane = self._find_active_pane(window, session_name, window_name)
+            if pane and pane.pane_pid:
+                return int(pane.pane_pid)
+            return None
+        except Exception as e:
+            logger.error(f"Failed to get pane pid for {session_name}:{window_name}: {e}")
+            return None
+
     def pipe_pane(self, session_name: str, window_name: str, file_path: str) -> None:
         """Start piping pane output to file.
 
@@ -52,6 +52,14 @@ def _env_positive_float(name: str, default: float) -> float:
 # All CAO-managed tmux sessions are prefixed to distinguish them from user sessions
 SESSION_PREFIX = "cao-"
 
+# Warm worktrees for ``use_worktree`` terminals (services/worktree_pool.py).
+# Up to WORKTREE_POOL_SIZE detached checkouts are kept per repository once it
+# has spawned a worktree terminal; one idle longer than WORKTREE_POOL_IDLE_TTL
+# seconds is removed, and all of them at server shutdown. Each one is a full
+# checkout on disk, so the pool is opt-in: the default size of 0 disables it.
+WORKTREE_POOL_SIZE = max(_env_int("CAO_WORKTREE_POOL_SIZE", 0), 0)
+WORKTREE_POOL_IDLE_TTL = max(_env_float("CAO_WORKTREE_POOL_IDLE_TTL", 900.0), 1.0)
+
 # =============================================================================
 # Provider Configuration
 # =============================================================================
@@ -126,6 +134,25 @@ LOG_DIR = CAO_HOME_DIR / "logs"
 TERMINAL_LOG_DIR = LOG_DIR / "terminal"  # Per-terminal log files for pipe-pane output
 TERMINAL_LOG_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
 
+# Segmented terminal logs (services/terminal_log_store.py). The live
+# ``{id}.log`` is sealed into a compressed segment once it reaches
+# TERMINAL_LOG_SEGMENT_BYTES; sealed segments are compressed in independent
+# frames of TERMINAL_LOG_FRAME_BYTES so a ranged read only inflates the frames
+# it touches. At most TERMINAL_LOG_MAX_OPEN_FILES live segments keep an open
+# append handle between writes.
+TERMINAL_LOG_SEGMENT_BYTES = max(_env_int("CAO_TERMINAL_LOG_SEGMENT_BYTES", 64 * 1024 * 1024), 1)
+TERMINAL_LOG_FRAME_BYTES = 1024 * 1024
+TERMINAL_LOG_MAX_OPEN_FILES = max(_env_int("CAO_TERMINAL_LOG_MAX_OPEN_FILES", 64), 1)
+
+# Terminal output search (services/terminal_search.py). LogWriter batches feed
+# an in-memory token index split into buckets of at most
+# TERMINAL_SEARCH_BUCKET_BYTES of log or TERMINAL_SEARCH_BUCKET_SECONDS of
+# wall time. Only the newest TERMINAL_SEARCH_MAX_BUCKETS buckets (across all
+# terminals) are kept, which bounds the index's memory; 0 disables indexing.
+TERMINAL_SEARCH_BUCKET_BYTES = 1024 * 1024
+TERMINAL_SEARCH_BUCKET_SECONDS = 60.0
+TERMINAL_SEARCH_MAX_BUCKETS = max(_env_int("CAO_TERMINAL_SEARCH_MAX_BUCKETS", 256), 0)
+
 # FIFO directory for event-driven terminal output streaming
 FIFO_DIR = CAO_HOME_DIR / "fifos"  # Named pipes for tmux pipe-pane streaming
 FIFO_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
@@ -248,6 +275,24 @@ PYTE_SCREEN_ROWS = 200
 # per-chunk rendered detection produces (measured worse than the raw path).
 PYTE_QUIESCENCE_DELAY_S = 0.2
 
+# Coalescing window (seconds) for event-driven provider startup
+# (services/startup_sequencer.py). Once a startup output chunk arrives, the
+# sequencer waits this long for the rest of the repaint before re-checking the
+# screen for trust/bypass prompts, so a dialog is answered within one window of
+# rendering instead of on the next fixed poll tick. 0 re-checks on every chunk.
+STARTUP_COALESCE_WINDOW_S = max(_env_float("CAO_STARTUP_COALESCE_WINDOW_S", 0.1), 0.0)
+
+# Terminal stream recording (services/stream_recorder.py). When set, every new
+# pipe-pane terminal records the exact coalesced output batches the FIFO
+# multiplexer publishes, with their timing and input boundaries, to
+# ``{dir}/{terminal_id}.cast.gz`` (asciicast v2). Replay them through
+# StatusMonitor with ``services/stream_replay.py`` to measure provider status
+# detection cost and accuracy offline. Unset (the default) records nothing.
+_stream_record_raw = os.environ.get("CAO_STREAM_RECORD_DIR", "").strip()
+STREAM_RECORD_DIR: "Path | None" = (
+    Path(_stream_record_raw).expanduser() if _stream_record_raw else None
+)
+
 # Eager inbox delivery: when enabled, deliver queued messages to terminals in
 # PROCESSING state for providers that declare
 # accepts_input_while_processing=True. Eliminates latency between agent turns
@@ -298,6 +343,27 @@ AGENT_CONTEXT_DIR = CAO_HOME_DIR / "agent-context"
 # Local agent store for custom agent profiles
 LOCAL_AGENT_STORE_DIR = CAO_HOME_DIR / "agent-store"
 
+# Seconds between background rescans of the agent profile catalog in cao-server
+# (``api.main.profile_catalog_daemon``). While the daemon runs, profile listing
+# and ``find_profiles`` answer from the last scan without touching the
+# filesystem, so a profile added outside CAO appears within one interval. 0 (the
+# default) disables the daemon; each listing then revalidates the per-file cache.
+PROFILE_CATALOG_POLL_INTERVAL = max(_env_float("CAO_PROFILE_CATALOG_POLL_INTERVAL", 0.0), 0.0)
+
+# Seconds between settings.json checks by cao-server's settings watcher
+# (``api.main.settings_watcher_daemon``). While it runs, hot-path settings reads
+# are served from the in-memory snapshot without a stat(), and an edit to
+# settings.json reaches them (and ``subscribe_settings`` listeners) within one
+# interval.
+SETTINGS_WATCH_INTERVAL = max(_env_float("CAO_SETTINGS_WATCH_INTERVAL", 1.0), 0.1)
+
+# Seconds between full fleet re-reads (sessions + terminal rows) by the AG-UI
+# fleet projection (``services/fleet_state.py``) while a dashboard is connected.
+# Lifecycle and status events keep the projection current in between; the
+# periodic pass only catches changes that raised no event (a tmux session killed
+# by hand).
+AGUI_FLEET_RECONCILE_INTERVAL = max(_env_float("CAO_AGUI_FLEET_RECONCILE_INTERVAL", 30.0), 1.0)
+
 # Local skill store for installed CAO skills
 SKILLS_DIR = CAO_HOME_DIR / "skills"
 
@@ -355,6 +421,17 @@ API_BASE_URL = f"http://{SERVER_HOST}:{SERVER_PORT}"
 # Default timeout (seconds) for HTTP calls to the CAO API server.
 MCP_REQUEST_TIMEOUT = 30
 
+# Optional Unix domain socket for local calls to the CAO API server. When set,
+# ``cao-server`` listens on this path in addition to TCP, and the pooled client
+# in ``clients/api_client.py`` routes API_BASE_URL requests over it, avoiding
+# loopback port exhaustion under heavy fan-out. Unset (the default) keeps TCP.
+API_SOCKET_PATH = os.path.expanduser(os.environ.get("CAO_API_SOCKET", "")) or None
+
+# Keep-alive connections the pooled API client holds per process. Sized for
+# concurrent MCP tool calls plus the CLI's status polling; excess requests still
+# succeed but their connections are not returned to the pool.
+API_POOL_MAXSIZE = 16
+
 
 # Operators can extend network allowlists via the env vars handled below.
 # Same comma-separated pattern as ``CAO_PROFILE_ALLOWED_HOSTS`` in install_service.
@@ -576,6 +653,18 @@ MEMORY_SCOPE_BUDGET_CHARS = 1000
 # ``cao memory export|import --format``.
 MEMORY_ARCHIVE_DEFAULT_FORMAT = "okf"
 
+# Worker threads a bulk memory session (archive import/export) uses to read,
+# parse and secret-scan topics ahead of the sequential store/write pass.
+MEMORY_BULK_WORKERS = max(_env_int("CAO_MEMORY_BULK_WORKERS", 8), 1)
+
+# First-message memory injection (services/memory_prefetch.py). create_terminal
+# builds each worker's <cao-memory> block in the background; send_input waits at
+# most MEMORY_PREFETCH_DEADLINE_S for it and otherwise sends the first message
+# without memory. A block older than MEMORY_PREFETCH_TTL_S is rebuilt (under the
+# same deadline) so memories stored since the spawn are not missed.
+MEMORY_PREFETCH_DEADLINE_S = max(_env_float("CAO_MEMORY_PREFETCH_DEADLINE_S", 0.5), 0.0)
+MEMORY_PREFETCH_TTL_S = max(_env_float("CAO_MEMORY_PREFETCH_TTL_S", 300.0), 1.0)
+
 # RESERVED — intentionally unreferenced today. These belong to the future
 # CAO-native tar.gz archive backend (parked branch
 # ``docs/memory-import-export``, #345 follow-up): tar-input hardening caps
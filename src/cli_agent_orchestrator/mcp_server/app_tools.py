@@ -33,8 +33,7 @@ import json
 import logging
 from typing import Any, Dict, List, Optional
 
-import requests
-
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL, MCP_REQUEST_TIMEOUT
 from cli_agent_orchestrator.ext_apps import (
     AGENT_RESOURCE_URI,
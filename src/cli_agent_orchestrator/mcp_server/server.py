@@ -7,10 +7,10 @@ import re
 import time
 from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
-import requests
 from fastmcp import FastMCP
 from pydantic import Field
 
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import (
     API_BASE_URL,
     DEFAULT_PROVIDER,
@@ -26,7 +26,7 @@ from cli_agent_orchestrator.mcp_server.models import HandoffResult
 from cli_agent_orchestrator.models.inbox import OrchestrationType
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.models.workflow_runtime import ReturnAck
-from cli_agent_orchestrator.services.memory_service import (
+from cli_agent_orchestrator.services.memory_errors import (
     MEMORY_DISABLED_MESSAGE,
     MemoryDisabledError,
     MemoryPartialWriteError,
@@ -443,11 +443,16 @@ def _send_user_prompt_answer(terminal_id: str, answer: str) -> Dict[str, Any]:
         return {"success": False, "terminal_id": terminal_id, "error": str(exc)}
 
 
+_HERMES_PICKER_TAIL_CHARS = 8192
+
+
 def _try_send_hermes_prompt_answer(terminal_id: str, answer: str) -> Optional[Dict[str, Any]]:
     """Answer Hermes clarify pickers with navigation keys when needed."""
+    # The picker is drawn at the bottom of the screen; a server-side tail keeps
+    # this check from shipping the whole rolling buffer.
     output_response = requests.get(
         f"{API_BASE_URL}/terminals/{terminal_id}/output",
-        params={"mode": "full"},
+        params={"mode": "full", "max_chars": _HERMES_PICKER_TAIL_CHARS},
         timeout=_mcp_timeout(),
     )
     output_response.raise_for_status()
@@ -804,7 +809,8 @@ async def _handoff_impl(
         # plus headroom; the server enforces the per-step timeout internally.
         client_timeout = float(timeout) + 180.0
         try:
-            response = requests.post(
+            response = await asyncio.to_thread(
+                requests.post,
                 f"{API_BASE_URL}/terminals/run-step",
                 json=payload,
                 timeout=client_timeout,
@@ -1273,7 +1279,8 @@ if ENABLE_WORKING_DIRECTORY:
             ),
         ),
     ) -> Dict[str, Any]:
-        return _assign_impl(
+        return await asyncio.to_thread(
+            _assign_impl,
             agent_profile,
             message,
             working_directory,
@@ -1306,7 +1313,8 @@ else:
             ),
         ),
     ) -> Dict[str, Any]:
-        return _assign_impl(
+        return await asyncio.to_thread(
+            _assign_impl,
             agent_profile,
             message,
             None,
@@ -1429,7 +1437,7 @@ async def send_message(
     Returns:
         Dict with success status and message details
     """
-    return _send_message_impl(receiver_id, message)
+    return await asyncio.to_thread(_send_message_impl, receiver_id, message)
 
 
 @mcp.tool()
@@ -1461,7 +1469,8 @@ async def emit_ui(
         Dict with the emitted event id and component name.
     """
     terminal_id = os.getenv("CAO_TERMINAL_ID")
-    response = requests.post(
+    response = await asyncio.to_thread(
+        requests.post,
         f"{API_BASE_URL}/agui/v1/emit_ui",
         json={
             "component": component,
@@ -1494,7 +1503,7 @@ async def answer_user_prompt(
     Use this only when the target terminal status is WAITING_USER_ANSWER. Normal
     task delivery should use assign, handoff, or send_message instead.
     """
-    return _send_user_prompt_answer(terminal_id, answer)
+    return await asyncio.to_thread(_send_user_prompt_answer, terminal_id, answer)
 
 
 @mcp.tool(description=LOAD_SKILL_TOOL_DESCRIPTION)
@@ -1502,7 +1511,7 @@ async def load_skill(
     name: str = Field(description="Name of the skill to retrieve"),
 ) -> Any:
     """Retrieve skill content from cao-server."""
-    return _load_skill_impl(name)
+    return await asyncio.to_thread(_load_skill_impl, name)
 
 
 @mcp.tool()
@@ -1739,7 +1748,7 @@ async def list_siblings(
     Use this to find other agents working in the same project/folder/tenant,
     then message them with send_message using the returned id.
     """
-    return _list_siblings_impl(depth, cross_session)
+    return await asyncio.to_thread(_list_siblings_impl, depth, cross_session)
 
 
 @mcp.tool()
@@ -1769,7 +1778,7 @@ async def update_metadata(
     sibling that can discover you -- treat it as you would any other
     inter-agent message, not as private state.
     """
-    return _update_metadata_impl(metadata)
+    return await asyncio.to_thread(_update_metadata_impl, metadata)
 
 
 # =============================================================================
@@ -2368,7 +2377,8 @@ async def workflow_return(
         payload["output_schema"] = output_schema
 
     try:
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{API_BASE_URL}/workflows/runs/{run_id}/steps/{step_id}/output",
             json=payload,
             timeout=_mcp_timeout(),
@@ -2440,7 +2450,8 @@ async def workflow_run(
         # The server awaits the WHOLE run inline (Q1=A), so this blocks for the full
         # run duration — use the worst-case-covering run timeout, NOT the short
         # per-call _mcp_timeout() (mirrors handoff's timeout + 180.0 reasoning).
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{API_BASE_URL}/workflows/runs",
             json=payload,
             timeout=WORKFLOW_RUN_REQUEST_TIMEOUT,
@@ -2477,7 +2488,8 @@ async def workflow_resume(
     try:
         # Resume re-drives the WHOLE run inline, so block for the full run duration
         # using the worst-case run timeout, NOT the short per-call _mcp_timeout().
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{API_BASE_URL}/workflows/runs/{run_id}/resume",
             timeout=WORKFLOW_RUN_REQUEST_TIMEOUT,
         )
@@ -2509,7 +2521,8 @@ async def workflow_cancel(
     run settles to CANCELLED.
     """
     try:
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{API_BASE_URL}/workflows/runs/{run_id}/cancel",
             timeout=_mcp_timeout(),
         )
@@ -2568,7 +2581,8 @@ async def workflow_start(
         payload["run_id"] = run_id
     try:
         # Async submit — the normal per-call timeout, NOT the long blocking one (TR-1).
-        response = requests.post(
+        response = await asyncio.to_thread(
+            requests.post,
             f"{API_BASE_URL}/workflows/runs:submit",
             json=payload,
             timeout=_mcp_timeout(),
@@ -2601,7 +2615,8 @@ async def workflow_status(
     structured envelope on EVERY path — never raises into the agent loop (EV-1).
     """
     try:
-        response = requests.get(
+        response = await asyncio.to_thread(
+            requests.get,
             f"{API_BASE_URL}/workflows/runs/{run_id}",
             timeout=_mcp_timeout(),
         )
@@ -2641,7 +2656,8 @@ async def workflow_result(
     unaffected — read them from ``steps[].output``.
     """
     try:
-        response = requests.get(
+        response = await asyncio.to_thread(
+            requests.get,
             f"{API_BASE_URL}/workflows/runs/{run_id}/result",
             timeout=_mcp_timeout(),
         )
@@ -2672,7 +2688,8 @@ async def workflow_list(
     if isinstance(state, str):
         params["state"] = state
     try:
-        response = requests.get(
+        response = await asyncio.to_thread(
+            requests.get,
             f"{API_BASE_URL}/workflows/runs",
             params=params,
             timeout=_mcp_timeout(),
@@ -2708,7 +2725,8 @@ async def workflow_wait(
     deadline = time.monotonic() + WORKFLOW_RUN_REQUEST_TIMEOUT
     while True:
         try:
-            response = requests.get(
+            response = await asyncio.to_thread(
+                requests.get,
                 f"{API_BASE_URL}/workflows/runs/{run_id}",
                 timeout=_mcp_timeout(),
             )
@@ -2734,7 +2752,8 @@ async def workflow_wait(
 
     # Terminal — fetch the retained result for the full envelope (MR-2).
     try:
-        result_response = requests.get(
+        result_response = await asyncio.to_thread(
+            requests.get,
             f"{API_BASE_URL}/workflows/runs/{run_id}/result",
             timeout=_mcp_timeout(),
         )
@@ -2855,7 +2874,8 @@ async def workflow_events(
     state: Optional[str] = None
 
     try:
-        response = requests.get(
+        response = await asyncio.to_thread(
+            requests.get,
             f"{API_BASE_URL}/workflows/runs/{run_id}/events",
             params=params,
             headers=headers,
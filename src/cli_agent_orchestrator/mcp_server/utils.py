@@ -9,8 +9,7 @@ enforced by ``test/test_http_only_boundary.py``.
 import logging
 from typing import Any, Dict, Optional
 
-import requests
-
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL, MCP_REQUEST_TIMEOUT
 from cli_agent_orchestrator.security.auth import get_local_bearer
 
@@ -1,11 +1,13 @@
 """CAO operations MCP server implementation."""
 
+import asyncio
+import threading
 from typing import Annotated, Any, Dict, List, Optional
 
-import requests  # type: ignore[import-untyped]
 from fastmcp import FastMCP
 from pydantic import Field
 
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL
 from cli_agent_orchestrator.ops_mcp_server.models import (
     InstallResult,
@@ -86,6 +88,39 @@ def _request_json(
         return None, f"{operation} failed: invalid JSON response ({exc})"
 
 
+# Log cursor of the last full-mode output read per terminal. The next full
+# read passes it as ``since`` so polling a chatty worker only transfers what it
+# printed in between.
+_output_cursors: Dict[str, str] = {}
+_output_cursors_lock = threading.Lock()
+
+
+def _output_params(
+    terminal_id: str, mode: str, max_chars: Optional[int], new_output_only: bool
+) -> Dict[str, Any]:
+    """Query params for ``GET /terminals/{id}/output`` (cursor and server-side cap)."""
+    params: Dict[str, Any] = {"mode": mode}
+    if max_chars is not None and max_chars > 0:
+        params["max_chars"] = max_chars
+    if mode == "full" and new_output_only:
+        with _output_cursors_lock:
+            cursor = _output_cursors.get(terminal_id)
+        if cursor:
+            params["since"] = cursor
+    return params
+
+
+def _remember_output_cursor(terminal_id: str, mode: str, data: Any) -> None:
+    # Only full reads advance the cursor: a 'last' read returns the extracted
+    # final message, not everything printed up to its cursor.
+    if mode != "full" or not isinstance(data, dict):
+        return
+    cursor = data.get("cursor")
+    if isinstance(cursor, str) and cursor:
+        with _output_cursors_lock:
+            _output_cursors[terminal_id] = cursor
+
+
 def _serialize_allowed_tools(allowed_tools: Optional[List[str]]) -> Optional[str]:
     """Serialize allowed tools for the session creation API."""
     if not allowed_tools:
@@ -120,8 +155,8 @@ async def _launch_session_impl(
         params["allowed_tools"] = serialized_allowed_tools
 
     body = {"initial_message": initial_message} if initial_message is not None else None
-    session_data, error = _request_json(
-        "post", "/sessions", params=params, json=body, operation="Launch session"
+    session_data, error = await asyncio.to_thread(
+        _request_json, "post", "/sessions", params=params, json=body, operation="Launch session"
     )
     if error:
         return LaunchResult(
@@ -163,7 +198,9 @@ async def list_profiles() -> ProfileListResult:
     Returns:
         ProfileListResult with success status and profiles list
     """
-    data, error = _request_json("get", "/agents/profiles", operation="List profiles")
+    data, error = await asyncio.to_thread(
+        _request_json, "get", "/agents/profiles", operation="List profiles"
+    )
     if error:
         return ProfileListResult(success=False, message=error)
     if isinstance(data, list):
@@ -189,7 +226,8 @@ async def get_profile_details(
     Returns:
         Dict with profile fields, or {"success": False, "message": ...} on error
     """
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "get",
         f"/agents/profiles/{name}",
         operation=f"Get profile details for '{name}'",
@@ -253,7 +291,8 @@ async def install_profile(
     if env_vars:
         body["env_vars"] = env_vars
 
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "post",
         "/agents/profiles/install",
         json=body,
@@ -353,7 +392,8 @@ async def send_session_message(
     Returns:
         SendMessageResult with success status and target terminal_id
     """
-    _, error = _request_json(
+    _, error = await asyncio.to_thread(
+        _request_json,
         "post",
         f"/terminals/{terminal_id}/inbox/messages",
         params={"sender_id": "cao-ops-mcp", "message": message},
@@ -373,6 +413,7 @@ def _read_session_output_impl(
     session_name: Optional[str],
     mode: Optional[str],
     max_chars: Optional[int],
+    new_output_only: bool = True,
 ) -> JsonDict:
     """Resolve a terminal and return its captured output (sync; mirrors other helpers)."""
     normalized = (mode or "full").lower()
@@ -423,25 +464,31 @@ def _read_session_output_impl(
                 "terminals": terminals,
             }
 
+    params = _output_params(resolved_terminal_id, normalized, max_chars, new_output_only)
     data, error = _request_json(
         "get",
         f"/terminals/{resolved_terminal_id}/output",
-        params={"mode": normalized},
+        params=params,
         operation=f"Read output for terminal '{resolved_terminal_id}'",
     )
     if error:
         return {"success": False, "message": error}
     if not isinstance(data, dict) or not isinstance(data.get("output"), str):
         return {"success": False, "message": "Read output failed: invalid response payload"}
+    _remember_output_cursor(resolved_terminal_id, normalized, data)
 
+    # The server applies max_chars itself; the local cap only matters against
+    # a server that predates it.
     output = data["output"]
-    total_chars = len(output)
-    truncated = False
-    if max_chars is not None and max_chars > 0 and total_chars > max_chars:
+    total_chars = data.get("total_chars")
+    if not isinstance(total_chars, int):
+        total_chars = len(output)
+    truncated = bool(data.get("truncated"))
+    if max_chars is not None and max_chars > 0 and len(output) > max_chars:
         output = output[-max_chars:]
         truncated = True
 
-    return {
+    result: JsonDict = {
         "success": True,
         "terminal_id": resolved_terminal_id,
         "mode": normalized,
@@ -449,6 +496,9 @@ def _read_session_output_impl(
         "truncated": truncated,
         "total_chars": total_chars,
     }
+    if "cursor" in data:
+        result["incremental"] = "since" in params and not data.get("reset")
+    return result
 
 
 @mcp.tool()
@@ -485,8 +535,16 @@ async def read_session_output(
             "in the result. Values <= 0 are treated as no cap."
         ),
     ] = None,
+    new_output_only: Annotated[
+        bool,
+        Field(
+            description="In 'full' mode, return only output printed since this server last "
+            "read the terminal in 'full' mode (the result has incremental=true). Set False "
+            "to re-read the whole rolling buffer."
+        ),
+    ] = True,
 ) -> JsonDict:
-    """Read a CAO terminal's captured scrollback with a deterministic full-buffer default.
+    """Read a CAO terminal's captured scrollback, by default only what is new.
 
     Defaults to mode='full' because raw rolling-buffer output is deterministic and
     best for scrollback/debugging. Use get_terminal_output, which defaults to
@@ -495,17 +553,26 @@ async def read_session_output(
     (when the session has exactly one terminal) and max_chars tail-capping, which
     get_terminal_output does not provide.
 
+    'full' reads default to new_output_only=True, so repeated reads of the same
+    terminal are incremental: only output printed since the previous 'full' read
+    is returned (incremental=true). Pass new_output_only=False to re-read the
+    whole rolling buffer.
+
     Args:
         terminal_id: Target terminal ID (primary key)
         session_name: Convenience alternative; resolved to a terminal when unambiguous
         mode: 'full' (default, rolling buffer) or 'last' (provider-extracted)
         max_chars: Optional tail cap on returned characters
+        new_output_only: Continue from the previous 'full' read (default True)
 
     Returns:
-        Dict {success, terminal_id, mode, output, truncated, total_chars}, or
-        {success: False, message[, terminals]} on error / ambiguous session
+        Dict {success, terminal_id, mode, output, truncated, total_chars[,
+        incremental]}, or {success: False, message[, terminals]} on error /
+        ambiguous session
     """
-    return _read_session_output_impl(terminal_id, session_name, mode, max_chars)
+    return await asyncio.to_thread(
+        _read_session_output_impl, terminal_id, session_name, mode, max_chars, new_output_only
+    )
 
 
 @mcp.tool()
@@ -526,7 +593,8 @@ async def get_terminal_status(
         Dict with id, name, provider, session_name, agent_profile, status,
         last_active — or {"success": False, "message": ...} on error
     """
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "get",
         f"/terminals/{terminal_id}",
         operation=f"Get terminal status for '{terminal_id}'",
@@ -552,6 +620,13 @@ async def get_terminal_output(
             )
         ),
     ] = "last",
+    new_output_only: Annotated[
+        bool,
+        Field(
+            description="In 'full' mode, return only output printed since this server last "
+            "read the terminal in 'full' mode. Set False to re-read the whole rolling buffer."
+        ),
+    ] = True,
 ) -> JsonDict:
     """Read a worker terminal's output with a completed-message-oriented default.
 
@@ -566,6 +641,7 @@ async def get_terminal_output(
     Args:
         terminal_id: Target terminal ID
         mode: 'last' (final response, default) or 'full' (rolling buffer)
+        new_output_only: In 'full' mode, continue from the previous 'full' read
 
     Returns:
         Dict with output and mode, or {"success": False, "message": ...} on error
@@ -576,15 +652,17 @@ async def get_terminal_output(
             "success": False,
             "message": f"Get terminal output failed: mode must be 'last' or 'full', got '{mode}'",
         }
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "get",
         f"/terminals/{terminal_id}/output",
-        params={"mode": normalized},
+        params=_output_params(terminal_id, normalized, None, new_output_only),
         operation=f"Get terminal output for '{terminal_id}'",
     )
     if error:
         return {"success": False, "message": error}
     if isinstance(data, dict):
+        _remember_output_cursor(terminal_id, normalized, data)
         return data
     return {"success": False, "message": "Get terminal output failed: invalid response payload"}
 
@@ -596,7 +674,9 @@ async def list_sessions() -> SessionListResult:
     Returns:
         SessionListResult with success status and sessions list
     """
-    data, error = _request_json("get", "/sessions", operation="List sessions")
+    data, error = await asyncio.to_thread(
+        _request_json, "get", "/sessions", operation="List sessions"
+    )
     if error:
         return SessionListResult(success=False, message=error)
     if isinstance(data, list):
@@ -622,7 +702,8 @@ async def get_session_info(
     Returns:
         Dict with session fields, or {"success": False, "message": ...} on error
     """
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "get",
         f"/sessions/{session_name}",
         operation=f"Get session info for '{session_name}'",
@@ -648,7 +729,8 @@ async def shutdown_session(
     Returns:
         Dict with success status and cleanup details, or failure dict on error
     """
-    data, error = _request_json(
+    data, error = await asyncio.to_thread(
+        _request_json,
         "delete",
         f"/sessions/{session_name}",
         operation=f"Shutdown session '{session_name}'",
@@ -79,18 +79,16 @@ class EventLogPublisher(CaoPlugin):
 
     @hook("post_create_terminal")
     async def on_post_create_terminal(self, event: PostCreateTerminalEvent) -> None:
-        """Record a terminal launch."""
-
-        self._emit(
-            event.event_type,
-            event.terminal_id,
-            event.session_id,
-            {
-                "event_type": event.event_type,
-                "provider": event.provider,
-                "agent_name": event.agent_name,
-            },
-        )
+        """Record a terminal launch, with its startup phase timings when known."""
+
+        detail = {
+            "event_type": event.event_type,
+            "provider": event.provider,
+            "agent_name": event.agent_name,
+        }
+        if event.startup_timings:
+            detail["startup_timings"] = dict(event.startup_timings)
+        self._emit(event.event_type, event.terminal_id, event.session_id, detail)
 
     @hook("post_create_session")
     async def on_post_create_session(self, event: PostCreateSessionEvent) -> None:
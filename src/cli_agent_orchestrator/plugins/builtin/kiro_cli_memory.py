@@ -29,10 +29,8 @@ import logging
 from pathlib import Path
 
 from cli_agent_orchestrator.backends.registry import get_backend
-from cli_agent_orchestrator.clients.database import get_terminal_metadata
 from cli_agent_orchestrator.plugins import PostCreateTerminalEvent, hook
 from cli_agent_orchestrator.plugins.base import CaoPlugin
-from cli_agent_orchestrator.services.memory_service import MemoryService
 from cli_agent_orchestrator.utils.atomic_file import locked_atomic_rewrite
 
 logger = logging.getLogger(__name__)
@@ -74,6 +72,8 @@ class KiroCliMemoryPlugin(CaoPlugin):
             )
             return
 
+        from cli_agent_orchestrator.services.memory_service import MemoryService
+
         try:
             context_block = MemoryService().get_memory_context_for_terminal(event.terminal_id)
         except Exception as exc:
@@ -127,6 +127,11 @@ class KiroCliMemoryPlugin(CaoPlugin):
     def _resolve_working_directory(self, event: PostCreateTerminalEvent) -> str | None:
         """Look up the pane's working directory for the terminal via backend."""
 
+        # Imported lazily (as is MemoryService): cao-mcp-server loads every
+        # cao.plugins entry point for on_mcp_server and must not pay for
+        # SQLAlchemy or the memory service at start-up.
+        from cli_agent_orchestrator.clients.database import get_terminal_metadata
+
         metadata = get_terminal_metadata(event.terminal_id)
         if metadata is None:
             return None
@@ -42,6 +42,13 @@ class McpAppsPlugin(CaoPlugin):
     """Registers the CAO MCP Apps surface on the FastMCP server at startup."""
 
     def on_mcp_server(self, mcp: Any) -> None:
+        # Default-off: every registration below is a no-op when the surface is
+        # disabled, so return before importing the MCP App stack (app_tools
+        # pulls FastAPI through security/auth) and keep cao-mcp-server start-up
+        # lean for every provider CLI that spawns one.
+        if not _surface_enabled():
+            return
+
         # Imported lazily so plugin discovery never pulls the MCP App stack at
         # import time (and to avoid an import cycle through mcp_server).
         from cli_agent_orchestrator.ext_apps import advertise_capability, register_widget
@@ -57,7 +64,7 @@ class McpAppsPlugin(CaoPlugin):
         # port-forwarded host isn't surprised. Set ``AUTH0_DOMAIN`` or
         # ``CAO_AUTH_JWKS_URI`` to enforce ``cao:read`` / ``cao:write`` /
         # ``cao:admin`` scopes on mutations.
-        if _surface_enabled() and not is_auth_enabled():
+        if not is_auth_enabled():
             logger.warning(
                 "CAO_MCP_APPS_ENABLED is set but no IdP is configured "
                 "(AUTH0_DOMAIN / CAO_AUTH_JWKS_URI unset): the MCP Apps surface is "
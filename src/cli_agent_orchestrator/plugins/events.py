@@ -70,6 +70,10 @@ class PostCreateTerminalEvent(CaoEvent):
     terminal_id: str = ""
     agent_name: str | None = None
     provider: str = ""
+    # Seconds from the start of provider initialize() to the end of each
+    # startup phase (services/startup_sequencer.py); None when the provider
+    # records none or its init is still running (deferred init).
+    startup_timings: dict[str, float] | None = None
 
 
 @dataclass
@@ -23,7 +23,7 @@ import logging
 import re
 import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 
@@ -73,6 +73,9 @@ class BaseProvider(ABC):
         self._allowed_tools: Optional[List[str]] = allowed_tools
         self._skill_prompt: Optional[str] = skill_prompt
         self._shell_baseline: Optional[str] = None
+        # Per-phase startup timings (services/startup_sequencer.py), filled in
+        # by initialize() for providers that run a StartupSequencer.
+        self._startup_timings: Optional[Dict[str, float]] = None
         # Native-status (herdr) dispatch tracking. _task_dispatched disambiguates
         # herdr's ambiguous "idle" (pre-first-turn IDLE vs post-turn COMPLETED);
         # the two *_first_detected stamps drive the post-completion buffer-flush
@@ -95,6 +98,16 @@ class BaseProvider(ABC):
     def shell_baseline(self, value: Optional[str]) -> None:
         self._shell_baseline = value
 
+    @property
+    def startup_timings(self) -> Optional[Dict[str, float]]:
+        """Seconds from the start of initialize() to the end of each startup phase.
+
+        Keys are ``STARTUP_PHASES`` from ``services/startup_sequencer.py``.
+        None until initialize() finished, and for providers that do not
+        record startup phases.
+        """
+        return self._startup_timings
+
     @property
     def status(self) -> TerminalStatus:
         """Get current provider status."""
@@ -185,6 +198,36 @@ class BaseProvider(ABC):
         """
         return self.get_status("\n".join(screen_lines))
 
+    # Opt-in flag for incrementally cleaned line detection. When True, the
+    # StatusMonitor keeps an escape-stripped line buffer for this terminal
+    # (fed once per chunk, see utils.text.CleanLineBuffer) and raw-path
+    # detection calls get_status_from_lines() with its tail instead of handing
+    # get_status() the whole rolling buffer to strip again. Only for providers
+    # whose get_status() starts with strip_terminal_escapes(); kiro_cli, which
+    # depends on the raw \r, must leave this False.
+    supports_line_detection: bool = False
+
+    # How many trailing cleaned lines get_status_from_lines() needs. None hands
+    # it every retained line (the cleaned counterpart of the raw rolling
+    # buffer), so detection cost grows with ``state_buffer_max``; providers
+    # that opt in should set a bound.
+    status_tail_lines: Optional[int] = None
+
+    def get_status_from_lines(self, lines: Sequence[str]) -> TerminalStatus:
+        """Detect status from pre-cleaned output lines.
+
+        ``lines`` is ``strip_terminal_escapes(buffer).split("\\n")`` (the last
+        ``status_tail_lines`` of it): escape-free, with cursor-to-column-1 moves
+        and carriage returns already turned into line breaks, and the final
+        element the line still being written. Called by the StatusMonitor
+        instead of get_status() when ``supports_line_detection`` is True.
+
+        Default implementation joins the lines and delegates to get_status,
+        which is correct for any provider because stripping is idempotent;
+        override to skip get_status()'s own stripping pass.
+        """
+        return self.get_status("\n".join(lines))
+
     @property
     def paste_submit_delay(self) -> float:
         """Seconds to wait after a bracketed paste before sending the Enter key.
@@ -11,7 +11,7 @@ import stat
 import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
 
 if TYPE_CHECKING:
     from cli_agent_orchestrator.models.agent_profile import AgentProfile
@@ -21,6 +21,7 @@ from cli_agent_orchestrator.constants import CAO_HOME_DIR
 from cli_agent_orchestrator.models.terminal import TerminalInputBlockedError, TerminalStatus
 from cli_agent_orchestrator.providers.base import BaseProvider
 from cli_agent_orchestrator.services.settings_service import get_server_settings
+from cli_agent_orchestrator.services.startup_sequencer import StartupSequencer
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile
 from cli_agent_orchestrator.utils.mcp_resolution import resolve_mcp_server_config
 from cli_agent_orchestrator.utils.terminal import wait_for_shell, wait_until_status
@@ -268,6 +269,9 @@ class ClaudeCodeProvider(BaseProvider):
         self._snapshot_tail_hash: Optional[str] = None
         self._snapshot_last_response: Optional[str] = None
         self._snapshot_response_count: int = 0
+        # Output wake-ups for _handle_startup_prompts while initialize() runs;
+        # None otherwise, and the prompt loop falls back to fixed sleeps.
+        self._startup: Optional[StartupSequencer] = None
 
     @staticmethod
     def _tail_hash(output: str, n: int = 30) -> str:
@@ -541,6 +545,19 @@ class ClaudeCodeProvider(BaseProvider):
                 raise
         logger.info("Set skipDangerousModePermissionPrompt in ~/.claude/settings.json")
 
+    async def _await_startup_output(self, timeout: float) -> None:
+        """Wait for the next startup repaint, at most ``timeout`` seconds.
+
+        Inside initialize() the StartupSequencer wakes on the terminal's
+        output events, so a dialog is answered one coalescing window after it
+        renders; called on its own (or on an event-inbox backend) this is a
+        plain sleep.
+        """
+        if self._startup is None:
+            await asyncio.sleep(timeout)
+        else:
+            await self._startup.wait_for_output(timeout)
+
     async def _handle_startup_prompts(
         self, idle_gap: Optional[float] = None, outer_timeout: Optional[float] = None
     ) -> None:
@@ -573,6 +590,10 @@ class ClaudeCodeProvider(BaseProvider):
         any prompt has been observed, only ``outer_timeout`` can end the loop;
         the idle-gap clock starts only once a prompt has actually been handled.
 
+        Between captures the loop waits for the next repaint rather than a
+        fixed tick (``_await_startup_output``); the 1s poll is only the
+        fallback when no output events are available.
+
         This method is awaited directly from initialize(), which runs on
         cao-server's single asyncio event loop. Every tmux-backed call here
         is offloaded via ``asyncio.to_thread`` and every sleep is
@@ -608,7 +629,7 @@ class ClaudeCodeProvider(BaseProvider):
                 get_backend().get_history, self.session_name, self.window_name
             )
             if not output:
-                await asyncio.sleep(1.0)
+                await self._await_startup_output(1.0)
                 continue
 
             clean_output = re.sub(ANSI_CODE_PATTERN, "", output)
@@ -628,7 +649,7 @@ class ClaudeCodeProvider(BaseProvider):
                     "\x1b[B",
                     enter_count=0,
                 )
-                await asyncio.sleep(0.5)
+                await self._await_startup_output(0.5)  # menu cursor repaint
                 status_monitor.notify_input_sent(self.terminal_id)
                 await asyncio.to_thread(
                     get_backend().send_special_key, self.session_name, self.window_name, "Enter"
@@ -636,7 +657,7 @@ class ClaudeCodeProvider(BaseProvider):
                 bypass_accepted = True
                 any_prompt_handled = True
                 last_prompt_time = time.monotonic()  # reset idle timer — trust prompt may follow
-                await asyncio.sleep(1.0)
+                await self._await_startup_output(1.0)
                 continue
 
             # 2) Handle workspace trust prompt
@@ -667,10 +688,25 @@ class ClaudeCodeProvider(BaseProvider):
                 logger.info("Claude Code started without prompts")
                 return
 
-            await asyncio.sleep(1.0)
+            await self._await_startup_output(1.0)
 
     async def initialize(self) -> bool:
-        """Initialize Claude Code provider by starting claude command."""
+        """Initialize Claude Code provider by starting claude command.
+
+        Per-phase timings are recorded in ``startup_timings`` (see
+        services/startup_sequencer.py).
+        """
+        with StartupSequencer(self.terminal_id) as startup:
+            self._startup = startup
+            try:
+                await self._initialize(startup)
+            finally:
+                self._startup = None
+                self._startup_timings = startup.timings
+                startup.log_timings("claude_code")
+        return True
+
+    async def _initialize(self, startup: StartupSequencer) -> None:
         from cli_agent_orchestrator.services.status_monitor import status_monitor
 
         # Load the profile once so the per-profile provider_init_timeout override
@@ -682,6 +718,7 @@ class ClaudeCodeProvider(BaseProvider):
         # Wait for shell prompt to appear in the tmux window
         if not await wait_for_shell(self.terminal_id, timeout=init_timeout):
             raise TimeoutError(f"Shell initialization timed out after {init_timeout}s")
+        startup.mark("shell_ready")
 
         # Prevent bypass permissions dialog from appearing (settings-based fix).
         # This does blocking file I/O (~/.claude/settings.json read+write)
@@ -705,11 +742,13 @@ class ClaudeCodeProvider(BaseProvider):
         await asyncio.to_thread(
             get_backend().send_keys, self.session_name, self.window_name, command
         )
+        startup.mark("cli_launched")
 
         # Handle startup prompts (bypass permissions + workspace trust).
         # Pass the resolved timeout as the outer cap so a containerized profile's
         # longer init budget also governs the startup-prompt handler.
         await self._handle_startup_prompts(outer_timeout=init_timeout)
+        startup.mark("prompts_handled")
 
         # Wait for Claude Code prompt to be ready.
         # Accept IDLE, COMPLETED, and WAITING_USER_ANSWER — some CLI versions show a startup
@@ -748,6 +787,7 @@ class ClaudeCodeProvider(BaseProvider):
             # UNKNOWN status that answer_user_prompt would hard-refuse to touch (it only accepts
             # WAITING_USER_ANSWER) and that no watchdog reaps.
             raise TimeoutError(f"Claude Code initialization timed out after {init_timeout}s")
+        startup.mark("first_idle")
 
         # The status wait fires as soon as the input box RENDERS, but the Ink
         # renderer drops keystrokes for a beat after that — "box rendered" is
@@ -757,7 +797,6 @@ class ClaudeCodeProvider(BaseProvider):
         await self.wait_until_input_ready()
 
         self._initialized = True
-        return True
 
     async def wait_until_input_ready(self, timeout: float = 5.0) -> bool:
         """Settle-check readiness gate for the Ink input box.
@@ -838,7 +877,20 @@ class ClaudeCodeProvider(BaseProvider):
         # Strip escapes / normalize cursor moves to newlines so the structural
         # checks below see clean, line-oriented text. On already-clean input
         # (unit fixtures, capture-pane output) this is a near no-op.
-        output = strip_terminal_escapes(output)
+        return self._get_status_from_clean(strip_terminal_escapes(output))
+
+    def get_status_from_lines(self, lines: Sequence[str]) -> TerminalStatus:
+        """Buffer-path detection over the StatusMonitor's pre-cleaned lines.
+
+        Skips get_status's stripping pass; the lines are already what
+        ``strip_terminal_escapes`` would produce for the rolling buffer.
+        """
+        native = self._resolve_native_status()
+        if native is not None:
+            return native
+        return self._get_status_from_clean("\n".join(lines))
+
+    def _get_status_from_clean(self, output: str) -> TerminalStatus:
         if not output.strip():
             return TerminalStatus.UNKNOWN
 
@@ -1075,6 +1127,12 @@ class ClaudeCodeProvider(BaseProvider):
     # Opt in to pyte rendered-screen detection (gated by CAO_PYTE_STATUS). The
     # detector below is tuned for a COMPOSITED viewport, not the raw stream.
     supports_screen_detection = True
+    # Raw-buffer detection reads StatusMonitor's incrementally cleaned lines.
+    supports_line_detection = True
+    # Detection keys off the last separator and the last spinner, prompt and
+    # response markers, which sit in the current turn's output; bounding the
+    # tail keeps the join and regex scans from growing with state_buffer_max.
+    status_tail_lines = 500
 
     def get_status_from_screen(self, screen_lines: List[str]) -> TerminalStatus:
         """Detect status from a pyte-composited viewport (escape-free rows).
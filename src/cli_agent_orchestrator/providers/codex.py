@@ -7,12 +7,13 @@ import re
 import shlex
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from cli_agent_orchestrator.backends.registry import get_backend
 from cli_agent_orchestrator.constants import CAO_HOME_DIR
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.providers.base import BaseProvider
+from cli_agent_orchestrator.services.pane_process_tracker import pane_process_tracker
 from cli_agent_orchestrator.services.settings_service import get_server_settings
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile
 from cli_agent_orchestrator.utils.mcp_resolution import resolve_mcp_server_config
@@ -789,6 +790,14 @@ class CodexProvider(BaseProvider):
     # through StatusMonitor's pyte-composited viewport so get_status() sees only
     # the live frame rather than stale redraw history.
     supports_screen_detection = True
+    # Raw-buffer detection (get_status polls while PROCESSING, CAO_PYTE_STATUS
+    # off) reads StatusMonitor's incrementally cleaned lines instead of
+    # re-stripping the whole rolling buffer each time.
+    supports_line_detection = True
+    # The last-user-message search spans a whole turn, not a bottom region,
+    # so the bound is generous: a default 32KB state buffer of Codex output
+    # cleans to roughly 1200 lines, and its last 500 classify the same way.
+    status_tail_lines = 500
 
     def __init__(
         self,
@@ -1208,22 +1217,42 @@ class CodexProvider(BaseProvider):
         if not output:
             return TerminalStatus.UNKNOWN
 
+        # Strip the RAW pipe-pane escapes (cursor positioning, in-place redraws),
+        # not just SGR colour codes — otherwise cursor sequences survive and the
+        # idle ``›`` prompt / structural checks below misfire on the raw stream.
+        return self._get_status_from_clean(strip_terminal_escapes(output))
+
+    def get_status_from_lines(self, lines: Sequence[str]) -> TerminalStatus:
+        """Detect status from the StatusMonitor's pre-cleaned lines.
+
+        Same detector as get_status, minus its stripping pass, over the last
+        ``status_tail_lines`` lines.
+        """
+        native = self._resolve_native_status()
+        if native is not None:
+            return native
+        if len(lines) == 1 and not lines[0]:
+            return TerminalStatus.UNKNOWN
+        return self._get_status_from_clean("\n".join(lines))
+
+    def _get_status_from_clean(self, clean_output: str) -> TerminalStatus:
         # Detect when the codex process has exited and the pane is back to a
         # bare shell. The pane's current command will revert to the shell
         # (e.g. "zsh") that was running before we launched codex. Returning
         # ERROR prevents the inbox service from typing a queued message into
         # the shell — which would execute it as arbitrary commands.
+        # The answer comes from pane_process_tracker (a cached /proc lookup);
+        # the tmux round-trip is only the fallback for untracked panes.
         if self._initialized and self.shell_baseline:
-            current_cmd = get_backend().get_pane_current_command(
-                self.session_name, self.window_name
-            )
-            if current_cmd == self.shell_baseline:
+            shell_in_foreground = pane_process_tracker.shell_in_foreground(self.terminal_id)
+            if shell_in_foreground is None:
+                shell_in_foreground = (
+                    get_backend().get_pane_current_command(self.session_name, self.window_name)
+                    == self.shell_baseline
+                )
+            if shell_in_foreground:
                 return TerminalStatus.ERROR
 
-        # Strip the RAW pipe-pane escapes (cursor positioning, in-place redraws),
-        # not just SGR colour codes — otherwise cursor sequences survive and the
-        # idle ``›`` prompt / structural checks below misfire on the raw stream.
-        clean_output = strip_terminal_escapes(output)
         tail_output = "\n".join(clean_output.splitlines()[-25:])
 
         # Search for user messages, excluding the Codex TUI footer when present.
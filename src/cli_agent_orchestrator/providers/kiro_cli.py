@@ -31,6 +31,7 @@ from cli_agent_orchestrator.providers.kiro_capabilities import (
     KiroPhase0KASError,
     build_kiro_command,
 )
+from cli_agent_orchestrator.services.pane_process_tracker import pane_process_tracker
 from cli_agent_orchestrator.services.settings_service import get_server_settings
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile
 from cli_agent_orchestrator.utils.terminal import wait_for_shell, wait_until_status
@@ -611,10 +612,15 @@ class KiroCliProvider(BaseProvider):
         # by Kiro's boot screen and silently dropped.
         if not has_idle_prompt and not has_new_tui_idle:
             if self._initialized and self.shell_baseline:
-                current_cmd = get_backend().get_pane_current_command(
-                    self.session_name, self.window_name
-                )
-                if current_cmd == self.shell_baseline:
+                # Cached /proc answer from pane_process_tracker; the tmux
+                # round-trip is only the fallback for untracked panes.
+                shell_in_foreground = pane_process_tracker.shell_in_foreground(self.terminal_id)
+                if shell_in_foreground is None:
+                    shell_in_foreground = (
+                        get_backend().get_pane_current_command(self.session_name, self.window_name)
+                        == self.shell_baseline
+                    )
+                if shell_in_foreground:
                     return TerminalStatus.IDLE
             return TerminalStatus.PROCESSING
 
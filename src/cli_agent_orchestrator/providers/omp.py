@@ -14,12 +14,13 @@ import re
 import shlex
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from cli_agent_orchestrator.backends.registry import get_backend
 from cli_agent_orchestrator.constants import CAO_HOME_DIR, SECURITY_PROMPT
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.providers.base import BaseProvider
+from cli_agent_orchestrator.services.pane_process_tracker import pane_process_tracker
 from cli_agent_orchestrator.services.settings_service import get_server_settings
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile
 from cli_agent_orchestrator.utils.mcp_resolution import resolve_mcp_server_config
@@ -75,6 +76,10 @@ class OmpProvider(BaseProvider):
     """Launch and monitor an interactive OMP session inside a CAO terminal."""
 
     supports_screen_detection = True
+    supports_line_detection = True
+    # The detector picks the latest working/error/waiting marker and any ready
+    # frame after it; 500 cleaned lines reach back far past the live frame.
+    status_tail_lines = 500
     supports_direct_status_probe = False
 
     def __init__(
@@ -238,10 +243,13 @@ class OmpProvider(BaseProvider):
 
     def _get_status_from_clean(self, clean: str) -> TerminalStatus:
         if self._initialized and self.shell_baseline:
-            current_cmd = get_backend().get_pane_current_command(
-                self.session_name, self.window_name
-            )
-            if current_cmd == self.shell_baseline:
+            shell_in_foreground = pane_process_tracker.shell_in_foreground(self.terminal_id)
+            if shell_in_foreground is None:
+                shell_in_foreground = (
+                    get_backend().get_pane_current_command(self.session_name, self.window_name)
+                    == self.shell_baseline
+                )
+            if shell_in_foreground:
                 return TerminalStatus.ERROR
 
         if not clean.strip():
@@ -276,6 +284,13 @@ class OmpProvider(BaseProvider):
         output = self._resolve_buffer(buffer)
         return self._get_status_from_clean(strip_terminal_escapes(output))
 
+    def get_status_from_lines(self, lines: Sequence[str]) -> TerminalStatus:
+        """Classify the StatusMonitor's pre-cleaned lines without re-stripping."""
+        native = self._resolve_native_status()
+        if native is not None:
+            return native
+        return self._get_status_from_clean("\n".join(lines))
+
     def get_status_from_screen(self, screen_lines: List[str]) -> TerminalStatus:
         """Classify OMP's pyte-composited viewport using the same precedence."""
         clean = "\n".join(line.rstrip() for line in screen_lines if line.strip())
@@ -26,11 +26,14 @@ avoid changing security-critical resolution behavior in this PR. See
 docs/configuration.md for the full rationale.
 """
 
+import hashlib
 import logging
 import os
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, List, Optional, cast
+from typing import Any, Callable, List, Optional, Tuple, cast
 
 import jwt
 from fastapi import Depends, Header, HTTPException, status
@@ -61,6 +64,14 @@ _JWKS_TTL = timedelta(hours=1)
 # closed instead.
 _JWKS_MAX_STALENESS = timedelta(hours=24)
 
+# Verified-token cache bounds. An entry is dropped ``_TOKEN_CACHE_EXPIRY_SKEW``
+# seconds before the token's ``exp`` (so the cache never accepts a token
+# ``jwt.decode`` would already reject) and at the latest ``_JWKS_TTL`` after it
+# was verified, so a key the IdP withdrew stops validating cached tokens on the
+# same schedule as uncached ones.
+_TOKEN_CACHE_SIZE = 1024
+_TOKEN_CACHE_EXPIRY_SKEW = 5.0
+
 
 # --- configuration (default-off) -----------------------------------------
 
@@ -150,6 +161,10 @@ class _JWKSCache:
       are fetched before validating;
     * when the source is unreachable, the cached client is reused if present
       (so a transient outage does not lock out valid callers).
+
+    ``generation`` changes whenever a fetch installs a new key set or the cache
+    is cleared; tokens verified under an older generation are not trusted from
+    the verified-token cache.
     """
 
     def __init__(self, ttl: timedelta = _JWKS_TTL) -> None:
@@ -158,6 +173,7 @@ class _JWKSCache:
         self._uri: Optional[str] = None
         self._fetched_at: Optional[datetime] = None
         self._lock = threading.Lock()
+        self.generation = 0
 
     def get_client(self, uri: str) -> PyJWKClient:
         with self._lock:
@@ -179,6 +195,7 @@ class _JWKSCache:
                 self._client = client
                 self._uri = uri
                 self._fetched_at = now
+                self.generation += 1
                 return client
             except Exception:  # source unreachable / fetch failed
                 # Reuse cached keys across a transient outage, but only up to a
@@ -202,6 +219,7 @@ class _JWKSCache:
             self._client = None
             self._uri = None
             self._fetched_at = None
+            self.generation += 1
 
 
 _jwks_cache = _JWKSCache()
@@ -213,6 +231,78 @@ def get_jwks_cache() -> _JWKSCache:
     return _jwks_cache
 
 
+# --- verified-token cache (bounded LRU, expiry-aware) ----------------------
+
+
+class _VerifiedTokenCache:
+    """Thread-safe LRU of scopes for tokens that already passed ``jwt.decode``.
+
+    Every authenticated request used to pay a full RS256 verification, and the
+    MCP servers and CLI poll status once a second per worker with the same
+    token. Entries are keyed by a SHA-256 of the token and the validation
+    context (JWKS URI, audience, issuer), so the raw bearer string is not
+    retained and a config change cannot reuse a verdict reached under other
+    rules. Only successful validations are cached.
+
+    An entry is served only while:
+
+    * it has not reached its deadline (``exp`` minus the skew, capped at the
+      JWKS TTL after verification); and
+    * the JWKS cache is still on the generation the token was verified under;
+      the first lookup after a key refresh or ``_jwks_cache.clear()`` empties
+      the cache.
+    """
+
+    def __init__(self, max_entries: int = _TOKEN_CACHE_SIZE) -> None:
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Tuple[str, ...], float]]" = OrderedDict()
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(token: str, *context: Optional[str]) -> str:
+        material = "\0".join([*(c or "" for c in context), token])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, generation: int) -> Optional[List[str]]:
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+                return None
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            scopes, deadline = entry
+            if time.time() >= deadline:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(scopes)
+
+    def put(self, key: str, scopes: List[str], exp: float, generation: int) -> None:
+        if self._max_entries <= 0:
+            return
+        deadline = min(exp - _TOKEN_CACHE_EXPIRY_SKEW, time.time() + _JWKS_TTL.total_seconds())
+        with self._lock:
+            if generation != self._generation:
+                return  # a lookup under newer keys already flushed the cache
+            self._entries[key] = (tuple(scopes), deadline)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_token_cache = _VerifiedTokenCache()
+
+
 # --- scope extraction -----------------------------------------------------
 
 
@@ -257,6 +347,10 @@ def extract_scopes_from_token(token: str) -> List[str]:
     and audience (``aud``) in addition to the RS256 signature and ``exp`` so a
     token minted by a different IdP — or for a different resource on the same
     IdP — is rejected rather than accepted on signature alone.
+
+    A token that validated is remembered in ``_token_cache`` until shortly
+    before its ``exp`` (or until the JWKS keys are refreshed), so repeat calls
+    with the same bearer skip the signature check.
     """
 
     if not is_auth_enabled():
@@ -266,6 +360,21 @@ def extract_scopes_from_token(token: str) -> List[str]:
     if not uri:  # pragma: no cover - guarded by is_auth_enabled
         return list(FULL_SCOPE_SET)
 
+    audience = get_expected_audience()
+    # Pin to the first advertised authorization server (the PRM endpoint
+    # advertises the same list). When an issuer is known we also require the
+    # ``iss`` claim to be present so it cannot simply be omitted.
+    issuers = get_authorization_servers()
+    expected_issuer = issuers[0] if issuers else None
+
+    # Read before any key fetch below so a token verified across a refresh is
+    # not cached under the new key set.
+    generation = _jwks_cache.generation
+    cache_key = _VerifiedTokenCache.key(token, uri, audience, expected_issuer)
+    cached = _token_cache.get(cache_key, generation)
+    if cached is not None:
+        return cached
+
     client = _jwks_cache.get_client(uri)
     try:
         signing_key = client.get_signing_key_from_jwt(token)
@@ -278,12 +387,6 @@ def extract_scopes_from_token(token: str) -> List[str]:
         client = _jwks_cache.get_client(uri)
         signing_key = client.get_signing_key_from_jwt(token)
 
-    audience = get_expected_audience()
-    # Pin to the first advertised authorization server (the PRM endpoint
-    # advertises the same list). When an issuer is known we also require the
-    # ``iss`` claim to be present so it cannot simply be omitted.
-    issuers = get_authorization_servers()
-    expected_issuer = issuers[0] if issuers else None
     required_claims = ["exp"]
     if expected_issuer is not None:
         required_claims.append("iss")
@@ -296,7 +399,10 @@ def extract_scopes_from_token(token: str) -> List[str]:
         issuer=expected_issuer,
         options=cast("Any", options),
     )
-    return _scopes_from_claims(claims)
+    scopes = _scopes_from_claims(claims)
+    if _jwks_cache.generation == generation:
+        _token_cache.put(cache_key, scopes, float(claims["exp"]), generation)
+    return scopes
 
 
 def get_scopes_for_local_token() -> List[str]:
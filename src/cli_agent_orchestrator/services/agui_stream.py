@@ -48,8 +48,8 @@ Note (file_mod → STATE_DELTA): each ``file_mod`` record is mapped to a real
 RFC-6902 patch (an ``add`` op on ``/last_file_mod``) derived from the record's
 own metadata, so the client's shared state reflects the change. The fleet-wide
 ``STATE_SNAPSHOT`` / ``STATE_DELTA`` channel (session/terminal topology) is
-computed separately by ``services/ui_state_service.py`` and emitted by the
-stream endpoint after each event. Debouncing high-rate file churn is a
+maintained separately by ``services/fleet_state.py`` and emitted by the
+stream endpoint whenever its version moves. Debouncing high-rate file churn is a
 follow-up at the stream layer.
 """
 
@@ -58,7 +58,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
-from cli_agent_orchestrator.services.ui_state_service import diff_snapshot
+from cli_agent_orchestrator.services.ui_state_service import diff_snapshot_by_id
 
 # AG-UI typed-event names. Pinned at the v1 spec families — when AG-UI evolves,
 # the mapping is the one-file change.
@@ -365,7 +365,7 @@ def to_agui_event(event: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
 # agent/fleet state and keep it current via minimal RFC-6902 patches. CAO's
 # authoritative projection + diff already exist as pure functions in
 # ``services/ui_state_service.py`` (``build_dashboard_snapshot`` /
-# ``diff_snapshot``); these two frames wrap them in AG-UI SSE envelopes so the
+# ``diff_snapshot_by_id``); these frames wrap them in AG-UI SSE envelopes so the
 # ``/agui/v1/stream`` endpoint can emit a full ``STATE_SNAPSHOT`` on connect and
 # incremental ``STATE_DELTA`` patches as the fleet changes. Keeping the framing
 # here (not in the endpoint) keeps it pure and unit-testable.
@@ -381,10 +381,18 @@ def state_delta_frame(
 ) -> Optional[Tuple[str, Dict[str, Any]]]:
     """Wrap the ``prev -> curr`` change as an AG-UI ``STATE_DELTA`` frame.
 
+    Collections are diffed per terminal / session id (``diff_snapshot_by_id``).
     Returns ``None`` when the snapshots are equal (no RFC-6902 ops), so the
     caller emits nothing on the wire for a no-op tick.
     """
-    ops: List[Dict[str, Any]] = diff_snapshot(prev, curr)
+    return state_patch_frame(diff_snapshot_by_id(prev, curr))
+
+
+def state_patch_frame(ops: List[Dict[str, Any]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Wrap already-computed RFC-6902 ops (e.g. from ``FleetState.deltas_since``).
+
+    Returns ``None`` for an empty op list.
+    """
     if not ops:
         return None
     return AGUI_STATE_DELTA, {"delta": ops}
@@ -406,6 +414,7 @@ __all__ = [
     "AGUI_TOOL_CALL_START",
     "GENERATIVE_UI_COMPONENTS",
     "state_delta_frame",
+    "state_patch_frame",
     "state_snapshot_frame",
     "to_agui_event",
 ]
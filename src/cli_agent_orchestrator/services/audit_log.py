@@ -17,6 +17,20 @@ Hard contracts:
   recovery primitive; flock is opt-in via setting (default OFF).
 - Per-day soft cap defaults to 100 MiB (operator override via
   ``memory.audit_log_day_cap_bytes`` JSON-only setting).
+- One writer thread owns the day file: callers sanitise and render their
+  line, then hand it over a bounded queue. Lines queued within
+  ``AUDIT_FLUSH_INTERVAL_S`` are appended with a single ``os.write``; the
+  day fd stays open and the cap is tracked in memory.
+- Each day file has a sidecar ``YYYY-MM-DD.idx`` of
+  ``timestamp<TAB>event_type<TAB>offset<TAB>length`` lines, appended after
+  the log write, so ``query_audit_log`` reads only matching lines. MCP
+  server processes append to the same day file, so while the index is open
+  the write and its index lines happen under flock (whatever
+  ``audit_log_flock`` says), with offsets taken from the file's real size.
+  The log stays authoritative: an index behind the log is caught up by
+  scanning, and an index entry that does not land on a whole line makes the
+  query scan the day instead. ``query_audit_log`` is a library entry point
+  (like ``read_audit_log``); no CLI or API route calls it yet.
 - ``memory.enabled = False`` short-circuits at the very top —
   documented forensic gap.
 - ``summary`` is wrapped in backticks; ``<>&`` are HTML-entity
@@ -26,17 +40,23 @@ Hard contracts:
 
 Non-blocking promise: the write boundary catches every OSError /
 PermissionError and emits a Python-logger WARNING. Memory ops never
-see an audit failure.
+see an audit failure, and ``write_audit_nowait`` never waits: a full
+queue drops the event (``queue_full``).
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import logging
 import os
 import platform
+import queue
 import re
-from datetime import datetime, timezone
+import threading
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 
 from cli_agent_orchestrator.constants import MEMORY_BASE_DIR
 from cli_agent_orchestrator.services.wiki_compiler import _sanitize_for_log
@@ -115,9 +135,18 @@ DROP_REASONS: frozenset = frozenset(
         "day_cap_exceeded",
         "disk_full",
         "loop_unavailable",
+        "queue_full",
     }
 )
 
+# Background writer: entries queued within one flush interval share a single
+# ``os.write``. The queue is bounded; a nowait event that finds it full is
+# dropped, an awaited one waits up to AUDIT_SUBMIT_TIMEOUT_S for room.
+AUDIT_QUEUE_MAX = 4096
+AUDIT_MAX_BATCH = 512
+AUDIT_FLUSH_INTERVAL_S = 0.1
+AUDIT_SUBMIT_TIMEOUT_S = 1.0
+
 
 # -----------------------------------------------------------------------------
 # Settings adapters — read-only; never raise out
@@ -249,13 +278,6 @@ def _open_audit_fd(target: Path) -> int:
     return fd
 
 
-def _under_day_cap(fd: int, cap: int) -> bool:
-    try:
-        return os.fstat(fd).st_size < cap
-    except OSError:
-        return False
-
-
 # -----------------------------------------------------------------------------
 # Line render
 # -----------------------------------------------------------------------------
@@ -289,123 +311,582 @@ def _drop(reason: str, event_type: str = "unknown") -> None:
         logger.warning("audit_log_drop event_type=%s reason=unknown", event_type)
 
 
-async def write_audit(event_type: str, summary: str, **fields: Any) -> None:
-    """Append a single audit entry. Never raises out to callers."""
+class _Entry:
+    """One rendered line on its way to the writer thread.
+
+    ``line is None`` marks a flush barrier: the writer only resolves its
+    ``done`` future, after every entry queued before it.
+    """
+
+    __slots__ = ("base_dir", "date_str", "timestamp", "event_type", "line", "done")
+
+    def __init__(
+        self,
+        base_dir: Path,
+        date_str: str,
+        timestamp: str,
+        event_type: str,
+        line: Optional[bytes],
+        done: Optional["concurrent.futures.Future[None]"] = None,
+    ) -> None:
+        self.base_dir = base_dir
+        self.date_str = date_str
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.line = line
+        self.done = done
+
+
+def _prepare(event_type: str, summary: str, fields: dict) -> Optional[_Entry]:
+    """Kill switch, whitelist and sanitisation; ``None`` means drop."""
+    if not _is_memory_enabled_safe():
+        return None  # kill switch fully off
+    if event_type not in AUDIT_EVENT_WHITELIST:
+        _drop("unknown_event", event_type)
+        # Best-effort self-emit (audit_log_error is in NOWAIT set — may
+        # itself be dropped if the queue is full).
+        if event_type != "audit_log_error":
+            entry = _prepare(
+                "audit_log_error",
+                f"unknown event_type rejected: {event_type[:32]}",
+                {"reason": "unknown_event"},
+            )
+            if entry is not None:
+                _writer.submit(entry)
+        return None
+
     try:
-        if not _is_memory_enabled_safe():
-            return  # kill switch fully off
-        if event_type not in AUDIT_EVENT_WHITELIST:
-            _drop("unknown_event", event_type)
-            # Best-effort self-emit (audit_log_error is in NOWAIT set —
-            # may itself be dropped if loop unavailable).
+        sanitised_summary = _sanitize_summary(summary or "")
+        sanitised_fields = {k: _sanitize_field_value(v) for k, v in fields.items()}
+    except Exception as e:
+        _drop("sanitise_failed", event_type)
+        logger.debug(f"audit_log sanitise raised: {e}")
+        return None
+
+    now = datetime.now(timezone.utc)
+    ts = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    line = _render_line(
+        timestamp=ts,
+        event_type=event_type,
+        fields=sanitised_fields,
+        summary=sanitised_summary,
+    )
+    if len(line) > PER_ENTRY_CAP_BYTES:
+        # Truncate at byte boundary; preserve newline.
+        line = line[: PER_ENTRY_CAP_BYTES - 1] + b"\n"
+    return _Entry(MEMORY_BASE_DIR, now.strftime("%Y-%m-%d"), ts, event_type, line)
+
+
+class _AuditWriter:
+    """Single background writer for every audit line in the process.
+
+    Callers render their line and enqueue it on a bounded queue; one daemon
+    thread drains it, appends everything queued within
+    ``AUDIT_FLUSH_INTERVAL_S`` with one ``os.write``, and appends the
+    matching entries to the day's offset index. The day file (and its index)
+    stay open between flushes; each flush costs one ``os.stat`` (noticing a
+    file rotated under us) and one ``fstat`` for the size to write at, taken
+    under the flock whenever the day is indexed.
+
+    A thread rather than an asyncio task: audit events come from the server
+    loop, from ``asyncio.run`` in CLI paths and from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Optional[_Entry]]" = queue.Queue(maxsize=AUDIT_QUEUE_MAX)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # The open day: resolved path, log fd, index fd, logical size.
+        self._path: Optional[Path] = None
+        self._fd = -1
+        self._idx_fd = -1
+        self._size = 0
+        self._ino = -1
+        # Whether the open day's index has been reconciled with the log yet.
+        self._index_checked = True
+
+    # -- producer side -------------------------------------------------------
+
+    def submit(self, entry: _Entry, timeout: float = 0.0) -> bool:
+        """Enqueue ``entry``; ``False`` (and a ``queue_full`` drop) if no room."""
+        self._ensure_thread()
+        try:
+            if timeout > 0:
+                self._queue.put(entry, timeout=timeout)
+            else:
+                self._queue.put_nowait(entry)
+            return True
+        except queue.Full:
+            if entry.line is not None:
+                _drop("queue_full", entry.event_type)
+            return False
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until everything queued so far is written; ``False`` on timeout."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        done: "concurrent.futures.Future[None]" = concurrent.futures.Future()
+        if not self.submit(_Entry(MEMORY_BASE_DIR, "", "", "", None, done), timeout):
+            return False
+        try:
+            done.result(timeout)
+            return True
+        except concurrent.futures.TimeoutError:
+            return False
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write what is queued, then stop the thread and close the day file."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
             try:
-                if event_type != "audit_log_error":
-                    await write_audit(
-                        "audit_log_error",
-                        f"unknown event_type rejected: {event_type[:32]}",
-                        reason="unknown_event",
-                    )
-            except Exception:
-                pass
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
             return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="cao-audit-writer", daemon=True
+                )
+                self._thread.start()
 
+    # -- writer thread -------------------------------------------------------
+
+    def _run(self) -> None:
         try:
-            sanitised_summary = _sanitize_summary(summary or "")
-            sanitised_fields = {k: _sanitize_field_value(v) for k, v in fields.items()}
-        except Exception as e:
-            _drop("sanitise_failed", event_type)
-            logger.debug(f"audit_log sanitise raised: {e}")
-            return
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                batch = [first]
+                stop = self._collect(batch)
+                try:
+                    self._flush(batch)
+                except Exception as e:  # noqa: BLE001 — non-blocking promise
+                    logger.warning("audit_log unexpected error: %s", type(e).__name__)
+                finally:
+                    for entry in batch:
+                        if entry.done is not None and not entry.done.done():
+                            entry.done.set_result(None)
+                if stop:
+                    return
+        finally:
+            self._close_day()
+
+    def _collect(self, batch: List[_Entry]) -> bool:
+        """Gather more entries for one flush; ``True`` if shutdown was requested.
+
+        Waits up to the flush interval for company, unless someone is already
+        waiting on this batch (an awaited ``write_audit`` or a flush barrier).
+        """
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL_S
+        waited_on = batch[0].done is not None
+        while len(batch) < AUDIT_MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            try:
+                if waited_on or remaining <= 0:
+                    entry = self._queue.get_nowait()
+                else:
+                    entry = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            if entry is None:
+                return True
+            batch.append(entry)
+            waited_on = waited_on or entry.done is not None
+        return False
 
-        date_str = _today_utc()
-        target = _resolve_log_path(MEMORY_BASE_DIR, date_str)
-        if target is None:
-            _drop("path_invalid", event_type)
-            return
-        if not _ensure_log_dir(MEMORY_BASE_DIR):
-            _drop("path_invalid", event_type)
+    def _flush(self, batch: List[_Entry]) -> None:
+        # Consecutive entries for the same day file share one write.
+        group: List[_Entry] = []
+        for entry in batch:
+            if entry.line is None:
+                continue
+            if group and (entry.base_dir, entry.date_str) != (
+                group[0].base_dir,
+                group[0].date_str,
+            ):
+                self._write_group(group)
+                group = []
+            group.append(entry)
+        if group:
+            self._write_group(group)
+
+    def _write_group(self, group: List[_Entry]) -> None:
+        first = group[0]
+        target = _resolve_log_path(first.base_dir, first.date_str)
+        if target is None or not self._open_day(first.base_dir, target):
+            reason = "path_invalid" if target is None else "perm_violation"
+            for entry in group:
+                _drop(reason, entry.event_type)
             return
 
-        fd = _open_audit_fd(target)
-        if fd < 0:
-            _drop("perm_violation", event_type)
-            return
+        # Index offsets come from self._size, which is only right if no other
+        # process appends between reading the size and writing: lock whenever
+        # an index is kept, not just when the setting asks for it.
+        locked = False
+        indexed = self._idx_fd >= 0
+        if (indexed or _audit_log_flock_enabled()) and platform.system() != "Windows":
+            try:
+                import fcntl
 
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+                locked = True
+            except OSError as e:
+                for entry in group:
+                    _drop("disk_full", entry.event_type)
+                logger.debug(f"audit_log flock/write error: {e}")
+                return
         try:
+            # Other processes may have appended since our last flush.
+            self._sync_size(os.fstat(self._fd).st_size)
             cap = _audit_day_cap_bytes()
-            if not _under_day_cap(fd, cap):
-                _drop("day_cap_exceeded", event_type)
+            lines: List[bytes] = []
+            index: List[bytes] = []
+            size = self._size
+            for entry in group:
+                assert entry.line is not None
+                if size >= cap:
+                    _drop("day_cap_exceeded", entry.event_type)
+                    continue
+                lines.append(entry.line)
+                index.append(
+                    f"{entry.timestamp}\t{entry.event_type}\t{size}\t{len(entry.line)}\n".encode()
+                )
+                size += len(entry.line)
+            if not lines:
                 return
-
-            ts = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-            line = _render_line(
-                timestamp=ts,
-                event_type=event_type,
-                fields=sanitised_fields,
-                summary=sanitised_summary,
-            )
-            if len(line) > PER_ENTRY_CAP_BYTES:
-                # Truncate at byte boundary; preserve newline.
-                line = line[: PER_ENTRY_CAP_BYTES - 1] + b"\n"
-
-            if _audit_log_flock_enabled() and platform.system() != "Windows":
+            try:
+                _write_all(self._fd, b"".join(lines))
+            except OSError as e:
+                for entry in group:
+                    _drop("disk_full", entry.event_type)
+                logger.debug(f"audit_log os.write error: {e}")
+                self._close_day()  # re-stat on the next flush
+                return
+            self._size = size
+            self._append_index(b"".join(index))
+        finally:
+            if locked:
                 try:
                     import fcntl
 
-                    fcntl.flock(fd, fcntl.LOCK_EX)
-                    try:
-                        os.write(fd, line)
-                    finally:
-                        try:
-                            fcntl.flock(fd, fcntl.LOCK_UN)
-                        except OSError:
-                            pass
-                except OSError as e:
-                    logger.warning("audit_log_drop event_type=%s reason=disk_full", event_type)
-                    logger.debug(f"audit_log flock/write error: {e}")
-            else:
-                try:
-                    os.write(fd, line)
-                except OSError as e:
-                    _drop("disk_full", event_type)
-                    logger.debug(f"audit_log os.write error: {e}")
-        finally:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                except OSError:
+                    pass
+
+    def _open_day(self, base_dir: Path, target: Path) -> bool:
+        """Make ``target`` the open day file; reuse the fd while it still is."""
+        try:
+            st = os.stat(target)
+        except FileNotFoundError:
+            st = None
+        except OSError:
+            return False
+        if self._path == target and self._fd >= 0 and st is not None and st.st_ino == self._ino:
+            return True
+        self._close_day()
+        if not _ensure_log_dir(base_dir):
+            return False
+        fd = _open_audit_fd(target)
+        if fd < 0:
+            return False
+        try:
+            fst = os.fstat(fd)
+        except OSError:
+            os.close(fd)
+            return False
+        self._path, self._fd, self._size, self._ino = target, fd, fst.st_size, fst.st_ino
+        self._idx_fd = _open_audit_fd(_index_path(target))
+        # Caught up by the next _sync_size, under the flock when one is taken:
+        # unlocked, another process's line could be indexed twice.
+        self._index_checked = False
+        return True
+
+    def _sync_size(self, size: int) -> None:
+        """Adopt an on-disk size that moved under us (another writer, truncation)."""
+        if size != self._size or not self._index_checked:
+            self._size = size
+            self._index_checked = True
+            if self._path is not None:
+                self._reconcile_index(self._path)
+
+    def _reconcile_index(self, target: Path) -> None:
+        """Bring the day's index level with the log after a crash or outside edit."""
+        if self._idx_fd < 0:
+            return
+        entries = _read_index(_index_path(target))
+        end = entries[-1][2] + entries[-1][3] if entries else 0
+        if end == self._size:
+            return
+        if end > self._size:  # the log shrank: rebuild from scratch
             try:
-                os.close(fd)
+                os.ftruncate(self._idx_fd, 0)
             except OSError:
-                pass
+                return
+            entries, end = [], 0
+        missing = _scan_log(target, end, self._size)
+        self._append_index(
+            b"".join(f"{ts}\t{ev}\t{off}\t{ln}\n".encode() for ts, ev, off, ln in missing)
+        )
+
+    def _append_index(self, data: bytes) -> None:
+        if self._idx_fd < 0 or not data:
+            return
+        try:
+            _write_all(self._idx_fd, data)
+        except OSError as e:
+            # The log line is what matters; queries fall back to a scan.
+            logger.debug(f"audit_log index write error: {e}")
+
+    def _close_day(self) -> None:
+        for fd in (self._fd, self._idx_fd):
+            if fd >= 0:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._path, self._fd, self._idx_fd, self._size, self._ino = None, -1, -1, 0, -1
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+_writer = _AuditWriter()
+
+
+def _close_writer_at_exit() -> None:
+    _writer.close(timeout=2.0)
+
+
+atexit.register(_close_writer_at_exit)
+
+
+async def write_audit(event_type: str, summary: str, **fields: Any) -> None:
+    """Append a single audit entry and wait until it is on disk.
+
+    Never raises out to callers. When the writer's queue is full this waits
+    up to ``AUDIT_SUBMIT_TIMEOUT_S`` for room before dropping.
+    """
+    try:
+        entry = _prepare(event_type, summary, fields)
+        if entry is None:
+            return
+        entry.done = concurrent.futures.Future()
+        if not _writer.submit(entry):
+            submitted = await asyncio.to_thread(_writer.submit, entry, AUDIT_SUBMIT_TIMEOUT_S)
+            if not submitted:
+                return
+        await asyncio.wrap_future(entry.done)
     except Exception as e:  # noqa: BLE001 — non-blocking promise
         logger.warning("audit_log unexpected error: %s", type(e).__name__)
 
 
 def write_audit_nowait(event_type: str, summary: str, **fields: Any) -> None:
-    """Schedule an audit write without awaiting it.
+    """Queue an audit write without waiting for it.
 
-    When a running loop is reachable (the server's dominant case) the write is
-    scheduled as a background task and the caller returns immediately. When no
-    loop is reachable (sync CLI/test paths), it falls back to ``asyncio.run``
-    in the caller's thread — a short, blocking append, treated as best-effort
-    (any error is dropped). This fallback is NOT offloaded to a worker thread.
+    The line is rendered in the caller's thread and handed to the writer
+    thread, so this never blocks and needs no running loop. When the queue
+    is full the event is dropped (``queue_full``) rather than stalling the
+    caller.
     """
     try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-    if loop is not None:
+        entry = _prepare(event_type, summary, fields)
+        if entry is not None:
+            _writer.submit(entry)
+    except Exception as e:  # noqa: BLE001 — non-blocking promise
+        logger.warning("audit_log unexpected error: %s", type(e).__name__)
+
+
+def flush_audit_log(timeout: float = 5.0) -> bool:
+    """Block until every audit entry queued so far is on disk.
+
+    Returns ``False`` if that did not happen within ``timeout`` seconds.
+    """
+    return _writer.flush(timeout)
+
+
+# -----------------------------------------------------------------------------
+# Offset index
+# -----------------------------------------------------------------------------
+
+_INDEX_SCAN_RE = re.compile(rb"^- (\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z) \[([a-z_]+)\]")
+
+# (timestamp, event_type, offset, length)
+IndexEntry = Tuple[str, str, int, int]
+
+
+def _index_path(log_path: Path) -> Path:
+    return log_path.with_suffix(".idx")
+
+
+def _read_index(path: Path) -> List[IndexEntry]:
+    """Parse a day's index; stops at the first malformed (torn) line."""
+    try:
+        flags = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(str(path), flags)
+    except OSError:
+        return []
+    try:
+        data = _read_range(fd, 0, os.fstat(fd).st_size)
+    except OSError:
+        return []
+    finally:
+        os.close(fd)
+    entries: List[IndexEntry] = []
+    for raw in data.split(b"\n")[:-1]:
+        parts = raw.split(b"\t")
         try:
-            loop.create_task(write_audit(event_type, summary, **fields))
-            return
-        except Exception as e:
-            logger.warning("audit_log_drop event_type=%s reason=loop_unavailable", event_type)
-            logger.debug(f"create_task failed: {e}")
-            return
-    # No running loop — best-effort sync drain via a fresh loop. We MUST
-    # NOT block the caller for long; treat any error as drop.
+            ts, ev, off, ln = parts
+            entries.append((ts.decode("ascii"), ev.decode("ascii"), int(off), int(ln)))
+        except ValueError:
+            break
+    return entries
+
+
+def _scan_log(path: Path, start: int, end: int) -> List[IndexEntry]:
+    """Index entries for the complete bullet lines in ``path[start:end]``."""
     try:
-        asyncio.run(write_audit(event_type, summary, **fields))
-    except Exception as e:
-        logger.warning("audit_log_drop event_type=%s reason=loop_unavailable", event_type)
-        logger.debug(f"asyncio.run fallback failed: {e}")
+        fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+    except OSError:
+        return []
+    try:
+        data = _read_range(fd, start, end - start)
+    except OSError:
+        return []
+    finally:
+        os.close(fd)
+    entries: List[IndexEntry] = []
+    offset = start
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break  # torn tail
+        match = _INDEX_SCAN_RE.match(line)
+        if match:
+            entries.append(
+                (match.group(1).decode("ascii"), match.group(2).decode("ascii"), offset, len(line))
+            )
+        offset += len(line)
+    return entries
+
+
+def _read_range(fd: int, offset: int, length: int) -> bytes:
+    chunks: List[bytes] = []
+    while length > 0:
+        chunk = os.pread(fd, min(length, 1 << 20), offset)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        offset += len(chunk)
+        length -= len(chunk)
+    return b"".join(chunks)
+
+
+def query_audit_log(
+    *,
+    event_type: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    date_str: Optional[str] = None,
+) -> List[str]:
+    """Audit lines matching ``event_type`` and/or ``[since, until]``, oldest first.
+
+    READ-ONLY. Uses each day's offset index to read only the matching lines;
+    a day without a usable index (written before the index existed, or
+    edited by hand) is scanned once in memory. ``date_str`` restricts the
+    query to that day; otherwise the days spanned by ``since``/``until``
+    (default: today) are searched. Naive datetimes are taken as UTC. Lines
+    are returned without their trailing newline.
+    """
+    if date_str is not None:
+        days = [date_str]
+    else:
+        last = (until or datetime.now(timezone.utc)).astimezone(timezone.utc).date()
+        first = since.astimezone(timezone.utc).date() if since is not None else last
+        days = [
+            (first + timedelta(days=i)).strftime("%Y-%m-%d") for i in range((last - first).days + 1)
+        ]
+    lo = _format_ts(since) if since is not None else ""
+    hi = _format_ts(until) if until is not None else "~"
+
+    out: List[str] = []
+    for day in days:
+        target = _resolve_log_path(MEMORY_BASE_DIR, day)
+        if target is None:
+            continue
+        try:
+            fd = os.open(str(target), os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+        except OSError:
+            continue
+        try:
+            size = os.fstat(fd).st_size
+            entries = _read_index(_index_path(target))
+            end = entries[-1][2] + entries[-1][3] if entries else 0
+            if end > size:
+                entries, end = [], 0  # the log shrank under the index
+            if end < size:
+                entries = entries + _scan_log(target, end, size)
+            lines = _read_lines(fd, _select(entries, event_type, lo, hi))
+            if lines is None:
+                # The index disagrees with the log; scanned entries cannot.
+                lines = _read_lines(fd, _select(_scan_log(target, 0, size), event_type, lo, hi))
+            out.extend(lines or [])
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+    return out
+
+
+def _select(
+    entries: List[IndexEntry], event_type: Optional[str], lo: str, hi: str
+) -> List[IndexEntry]:
+    # A linear filter, not a bisect: lines from several processes are only
+    # roughly in timestamp order.
+    return [e for e in entries if lo <= e[0] <= hi and (event_type is None or e[1] == event_type)]
+
+
+def _format_ts(moment: datetime) -> str:
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _read_lines(fd: int, entries: List[IndexEntry]) -> Optional[List[str]]:
+    """Read the indexed lines, one ``pread`` per run of adjacent entries.
+
+    Returns None if any entry does not cover exactly one whole line of its
+    own (preceded by a newline, starting with its timestamp and event type,
+    ending in ``\\n``): the index is out of step with the log.
+    """
+    lines: List[str] = []
+    i = 0
+    while i < len(entries):
+        j = i
+        while j + 1 < len(entries) and entries[j + 1][2] == entries[j][2] + entries[j][3]:
+            j += 1
+        start = entries[i][2]
+        # One byte before the run, to check it starts a line.
+        lead = 1 if start > 0 else 0
+        data = _read_range(fd, start - lead, entries[j][2] + entries[j][3] - start + lead)
+        if lead and data[:1] != b"\n":
+            return None
+        for ts, ev, offset, length in entries[i : j + 1]:
+            raw = data[offset - start + lead : offset - start + lead + length]
+            if not (raw.endswith(b"\n") and raw.startswith(f"- {ts} [{ev}]".encode())):
+                return None
+            lines.append(raw.rstrip(b"\n").decode("utf-8", errors="replace"))
+        i = j + 1
+    return lines
 
 
 # -----------------------------------------------------------------------------
@@ -414,9 +895,10 @@ def write_audit_nowait(event_type: str, summary: str, **fields: Any) -> None:
 
 
 def sweep_old_audit_logs(*, retention_days: int = 30) -> int:
-    """Delete log files older than ``retention_days``. Returns count deleted."""
-    from datetime import timedelta
+    """Delete log files (and their offset indexes) older than ``retention_days``.
 
+    Returns the number of log files deleted.
+    """
     deleted = 0
     log_dir = MEMORY_BASE_DIR / "logs" / "memory"
     if not log_dir.exists():
@@ -445,6 +927,7 @@ def sweep_old_audit_logs(*, retention_days: int = 30) -> int:
             continue
         try:
             path.unlink(missing_ok=True)
+            _index_path(path).unlink(missing_ok=True)
             deleted += 1
         except OSError as e:
             logger.warning("audit_log_sweep_failed errno_name=%s", type(e).__name__)
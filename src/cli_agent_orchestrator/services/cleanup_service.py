@@ -16,6 +16,8 @@ from cli_agent_orchestrator.providers.manager import provider_manager
 from cli_agent_orchestrator.services.fifo_reader import fifo_manager
 from cli_agent_orchestrator.services.memory_format import parse_index_entry
 from cli_agent_orchestrator.services.status_monitor import status_monitor
+from cli_agent_orchestrator.services.terminal_log_store import terminal_log_store
+from cli_agent_orchestrator.services.terminal_search import terminal_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -66,10 +68,23 @@ def cleanup_old_data():
             db.commit()
             logger.info(f"Deleted {deleted_messages} old inbox messages from database")
 
-        # Clean up old terminal log files
+        # Clean up old terminal log files. A terminal whose live log went
+        # quiet before the cutoff is removed with all its segments; a
+        # still-active one only loses sealed segments older than the cutoff,
+        # keeping its logical offsets intact.
         terminal_logs_deleted = 0
         if TERMINAL_LOG_DIR.exists():
-            for pattern in ("*.log", "*.scrollback", "*.snapshot.json"):
+            for index_file in TERMINAL_LOG_DIR.glob("*.idx"):
+                terminal_logs_deleted += terminal_log_store.prune(
+                    TERMINAL_LOG_DIR, index_file.stem, cutoff_date.timestamp()
+                )
+            for log_file in TERMINAL_LOG_DIR.glob("*.log"):
+                if log_file.stat().st_mtime < cutoff_date.timestamp():
+                    terminal_logs_deleted += terminal_log_store.remove(
+                        TERMINAL_LOG_DIR, log_file.stem
+                    )
+                    terminal_search_index.discard(log_file.stem)
+            for pattern in ("*.scrollback", "*.snapshot.json"):
                 for log_file in TERMINAL_LOG_DIR.glob(pattern):
                     if log_file.stat().st_mtime < cutoff_date.timestamp():
                         log_file.unlink()
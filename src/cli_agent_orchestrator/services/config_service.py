@@ -296,9 +296,12 @@ def _load_raw() -> Dict[str, Any]:
 
 
 def _save_raw(data: Dict[str, Any]) -> None:
+    from cli_agent_orchestrator.services import settings_service
+
     settings_file = _settings_file()
     settings_file.parent.mkdir(parents=True, exist_ok=True)
     settings_file.write_text(json.dumps(data, indent=2))
+    settings_service.refresh_settings_snapshot()
 
 
 def _get_from_file(path: str) -> Any:
@@ -468,8 +471,8 @@ class ConfigService:
     """Single reader/writer for CAO's unified configuration.
 
     Stateless — every method re-resolves from env/file on each call (settings
-    files are small and infrequently read; see ``settings_service.get_server_settings``
-    for the one hot-path that still caches on mtime).
+    files are small and infrequently read; hot paths read
+    ``settings_service.get_settings_snapshot()`` instead).
     """
 
     @staticmethod
@@ -3,16 +3,28 @@
 Event Topics:
 - terminal.{id}.output  → raw output chunks (from FIFO readers)
 - terminal.{id}.status  → status changes (from StatusMonitor)
+
+Routing: subscription patterns are dot-separated segments where ``*`` matches
+exactly one (non-empty) segment. Patterns live in a segment trie; a topic is
+resolved against it once and the resulting subscriber tuple is cached, so a
+publish costs one dict lookup however many wildcard subscriptions exist.
+Subscribe/unsubscribe (rare) rebuild the trie and start a fresh cache, and
+swap both in as one immutable snapshot, so dispatch on the loop thread reads
+routes without taking the lock.
 """
 
 import asyncio
 import logging
-import re
 import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-from cli_agent_orchestrator.services.settings_service import get_server_settings
+from cli_agent_orchestrator.services.settings_service import (
+    SettingsSnapshot,
+    get_server_settings,
+    subscribe_settings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,18 +46,150 @@ _DROP_STATE_MAX_TOPICS = 1024
 _DROP_STATE_TTL_SECS = 300.0
 
 
+# Resolved-topic cache bound. Topics embed terminal IDs, so the cache is
+# simply restarted when it fills instead of tracking per-topic recency.
+_ROUTE_CACHE_MAX = 4096
+
+
+class _MergingQueue(asyncio.Queue):
+    """Subscriber queue that merges output instead of dropping it when full.
+
+    Once ``capacity`` events are pending, a new ``{"data": str}`` event is
+    concatenated onto the newest pending event of the same topic (the bytes
+    stay in order within that topic). With nothing pending for that topic it is
+    queued past capacity, which can happen at most once per topic before
+    merging takes over, so the queue stays bounded by capacity + live topics.
+    Order across different topics is not preserved for merged bytes, which is
+    why only per-terminal output subscribers opt in.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        # Unbounded underneath: capacity is enforced in put_nowait.
+        super().__init__()
+        self._capacity = capacity
+        self.merged = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._capacity
+
+    def _init(self, maxsize: int) -> None:
+        # Each entry is a one-item list so a pending event can be swapped for
+        # its merged successor in place; _tails maps topic -> newest entry.
+        self._queue: Deque[List[Dict[str, Any]]] = deque()
+        self._tails: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _put(self, item: Dict[str, Any]) -> None:
+        entry = [item]
+        self._queue.append(entry)
+        self._tails[item["topic"]] = entry
+
+    def _get(self) -> Dict[str, Any]:
+        entry = self._queue.popleft()
+        item = entry[0]
+        if self._tails.get(item["topic"]) is entry:
+            del self._tails[item["topic"]]
+        return item
+
+    def put_nowait(self, item: Dict[str, Any]) -> None:
+        if self._capacity > 0 and len(self._queue) >= self._capacity:
+            entry = self._tails.get(item["topic"])
+            chunk = item["data"].get("data")
+            if entry is not None and isinstance(chunk, str):
+                pending = entry[0]
+                entry[0] = {
+                    "topic": pending["topic"],
+                    "data": {**pending["data"], "data": pending["data"]["data"] + chunk},
+                }
+                self.merged += 1
+                return
+        super().put_nowait(item)
+
+
+class _Subscriber:
+    """One subscription and its delivery counters (updated on the loop thread)."""
+
+    __slots__ = ("pattern", "queue", "delivered", "dropped", "high_water")
+
+    def __init__(self, pattern: str, queue: asyncio.Queue) -> None:
+        self.pattern = pattern
+        self.queue = queue
+        self.delivered = 0
+        self.dropped = 0
+        self.high_water = 0
+
+
+class _TopicNode:
+    __slots__ = ("children", "wildcard", "subscribers")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TopicNode"] = {}
+        self.wildcard: Optional["_TopicNode"] = None
+        self.subscribers: Tuple[_Subscriber, ...] = ()
+
+
+class _Routes:
+    """Immutable trie snapshot plus the topic cache resolved against it."""
+
+    __slots__ = ("root", "cache")
+
+    def __init__(self, subscribers: List[_Subscriber]) -> None:
+        self.root = _TopicNode()
+        self.cache: Dict[str, Tuple[_Subscriber, ...]] = {}
+        for sub in subscribers:
+            node = self.root
+            for segment in sub.pattern.split("."):
+                if segment == "*":
+                    if node.wildcard is None:
+                        node.wildcard = _TopicNode()
+                    node = node.wildcard
+                else:
+                    node = node.children.setdefault(segment, _TopicNode())
+            node.subscribers += (sub,)
+
+    def resolve(self, topic: str) -> Tuple[_Subscriber, ...]:
+        frontier = [self.root]
+        for segment in topic.split("."):
+            matched = []
+            for node in frontier:
+                child = node.children.get(segment)
+                if child is not None:
+                    matched.append(child)
+                if node.wildcard is not None and segment:
+                    matched.append(node.wildcard)
+            if not matched:
+                return ()
+            frontier = matched
+        return tuple(sub for node in frontier for sub in node.subscribers)
+
+
+def _check_pattern(pattern: str) -> None:
+    for segment in pattern.split("."):
+        if "*" in segment and segment != "*":
+            raise ValueError(f"'*' must be a whole topic segment: {pattern!r}")
+
+
 class EventBus:
     """Thread-safe publishing, async consumption via asyncio.Queue."""
 
     def __init__(self):
-        self._exact: Dict[str, List[asyncio.Queue]] = {}
-        self._wildcard: Dict[str, Tuple[re.Pattern, List[asyncio.Queue]]] = {}
+        # Guards _subscribers and the _routes swap; dispatch never takes it.
         self._lock = threading.Lock()
+        self._subscribers: List[_Subscriber] = []
+        self._routes = _Routes([])
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         # Per-topic rate-limit state for queue-full drop reporting.
         # {topic: (dropped_since_last_log, last_log_monotonic)}
         self._drop_counts: Dict[str, int] = {}
         self._drop_last_logged: Dict[str, float] = {}
+        # event_bus_max_queue_size: resolved on first subscribe, then kept
+        # current by a settings listener so subscribe() never re-reads settings.
+        self._queue_maxsize: Optional[int] = None
+        subscribe_settings(self._on_settings_changed)
+
+    def _on_settings_changed(self, snapshot: SettingsSnapshot) -> None:
+        """Apply a new queue size to subscriptions made from now on."""
+        self._queue_maxsize = snapshot.server["event_bus_max_queue_size"]
 
     def set_loop(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
         """Register the asyncio event loop (required for thread-safe publishing).
@@ -55,6 +199,11 @@ class EventBus:
         """
         self._loop = loop
 
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """The loop events are dispatched on, or None while detached."""
+        return self._loop
+
     def publish(self, topic: str, data: dict) -> None:
         """Publish event to all matching subscribers. Safe to call from any thread."""
         loop = self._loop
@@ -68,46 +217,90 @@ class EventBus:
             # crashing the publisher thread.
             logger.debug(f"Event bus loop closed; dropping event: {topic}")
 
-    def subscribe(self, pattern: str) -> asyncio.Queue:
-        """Subscribe to a topic pattern (e.g., 'terminal.*.output'). Returns async queue."""
-        queue: asyncio.Queue = asyncio.Queue(
-            maxsize=get_server_settings()["event_bus_max_queue_size"]
-        )
+    def publish_batch(self, events: List[Tuple[str, dict]]) -> None:
+        """Publish several ``(topic, data)`` events with a single loop wake-up.
+
+        Same delivery as calling publish() per event, in order; used by
+        publishers that flush many terminals at once (the FIFO multiplexer).
+        Safe to call from any thread.
+        """
+        loop = self._loop
+        if loop is None or not events:
+            return
+        try:
+            loop.call_soon_threadsafe(self._dispatch_batch, events)
+        except RuntimeError:
+            logger.debug(f"Event bus loop closed; dropping {len(events)} events")
+
+    def _dispatch_batch(self, events: List[Tuple[str, dict]]) -> None:
+        for topic, data in events:
+            self._dispatch(topic, data)
+
+    def subscribe(self, pattern: str, merge_output: bool = False) -> asyncio.Queue:
+        """Subscribe to a topic pattern (e.g., 'terminal.*.output'). Returns async queue.
+
+        ``merge_output=True`` is for output consumers that concatenate chunks
+        anyway (StatusMonitor, LogWriter): when the queue is full, a new chunk
+        is merged into the same terminal's newest pending chunk instead of
+        being dropped, so back-pressure delays bytes but never loses them.
+
+        Raises:
+            ValueError: If ``*`` is used inside a segment rather than as one.
+        """
+        _check_pattern(pattern)
+        maxsize = self._queue_maxsize
+        if maxsize is None:
+            maxsize = self._queue_maxsize = get_server_settings()["event_bus_max_queue_size"]
+        queue: asyncio.Queue = _MergingQueue(maxsize) if merge_output else asyncio.Queue(maxsize)
 
         with self._lock:
-            if "*" in pattern:
-                regex = pattern.replace(".", r"\.").replace("*", "[^.]+")
-                if regex not in self._wildcard:
-                    self._wildcard[regex] = (re.compile(f"^{regex}$"), [])
-                self._wildcard[regex][1].append(queue)
-            else:
-                if pattern not in self._exact:
-                    self._exact[pattern] = []
-                self._exact[pattern].append(queue)
+            self._subscribers = [*self._subscribers, _Subscriber(pattern, queue)]
+            self._routes = _Routes(self._subscribers)
 
         return queue
 
     def unsubscribe(self, pattern: str, queue: asyncio.Queue) -> None:
         """Remove a queue from a subscription pattern."""
         with self._lock:
-            if "*" in pattern:
-                regex = pattern.replace(".", r"\.").replace("*", "[^.]+")
-                if regex in self._wildcard:
-                    queues = self._wildcard[regex][1]
-                    try:
-                        queues.remove(queue)
-                    except ValueError:
-                        pass
-                    if not queues:
-                        del self._wildcard[regex]
-            else:
-                if pattern in self._exact:
-                    try:
-                        self._exact[pattern].remove(queue)
-                    except ValueError:
-                        pass
-                    if not self._exact[pattern]:
-                        del self._exact[pattern]
+            remaining = [
+                sub
+                for sub in self._subscribers
+                if not (sub.queue is queue and sub.pattern == pattern)
+            ]
+            if len(remaining) != len(self._subscribers):
+                self._subscribers = remaining
+                self._routes = _Routes(remaining)
+
+    def clear(self) -> None:
+        """Drop every subscription (test fixtures re-bootstrapping per event loop)."""
+        with self._lock:
+            self._subscribers = []
+            self._routes = _Routes([])
+
+    def subscriber_stats(self) -> List[Dict[str, Any]]:
+        """Per-subscriber delivery and lag counters.
+
+        ``lag`` is the number of events waiting in the subscriber's queue right
+        now and ``high_water`` the most it has ever held; ``dropped`` counts
+        events lost to a full queue and ``merged`` chunks folded into a pending
+        one by a ``merge_output`` subscriber.
+        """
+        stats = []
+        for sub in self._subscribers:
+            queue = sub.queue
+            stats.append(
+                {
+                    "pattern": sub.pattern,
+                    "merge_output": isinstance(queue, _MergingQueue),
+                    "lag": queue.qsize(),
+                    "capacity": queue.maxsize,
+                    "high_water": sub.high_water,
+                    "delivered": sub.delivered,
+                    "dropped": sub.dropped,
+                    "merged": getattr(queue, "merged", 0),
+                }
+            )
+        return stats
 
     def _prune_drop_state(self, now: float) -> None:
         """Drop rate-limit entries for topics idle longer than the TTL.
@@ -173,26 +366,32 @@ class EventBus:
         """Route event to matching subscriber queues.
 
         Runs on the asyncio loop thread (via ``call_soon_threadsafe``), so
-        drop-count bookkeeping in ``_record_drop`` is single-threaded and
-        does not need its own lock.
+        the route cache, the subscriber counters and drop-count bookkeeping
+        in ``_record_drop`` are single-threaded and need no lock. One event
+        dict is shared by every subscriber.
         """
+        routes = self._routes
+        subscribers = routes.cache.get(topic)
+        if subscribers is None:
+            subscribers = routes.resolve(topic)
+            if len(routes.cache) >= _ROUTE_CACHE_MAX:
+                routes.cache.clear()
+            routes.cache[topic] = subscribers
+        if not subscribers:
+            return
         event = {"topic": topic, "data": data}
-        with self._lock:
-            # O(1) exact match lookup
-            for q in self._exact.get(topic, []):
-                try:
-                    q.put_nowait(event)
-                except asyncio.QueueFull:
-                    self._record_drop(topic)
-
-            # Wildcard pattern matching
-            for compiled, queues in self._wildcard.values():
-                if compiled.match(topic):
-                    for q in queues:
-                        try:
-                            q.put_nowait(event)
-                        except asyncio.QueueFull:
-                            self._record_drop(topic)
+        for sub in subscribers:
+            queue = sub.queue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                sub.dropped += 1
+                self._record_drop(topic)
+                continue
+            sub.delivered += 1
+            depth = queue.qsize()
+            if depth > sub.high_water:
+                sub.high_water = depth
 
 
 bus = EventBus()
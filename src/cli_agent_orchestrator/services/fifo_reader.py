@@ -1,14 +1,23 @@
 """FIFO reader for streaming terminal output from tmux pipe-pane.
 
 Publisher: terminal.{id}.output
+
+One multiplexer thread owns every terminal's FIFO: it waits on all read ends
+with a single ``selectors`` selector (epoll on Linux, kqueue on macOS),
+coalesces per terminal, and publishes each round's flushed batches with one
+event-loop wake-up. Idle terminals cost nothing — the thread only wakes for
+data, for a pending coalesce deadline, or for a reader being added/removed.
 """
 
+import hashlib
 import logging
 import os
-import select
+import selectors
 import threading
 import time
-from typing import Callable, Dict, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Hashable, List, Optional, Tuple
 
 from cli_agent_orchestrator.constants import (
     FIFO_DIR,
@@ -19,14 +28,15 @@ from cli_agent_orchestrator.constants import (
     PIPE_LIVENESS_STALL_CHECKS,
 )
 from cli_agent_orchestrator.services.event_bus import bus
+from cli_agent_orchestrator.services.stream_recorder import stream_recorder
 
 logger = logging.getLogger(__name__)
 
 CHUNK_SIZE = 4096
 
-# How often a parked reader re-checks its stop flag. Bounds both shutdown
-# latency and the cost of an idle terminal (one select wakeup per interval).
-_POLL_INTERVAL = 0.5
+# How long stop_reader() waits for the multiplexer to flush and close a
+# terminal's FIFO before giving up on it.
+_STOP_TIMEOUT = 2.0
 
 # Coalesce rapid-fire chunks into one publish per window. TUI providers (kiro-cli)
 # animate a spinner at ~10 fps; every frame is a separate FIFO write, and each
@@ -51,10 +61,55 @@ _COALESCE_MAX_BYTES = 64 * 1024
 # fakes. terminal_service wires the real backend calls at create_reader time.
 PaneProbe = Callable[[], str]  # returns the live pane content (tmux capture-pane tail)
 RearmPipe = Callable[[], None]  # re-attaches pipe-pane (stop then start, NOT a bare toggle)
+# Optional batched form of PaneProbe: maps each terminal's opaque probe key to
+# its live pane content in one backend round-trip (keys it could not capture
+# are simply absent). Lets a watchdog tick cost one tmux fork instead of a
+# listing + capture-pane per terminal; terminals missing from the result fall
+# back to their own PaneProbe.
+BatchPaneProbe = Callable[[List[Hashable]], Dict[Hashable, str]]
+
+
+def _content_digest(content: str) -> bytes:
+    """Fixed-size fingerprint of a pane capture, kept as the watchdog baseline."""
+    return hashlib.blake2b(content.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+@dataclass
+class _FifoStream:
+    """One terminal's FIFO as owned by the multiplexer thread."""
+
+    terminal_id: str
+    read_fd: int
+    keepalive_fd: int
+    topic: str = ""
+    pending: bytearray = field(default_factory=bytearray)
+    # Monotonic time at which the currently-accumulating batch started.
+    batch_start: float = 0.0
+    closed: bool = False
+
+    def __post_init__(self) -> None:
+        self.topic = f"terminal.{self.terminal_id}.output"
+
+    def take_event(self) -> Tuple[str, dict]:
+        event = (self.topic, {"data": self.pending.decode("utf-8", errors="replace")})
+        self.pending.clear()
+        return event
+
+    def close(self) -> None:
+        # Idempotent: closing twice could hit an fd number already reused by
+        # another terminal's stream.
+        if self.closed:
+            return
+        self.closed = True
+        for fd in (self.read_fd, self.keepalive_fd):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
 
 class FifoManager:
-    """Manages FIFO lifecycle: create named pipe, start reader thread, stop and cleanup.
+    """Manages FIFO lifecycle: create named pipe, read it on the shared multiplexer, stop and cleanup.
 
     Also runs a pipe-pane liveness watchdog (issue #388): tmux can silently
     stop forwarding a pane's output to the FIFO after a burst of alternate-screen
@@ -88,10 +143,25 @@ class FifoManager:
     """
 
     def __init__(self):
-        self._readers: Dict[str, threading.Event] = {}  # terminal_id -> stop flag
-        self._threads: Dict[str, threading.Thread] = {}
+        # terminal_id -> the terminal's stream, while it is registered. The
+        # stream's fds are only ever read/closed by the multiplexer thread.
+        self._readers: Dict[str, _FifoStream] = {}
         self._lock = threading.Lock()
 
+        # ---- FIFO multiplexer (one thread for every terminal) ----
+        # create_reader()/stop_reader() never touch the selector directly: they
+        # queue ("add", stream) / ("remove", terminal_id, done) commands and
+        # poke the wake pipe, so registering, reading and closing an fd all
+        # happen on the multiplexer thread and an fd can never be closed (and
+        # its number reused) under a concurrent read.
+        self._mux_commands: Deque[tuple] = deque()
+        self._mux_thread: Optional[threading.Thread] = None
+        # Set when the multiplexer thread died on an error (not a stop); the
+        # watchdog then restarts it even if no new reader comes along.
+        self._mux_failed = False
+        self._wake_r = -1
+        self._wake_w = -1
+
         # ---- pipe-pane liveness watchdog state (issue #388) ----
         # Monotonic timestamp of the last time this terminal is considered to
         # have delivered real, current output. Read by the watchdog to tell a
@@ -128,10 +198,15 @@ class FifoManager:
         # register these; herdr and callers that pass none are never watched).
         self._pane_probe: Dict[str, PaneProbe] = {}
         self._rearm: Dict[str, RearmPipe] = {}
-        # Per-terminal watchdog bookkeeping: (last_pane_content, last_check_monotonic,
-        # consecutive_diverging_checks). The full tail string (not a hash) is
-        # stored so an accidental hash collision can never mask a real stall.
-        self._liveness: Dict[str, Tuple[str, float, int]] = {}
+        # Batched probing: each terminal's key for the shared batch probe
+        # (only terminals enrolled with a probe_key are batched).
+        self._probe_keys: Dict[str, Hashable] = {}
+        self._batch_probe: Optional[BatchPaneProbe] = None
+        # Per-terminal watchdog bookkeeping: (baseline_digest, last_check_monotonic,
+        # consecutive_diverging_checks). Only a 128-bit digest of the baseline
+        # capture is kept, not the capture itself, so watchdog memory stays
+        # bounded no matter how many terminals or how long the probed tail.
+        self._liveness: Dict[str, Tuple[bytes, float, int]] = {}
         # Consecutive re-arm *failures* per terminal (rearm() raised). Reset on
         # any successful re-arm; once it hits PIPE_LIVENESS_MAX_REARM_FAILURES
         # the terminal is dropped from the watchdog instead of retrying forever.
@@ -146,13 +221,30 @@ class FifoManager:
         terminal_id: str,
         pane_probe: Optional[PaneProbe] = None,
         rearm: Optional[RearmPipe] = None,
+        probe_key: Optional[Hashable] = None,
     ) -> None:
-        """Create FIFO and start reader thread.
+        """Create the FIFO and hand it to the multiplexer thread.
 
         ``pane_probe``/``rearm`` are optional and only supplied by pipe-pane
         (tmux) callers. When both are given, the terminal is enrolled in the
         liveness watchdog (issue #388). Callers that omit them (or backends
         without pipe-pane) get exactly the old behavior — no watchdog.
+        ``probe_key`` additionally lets the watchdog capture this terminal
+        through the batch probe installed with ``set_batch_probe()``.
+
+        Never blocks in a FIFO ``open()`` (issue #382): the original design
+        opened the pipe with a plain blocking ``O_RDONLY`` and reopened on
+        every EOF, which parked the reader in the kernel's ``wait_for_partner``
+        whenever no writer was attached; readers stranded that way on unlinked
+        inodes accumulated until the whole server wedged. Instead:
+
+        - the read end is opened ``O_RDONLY | O_NONBLOCK``, which succeeds
+          immediately for a FIFO even with no writer;
+        - a keepalive write end is held by this process, so the pipe never
+          reaches writer-count zero — the selector therefore only reports the
+          fd readable when actual data arrives (avoiding the busy EOF spin a
+          writer-less non-blocking FIFO would otherwise produce), and tmux
+          detaching its ``pipe-pane`` writer produces no EOF churn at all.
         """
         fifo_path = FIFO_DIR / f"{terminal_id}.fifo"
 
@@ -165,15 +257,10 @@ class FifoManager:
             if not fifo_path.exists():
                 os.mkfifo(fifo_path)
 
-            stop_flag = threading.Event()
-            thread = threading.Thread(
-                target=self._reader_loop,
-                args=(terminal_id, fifo_path, stop_flag),
-                daemon=True,
-                name=f"fifo-{terminal_id}",
-            )
-            self._readers[terminal_id] = stop_flag
-            self._threads[terminal_id] = thread
+            stream = self._open_stream(terminal_id)
+            if stream is None:
+                return
+            self._readers[terminal_id] = stream
             # Seed the liveness clock BEFORE pipe-pane starts so the first
             # watchdog check has a baseline; the reader bumps it on real data.
             now = time.monotonic()
@@ -183,7 +270,11 @@ class FifoManager:
             if enroll:
                 self._pane_probe[terminal_id] = pane_probe
                 self._rearm[terminal_id] = rearm
-            thread.start()
+                if probe_key is not None:
+                    self._probe_keys[terminal_id] = probe_key
+            self._ensure_multiplexer_locked()
+            self._mux_commands.append(("add", stream))
+            self._wake_multiplexer()
 
         if enroll:
             self._ensure_watchdog()
@@ -191,7 +282,7 @@ class FifoManager:
         logger.info("Started FIFO reader for terminal %s", terminal_id)
 
     def stop_reader(self, terminal_id: str) -> None:
-        """Stop the reader thread (if running) and delete the FIFO file.
+        """Stop reading the terminal's FIFO (if tracked) and delete the FIFO file.
 
         The unlink is best-effort and runs even when no in-memory reader is
         tracked for ``terminal_id`` — e.g. retention cleanup iterating DB
@@ -199,19 +290,24 @@ class FifoManager:
         ``*.fifo`` files may still be on disk. Without it those files would
         accumulate unbounded.
         """
+        done = threading.Event()
         with self._lock:
-            stop_flag = self._readers.pop(terminal_id, None)
-            thread = self._threads.pop(terminal_id, None)
+            stream = self._readers.pop(terminal_id, None)
             # Drop watchdog bookkeeping so a re-created terminal starts clean and
             # the watchdog stops probing a gone pane.
             self._pane_probe.pop(terminal_id, None)
             self._rearm.pop(terminal_id, None)
+            self._probe_keys.pop(terminal_id, None)
             self._liveness.pop(terminal_id, None)
             self._last_data_at.pop(terminal_id, None)
             self._rearm_failures.pop(terminal_id, None)
             self._registered_at.pop(terminal_id, None)
             self._ever_delivered.pop(terminal_id, None)
             self._cold_start_attempts.pop(terminal_id, None)
+            mux_alive = self._mux_thread is not None and self._mux_thread.is_alive()
+            if stream is not None and mux_alive:
+                self._mux_commands.append(("remove", stream, done))
+                self._wake_multiplexer()
 
         # Deliberately NOT stopping the watchdog thread here even when this was
         # the last enrolled terminal: doing it under a "now idle" check raced
@@ -225,26 +321,29 @@ class FifoManager:
         # actually torn down at process shutdown (api/main.py's lifespan).
         fifo_path = FIFO_DIR / f"{terminal_id}.fifo"
 
-        if stop_flag and thread:
-            # The reader never blocks in open()/read() (non-blocking fd +
-            # select with a timeout), so setting the flag is sufficient — it is
-            # observed within one poll interval. No write-side "wakeup" open is
-            # needed; the old wakeup raced with the reader's reopen cycle and
-            # could strand the thread forever in a blocking FIFO open on an
-            # unlinked inode (issue #382).
-            stop_flag.set()
-            thread.join(timeout=2.0)
-            if thread.is_alive():
-                # Never silent: a leaked reader thread was how #382's wedge
-                # built up. With the non-blocking loop this should not happen.
+        if stream is not None:
+            if not mux_alive:
+                stream.close()
+            # The multiplexer never blocks in open()/read() (non-blocking fds),
+            # so it handles the removal — flush pending bytes, unregister, close
+            # both fds — on its next wake-up. No write-side "wakeup" open of the
+            # FIFO is needed; that raced with the old reader's reopen cycle and
+            # could strand it forever on an unlinked inode (issue #382).
+            elif not done.wait(timeout=_STOP_TIMEOUT):
+                # Never silent: a reader that kept its fds open past teardown
+                # was how #382's wedge built up.
                 logger.warning(
-                    "FIFO reader thread for terminal %s did not exit "
-                    "within 2s; leaking a daemon thread",
+                    "FIFO multiplexer did not release terminal %s within %ss",
                     terminal_id,
+                    _STOP_TIMEOUT,
                 )
             else:
                 logger.info("Stopped FIFO reader for terminal %s", terminal_id)
 
+        # After the multiplexer released the stream, so a recording (if any)
+        # ends with the terminal's final flushed bytes.
+        stream_recorder.stop(terminal_id)
+
         # Best-effort unlink regardless of whether a reader was tracked — when
         # none is tracked there is no active reader holding the FIFO, so removing
         # a stale file on disk is safe.
@@ -253,127 +352,240 @@ class FifoManager:
         except OSError:
             pass
 
-    def _reader_loop(self, terminal_id: str, fifo_path, stop_flag: threading.Event) -> None:
-        """Read chunks from FIFO and publish to the event bus.
+    # ---- FIFO multiplexer -----------------------------------------------------
 
-        Never blocks in a FIFO ``open()`` (issue #382): the previous design
-        opened the pipe with a plain blocking ``O_RDONLY`` and reopened on
-        every EOF, which parked the thread in the kernel's ``wait_for_partner``
-        whenever no writer was attached. ``stop_reader``'s write-side wakeup
-        only worked if the thread happened to be inside ``open()`` at that
-        instant — miss the window (post-EOF reopen, error sleep) and the
-        thread was stranded forever on an inode whose name had been unlinked.
-        Accumulated leaks eventually wedged the whole server.
-
-        Instead:
-        - the read end is opened ``O_RDONLY | O_NONBLOCK``, which succeeds
-          immediately for a FIFO even with no writer;
-        - a keepalive write end is held by this process, so the pipe never
-          reaches writer-count zero — ``select`` therefore only reports the fd
-          readable when actual data arrives (avoiding the busy EOF spin a
-          writer-less non-blocking FIFO would otherwise produce), and tmux
-          detaching its ``pipe-pane`` writer produces no EOF churn at all;
-        - ``select`` uses a timeout so the stop flag is observed within
-          ``_POLL_INTERVAL`` seconds regardless of traffic.
-
-        Chunks are also coalesced (``_COALESCE_WINDOW``) before publishing.
-        Kiro's TUI animates a spinner at ~10 fps and each frame is a separate
-        FIFO write — publishing one event per raw read floods the shared
-        async queue (1024 slots, drop-on-full), and the dropped events wiped
-        out worker state transitions that assign/handoff rely on. Batching
-        every 50ms of chunks into one event drops the publish rate ~20x
-        during bursts while staying well under the status monitor's 200ms
-        quiescence debounce, so detection is unaffected and consumers see
-        the same bytes in the same order.
+    @staticmethod
+    def _open_stream(terminal_id: str) -> Optional[_FifoStream]:
+        """Open both ends of ``terminal_id``'s FIFO, or log and return None."""
+        fifo_path = FIFO_DIR / f"{terminal_id}.fifo"
+        try:
+            # Non-blocking read open of a FIFO succeeds immediately (POSIX),
+            # writer attached or not.
+            read_fd = os.open(str(fifo_path), os.O_RDONLY | os.O_NONBLOCK)
+            try:
+                # With our read end open, a non-blocking write open cannot ENXIO.
+                keepalive_fd = os.open(str(fifo_path), os.O_WRONLY | os.O_NONBLOCK)
+            except OSError:
+                os.close(read_fd)
+                raise
+        except OSError as e:
+            logger.error("Failed to open FIFO for terminal %s: %s", terminal_id, e)
+            return None
+        return _FifoStream(terminal_id, read_fd, keepalive_fd)
+
+    def _ensure_multiplexer_locked(self) -> None:
+        """Start the multiplexer thread on first use (caller holds ``_lock``).
+
+        A previous thread that crashed (or was stopped) closed every stream it
+        owned. Terminals still registered are reopened and handed to the new
+        thread, so one failure never silently cuts off every existing
+        terminal's output; a tmux writer that lost the pipe meanwhile is
+        re-armed by the liveness watchdog.
+        """
+        if self._mux_thread is not None and self._mux_thread.is_alive():
+            return
+        self._mux_failed = False
+        if self._wake_r < 0:
+            self._wake_r, self._wake_w = os.pipe()
+            os.set_blocking(self._wake_r, False)
+            os.set_blocking(self._wake_w, False)
+        for terminal_id, stream in list(self._readers.items()):
+            if not stream.closed:
+                continue  # queued "add" the new thread will pick up
+            fifo_path = FIFO_DIR / f"{terminal_id}.fifo"
+            try:
+                if not fifo_path.exists():
+                    os.mkfifo(fifo_path)
+            except OSError as e:
+                logger.error("Failed to recreate FIFO for terminal %s: %s", terminal_id, e)
+                continue
+            reopened = self._open_stream(terminal_id)
+            if reopened is None:
+                continue
+            self._readers[terminal_id] = reopened
+            self._mux_commands.append(("add", reopened))
+            logger.info("Reattached FIFO reader for terminal %s", terminal_id)
+        self._mux_thread = threading.Thread(
+            target=self._multiplexer_loop, daemon=True, name="fifo-multiplexer"
+        )
+        self._mux_thread.start()
+        if self._mux_commands:
+            self._wake_multiplexer()
+
+    def _wake_multiplexer(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except BlockingIOError:
+            pass  # Wake pipe already full: the thread is awake either way.
+
+    def _multiplexer_loop(self) -> None:
+        """Read every registered FIFO and publish coalesced output.
+
+        Chunks are coalesced per terminal (``_COALESCE_WINDOW``) before
+        publishing. Kiro's TUI animates a spinner at ~10 fps and each frame
+        is a separate FIFO write — publishing one event per raw read floods
+        the shared async queue (1024 slots, drop-on-full), and the dropped
+        events wiped out worker state transitions that assign/handoff rely
+        on. Batching every 50ms of a terminal's chunks into one event drops
+        the publish rate ~20x during bursts while staying well under the
+        status monitor's 200ms quiescence debounce, so detection is
+        unaffected and consumers see the same bytes in the same order. A
+        batch is also flushed early once it reaches ``_COALESCE_MAX_BYTES``.
+
+        Everything flushed in one pass is handed to the event bus as a single
+        batch (one ``call_soon_threadsafe``), however many terminals it spans.
 
         Liveness bookkeeping for the pipe-pane watchdog (issue #388) is
         recorded independent of coalescing, right when bytes are pulled off
-        the FIFO — the watchdog only cares whether the FIFO delivered data
-        in a window, not whether/when that data was published.
+        a FIFO — the watchdog only cares whether the FIFO delivered data in a
+        window, not whether/when that data was published.
         """
-        topic = f"terminal.{terminal_id}.output"
-        read_fd = -1
-        keepalive_fd = -1
-        pending = bytearray()
-        # Time at which the currently-accumulating batch started.
-        batch_start = 0.0
+        selector = selectors.DefaultSelector()
+        selector.register(self._wake_r, selectors.EVENT_READ)
+        streams: Dict[int, _FifoStream] = {}
+        failed = False
         try:
-            # Non-blocking read open of a FIFO succeeds immediately (POSIX),
-            # writer attached or not.
-            read_fd = os.open(str(fifo_path), os.O_RDONLY | os.O_NONBLOCK)
-            # With our read end open, a non-blocking write open cannot ENXIO.
-            keepalive_fd = os.open(str(fifo_path), os.O_WRONLY | os.O_NONBLOCK)
-
-            while not stop_flag.is_set():
-                # Wait at most _COALESCE_WINDOW so we always flush pending data
-                # within one window even when the writer went silent mid-burst
-                # (e.g. kiro's TUI paused between spinner frames). The
-                # _POLL_INTERVAL upper bound is still honored when nothing has
-                # been received yet (pending is empty).
-                timeout = _COALESCE_WINDOW if pending else _POLL_INTERVAL
-                readable, _, _ = select.select([read_fd], [], [], timeout)
-                if readable:
-                    try:
-                        raw = os.read(read_fd, CHUNK_SIZE)
-                    except BlockingIOError:
-                        raw = b""
-                    if raw:
-                        # Record liveness for the pipe-pane watchdog (issue
-                        # #388): the watchdog treats "pane advanced but no
-                        # byte delivered since the last check" as a stall.
-                        # This must be recorded the instant bytes are pulled
-                        # off the FIFO, independent of the coalescing/publish
-                        # schedule below — the watchdog cares whether the FIFO
-                        # delivered data, not whether/when a batch flushed.
-                        #
-                        # Guarded by membership rather than unconditional: if
-                        # stop_reader already popped this terminal (torn down
-                        # while this thread was mid-read, before it noticed
-                        # stop_flag), writing here would resurrect a dict entry
-                        # nothing will ever clean up again — a slow leak across
-                        # create/stop churn. The check-then-write must happen
-                        # under _lock as one critical section: a stop_reader()
-                        # pop between an unlocked check and the assignment
-                        # could still resurrect the entry (round-3 Copilot
-                        # review on #397). Cheap and non-blocking either way —
-                        # this is a plain dict write, not the slow tmux probe.
-                        with self._lock:
-                            if terminal_id in self._readers:
-                                self._last_data_at[terminal_id] = time.monotonic()
-                                self._ever_delivered[terminal_id] = True
-                        if not pending:
-                            batch_start = time.monotonic()
-                        pending.extend(raw)
-
-                # Flush conditions: window elapsed, size cap hit, or select
-                # returned nothing (writer went idle). "Writer went idle"
-                # matters because kiro's TUI can stop emitting bytes mid-turn
-                # (waiting on an LLM response) — we must publish what we have
-                # so status detection can see the current buffer state.
-                if pending and (
-                    time.monotonic() - batch_start >= _COALESCE_WINDOW
-                    or len(pending) >= _COALESCE_MAX_BYTES
-                    or not readable
-                ):
-                    bus.publish(topic, {"data": pending.decode("utf-8", errors="replace")})
-                    pending.clear()
-        except Exception as e:
-            if not stop_flag.is_set():
-                logger.error("FIFO reader for terminal %s exiting on error: %s", terminal_id, e)
+            while True:
+                timeout = None
+                batching = [stream for stream in streams.values() if stream.pending]
+                if batching:
+                    deadline = min(stream.batch_start for stream in batching) + _COALESCE_WINDOW
+                    timeout = max(deadline - time.monotonic(), 0.0)
+
+                ready = selector.select(timeout)
+                events: List[Tuple[str, dict]] = []
+                # stop_reader() waiters, released once their final bytes are published.
+                released: List[threading.Event] = []
+                stopping = False
+                for key, _ in ready:
+                    if key.fd == self._wake_r:
+                        self._drain_wake_pipe()
+                        stopping = self._apply_mux_commands(selector, streams, events, released)
+                        continue
+                    stream = streams.get(key.fd)
+                    if stream is not None:
+                        self._read_stream(selector, streams, stream, events)
+
+                # Flush batches whose window elapsed or that hit the size cap
+                # (everything, when stopping).
+                now = time.monotonic()
+                for stream in streams.values():
+                    if stream.pending and (
+                        stopping
+                        or now - stream.batch_start >= _COALESCE_WINDOW
+                        or len(stream.pending) >= _COALESCE_MAX_BYTES
+                    ):
+                        events.append(stream.take_event())
+                if events:
+                    if stream_recorder.active:
+                        stream_recorder.record_output(events)
+                    bus.publish_batch(events)
+                for done in released:
+                    done.set()
+                if stopping:
+                    return
+        except Exception:
+            logger.exception("FIFO multiplexer exiting on error")
+            failed = True
         finally:
-            # Flush any unpublished bytes so the last frame of a torn-down
-            # terminal isn't lost — status/log consumers may need it.
-            if pending:
+            for stream in streams.values():
+                stream.close()
+            selector.close()
+        if failed:
+            # Only now that every stream is closed, so a restart reopens them all.
+            with self._lock:
+                self._mux_failed = True
+
+    def _drain_wake_pipe(self) -> None:
+        try:
+            while os.read(self._wake_r, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def _apply_mux_commands(
+        self,
+        selector: selectors.BaseSelector,
+        streams: Dict[int, _FifoStream],
+        events: List[Tuple[str, dict]],
+        released: List[threading.Event],
+    ) -> bool:
+        """Apply queued add/remove/stop commands; returns True on stop."""
+        stop = False
+        while self._mux_commands:
+            command = self._mux_commands.popleft()
+            if command[0] == "stop":
+                stop = True
+            elif command[0] == "add":
+                stream = command[1]
+                if stream.closed:
+                    continue
                 try:
-                    bus.publish(topic, {"data": pending.decode("utf-8", errors="replace")})
-                except Exception:
-                    pass
-            for fd in (read_fd, keepalive_fd):
-                if fd >= 0:
-                    try:
-                        os.close(fd)
-                    except OSError:
-                        pass
+                    selector.register(stream.read_fd, selectors.EVENT_READ)
+                except (OSError, ValueError) as e:
+                    logger.error("Failed to watch FIFO for terminal %s: %s", stream.terminal_id, e)
+                    stream.close()
+                    continue
+                streams[stream.read_fd] = stream
+            else:
+                _, stream, done = command
+                if streams.get(stream.read_fd) is stream:
+                    del streams[stream.read_fd]
+                    selector.unregister(stream.read_fd)
+                    # Flush any unpublished bytes so the last frame of a torn-down
+                    # terminal isn't lost — status/log consumers may need it.
+                    if stream.pending:
+                        events.append(stream.take_event())
+                stream.close()
+                released.append(done)
+        return stop
+
+    def _read_stream(
+        self,
+        selector: selectors.BaseSelector,
+        streams: Dict[int, _FifoStream],
+        stream: _FifoStream,
+        events: List[Tuple[str, dict]],
+    ) -> None:
+        terminal_id = stream.terminal_id
+        try:
+            raw = os.read(
+                stream.read_fd, max(_COALESCE_MAX_BYTES - len(stream.pending), CHUNK_SIZE)
+            )
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # Treat like the old per-terminal reader exiting on error: stop
+            # reading this FIFO, keep serving every other terminal.
+            logger.error("FIFO reader for terminal %s exiting on error: %s", terminal_id, e)
+            streams.pop(stream.read_fd, None)
+            selector.unregister(stream.read_fd)
+            if stream.pending:
+                events.append(stream.take_event())
+            stream.close()
+            return
+        if not raw:
+            return
+        # Record liveness for the pipe-pane watchdog (issue #388): the
+        # watchdog treats "pane advanced but no byte delivered since the last
+        # check" as a stall, so this happens the instant bytes are pulled off
+        # the FIFO, independent of the coalescing/publish schedule.
+        #
+        # Guarded by membership rather than unconditional: if stop_reader
+        # already popped this terminal (torn down while its removal command
+        # was still queued), writing here would resurrect a dict entry nothing
+        # will ever clean up again — a slow leak across create/stop churn. The
+        # check-then-write must happen under _lock as one critical section: a
+        # stop_reader() pop between an unlocked check and the assignment could
+        # still resurrect the entry (round-3 Copilot review on #397).
+        with self._lock:
+            now = time.monotonic()
+            if terminal_id in self._readers:
+                self._last_data_at[terminal_id] = now
+                self._ever_delivered[terminal_id] = True
+        if not stream.pending:
+            stream.batch_start = now
+        stream.pending.extend(raw)
 
     # ---- pipe-pane liveness watchdog (issue #388) ---------------------------
 
@@ -390,6 +602,27 @@ class FifoManager:
             )
             self._watchdog_thread.start()
 
+    def stop_multiplexer(self) -> None:
+        """Stop the multiplexer thread (shutdown / tests).
+
+        Pending output is flushed and every FIFO fd is closed. Terminals still
+        registered stay tracked but are no longer read until the next
+        create_reader() restarts the thread and reopens them; stop_reader()
+        still cleans them up.
+        """
+        with self._lock:
+            thread = self._mux_thread
+            if thread is None or not thread.is_alive():
+                return
+            self._mux_commands.append(("stop",))
+            self._wake_multiplexer()
+        thread.join(timeout=_STOP_TIMEOUT)
+
+    def set_batch_probe(self, batch_probe: Optional[BatchPaneProbe]) -> None:
+        """Install (or with None, remove) the watchdog's batched pane probe."""
+        with self._lock:
+            self._batch_probe = batch_probe
+
     def stop_watchdog(self) -> None:
         """Stop the watchdog thread (shutdown / tests)."""
         self._watchdog_stop.set()
@@ -407,14 +640,41 @@ class FifoManager:
             # _check_pipe_liveness(), which takes it again itself per-terminal
             # — so no lock is held across the slow probe()/rearm() calls.
             with self._lock:
+                if self._mux_failed and not self._mux_thread.is_alive():
+                    self._ensure_multiplexer_locked()
                 terminal_ids = list(self._pane_probe.keys())
+                probe_keys = {
+                    tid: self._probe_keys[tid] for tid in terminal_ids if tid in self._probe_keys
+                }
+                batch_probe = self._batch_probe
+            # Capture every batchable pane in one round-trip up front: besides
+            # saving the per-terminal forks, it stops probes for terminals late
+            # in the list drifting behind the tick.
+            contents: Dict[Hashable, str] = {}
+            probed_at = time.monotonic()
+            if batch_probe is not None and probe_keys:
+                try:
+                    contents = batch_probe(list(dict.fromkeys(probe_keys.values())))
+                except Exception:
+                    logger.exception("batched pane probe failed; probing terminals one by one")
+                probed_at = time.monotonic()
             for terminal_id in terminal_ids:
                 try:
-                    self._check_pipe_liveness(terminal_id)
+                    key = probe_keys.get(terminal_id)
+                    content = contents.get(key) if key is not None else None
+                    if content is None:
+                        self._check_pipe_liveness(terminal_id)
+                    else:
+                        self._check_pipe_liveness(terminal_id, content, probed_at)
                 except Exception:
                     logger.exception("pipe-pane liveness check failed for terminal %s", terminal_id)
 
-    def _check_pipe_liveness(self, terminal_id: str) -> None:
+    def _check_pipe_liveness(
+        self,
+        terminal_id: str,
+        content: Optional[str] = None,
+        probed_at: Optional[float] = None,
+    ) -> None:
         """One liveness check for a terminal: re-arm a stalled pipe-pane forwarder.
 
         A stalled forwarder is invisible from inside the FIFO reader (no bytes to
@@ -454,6 +714,9 @@ class FifoManager:
         a variant of the divergence logic — it is checked instead of it,
         because divergence requires a healthy baseline to diverge FROM, and a
         pipe that's been dead since t=0 never gets one. See module docstring.
+
+        ``content``/``probed_at`` carry a capture the watchdog already took
+        through the batch probe; without them the terminal's own probe runs.
         """
         probe = self._pane_probe.get(terminal_id)
         rearm = self._rearm.get(terminal_id)
@@ -463,8 +726,11 @@ class FifoManager:
         # probe() is a slow tmux `capture-pane` call — deliberately made
         # without holding self._lock so it never blocks stop_reader() (or
         # other terminals' housekeeping) for its duration.
-        content = probe()
-        now = time.monotonic()
+        if content is None:
+            content = probe()
+            probed_at = None
+        now = probed_at if probed_at is not None else time.monotonic()
+        digest = _content_digest(content)
 
         do_rearm = False
         cold_start = False
@@ -516,6 +782,7 @@ class FifoManager:
                     cold_start_give_up = True
                     self._pane_probe.pop(terminal_id, None)
                     self._rearm.pop(terminal_id, None)
+                    self._probe_keys.pop(terminal_id, None)
                     self._liveness.pop(terminal_id, None)
                     self._rearm_failures.pop(terminal_id, None)
                     self._registered_at.pop(terminal_id, None)
@@ -535,14 +802,14 @@ class FifoManager:
                     # the divergence check starts clean on the next tick
                     # instead of possibly re-triggering off a baseline
                     # captured before rearm.
-                    self._liveness[terminal_id] = (content, now, 0)
+                    self._liveness[terminal_id] = (digest, now, 0)
             else:
                 prev = self._liveness.get(terminal_id)
                 if prev is None:
                     # First observation: establish a baseline, never act on it.
-                    self._liveness[terminal_id] = (content, now, 0)
+                    self._liveness[terminal_id] = (digest, now, 0)
                 else:
-                    baseline_content, last_check_at, strikes = prev
+                    baseline_digest, last_check_at, strikes = prev
 
                     # Did the reader deliver anything since the previous check?
                     fifo_advanced = last_data_at >= last_check_at
@@ -550,16 +817,16 @@ class FifoManager:
                     if fifo_advanced:
                         # Healthy: the pipe is confirmed delivering. Re-baseline
                         # to the current pane content and clear strikes.
-                        self._liveness[terminal_id] = (content, now, 0)
+                        self._liveness[terminal_id] = (digest, now, 0)
                     else:
                         # FIFO silent since the last check. Compare against the
                         # STICKY baseline (last known-healthy content), not the
                         # previous check's content — see docstring for why this
-                        # matters for a burst-then-settle stall. Full tail
-                        # string compared, not a hash: a hash collision would
-                        # make this False and mask a real stall (negligible
-                        # probability, but the string is just as cheap to
-                        # compare and collision-free).
+                        # matters for a burst-then-settle stall. Compared by
+                        # 128-bit digest: a collision that masks a real stall
+                        # is far less likely than tmux itself misbehaving, and
+                        # it keeps the pinned baseline from holding a full
+                        # capture per terminal.
                         #
                         # Tradeoff (round-3 review, call-me-ram): pinning the
                         # baseline means ANY one-shot pane divergence seen
@@ -574,7 +841,7 @@ class FifoManager:
                         # idle pipe plus one snapshot replay), and it's the
                         # unavoidable price of catching a stall that settles
                         # into a new static frame — accepted deliberately.
-                        diverged_from_baseline = content != baseline_content
+                        diverged_from_baseline = digest != baseline_digest
 
                         if diverged_from_baseline:
                             strikes += 1
@@ -589,7 +856,7 @@ class FifoManager:
                         # accumulating strikes against the original pre-stall
                         # baseline across checks where the now-static content
                         # no longer changes.
-                        self._liveness[terminal_id] = (baseline_content, now, strikes)
+                        self._liveness[terminal_id] = (baseline_digest, now, strikes)
 
         if cold_start_give_up:
             logger.error(
@@ -659,6 +926,7 @@ class FifoManager:
                 if give_up:
                     self._pane_probe.pop(terminal_id, None)
                     self._rearm.pop(terminal_id, None)
+                    self._probe_keys.pop(terminal_id, None)
                     self._liveness.pop(terminal_id, None)
                     self._rearm_failures.pop(terminal_id, None)
                     self._registered_at.pop(terminal_id, None)
@@ -687,7 +955,10 @@ class FifoManager:
             self._rearm_failures.pop(terminal_id, None)
             self._last_data_at[terminal_id] = time.monotonic()
 
-        bus.publish(f"terminal.{terminal_id}.output", {"data": replay})
+        event = (f"terminal.{terminal_id}.output", {"data": replay})
+        if stream_recorder.active:
+            stream_recorder.record_output([event])
+        bus.publish(*event)
 
 
 # Module-level singleton
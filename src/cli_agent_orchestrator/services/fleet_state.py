@@ -0,0 +1,333 @@
+"""Process-wide fleet projection behind the AG-UI ``STATE_DELTA`` channel.
+
+``/agui/v1/stream`` used to rebuild the whole ``DashboardSnapshot`` for every
+bus event on every connected stream: ``session_service.list_sessions()`` (a
+backend call plus a terminal query per session), another terminal query per
+session, then a full diff, all on the event loop. ``FleetState`` keeps one
+scope-less snapshot for the whole process instead:
+
+* Lifecycle records (``launch`` / ``completion``) mark it dirty. The next
+  ``refresh()`` re-reads the fleet once, in a worker thread, however many
+  streams saw the record.
+* ``terminal.*.status`` events from StatusMonitor patch one terminal's
+  ``status`` in place, with no I/O.
+* While a dashboard is connected, the fleet is also re-read every
+  ``AGUI_FLEET_RECONCILE_INTERVAL`` seconds to catch changes that raised no
+  event.
+
+Each change bumps ``version`` and records its RFC 6902 ops
+(``diff_snapshot_by_id``) once. Streams remember the version they last sent
+and fetch the concatenated ops since then with ``deltas_since``, so the cost
+of a change is paid once, not once per subscriber. A stream that falls
+further behind than the retained history gets a fresh ``STATE_SNAPSHOT``.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from cli_agent_orchestrator.constants import AGUI_FLEET_RECONCILE_INTERVAL
+from cli_agent_orchestrator.services.ui_state_service import (
+    build_dashboard_snapshot,
+    diff_snapshot_by_id,
+)
+from cli_agent_orchestrator.utils.event import terminal_id_from_topic
+
+logger = logging.getLogger(__name__)
+
+# Versions whose ops are retained for streams catching up.
+_DELTA_HISTORY = 64
+
+# Event ids remembered so a record seen by several streams dirties the
+# projection once.
+_SEEN_EVENT_IDS = 512
+
+# Record kinds / legacy types that add or remove sessions and terminals.
+_LIFECYCLE_KINDS = frozenset({"launch", "completion"})
+_LIFECYCLE_LEGACY_TYPES = frozenset(
+    {"session.created", "session.killed", "terminal.created", "terminal.killed"}
+)
+
+FleetLoader = Callable[[], Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]
+
+
+def _load_fleet() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Read sessions and their terminal rows (blocking; run off the loop).
+
+    A failing per-session terminal listing is skipped so one bad session can't
+    blank the dashboard; ``list_sessions`` itself already returns ``[]`` when
+    the backend is unavailable.
+    """
+    from cli_agent_orchestrator.clients import database
+    from cli_agent_orchestrator.services import session_service
+
+    sessions = session_service.list_sessions()
+    terminals: List[Dict[str, Any]] = []
+    for sess in sessions:
+        try:
+            terminals.extend(database.list_terminals_by_session(sess["id"]))
+        except Exception:
+            logger.debug("fleet_state: terminal listing failed for %s", sess.get("id"))
+    return sessions, terminals
+
+
+class FleetWatch:
+    """One stream's wake-up signal, set from any thread when the fleet changes."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.changed = asyncio.Event()
+
+
+class FleetState:
+    """Versioned, incrementally maintained fleet ``DashboardSnapshot``.
+
+    State is guarded by a ``threading.Lock`` because rebuilds run in worker
+    threads; ``refresh`` is the only method that does I/O.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[FleetLoader] = None,
+        reconcile_interval: float = AGUI_FLEET_RECONCILE_INTERVAL,
+    ) -> None:
+        self._loader = loader or _load_fleet
+        self._reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        # Serializes rebuilds so concurrent refreshers load the fleet once.
+        self._refresh_lock = threading.Lock()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._version = 0
+        self._deltas: Deque[Tuple[int, List[Dict[str, Any]]]] = deque(maxlen=_DELTA_HISTORY)
+        self._dirty = True
+        # Last status StatusMonitor published per terminal; DB rows carry none.
+        self._statuses: Dict[str, str] = {}
+        self._seen: Deque[str] = deque(maxlen=_SEEN_EVENT_IDS)
+        self._seen_set: Set[str] = set()
+        self._watches: List[FleetWatch] = []
+        self._follower: Optional[asyncio.Task] = None
+
+    # ------------------------------------------------------------------
+    # Subscribers
+    # ------------------------------------------------------------------
+
+    def attach(self) -> FleetWatch:
+        """Register a stream; the first one starts status following.
+
+        Must be called on the event loop. A projection nobody watched may have
+        drifted, so the first stream starts from a fresh read.
+        """
+        watch = FleetWatch(asyncio.get_running_loop())
+        with self._lock:
+            if not self._watches:
+                self._snapshot = None
+                self._deltas.clear()
+                self._seen.clear()
+                self._seen_set.clear()
+                self._dirty = True
+            self._watches.append(watch)
+        if self._follower is None or self._follower.done():
+            self._follower = asyncio.create_task(self._follow())
+        return watch
+
+    def detach(self, watch: FleetWatch) -> None:
+        """Unregister a stream (idempotent); the last one stops the follower."""
+        with self._lock:
+            self._watches = [w for w in self._watches if w is not watch]
+            idle = not self._watches
+        if idle and self._follower is not None:
+            self._follower.cancel()
+            self._follower = None
+
+    # ------------------------------------------------------------------
+    # Inputs
+    # ------------------------------------------------------------------
+
+    def observe(self, event: Dict[str, Any]) -> None:
+        """Note a bus record; lifecycle records mark the fleet for a re-read."""
+        if event.get("kind") not in _LIFECYCLE_KINDS and (
+            event.get("type") not in _LIFECYCLE_LEGACY_TYPES
+        ):
+            return
+        event_id = event.get("id")
+        with self._lock:
+            if event_id is not None:
+                if event_id in self._seen_set:
+                    return
+                if len(self._seen) == self._seen.maxlen:
+                    self._seen_set.discard(self._seen[0])
+                self._seen.append(event_id)
+                self._seen_set.add(event_id)
+            self._dirty = True
+
+    def mark_dirty(self) -> None:
+        with self._lock:
+            self._dirty = True
+
+    def set_status(self, terminal_id: str, status: Optional[str]) -> None:
+        """Apply a StatusMonitor transition without touching the backend."""
+        if status is None:
+            return
+        with self._lock:
+            self._statuses[terminal_id] = status
+            if self._snapshot is None:
+                return
+            terminals = self._snapshot["terminals"]
+            index = next((i for i, view in enumerate(terminals) if view["id"] == terminal_id), None)
+            if index is None or terminals[index]["status"] == status:
+                return
+            updated = list(terminals)
+            updated[index] = {**terminals[index], "status": status}
+            ops = [{"op": "replace", "path": f"/terminals/{index}/status", "value": status}]
+            self._publish_locked({**self._snapshot, "terminals": updated}, ops)
+        self._notify()
+
+    async def refresh(self) -> None:
+        """Re-read the fleet if a lifecycle record dirtied it.
+
+        Raises whatever the loader raises; the projection stays dirty so the
+        next call retries.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+        if await asyncio.to_thread(self._refresh_sync):
+            self._notify()
+
+    def _refresh_sync(self) -> bool:
+        with self._refresh_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False  # another refresher loaded it while we waited
+                self._dirty = False
+            try:
+                sessions, terminals = self._loader()
+            except Exception:
+                self.mark_dirty()
+                raise
+            with self._lock:
+                # Forget statuses of terminals that left the fleet, but keep one
+                # that arrived before its terminal's row was first listed.
+                live = {row.get("id") for row in terminals}
+                prev = self._snapshot
+                listed = {view["id"] for view in prev["terminals"]} if prev else set()
+                self._statuses = {
+                    t: s for t, s in self._statuses.items() if t in live or t not in listed
+                }
+                rows = [
+                    (
+                        {**row, "status": self._statuses[row["id"]]}
+                        if row.get("status") is None and row.get("id") in self._statuses
+                        else row
+                    )
+                    for row in terminals
+                ]
+                curr = build_dashboard_snapshot(sessions, rows)
+                del curr["scopes"]  # per stream; added by the endpoint
+                if prev is None:
+                    self._publish_locked(curr, None)
+                    return True
+                ops = diff_snapshot_by_id(prev, curr)
+                if not ops:
+                    return False
+                self._publish_locked(curr, ops)
+                return True
+
+    def _publish_locked(
+        self, snapshot: Dict[str, Any], ops: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        self._version += 1
+        self._snapshot = snapshot
+        if ops is None:
+            # A fresh baseline: earlier versions can't be patched forward.
+            self._deltas.clear()
+        else:
+            self._deltas.append((self._version, ops))
+
+    def _notify(self) -> None:
+        with self._lock:
+            watches = list(self._watches)
+        for watch in watches:
+            try:
+                watch.loop.call_soon_threadsafe(watch.changed.set)
+            except RuntimeError:
+                pass  # the stream's loop is gone; detach will follow
+
+    # ------------------------------------------------------------------
+    # Outputs
+    # ------------------------------------------------------------------
+
+    def current(self) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """``(version, snapshot)``; the snapshot is shared, never mutate it."""
+        with self._lock:
+            return self._version, self._snapshot
+
+    def deltas_since(self, version: int) -> Optional[List[Dict[str, Any]]]:
+        """Ops taking the snapshot at ``version`` to the current one.
+
+        Returns ``[]`` when ``version`` is current and None when the retained
+        history no longer reaches back that far (send a snapshot instead).
+        """
+        with self._lock:
+            if version == self._version:
+                return []
+            if not self._deltas or not self._deltas[0][0] - 1 <= version < self._version:
+                return None
+            return [op for v, version_ops in self._deltas if v > version for op in version_ops]
+
+    # ------------------------------------------------------------------
+    # Background follower (runs while at least one stream is attached)
+    # ------------------------------------------------------------------
+
+    async def _follow(self) -> None:
+        from cli_agent_orchestrator.services.event_bus import bus
+
+        queue = bus.subscribe("terminal.*.status")
+        # One fixed deadline, not a fresh timeout per event: on a busy fleet
+        # status events arrive more often than the interval, and the
+        # reconcile that corrects drift must still run.
+        next_reconcile = time.monotonic() + self._reconcile_interval
+        try:
+            while True:
+                remaining = next_reconcile - time.monotonic()
+                if remaining > 0:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    else:
+                        terminal_id = terminal_id_from_topic(event["topic"])
+                        self.set_status(terminal_id, event["data"].get("status"))
+                        continue
+                next_reconcile = time.monotonic() + self._reconcile_interval
+                self.mark_dirty()
+                try:
+                    await self.refresh()
+                except Exception:
+                    logger.warning("fleet_state: reconcile failed", exc_info=True)
+        finally:
+            bus.unsubscribe("terminal.*.status", queue)
+
+
+_fleet_state: Optional[FleetState] = None
+_fleet_state_lock = threading.Lock()
+
+
+def get_fleet_state() -> FleetState:
+    """Return the process-wide ``FleetState`` (lazily created)."""
+    global _fleet_state
+    if _fleet_state is None:
+        with _fleet_state_lock:
+            if _fleet_state is None:
+                _fleet_state = FleetState()
+    return _fleet_state
+
+
+def reset_fleet_state() -> None:
+    """Drop the singleton projection (used by tests to start with a clean slate)."""
+    global _fleet_state
+    with _fleet_state_lock:
+        _fleet_state = None
@@ -16,16 +16,26 @@ scheduling a single ``asyncio.to_thread(write)``. Same-terminal chunks are
 concatenated into one file-open, keeping ordering and cutting file-open
 overhead. Different terminals' chunks are grouped by path so a burst on
 terminal A doesn't block writes for terminal B.
+
+Storage
+-------
+Chunks go through ``terminal_log_store``: the live ``{id}.log`` keeps an open
+append handle between batches and is sealed into a compressed segment once it
+reaches ``TERMINAL_LOG_SEGMENT_BYTES``, so a long-lived terminal's log no
+longer grows as one unbounded file. The same worker-thread hop then feeds
+the batch to ``terminal_search_index`` with each chunk's log offset, so
+search indexing never runs on the event loop.
 """
 
 import asyncio
 import logging
 from collections import defaultdict
-from pathlib import Path
 from typing import Dict, List
 
 from cli_agent_orchestrator.constants import TERMINAL_LOG_DIR
 from cli_agent_orchestrator.services.event_bus import bus
+from cli_agent_orchestrator.services.terminal_log_store import terminal_log_store
+from cli_agent_orchestrator.services.terminal_search import terminal_search_index
 from cli_agent_orchestrator.utils.event import terminal_id_from_topic
 
 logger = logging.getLogger(__name__)
@@ -48,9 +58,14 @@ class LogWriter:
     """
 
     async def run(self) -> None:
-        queue = bus.subscribe("terminal.*.output")
+        queue = bus.subscribe("terminal.*.output", merge_output=True)
         logger.info("LogWriter started")
+        try:
+            await self._drain(queue)
+        finally:
+            terminal_log_store.close_all()
 
+    async def _drain(self, queue: "asyncio.Queue[dict]") -> None:
         while True:
             try:
                 # Block until at least one event is available.
@@ -66,14 +81,13 @@ class LogWriter:
                     except asyncio.QueueEmpty:
                         break
 
-                # Group same-file writes so we open each file at most once
-                # per batch. Preserves order because dict-of-lists append
+                # Group same-terminal writes so each log is appended at most
+                # once per batch. Preserves order because dict-of-lists append
                 # order matches drain order (Python 3.7+ dicts are ordered).
-                grouped: Dict[Path, List[str]] = defaultdict(list)
+                grouped: Dict[str, List[str]] = defaultdict(list)
                 for event in events:
                     terminal_id = terminal_id_from_topic(event["topic"])
-                    log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
-                    grouped[log_path].append(event["data"]["data"])
+                    grouped[terminal_id].append(event["data"]["data"])
 
                 # One thread hop per unique file, not per event. Schedule the
                 # per-file writes concurrently (gather) so a large batch for
@@ -81,8 +95,8 @@ class LogWriter:
                 # each is an independent append to a distinct path.
                 await asyncio.gather(
                     *(
-                        asyncio.to_thread(self._write, path, "".join(chunks))
-                        for path, chunks in grouped.items()
+                        asyncio.to_thread(self._write, terminal_id, chunks)
+                        for terminal_id, chunks in grouped.items()
                     )
                 )
             except Exception as e:
@@ -91,12 +105,17 @@ class LogWriter:
                 logger.error(f"Failed to write log: {e}")
 
     @staticmethod
-    def _write(path: Path, data: str) -> None:
-        # Explicit UTF-8: the platform default encoding can be non-UTF-8
-        # (e.g. POSIX/C locale), and a single unencodable chunk would raise
-        # UnicodeEncodeError and stop log persistence for the terminal.
-        with open(path, "a", encoding="utf-8", errors="replace") as f:
-            f.write(data)
+    def _write(terminal_id: str, chunks: List[str]) -> None:
+        # Explicit UTF-8 with replacement: a single unencodable chunk (lone
+        # surrogate) would otherwise raise UnicodeEncodeError and stop log
+        # persistence for the terminal.
+        encoded = [chunk.encode("utf-8", errors="replace") for chunk in chunks]
+        offset = terminal_log_store.append(TERMINAL_LOG_DIR, terminal_id, b"".join(encoded))
+        located = []
+        for chunk, raw in zip(chunks, encoded):
+            located.append((offset, chunk))
+            offset += len(raw)
+        terminal_search_index.add(terminal_id, located, offset)
 
 
 log_writer = LogWriter()
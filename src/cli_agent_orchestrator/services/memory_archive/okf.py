@@ -29,7 +29,7 @@ import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 import frontmatter
 
@@ -43,6 +43,7 @@ from cli_agent_orchestrator.services.secret_gate import redact_secrets, scan_for
 from cli_agent_orchestrator.utils.path_validation import resolve_and_validate_path
 
 if TYPE_CHECKING:
+    from cli_agent_orchestrator.services.memory_bulk import MemoryBulkSession
     from cli_agent_orchestrator.services.memory_service import MemoryService
 
 logger = logging.getLogger(__name__)
@@ -78,6 +79,21 @@ _CONFLICT_POLICIES = frozenset({"skip", "replace", "merge"})
 _HEADER_COMMENT_RE = re.compile(r"<!--\s*id:")
 
 
+@dataclass
+class _ParsedTopic:
+    """One bundle file after the inbound parse pipeline (pre-store)."""
+
+    rel: str
+    key: str
+    rejected: Optional[str] = None  # rejection reason; the other fields are unset
+    memory_type: str = MemoryType.REFERENCE.value
+    tags: str = ""
+    occurred_at: Optional[datetime] = None
+    body: str = ""
+    see_also_dropped: int = 0
+    escaped: bool = False
+
+
 @dataclass
 class _Topic:
     """One topic collected for export (post secret-gate)."""
@@ -138,35 +154,16 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         )
 
         report = ExportReport()
-        topics = self._collect_topics(scope, scope_id, include_history, redact, report)
-        dest_real.mkdir(parents=True, exist_ok=True)
-
-        # Bundle-relative path per surviving (scope_id, key) — the See-Also
-        # normalization target set. A link whose key is absent here (e.g.
-        # its topic was secret-skipped) degrades to plain text.
-        rel_paths: Dict[Tuple[Optional[str], str], str] = {
-            (t.scope_id, t.key): t.rel_path for t in topics
-        }
-
-        written_rel: Set[str] = set()
-        for topic in sorted(topics, key=lambda t: (t.scope_id or "", t.key)):
-            body = self._normalize_see_also(topic.body, topic.scope_id, rel_paths, report)
-            content = self._render_topic(topic, body)
-            if self._write_if_changed(dest_real / topic.rel_path, content):
-                report.exported += 1
-            else:
-                report.unchanged += 1
-            written_rel.add(topic.rel_path)
-            if include_history and topic.history:
-                history_rel = f"{_HISTORY_DIR}/{topic.rel_path}"
-                self._write_if_changed(dest_real / history_rel, topic.history)
-                written_rel.add(history_rel)
+        with self._svc.bulk() as bulk:
+            topics = self._collect_topics(scope, scope_id, include_history, redact, report, bulk)
+            dest_real.mkdir(parents=True, exist_ok=True)
+            self._write_topics(dest_real, topics, include_history, report, bulk)
 
         self._write_if_changed(dest_real / "index.md", self._render_index(topics))
         self._write_if_changed(dest_real / "manifest.md", self._render_manifest(scope, scope_id))
 
         if prune:
-            self._prune(dest_real, written_rel, report)
+            self._prune(dest_real, {rel for t in topics for rel in self._topic_files(t)}, report)
 
         logger.info(
             "okf_export_completed scope=%s exported=%d unchanged=%d skipped_secret=%d "
@@ -181,6 +178,44 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         )
         return report
 
+    @staticmethod
+    def _topic_files(topic: _Topic) -> List[str]:
+        """Bundle-relative files one exported topic owns (prune keep-set)."""
+        if topic.history:
+            return [topic.rel_path, f"{_HISTORY_DIR}/{topic.rel_path}"]
+        return [topic.rel_path]
+
+    def _write_topics(
+        self,
+        dest: Path,
+        topics: List[_Topic],
+        include_history: bool,
+        report: ExportReport,
+        bulk: "MemoryBulkSession",
+    ) -> None:
+        """Render every topic, then write the changed files on the bulk workers."""
+        # Bundle-relative path per surviving (scope_id, key) — the See-Also
+        # normalization target set. A link whose key is absent here (e.g.
+        # its topic was secret-skipped) degrades to plain text.
+        rel_paths: Dict[Tuple[Optional[str], str], str] = {
+            (t.scope_id, t.key): t.rel_path for t in topics
+        }
+
+        topic_files: List[Tuple[Path, str]] = []
+        history_files: List[Tuple[Path, str]] = []
+        for topic in sorted(topics, key=lambda t: (t.scope_id or "", t.key)):
+            body = self._normalize_see_also(topic.body, topic.scope_id, rel_paths, report)
+            topic_files.append((dest / topic.rel_path, self._render_topic(topic, body)))
+            if include_history and topic.history:
+                history_files.append((dest / _HISTORY_DIR / topic.rel_path, topic.history))
+
+        written = bulk.map(lambda f: self._write_if_changed(*f), topic_files + history_files)
+        for changed in written[: len(topic_files)]:
+            if changed:
+                report.exported += 1
+            else:
+                report.unchanged += 1
+
     def import_bundle(
         self,
         src: Path,
@@ -221,6 +256,7 @@ class OkfArchiveBackend(MemoryArchiveBackend):
 
         report = ImportReport(target_scope=target_scope, target_scope_id=scope_id, dry_run=dry_run)
 
+        candidates: List[Tuple[Path, str]] = []
         for path in sorted(src_real.rglob("*.md")):
             rel = path.relative_to(src_real).as_posix()
             if path.name in _RESERVED_FILES or rel.split("/", 1)[0] == _HISTORY_DIR:
@@ -239,15 +275,25 @@ class OkfArchiveBackend(MemoryArchiveBackend):
                     "nested topic paths are not supported; place topics in the bundle root",
                 )
                 continue
-            self._import_one_topic(
-                path,
-                rel,
-                target_scope,
-                scope_id,
-                conflict_policy,
-                dry_run,
-                terminal_context,
-                report,
+            candidates.append((path, rel))
+
+        # Parse, escape and secret-scan every file on the bulk workers, then
+        # apply them in bundle order through store(), whose index, metadata
+        # and wiki writes the session batches until exit.
+        with self._svc.bulk() as bulk:
+            parsed = bulk.map(
+                lambda c: self._parse_topic(c[0], c[1], target_scope, bulk), candidates
+            )
+            asyncio.run(
+                self._import_topics(
+                    parsed,
+                    target_scope,
+                    scope_id,
+                    conflict_policy,
+                    dry_run,
+                    terminal_context,
+                    report,
+                )
             )
 
         logger.info(
@@ -268,41 +314,34 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         )
         return report
 
-    def _import_one_topic(
-        self,
-        path: Path,
-        rel: str,
-        target_scope: str,
-        scope_id: Optional[str],
-        conflict_policy: str,
-        dry_run: bool,
-        terminal_context: Optional[dict],
-        report: ImportReport,
-    ) -> None:
-        """Run one bundle file through the D5 inbound pipeline.
+    def _parse_topic(
+        self, path: Path, rel: str, target_scope: str, bulk: "MemoryBulkSession"
+    ) -> _ParsedTopic:
+        """Run one bundle file through the D5 inbound parse pipeline.
 
-        Per-file failures record a key-only rejection and return — the
-        import continues with the remaining files. Only pattern names and
-        filenames appear in the report/logs, never content bytes.
+        Thread-safe (runs on the bulk workers): touches no report state. A
+        per-file failure comes back as ``rejected``; only pattern names and
+        filenames appear in it or the logs, never content bytes.
         """
         key = path.stem
+        parsed = _ParsedTopic(rel=rel, key=key)
         try:
             sanitized = self._sanitize_key_safe(key)
         except ValueError:
             sanitized = None
         if sanitized != key:
-            self._reject(report, rel, "filename stem fails key sanitizer round-trip")
-            return
+            parsed.rejected = "filename stem fails key sanitizer round-trip"
+            return parsed
 
         try:
             post = frontmatter.loads(path.read_text(encoding="utf-8"))
         except OSError as e:
-            self._reject(report, rel, f"unreadable file: {e.__class__.__name__}")
-            return
+            parsed.rejected = f"unreadable file: {e.__class__.__name__}"
+            return parsed
         except Exception as e:  # noqa: BLE001 — untrusted YAML can raise any parser error
             logger.warning("okf_import_unparseable key=%s error=%s", key, e.__class__.__name__)
-            self._reject(report, rel, f"frontmatter parse failed: {e.__class__.__name__}")
-            return
+            parsed.rejected = f"frontmatter parse failed: {e.__class__.__name__}"
+            return parsed
 
         meta = post.metadata
         # ``type`` is required by OKF §9 — its absence is a per-file
@@ -311,34 +350,71 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         # silently (test 7).
         raw_type = meta.get("type")
         if raw_type is None:
-            self._reject(report, rel, "missing required frontmatter key: type")
-            return
+            parsed.rejected = "missing required frontmatter key: type"
+            return parsed
         try:
-            memory_type = MemoryType(str(raw_type)).value
+            parsed.memory_type = MemoryType(str(raw_type)).value
         except ValueError:
-            memory_type = MemoryType.REFERENCE.value
+            parsed.memory_type = MemoryType.REFERENCE.value
 
-        tags = self._coerce_tags(meta.get("tags"))
-        occurred_at = self._coerce_timestamp(meta.get("timestamp"), key)
+        parsed.tags = self._coerce_tags(meta.get("tags"))
+        parsed.occurred_at = self._coerce_timestamp(meta.get("timestamp"), key)
 
         # Body pipeline, in order: strip See-Also (export-only in PR 1),
         # escape structural markers, drop the leading H1 (store() writes
         # its own).
-        body, dropped = self._strip_see_also_block(post.content)
-        report.see_also_dropped += dropped
-        body, escaped = self._escape_structural_markers(body)
-        if escaped:
-            report.bodies_escaped += 1
-        body = self._strip_leading_h1(body, key).strip()
+        body, parsed.see_also_dropped = self._strip_see_also_block(post.content)
+        body, parsed.escaped = self._escape_structural_markers(body)
+        parsed.body = self._strip_leading_h1(body, key).strip()
 
         # Federated is credential-gated (parity with store()'s gate, but
-        # reported per file so dry_run sees it too). Pattern NAME only.
+        # reported per file so dry_run sees it too). Pattern NAME only. The
+        # session memoizes the result, so store() does not scan it again.
         if target_scope == MemoryScope.FEDERATED.value:
-            hit = scan_for_secrets(body)
+            hit = bulk.scan(parsed.body)
             if hit:
                 logger.warning("okf_import_secret_rejected key=%s", key)
-                self._reject(report, rel, f"matched credential pattern {hit!r}")
-                return
+                parsed.rejected = f"matched credential pattern {hit!r}"
+        return parsed
+
+    async def _import_topics(
+        self,
+        parsed: List[_ParsedTopic],
+        target_scope: str,
+        scope_id: Optional[str],
+        conflict_policy: str,
+        dry_run: bool,
+        terminal_context: Optional[dict],
+        report: ImportReport,
+    ) -> None:
+        """Apply parsed topics in bundle order (one event loop for the lot)."""
+        for topic in parsed:
+            await self._import_one_topic(
+                topic, target_scope, scope_id, conflict_policy, dry_run, terminal_context, report
+            )
+
+    async def _import_one_topic(
+        self,
+        topic: _ParsedTopic,
+        target_scope: str,
+        scope_id: Optional[str],
+        conflict_policy: str,
+        dry_run: bool,
+        terminal_context: Optional[dict],
+        report: ImportReport,
+    ) -> None:
+        """Count one parsed topic into ``report`` and store it unless dry-run.
+
+        A rejection (parse or store) is recorded and the import continues
+        with the remaining files.
+        """
+        report.see_also_dropped += topic.see_also_dropped
+        if topic.escaped:
+            report.bodies_escaped += 1
+        if topic.rejected is not None:
+            self._reject(report, topic.rel, topic.rejected)
+            return
+        key = topic.key
 
         wiki_path = self._svc.get_wiki_path(target_scope, scope_id, key)
         exists = wiki_path.exists()
@@ -350,7 +426,7 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         if dry_run:
             # No store()/forget() calls — replicate store()'s D5 clamp rule
             # so the dry-run report matches what a real run would count.
-            if self._would_clamp(occurred_at, wiki_path, exists, conflict_policy):
+            if self._would_clamp(topic.occurred_at, wiki_path, exists, conflict_policy):
                 report.timestamps_clamped += 1
             if exists and conflict_policy == "replace":
                 report.replaced += 1
@@ -362,30 +438,26 @@ class OkfArchiveBackend(MemoryArchiveBackend):
 
         try:
             if exists and conflict_policy == "replace":
-                asyncio.run(
-                    self._svc.forget(
-                        key,
-                        scope=target_scope,
-                        scope_id=scope_id,
-                        terminal_context=terminal_context,
-                    )
-                )
-            memory = asyncio.run(
-                self._svc.store(
-                    content=body,
+                await self._svc.forget(
+                    key,
                     scope=target_scope,
-                    memory_type=memory_type,
-                    key=key,
-                    tags=tags,
+                    scope_id=scope_id,
                     terminal_context=terminal_context,
-                    occurred_at=occurred_at,
                 )
+            memory = await self._svc.store(
+                content=topic.body,
+                scope=target_scope,
+                memory_type=topic.memory_type,
+                key=key,
+                tags=topic.tags,
+                terminal_context=terminal_context,
+                occurred_at=topic.occurred_at,
             )
         except ValueError as e:
             # store()'s own validation (incl. its federated gate) — the
             # message carries pattern names / field names only, no content.
             logger.warning("okf_import_store_rejected key=%s", key)
-            self._reject(report, rel, str(e))
+            self._reject(report, topic.rel, str(e))
             return
 
         if memory.timestamp_clamped:
@@ -541,20 +613,22 @@ class OkfArchiveBackend(MemoryArchiveBackend):
         include_history: bool,
         redact: bool,
         report: ExportReport,
+        bulk: "MemoryBulkSession",
     ) -> List[_Topic]:
         """Enumerate the scope's topics via the container index walk.
 
         Uses the index walk (not ``recall()``, whose ``limit`` caps results)
         so every topic of the scope is enumerated. Entries are filtered
         strictly to ``scope`` (and to ``scope_id`` when given for nested
-        scopes). Secret-gated per D5 before anything leaves the store.
+        scopes). Secret-gated per D5 before anything leaves the store; the
+        reads and gate scans run on the bulk workers.
         """
         index_path = self._svc.get_index_path(scope, scope_id)
         if not index_path.exists():
             return []
         entries = self._svc._parse_index(index_path)
 
-        topics: List[_Topic] = []
+        selected: List[dict] = []
         for entry in entries:
             if entry["scope"] != scope:
                 continue
@@ -569,57 +643,86 @@ class OkfArchiveBackend(MemoryArchiveBackend):
             if not self._entry_path_components_safe(entry["key"], entry_scope_id):
                 logger.warning("okf_export_unsafe_index_entry key=%s", entry["key"])
                 continue
+            selected.append(entry)
 
-            # Defense-in-depth: relative_path is index-derived and used as a
-            # READ path — a tampered entry (../ segments, symlink hop) must
-            # not read files outside the container's wiki dir. Key-only log.
-            wiki_file = (index_path.parent / entry["relative_path"]).resolve()
-            wiki_root = index_path.parent.resolve()
-            if not wiki_file.is_relative_to(wiki_root):
-                logger.warning("okf_export_unsafe_index_path key=%s", entry["key"])
-                continue
-            if not wiki_file.exists():
-                logger.debug("okf_export_missing_file key=%s", entry["key"])
-                continue
-            try:
-                file_content = wiki_file.read_text(encoding="utf-8")
-            except OSError as e:
-                logger.warning("okf_export_read_failed key=%s: %s", entry["key"], e)
-                continue
+        read = bulk.map(
+            lambda entry: self._read_topic(
+                index_path, scope, entry, include_history, redact, bulk.scan
+            ),
+            selected,
+        )
 
-            memory = self._svc._parse_wiki_file(wiki_file, file_content, entry)
-            if memory is None:
-                logger.debug("okf_export_unparseable key=%s", entry["key"])
+        topics: List[_Topic] = []
+        for entry, result in zip(selected, read):
+            if result is None:
                 continue
+            topic, fired = result
+            if self._record_secret_gate(entry["key"], fired, redact, report):
+                topics.append(topic)
+        return topics
 
-            headings = list(_TIMESTAMP_HEADING_RE.finditer(file_content))
-            latest_text = file_content[headings[-1].end() :].strip()
-            history_text = ""
-            if include_history and len(headings) > 1:
-                history_text = (
-                    file_content[headings[0].start() : headings[-1].start()].rstrip("\n") + "\n"
-                )
+    def _read_topic(
+        self,
+        index_path: Path,
+        scope: str,
+        entry: dict,
+        include_history: bool,
+        redact: bool,
+        scan: Callable[[str], Optional[str]],
+    ) -> Optional[Tuple[_Topic, List[str]]]:
+        """Read, parse and secret-gate one index entry (thread-safe).
 
-            gated = self._apply_secret_gate(entry["key"], latest_text, history_text, redact, report)
-            if gated is None:
-                continue
-            latest_text, history_text = gated
-
-            topics.append(
-                _Topic(
-                    key=entry["key"],
-                    scope_id=entry_scope_id if scope in _NESTED_SCOPES else None,
-                    nested=scope in _NESTED_SCOPES and entry_scope_id is not None,
-                    memory_type=memory.memory_type,
-                    tags=[t for t in (memory.tags or "").split(",") if t],
-                    description=self._derive_description(latest_text),
-                    created_iso=memory.created_at.strftime(_ISO_FORMAT),
-                    updated_iso=memory.updated_at.strftime(_ISO_FORMAT),
-                    body=latest_text,
-                    history=history_text,
-                )
+        Returns ``(topic, fired pattern names)`` — with ``redact`` the
+        topic already carries the redacted text — or None when the entry
+        cannot be exported.
+        """
+        # Defense-in-depth: relative_path is index-derived and used as a
+        # READ path — a tampered entry (../ segments, symlink hop) must
+        # not read files outside the container's wiki dir. Key-only log.
+        wiki_file = (index_path.parent / entry["relative_path"]).resolve()
+        wiki_root = index_path.parent.resolve()
+        if not wiki_file.is_relative_to(wiki_root):
+            logger.warning("okf_export_unsafe_index_path key=%s", entry["key"])
+            return None
+        if not wiki_file.exists():
+            logger.debug("okf_export_missing_file key=%s", entry["key"])
+            return None
+        try:
+            file_content = wiki_file.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.warning("okf_export_read_failed key=%s: %s", entry["key"], e)
+            return None
+
+        memory = self._svc._parse_wiki_file(wiki_file, file_content, entry)
+        if memory is None:
+            logger.debug("okf_export_unparseable key=%s", entry["key"])
+            return None
+
+        headings = list(_TIMESTAMP_HEADING_RE.finditer(file_content))
+        latest_text = file_content[headings[-1].end() :].strip()
+        history_text = ""
+        if include_history and len(headings) > 1:
+            history_text = (
+                file_content[headings[0].start() : headings[-1].start()].rstrip("\n") + "\n"
             )
-        return topics
+
+        latest_text, history_text, fired = self._apply_secret_gate(
+            latest_text, history_text, redact, scan
+        )
+        entry_scope_id = entry.get("scope_id")
+        topic = _Topic(
+            key=entry["key"],
+            scope_id=entry_scope_id if scope in _NESTED_SCOPES else None,
+            nested=scope in _NESTED_SCOPES and entry_scope_id is not None,
+            memory_type=memory.memory_type,
+            tags=[t for t in (memory.tags or "").split(",") if t],
+            description=self._derive_description(latest_text),
+            created_iso=memory.created_at.strftime(_ISO_FORMAT),
+            updated_iso=memory.updated_at.strftime(_ISO_FORMAT),
+            body=latest_text,
+            history=history_text,
+        )
+        return topic, fired
 
     @staticmethod
     def _entry_path_components_safe(key: str, entry_scope_id: Optional[str]) -> bool:
@@ -646,43 +749,53 @@ class OkfArchiveBackend(MemoryArchiveBackend):
 
     @staticmethod
     def _apply_secret_gate(
-        key: str,
         latest_text: str,
         history_text: str,
         redact: bool,
-        report: ExportReport,
-    ) -> Optional[Tuple[str, str]]:
+        scan: Callable[[str], Optional[str]],
+    ) -> Tuple[str, str, List[str]]:
         """Run the D5 declassification gate on one topic's outbound content.
 
-        Default policy: any hit skips the topic (returns ``None``) and
-        records the pattern NAME in ``skip_reasons``. With ``redact``,
-        matches are replaced and the topic exports. Only pattern names are
-        ever logged — never content bytes.
+        Returns ``(latest_text, history_text, fired)``. With ``redact``,
+        matches are replaced in the returned text; otherwise the text is
+        returned as-is and any ``fired`` pattern means the topic is skipped
+        (``_record_secret_gate``). Pure, so it can run on the bulk workers.
         """
         if redact:
             latest_text, fired = redact_secrets(latest_text)
             if history_text:
                 history_text, history_fired = redact_secrets(history_text)
                 fired.extend(n for n in history_fired if n not in fired)
-            if fired:
-                report.redacted += 1
-                logger.warning("okf_export_secret_redacted key=%s patterns=%s", key, fired)
-            return latest_text, history_text
+            return latest_text, history_text, fired
 
         fired = []
-        hit = scan_for_secrets(latest_text)
+        hit = scan(latest_text)
         if hit:
             fired.append(hit)
         if history_text:
-            history_hit = scan_for_secrets(history_text)
+            history_hit = scan(history_text)
             if history_hit and history_hit not in fired:
                 fired.append(history_hit)
-        if fired:
-            report.skipped_secret += 1
-            report.skip_reasons[key] = fired
-            logger.warning("okf_export_secret_skipped key=%s patterns=%s", key, fired)
-            return None
-        return latest_text, history_text
+        return latest_text, history_text, fired
+
+    @staticmethod
+    def _record_secret_gate(key: str, fired: List[str], redact: bool, report: ExportReport) -> bool:
+        """Count one topic's gate result; False when the topic is skipped.
+
+        Default policy: any hit skips the topic and records the pattern
+        NAME in ``skip_reasons``. With ``redact`` the topic exports. Only
+        pattern names are ever logged — never content bytes.
+        """
+        if not fired:
+            return True
+        if redact:
+            report.redacted += 1
+            logger.warning("okf_export_secret_redacted key=%s patterns=%s", key, fired)
+            return True
+        report.skipped_secret += 1
+        report.skip_reasons[key] = fired
+        logger.warning("okf_export_secret_skipped key=%s patterns=%s", key, fired)
+        return False
 
     # -------------------------------------------------------------------------
     # Rendering (deterministic — D3)
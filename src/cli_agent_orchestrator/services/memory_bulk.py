@@ -0,0 +1,234 @@
+"""Bulk write session for ``MemoryService`` (archive import/export).
+
+A plain ``store()`` does a full round trip per topic: it rewrites the
+scope's ``index.md`` under ``.index.lock``, commits its own SQLite
+transaction and writes the wiki file. Importing a bundle of thousands of
+topics therefore rewrites ``index.md`` thousands of times (quadratic in the
+index size) and commits thousands of transactions.
+
+Inside ``MemoryService.bulk()`` the same calls are deferred to this session:
+
+* wiki writes are buffered (a later ``store()`` of the same topic in the
+  session reads the buffered text) and land at exit, one atomic replace
+  per file;
+* index changes are collected per ``index.md`` and applied in one
+  read-modify-write per file at exit;
+* metadata upserts are committed in a single transaction at exit;
+* LLM compiles of merged topics are scheduled once the files exist.
+
+``map()`` fans per-topic preparation (file reads, frontmatter parsing,
+secret scanning) out over ``MEMORY_BULK_WORKERS`` threads, and ``scan()``
+memoizes secret-gate results so ``store()``'s federated gate does not
+re-scan a body the caller already checked.
+
+The active session lives in a ``ContextVar`` so only the caller that
+opened it is batched: concurrent ``store()`` calls from other requests on
+the same service keep their immediate, per-call durability. Buffered
+topics skip ``store()``'s per-topic flock; the session is meant for one
+bulk writer, not as a transaction against concurrent writers.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from cli_agent_orchestrator.services.memory_errors import MemoryPartialWriteError
+from cli_agent_orchestrator.services.secret_gate import scan_for_secrets
+
+if TYPE_CHECKING:
+    from cli_agent_orchestrator.services.memory_service import MemoryService
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# (scope section, key, relative path) -> index entry line, None to remove.
+IndexChanges = Dict[Tuple[str, str, str], Optional[str]]
+
+_active: ContextVar[Optional["MemoryBulkSession"]] = ContextVar(
+    "cao_memory_bulk_session", default=None
+)
+
+
+def active_bulk_session() -> Optional["MemoryBulkSession"]:
+    """The bulk session opened by this caller's context, if any."""
+    return _active.get()
+
+
+class MemoryBulkSession:
+    """Deferred wiki, index and metadata writes for one ``MemoryService``."""
+
+    def __init__(self, service: "MemoryService", workers: int) -> None:
+        self.service = service
+        self._workers = workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._files: Dict[Path, str] = {}
+        self._index: Dict[Path, IndexChanges] = {}
+        self._index_stamp: Dict[Path, str] = {}
+        self._metadata: Dict[Tuple[str, Optional[str], str], Dict[str, Any]] = {}
+        self._compiles: List[Dict[str, Any]] = []
+        self._scans: Dict[str, Optional[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Concurrent preparation
+    # ------------------------------------------------------------------
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """``fn`` over ``items`` on the session's worker threads, in order."""
+        items = list(items)
+        if self._workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._workers, thread_name_prefix="cao-memory-bulk"
+            )
+        return list(self._executor.map(fn, items))
+
+    def scan(self, content: str) -> Optional[str]:
+        """``scan_for_secrets`` memoized for the session (thread-safe)."""
+        try:
+            return self._scans[content]
+        except KeyError:
+            hit = self._scans[content] = scan_for_secrets(content)
+            return hit
+
+    # ------------------------------------------------------------------
+    # Deferred writes (called by MemoryService)
+    # ------------------------------------------------------------------
+
+    def pending(self, path: Path) -> Optional[str]:
+        """Buffered text for ``path``, or None when nothing is pending."""
+        return self._files.get(path)
+
+    def write(self, path: Path, content: str) -> None:
+        self._files[path] = content
+
+    def discard(self, path: Path) -> bool:
+        """Drop a buffered write (forget); True when one was pending."""
+        return self._files.pop(path, None) is not None
+
+    def defer_index(
+        self,
+        index_path: Path,
+        section: str,
+        key: str,
+        relative_path: str,
+        entry_line: Optional[str],
+        timestamp: str,
+    ) -> None:
+        changes = self._index.setdefault(index_path, {})
+        # Re-inserting moves the entry to the end: the last change applied
+        # is the newest, and the index lists the newest first.
+        changes.pop((section, key, relative_path), None)
+        changes[(section, key, relative_path)] = entry_line
+        self._index_stamp[index_path] = timestamp
+
+    def defer_metadata(self, fields: Dict[str, Any]) -> None:
+        identity = (fields["scope"], fields["scope_id"], fields["key"])
+        self._metadata[identity] = fields
+
+    def drop_metadata(self, key: str, scope: str, scope_id: Optional[str]) -> None:
+        self._metadata.pop((scope, scope_id, key), None)
+
+    def defer_compile(self, **kwargs: Any) -> None:
+        self._compiles.append(kwargs)
+
+    # ------------------------------------------------------------------
+    # Flush
+    # ------------------------------------------------------------------
+
+    def flush(self) -> None:
+        """Apply everything deferred: wiki files, then indexes, then metadata.
+
+        The same order ``store()`` uses, so a metadata failure leaves the
+        same repairable state (``MemoryPartialWriteError``).
+        """
+        files, self._files = self._files, {}
+        created: Set[Path] = set()
+        for path, content in files.items():
+            if path.parent not in created:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(path.parent)
+            tmp_path = path.parent / f".{path.stem}.tmp"
+            tmp_path.write_text(content, encoding="utf-8")
+            os.replace(str(tmp_path), str(path))
+
+        index, self._index = self._index, {}
+        stamps, self._index_stamp = self._index_stamp, {}
+        for index_path, changes in index.items():
+            self.service._write_index(index_path, changes, stamps[index_path])
+
+        rows, self._metadata = list(self._metadata.values()), {}
+        if rows:
+            try:
+                self.service._upsert_metadata_batch(rows)
+            except Exception as e:
+                logger.error(
+                    "Memory metadata SQLite batch upsert failed after durable writes (rows=%d)",
+                    len(rows),
+                )
+                raise MemoryPartialWriteError(
+                    key=rows[0]["key"],
+                    scope=rows[0]["scope"],
+                    scope_id=rows[0]["scope_id"],
+                    file_path=rows[0]["file_path"],
+                ) from e
+
+        compiles, self._compiles = self._compiles, []
+        for kwargs in compiles:
+            try:
+                self.service._schedule_background_compile(**kwargs)
+            except Exception as e:  # noqa: BLE001 — scheduling is best-effort
+                logger.warning(f"wiki compile not scheduled (key={kwargs.get('key')}): {e}")
+        if files or index:
+            logger.info(
+                "memory_bulk_flushed files=%d indexes=%d metadata_rows=%d",
+                len(files),
+                len(index),
+                len(rows),
+            )
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+@contextmanager
+def open_bulk_session(service: "MemoryService", workers: int) -> Iterator[MemoryBulkSession]:
+    """Batch ``service``'s writes from this context until exit (reentrant).
+
+    Deferred writes are flushed even when the body raises: everything the
+    caller stored before the error is as durable as with plain ``store()``.
+    """
+    current = _active.get()
+    if current is not None and current.service is service:
+        yield current
+        return
+    session = MemoryBulkSession(service, workers)
+    token = _active.set(session)
+    try:
+        yield session
+    finally:
+        _active.reset(token)
+        try:
+            session.flush()
+        finally:
+            session.close()
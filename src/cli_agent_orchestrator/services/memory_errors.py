@@ -0,0 +1,47 @@
+"""Memory error types and messages, importable without the memory service.
+
+``memory_service`` pulls in SQLAlchemy metadata, BM25 scoring and the wiki
+pipeline. Callers that only need to recognise a disabled or partially-written
+memory operation (``cao-mcp-server`` tools, CLI commands) import from here so
+their start-up does not pay for the service. ``memory_service`` re-exports
+every name for backwards compatibility.
+"""
+
+from typing import Optional
+
+MEMORY_DISABLED_MESSAGE = (
+    "memory subsystem is disabled. Set memory.enabled=true in settings.json " "to re-enable."
+)
+
+
+class MemoryDisabledError(RuntimeError):
+    """Raised when a write entry point is called while memory is disabled.
+
+    Read paths (recall, get_memory_context_for_terminal) instead return an
+    empty result, since silent empty reads are a safer no-op than raising.
+    """
+
+
+class MemoryPartialWriteError(RuntimeError):
+    """Raised when durable wiki projections outlive a failed metadata write."""
+
+    error_kind = "memory_metadata_partial_write"
+    repair_command = "cao memory repair --apply"
+
+    def __init__(
+        self,
+        *,
+        key: str,
+        scope: str,
+        scope_id: Optional[str],
+        file_path: str,
+    ) -> None:
+        self.key = key
+        self.scope = scope
+        self.scope_id = scope_id
+        self.file_path = file_path
+        self.completed_phases = ["wiki", "index"]
+        super().__init__(
+            "Memory content and index were saved, but SQLite metadata could not be updated. "
+            f"Run `{self.repair_command}`."
+        )
@@ -0,0 +1,169 @@
+"""Speculative ``<cao-memory>`` blocks for first-message injection.
+
+``inject_memory_context`` used to build a worker's memory block inside
+``send_input``: project resolution, a tmux cwd lookup, index parsing and wiki
+reads, all while the sender waited and before the first paste reached tmux.
+None of that depends on the message (only the curator path does), so
+``create_terminal`` now hands the terminal to ``MemoryContextPrefetcher``
+as soon as its row exists, and the block is built on a background thread
+while the provider starts.
+
+At send time ``take`` waits at most ``MEMORY_PREFETCH_DEADLINE_S`` for the
+terminal's block; past the deadline the message goes out without memory
+rather than blocking the sender. A terminal with no prefetch (created before
+a server restart) or a stale one (older than ``MEMORY_PREFETCH_TTL_S``, so
+memories stored since may be missing) is built on demand under the same
+deadline.
+
+Every injection is recorded by outcome -- ``hit`` (ready at send), ``wait``
+(ready within the deadline), ``miss`` (built on demand), ``timeout``,
+``error`` and ``curated`` (dispatched to the session's memory_manager) --
+in ``stats()`` and, with telemetry enabled, the
+``cao.memory.injection_latency`` histogram.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from cli_agent_orchestrator.constants import MEMORY_PREFETCH_DEADLINE_S, MEMORY_PREFETCH_TTL_S
+
+logger = logging.getLogger(__name__)
+
+# Background builds run concurrently with provider startup; a handful of
+# threads covers a team fan-out without competing with the API for SQLite.
+_WORKERS = 4
+
+OUTCOMES = ("hit", "wait", "miss", "timeout", "error", "curated")
+
+# A build's result: the block to inject, or None when the session runs a
+# memory_manager curator and the block has to be curated at send time.
+Builder = Callable[[], Optional[str]]
+
+
+class MemoryContextPrefetcher:
+    """Per-terminal memory blocks built ahead of the first message."""
+
+    def __init__(
+        self, deadline: float = MEMORY_PREFETCH_DEADLINE_S, ttl: float = MEMORY_PREFETCH_TTL_S
+    ) -> None:
+        self.deadline = deadline
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # terminal_id -> (build future, monotonic time it was scheduled)
+        self._entries: Dict[str, Tuple["Future[Optional[str]]", float]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats: Dict[str, Any] = {outcome: 0 for outcome in OUTCOMES}
+        self._stats.update(scheduled=0, latency_seconds=0.0)
+
+    def _submit(self, build: Builder) -> "Future[Optional[str]]":
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_WORKERS, thread_name_prefix="cao-memory-prefetch"
+                )
+            return self._executor.submit(build)
+
+    def schedule(self, terminal_id: str, build: Builder) -> None:
+        """Start building ``terminal_id``'s block in the background."""
+        future = self._submit(build)
+        with self._lock:
+            previous = self._entries.pop(terminal_id, None)
+            self._entries[terminal_id] = (future, time.monotonic())
+            self._stats["scheduled"] += 1
+        if previous is not None:
+            previous[0].cancel()
+
+    def take(self, terminal_id: str, build: Builder) -> Tuple[Optional[str], str]:
+        """Claim ``terminal_id``'s block, waiting at most ``deadline`` seconds.
+
+        Without a fresh prefetch, ``build`` runs now under the same deadline.
+        Returns ``(result, outcome)``: ``result`` is the build's value (None
+        on ``timeout``/``error``, or when the build asks for curation) and
+        ``outcome`` one of ``hit``, ``wait``, ``miss``, ``timeout``, ``error``.
+        """
+        with self._lock:
+            entry = self._entries.pop(terminal_id, None)
+        if entry is not None and time.monotonic() - entry[1] > self._ttl:
+            entry[0].cancel()
+            entry = None
+        if entry is None:
+            future, outcome = self._submit(build), "miss"
+        else:
+            future = entry[0]
+            outcome = "hit" if future.done() else "wait"
+        try:
+            return future.result(timeout=self.deadline), outcome
+        except FutureTimeoutError:
+            logger.info(
+                f"Memory context for terminal {terminal_id} not ready within "
+                f"{self.deadline}s; sending the first message without it"
+            )
+            return None, "timeout"
+        except Exception as e:
+            logger.warning(f"Failed to build memory context for terminal {terminal_id}: {e}")
+            return None, "error"
+
+    def discard(self, terminal_id: str) -> None:
+        """Forget ``terminal_id``'s prefetch (terminal deleted)."""
+        with self._lock:
+            entry = self._entries.pop(terminal_id, None)
+        if entry is not None:
+            entry[0].cancel()
+
+    def record(self, outcome: str, seconds: float) -> None:
+        """Count one injection and the time it added to ``send_input``."""
+        with self._lock:
+            self._stats[outcome] += 1
+            self._stats["latency_seconds"] += seconds
+        from cli_agent_orchestrator.telemetry import record_memory_injection
+
+        record_memory_injection(seconds, outcome)
+
+    def stats(self) -> Dict[str, Any]:
+        """Injection counts by outcome, hit rate and mean added latency."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._entries)
+        injections = sum(stats[outcome] for outcome in OUTCOMES)
+        prefetched = stats["hit"] + stats["wait"]
+        stats["injections"] = injections
+        stats["hit_rate"] = round(prefetched / injections, 3) if injections else None
+        latency = stats.pop("latency_seconds")
+        stats["mean_latency_seconds"] = round(latency / injections, 4) if injections else None
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            entries, self._entries = self._entries, {}
+        for future, _ in entries.values():
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_prefetcher: Optional[MemoryContextPrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_memory_prefetcher() -> MemoryContextPrefetcher:
+    """Return the process-wide ``MemoryContextPrefetcher`` (lazily created)."""
+    global _prefetcher
+    if _prefetcher is None:
+        with _prefetcher_lock:
+            if _prefetcher is None:
+                _prefetcher = MemoryContextPrefetcher()
+    return _prefetcher
+
+
+def reset_memory_prefetcher() -> None:
+    """Drop the singleton (used by tests to start with a clean slate)."""
+    global _prefetcher
+    with _prefetcher_lock:
+        prefetcher, _prefetcher = _prefetcher, None
+    if prefetcher is not None:
+        prefetcher.close()
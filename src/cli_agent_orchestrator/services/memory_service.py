@@ -12,15 +12,27 @@ import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional, Set
+from typing import Any, ContextManager, Dict, List, Optional, Set
 
 from cli_agent_orchestrator.constants import (
     MEMORY_BASE_DIR,
+    MEMORY_BULK_WORKERS,
     MEMORY_MAX_PER_SCOPE,
     MEMORY_SCOPE_BUDGET_CHARS,
 )
 from cli_agent_orchestrator.models.memory import Memory, MemoryScope, MemoryType
 from cli_agent_orchestrator.services.memory_archive.base import ExportReport, ImportReport
+from cli_agent_orchestrator.services.memory_bulk import (
+    IndexChanges,
+    MemoryBulkSession,
+    active_bulk_session,
+    open_bulk_session,
+)
+from cli_agent_orchestrator.services.memory_errors import (  # noqa: F401 - re-exported
+    MEMORY_DISABLED_MESSAGE,
+    MemoryDisabledError,
+    MemoryPartialWriteError,
+)
 from cli_agent_orchestrator.services.memory_format import (
     normalize_memory_tags,
     parse_index_entry,
@@ -35,44 +47,6 @@ logger = logging.getLogger(__name__)
 VALID_SEARCH_MODES = ("metadata", "bm25", "hybrid")
 
 
-MEMORY_DISABLED_MESSAGE = (
-    "memory subsystem is disabled. Set memory.enabled=true in settings.json " "to re-enable."
-)
-
-
-class MemoryDisabledError(RuntimeError):
-    """Raised when a write entry point is called while memory is disabled.
-
-    Read paths (recall, get_memory_context_for_terminal) instead return an
-    empty result, since silent empty reads are a safer no-op than raising.
-    """
-
-
-class MemoryPartialWriteError(RuntimeError):
-    """Raised when durable wiki projections outlive a failed metadata write."""
-
-    error_kind = "memory_metadata_partial_write"
-    repair_command = "cao memory repair --apply"
-
-    def __init__(
-        self,
-        *,
-        key: str,
-        scope: str,
-        scope_id: Optional[str],
-        file_path: str,
-    ) -> None:
-        self.key = key
-        self.scope = scope
-        self.scope_id = scope_id
-        self.file_path = file_path
-        self.completed_phases = ["wiki", "index"]
-        super().__init__(
-            "Memory content and index were saved, but SQLite metadata could not be updated. "
-            f"Run `{self.repair_command}`."
-        )
-
-
 def _is_memory_enabled() -> bool:
     """Module-level guard for memory entry points.
 
@@ -103,6 +77,13 @@ _curator_locks: dict[str, threading.Lock] = {}
 
 _PROJECT_ID_OVERRIDE_PATTERN = re.compile(r"^[a-zA-Z0-9._\-]{1,128}$")
 
+# Keys per ``IN (...)`` lookup when a bulk session upserts metadata (SQLite
+# caps bound parameters per statement).
+_METADATA_BATCH_CHUNK = 500
+
+# Leading ``- [key](relative/path.md)`` link of an index.md entry line.
+_INDEX_LINK_RE = re.compile(r"- \[([^\]]+)\]\(([^)]+)\)")
+
 
 class ProjectIdentityResolutionError(RuntimeError):
     """Raised when no project identity can be derived from any source."""
@@ -284,6 +265,28 @@ class MemoryService:
                 autocommit=False, autoflush=False, bind=db_engine
             )
 
+    # -------------------------------------------------------------------------
+    # Bulk sessions
+    # -------------------------------------------------------------------------
+
+    def bulk(self) -> ContextManager[MemoryBulkSession]:
+        """Batch this caller's ``store()``/``forget()`` writes until exit.
+
+        Used by archive import/export. Wiki files, ``index.md`` and SQLite
+        metadata are written once at exit instead of once per topic; see
+        ``memory_bulk`` for the exact contract::
+
+            with svc.bulk() as session:
+                for body in bodies:
+                    asyncio.run(svc.store(body, scope="global"))
+        """
+        return open_bulk_session(self, MEMORY_BULK_WORKERS)
+
+    def _bulk_session(self) -> Optional[MemoryBulkSession]:
+        """The caller's active bulk session on THIS service, if any."""
+        session = active_bulk_session()
+        return session if session is not None and session.service is self else None
+
     # -------------------------------------------------------------------------
     # SQLite metadata operations
     # -------------------------------------------------------------------------
@@ -332,6 +335,24 @@ class MemoryService:
         "computed, none found" and IS written (distinct from None so the
         second pass doesn't retry endlessly).
         """
+        fields = dict(
+            key=key,
+            memory_type=memory_type,
+            scope=scope,
+            scope_id=scope_id,
+            file_path=file_path,
+            tags=tags,
+            source_provider=source_provider,
+            source_terminal_id=source_terminal_id,
+            token_estimate=token_estimate,
+            last_compiled_at=last_compiled_at,
+            related_keys=related_keys,
+            preserve_provenance=preserve_provenance,
+        )
+        bulk = self._bulk_session()
+        if bulk is not None:
+            bulk.defer_metadata(fields)
+            return
         from cli_agent_orchestrator.clients.database import MemoryMetadataModel
 
         with self._get_db_session() as db:
@@ -348,28 +369,84 @@ class MemoryService:
                 )
                 .first()
             )
-            if existing:
-                existing.memory_type = memory_type
-                existing.tags = tags
-                existing.file_path = file_path
-                if not preserve_provenance:
-                    existing.source_provider = source_provider
-                    existing.source_terminal_id = source_terminal_id
-                existing.token_estimate = token_estimate
-                if last_compiled_at is not None:
-                    # A compile write: pin updated_at to the same instant so
-                    # the staleness check (last_compiled_at >= updated_at)
-                    # sees the topic as freshly compiled, not perpetually
-                    # stale by the microseconds between two now() calls.
-                    existing.updated_at = last_compiled_at
-                    existing.last_compiled_at = last_compiled_at
-                else:
-                    existing.updated_at = datetime.now(timezone.utc)
-                if related_keys is not None:
-                    existing.related_keys = related_keys
-                db.commit()
+            self._apply_metadata_upsert(db, existing, **fields)
+            db.commit()
+
+    def _upsert_metadata_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """``_upsert_metadata`` for many rows in ONE transaction (bulk flush).
+
+        Existing rows are loaded per (scope, scope_id) in chunked ``IN``
+        queries rather than one lookup per row.
+        """
+        from cli_agent_orchestrator.clients.database import MemoryMetadataModel
+
+        keys_by_scope: Dict[Any, List[str]] = {}
+        for fields in rows:
+            keys_by_scope.setdefault((fields["scope"], fields["scope_id"]), []).append(
+                fields["key"]
+            )
+        with self._get_db_session() as db:
+            existing: Dict[Any, Any] = {}
+            for (scope, scope_id), keys in keys_by_scope.items():
+                for start in range(0, len(keys), _METADATA_BATCH_CHUNK):
+                    matches = db.query(MemoryMetadataModel).filter(
+                        MemoryMetadataModel.key.in_(keys[start : start + _METADATA_BATCH_CHUNK]),
+                        MemoryMetadataModel.scope == scope,
+                        (
+                            MemoryMetadataModel.scope_id == scope_id
+                            if scope_id is not None
+                            else MemoryMetadataModel.scope_id.is_(None)
+                        ),
+                    )
+                    for row in matches:
+                        existing.setdefault((scope, scope_id, row.key), row)
+            for fields in rows:
+                identity = (fields["scope"], fields["scope_id"], fields["key"])
+                self._apply_metadata_upsert(db, existing.get(identity), **fields)
+            db.commit()
+
+    @staticmethod
+    def _apply_metadata_upsert(
+        db: Any,
+        existing: Any,
+        key: str,
+        memory_type: str,
+        scope: str,
+        scope_id: Optional[str],
+        file_path: str,
+        tags: str,
+        source_provider: Optional[str],
+        source_terminal_id: Optional[str],
+        token_estimate: Optional[int],
+        last_compiled_at: Optional[datetime],
+        related_keys: Optional[str],
+        preserve_provenance: bool,
+    ) -> None:
+        """Stage one upsert on ``db`` against its ``existing`` row (the caller commits)."""
+        from cli_agent_orchestrator.clients.database import MemoryMetadataModel
+
+        if existing:
+            existing.memory_type = memory_type
+            existing.tags = tags
+            existing.file_path = file_path
+            if not preserve_provenance:
+                existing.source_provider = source_provider
+                existing.source_terminal_id = source_terminal_id
+            existing.token_estimate = token_estimate
+            if last_compiled_at is not None:
+                # A compile write: pin updated_at to the same instant so
+                # the staleness check (last_compiled_at >= updated_at)
+                # sees the topic as freshly compiled, not perpetually
+                # stale by the microseconds between two now() calls.
+                existing.updated_at = last_compiled_at
+                existing.last_compiled_at = last_compiled_at
             else:
-                row = MemoryMetadataModel(
+                existing.updated_at = datetime.now(timezone.utc)
+            if related_keys is not None:
+                existing.related_keys = related_keys
+        else:
+            db.add(
+                MemoryMetadataModel(
                     id=str(uuid.uuid4()),
                     key=key,
                     memory_type=memory_type,
@@ -383,13 +460,17 @@ class MemoryService:
                     last_compiled_at=last_compiled_at,
                     related_keys=related_keys,
                 )
-                db.add(row)
-                db.commit()
+            )
 
     def _delete_metadata(self, key: str, scope: str, scope_id: Optional[str]) -> bool:
         """Delete the metadata row for (key, scope, scope_id). Returns True if removed."""
         from cli_agent_orchestrator.clients.database import MemoryMetadataModel
 
+        bulk = self._bulk_session()
+        if bulk is not None:
+            # A deferred upsert must not resurrect the row at flush.
+            bulk.drop_metadata(key, scope, scope_id)
+
         with self._get_db_session() as db:
             q = db.query(MemoryMetadataModel).filter(
                 MemoryMetadataModel.key == key,
@@ -695,6 +776,7 @@ class MemoryService:
         # Validate
         MemoryScope(scope)
         MemoryType(memory_type)
+        bulk = self._bulk_session()
 
         # Federated writes are credential-gated. The machine-wide shared
         # tier rejects content matching common secret patterns. The log
@@ -702,7 +784,7 @@ class MemoryService:
         if scope == MemoryScope.FEDERATED.value:
             from cli_agent_orchestrator.services.secret_gate import scan_for_secrets
 
-            hit = scan_for_secrets(content)
+            hit = bulk.scan(content) if bulk is not None else scan_for_secrets(content)
             if hit:
                 # Do not log detector output; emit only a constant event marker.
                 logger.warning("federated_secret_rejected")
@@ -770,27 +852,34 @@ class MemoryService:
         timestamp_clamped = False
 
         wiki_path = self.get_wiki_path(scope, scope_id, key)
-        wiki_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Per-topic lock around the read-modify-write cycle. Without
         # this, two concurrent store() calls for the same
         # (scope, scope_id, key) can both read the old content and
         # then overwrite each other, losing one update. Mirrors the
-        # .index.lock pattern in _update_index.
-        topic_lock_path = wiki_path.parent / f".{wiki_path.stem}.lock"
-        topic_lock_fd = open(topic_lock_path, "w")
+        # .index.lock pattern in _update_index. A bulk session buffers
+        # the write until exit, so there is nothing to lock here.
+        topic_lock_fd = None
+        if bulk is None:
+            wiki_path.parent.mkdir(parents=True, exist_ok=True)
+            topic_lock_path = wiki_path.parent / f".{wiki_path.stem}.lock"
+            topic_lock_fd = open(topic_lock_path, "w")
         try:
-            fcntl.flock(topic_lock_fd, fcntl.LOCK_EX)
+            if topic_lock_fd is not None:
+                fcntl.flock(topic_lock_fd, fcntl.LOCK_EX)
 
             # Check if topic file already exists (upsert)
-            is_update = wiki_path.exists()
+            pending = bulk.pending(wiki_path) if bulk is not None else None
+            is_update = pending is not None or wiki_path.exists()
             memory_id = str(uuid.uuid4())
             created_at = now
             latest_section_at: Optional[datetime] = None
 
             if is_update:
                 # Read existing file to get original created_at and id from comment
-                existing_content = wiki_path.read_text(encoding="utf-8")
+                existing_content = (
+                    pending if pending is not None else wiki_path.read_text(encoding="utf-8")
+                )
                 # Try to extract original id
                 id_match = re.search(r"<!-- id: ([a-f0-9\-]+)", existing_content)
                 if id_match:
@@ -868,9 +957,12 @@ class MemoryService:
             # written to the machine-wide federated tier is screened by the
             # secret gate (``scan_for_secrets``) earlier in ``store()`` and
             # rejected if it matches a credential pattern.
-            tmp_path = wiki_path.parent / f".{wiki_path.stem}.tmp"
-            tmp_path.write_text(new_content, encoding="utf-8")
-            os.replace(str(tmp_path), str(wiki_path))
+            if bulk is not None:
+                bulk.write(wiki_path, new_content)
+            else:
+                tmp_path = wiki_path.parent / f".{wiki_path.stem}.tmp"
+                tmp_path.write_text(new_content, encoding="utf-8")
+                os.replace(str(tmp_path), str(wiki_path))
 
             # LLM wiki compilation, deferred. A coding-agent CLI cold-starts in
             # tens of seconds — far too slow to block store() — so on an "llm"
@@ -885,7 +977,14 @@ class MemoryService:
                 from cli_agent_orchestrator.services.settings_service import get_compile_mode
 
                 if is_update and get_compile_mode() == "llm":
-                    self._schedule_background_compile(
+                    # In a bulk session the file lands at exit; the compile
+                    # is scheduled then, or its stale-check would drop it.
+                    schedule = (
+                        bulk.defer_compile
+                        if bulk is not None
+                        else self._schedule_background_compile
+                    )
+                    schedule(
                         scope=scope,
                         scope_id=scope_id,
                         key=key,
@@ -949,10 +1048,11 @@ class MemoryService:
 
             logger.info(f"Memory {action}: key={key} scope={scope} scope_id={scope_id}")
         finally:
-            try:
-                fcntl.flock(topic_lock_fd, fcntl.LOCK_UN)
-            finally:
-                topic_lock_fd.close()
+            if topic_lock_fd is not None:
+                try:
+                    fcntl.flock(topic_lock_fd, fcntl.LOCK_UN)
+                finally:
+                    topic_lock_fd.close()
 
         source_provider = None
         source_terminal_id = None
@@ -1719,9 +1819,42 @@ class MemoryService:
     ) -> None:
         """Update index.md with the memory entry.
 
-        Uses fcntl.flock() to prevent concurrent writes from corrupting the index.
+        Inside a bulk session the change is deferred and applied together
+        with the session's other changes to the same index at exit.
         """
         index_path = self.get_index_path(scope, scope_id)
+
+        # Build the new entry line. Session and agent scopes nest
+        # scope_id into the path so different sessions/agents do
+        # not collide on the same key.
+        if scope in (MemoryScope.SESSION.value, MemoryScope.AGENT.value) and scope_id:
+            relative_path = f"{scope}/{scope_id}/{key}.md"
+        else:
+            relative_path = f"{scope}/{key}.md"
+        entry_line: Optional[str] = None
+        if action != "remove":
+            est_tokens = int(len(content.split()) * 1.3)
+            entry_line = (
+                f"- [{key}]({relative_path}) — "
+                f"type:{memory_type} tags:{tags} ~{est_tokens}tok updated:{timestamp}"
+            )
+
+        bulk = self._bulk_session()
+        if bulk is not None:
+            bulk.defer_index(index_path, scope, key, relative_path, entry_line, timestamp)
+            return
+        self._write_index(index_path, {(scope, key, relative_path): entry_line}, timestamp)
+
+    def _write_index(self, index_path: Path, changes: IndexChanges, timestamp: str) -> None:
+        """Apply index entry changes in one read-modify-write of ``index_path``.
+
+        ``changes`` maps ``(scope section, key, relative_path)`` to the new
+        entry line, or None to remove the entry, in the order they were
+        made. An existing entry for the key is replaced; new entries go to
+        the top of their section, most recent first.
+
+        Uses fcntl.flock() to prevent concurrent writes from corrupting the index.
+        """
         index_path.parent.mkdir(parents=True, exist_ok=True)
 
         lock_path = index_path.parent / ".index.lock"
@@ -1732,20 +1865,6 @@ class MemoryService:
             fcntl.flock(lock_fd, fcntl.LOCK_EX)
             # NOTE: lock_fd is always released/closed in the finally block below.
 
-            est_tokens = int(len(content.split()) * 1.3)
-
-            # Build the new entry line. Session and agent scopes nest
-            # scope_id into the path so different sessions/agents do
-            # not collide on the same key.
-            if scope in (MemoryScope.SESSION.value, MemoryScope.AGENT.value) and scope_id:
-                relative_path = f"{scope}/{scope_id}/{key}.md"
-            else:
-                relative_path = f"{scope}/{key}.md"
-            entry_line = (
-                f"- [{key}]({relative_path}) — "
-                f"type:{memory_type} tags:{tags} ~{est_tokens}tok updated:{timestamp}"
-            )
-
             if index_path.exists():
                 lines = index_path.read_text(encoding="utf-8").splitlines()
             else:
@@ -1761,27 +1880,26 @@ class MemoryService:
                     lines[i] = f"<!-- Updated: {timestamp} -->"
                     break
 
-            # Find the scope section, or create it
-            section_header = f"## {scope}"
-            section_idx = None
-            for i, line in enumerate(lines):
-                if line.strip() == section_header:
-                    section_idx = i
-                    break
-
-            if section_idx is None:
-                # Add new section at end
-                lines.append("")
-                lines.append(section_header)
-                section_idx = len(lines) - 1
-
-            if action == "remove":
-                # Remove existing entry for this key
-                lines = [ln for ln in lines if not (f"[{key}](" in ln and f"{relative_path}" in ln)]
-            else:
-                # Remove existing entry for this key if present (for update)
-                lines = [ln for ln in lines if not (f"[{key}](" in ln and f"{relative_path}" in ln)]
-                # Re-find section after removal
+            # Remove every existing entry for the changed keys (update or
+            # remove), then insert the new lines under their section.
+            replaced = {(key, relative_path) for _, key, relative_path in changes}
+            kept: List[str] = []
+            for ln in lines:
+                link = _INDEX_LINK_RE.match(ln)
+                if link and (link.group(1), link.group(2)) in replaced:
+                    continue
+                kept.append(ln)
+            lines = kept
+
+            inserts: Dict[str, List[str]] = {}
+            for (section, _, _), entry_line in changes.items():
+                section_lines = inserts.setdefault(section, [])
+                if entry_line is not None:
+                    section_lines.append(entry_line)
+
+            for section, section_lines in inserts.items():
+                # Find the scope section, or create it at the end
+                section_header = f"## {section}"
                 section_idx = None
                 for i, line in enumerate(lines):
                     if line.strip() == section_header:
@@ -1791,9 +1909,7 @@ class MemoryService:
                     lines.append("")
                     lines.append(section_header)
                     section_idx = len(lines) - 1
-
-                # Insert entry after section header
-                lines.insert(section_idx + 1, entry_line)
+                lines[section_idx + 1 : section_idx + 1] = reversed(section_lines)
 
             # Atomic write
             new_content = "\n".join(lines) + "\n"
@@ -2677,8 +2793,11 @@ class MemoryService:
         if scope_id is None:
             scope_id = self.resolve_scope_id(scope, terminal_context)
         wiki_path = self.get_wiki_path(scope, scope_id, key)
+        bulk = self._bulk_session()
+        # A topic stored earlier in the same bulk session is only buffered.
+        buffered = bulk is not None and bulk.discard(wiki_path)
 
-        if not wiki_path.exists():
+        if not buffered and not wiki_path.exists():
             # Drop any stale SQLite row so metadata stays consistent
             # with the wiki even when the file vanished out-of-band.
             try:
@@ -2692,7 +2811,7 @@ class MemoryService:
             return False
 
         # Delete the wiki file
-        wiki_path.unlink()
+        wiki_path.unlink(missing_ok=buffered)
         logger.info(f"Deleted memory file: {wiki_path}")
 
         # Update index.md. Pass the current timestamp so the index header
@@ -2903,6 +3022,26 @@ class MemoryService:
             logger.debug(f"_find_context_manager_terminal failed: {e}")
         return None
 
+    def get_prefetchable_memory_context(self, terminal_id: str) -> Optional[str]:
+        """The injection block, when it can be built before the first message.
+
+        Returns None when ``terminal_id``'s session runs a memory_manager
+        curator: its block depends on the task description, so it is only
+        built at send time (``get_curated_memory_context``). Otherwise the
+        deterministic Phase 1 block, which needs nothing but the terminal;
+        as in ``get_curated_memory_context``, a failed curator lookup falls
+        back to it too.
+        """
+        if not _is_memory_enabled():
+            return ""
+        try:
+            ctx = self._get_terminal_context(terminal_id)
+            if ctx and self._find_context_manager_terminal(ctx.get("session_name")):
+                return None
+        except Exception as e:
+            logger.debug(f"get_prefetchable_memory_context failed, falling back: {e}")
+        return self.get_memory_context_for_terminal(terminal_id)
+
     def get_curated_memory_context(
         self, terminal_id: str, task_description: Optional[str] = None
     ) -> str:
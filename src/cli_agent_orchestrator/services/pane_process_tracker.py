@@ -0,0 +1,158 @@
+"""Tracks whether each pane's shell is back in the foreground, without tmux.
+
+Providers that launch a CLI from the pane's shell (Codex, Kiro, omp) detect
+"the CLI has exited" by comparing the pane's foreground command with the
+shell captured before launch. Asking tmux for ``pane_current_command`` costs
+a list-sessions, list-windows, list-panes and display-message round trip —
+up to four forks — and ``get_status`` runs on every quiescence edge of every
+terminal.
+
+The tracker answers the same question from the kernel instead. The pane PID
+(the shell tmux spawned) is recorded once when the terminal is created.
+``/proc/<pid>/stat`` carries both the shell's process group and the
+foreground process group of its controlling tty (``tpgid``); the shell is in
+the foreground exactly when the two match. While a CLI holds the foreground
+the tracker keeps a pidfd on the CLI's group leader, so the cached "CLI still
+running" answer costs one zero-timeout poll and is invalidated by the
+kernel's exit notification rather than by a timer. Where pidfds are
+unavailable the answer is cached for ``_CACHE_TTL`` seconds instead.
+
+Every lookup returns None when the answer is unknown — untracked terminal
+(e.g. one restored after a server restart), backend without pane PIDs, no
+``/proc`` — and callers fall back to ``get_pane_current_command``.
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_PROC_ROOT = Path("/proc")
+
+# How long a "CLI in the foreground" answer is reused when no pidfd could be
+# pinned on the CLI (kernel < 5.3, non-Linux, leader already gone). Short
+# enough that an exited CLI is noticed on the next quiescence edge.
+_CACHE_TTL = 0.25
+
+
+@dataclass
+class _PaneProcess:
+    pane_pid: int
+    cli_pidfd: Optional[int] = None
+    cached_until: float = 0.0
+
+
+def _read_process_groups(pid: int) -> Optional[Tuple[int, int]]:
+    """Return ``(pgrp, tpgid)`` for ``pid`` from ``/proc``, or None."""
+    try:
+        stat = (_PROC_ROOT / str(pid) / "stat").read_bytes()
+    except OSError:
+        return None
+    # The command name is parenthesised and may itself contain spaces or ")";
+    # the numeric fields start after the last ")".
+    fields = stat[stat.rfind(b")") + 2 :].split()
+    try:
+        pgrp, tpgid = int(fields[2]), int(fields[5])
+    except (IndexError, ValueError):
+        return None
+    if tpgid <= 0:
+        # No controlling terminal: nothing to compare against.
+        return None
+    return pgrp, tpgid
+
+
+def _open_pidfd(pid: int) -> Optional[int]:
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is None:
+        return None
+    try:
+        return pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _pidfd_exited(pidfd: int) -> bool:
+    """A pidfd polls readable once its process has exited."""
+    try:
+        readable, _, _ = select.select([pidfd], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+class PaneProcessTracker:
+    """Caches per-terminal "is the shell in the foreground" answers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._panes: Dict[str, _PaneProcess] = {}
+
+    def track(self, terminal_id: str, pane_pid: int) -> None:
+        """Record the PID of the shell running in ``terminal_id``'s pane."""
+        with self._lock:
+            previous = self._panes.pop(terminal_id, None)
+            self._panes[terminal_id] = _PaneProcess(pane_pid=pane_pid)
+        if previous is not None and previous.cli_pidfd is not None:
+            os.close(previous.cli_pidfd)
+
+    def untrack(self, terminal_id: str) -> None:
+        """Forget ``terminal_id`` and release its pidfd. No-op if untracked."""
+        with self._lock:
+            entry = self._panes.pop(terminal_id, None)
+        if entry is not None and entry.cli_pidfd is not None:
+            os.close(entry.cli_pidfd)
+
+    def is_tracked(self, terminal_id: str) -> bool:
+        with self._lock:
+            return terminal_id in self._panes
+
+    def shell_in_foreground(self, terminal_id: str) -> Optional[bool]:
+        """Whether the pane's shell owns the tty's foreground process group.
+
+        True means no other program is running in the foreground (the CLI has
+        exited, or was never started); False means a child of the shell holds
+        the foreground. None means unknown and the caller should fall back to
+        asking the backend.
+        """
+        with self._lock:
+            entry = self._panes.get(terminal_id)
+            if entry is None:
+                return None
+            if entry.cli_pidfd is not None:
+                if not _pidfd_exited(entry.cli_pidfd):
+                    return False
+                os.close(entry.cli_pidfd)
+                entry.cli_pidfd = None
+            elif time.monotonic() < entry.cached_until:
+                return False
+            pane_pid = entry.pane_pid
+
+        groups = _read_process_groups(pane_pid)
+        if groups is None:
+            return None
+        pgrp, tpgid = groups
+        if pgrp == tpgid:
+            return True
+
+        pidfd = _open_pidfd(tpgid)
+        with self._lock:
+            entry = self._panes.get(terminal_id)
+            if entry is None or entry.pane_pid != pane_pid or entry.cli_pidfd is not None:
+                # Untracked, re-tracked or pinned concurrently: keep theirs.
+                if pidfd is not None:
+                    os.close(pidfd)
+                return False
+            if pidfd is not None:
+                entry.cli_pidfd = pidfd
+            else:
+                entry.cached_until = time.monotonic() + _CACHE_TTL
+        return False
+
+
+pane_process_tracker = PaneProcessTracker()
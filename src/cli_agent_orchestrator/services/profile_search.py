@@ -6,9 +6,11 @@ Ref: https://github.com/awslabs/cli-agent-orchestrator/issues/340
 Design constraints (v1):
 - Read-only: matches on metadata only. Files are read to parse frontmatter,
   but the prompt body is never indexed, matched against, or returned.
-- Ephemeral: the corpus is rebuilt from ``list_agent_profiles()`` on every
-  query. Profile counts are small (tens), so a persistent index would only
-  add staleness risk (profiles are installed/removed outside CAO's control).
+- Never stale: the corpus is rebuilt from ``list_agent_profiles()`` (itself
+  cached against file stamps) on every query. Only the BM25 index is kept
+  between queries, keyed by the exact token corpus it was built from, so an
+  installed/removed/edited profile always yields a fresh index and an
+  unchanged catalog reuses the warm one.
 - BM25 via ``rank_bm25`` (same lazy-import + graceful-degradation pattern as
   ``memory_service``). If the library is unavailable, falls back to simple
   token-overlap scoring so ``find`` still works.
@@ -16,7 +18,8 @@ Design constraints (v1):
 
 import logging
 import re
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,12 @@ RESULT_FIELDS = ("name", "description", "capabilities", "tags", "role", "source"
 
 DEFAULT_LIMIT = 10
 
+_Corpus = Tuple[Tuple[str, ...], ...]
+
+# The last BM25 index and the corpus it was built from.
+_index_lock = threading.Lock()
+_index_cache: Optional[Tuple[_Corpus, Any]] = None
+
 
 def _tokenize(text: str) -> List[str]:
     """Lowercase, split on non-alphanumeric, drop empties."""
@@ -80,6 +89,55 @@ def _overlap_scores(query_tokens: List[str], corpus_tokens: List[List[str]]) ->
     return [float(len(query_set & set(doc))) for doc in corpus_tokens]
 
 
+def _bm25_index(corpus_tokens: List[List[str]]) -> Any:
+    """Return a BM25Plus index over ``corpus_tokens``, reusing the last one if equal.
+
+    Raises ImportError when rank_bm25 is unavailable.
+    """
+    global _index_cache
+    key: _Corpus = tuple(tuple(doc) for doc in corpus_tokens)
+    with _index_lock:
+        cached = _index_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    from rank_bm25 import BM25Plus  # type: ignore[import-untyped]
+
+    # BM25Plus lower-bounds term contributions so scores stay positive.
+    # Plain BM25Okapi produces zero/negative IDF for terms present in most
+    # of a small corpus, which can rank a profile matching every query
+    # term below partial matches.
+    index = BM25Plus(corpus_tokens)
+    with _index_lock:
+        _index_cache = (key, index)
+    return index
+
+
+def _searchable_corpus(profiles: Optional[List[Dict]]) -> Tuple[List[Dict], List[List[str]]]:
+    """Return the recommendable profiles and their token lists."""
+    if profiles is None:
+        from cli_agent_orchestrator.utils.agent_profiles import list_agent_profiles
+
+        profiles = list_agent_profiles()
+    # Exclude profiles that load_agent_profile() would reject: frontmatter
+    # parse failures, metadata that fails AgentProfile model validation, or a
+    # profile directory without agent.md. Recommending any of these would
+    # break discover-then-load consistency for handoff/assign.
+    profiles = [p for p in profiles if p.get("loadable", True)]
+    return profiles, [_tokenize(_searchable_text(p)) for p in profiles]
+
+
+def warm_profile_index(profiles: Optional[List[Dict]] = None) -> None:
+    """Build the BM25 index for the current catalog ahead of the next query."""
+    _, corpus_tokens = _searchable_corpus(profiles)
+    if not any(corpus_tokens):
+        return
+    try:
+        _bm25_index(corpus_tokens)
+    except ImportError:
+        pass
+
+
 def search_profiles(
     query: str,
     limit: int = DEFAULT_LIMIT,
@@ -105,32 +163,17 @@ def search_profiles(
     if not query_tokens or limit <= 0:
         return []
 
-    if profiles is None:
-        from cli_agent_orchestrator.utils.agent_profiles import list_agent_profiles
-
-        profiles = list_agent_profiles()
-    # Exclude profiles that load_agent_profile() would reject: frontmatter
-    # parse failures, metadata that fails AgentProfile model validation, or a
-    # profile directory without agent.md. Recommending any of these would
-    # break discover-then-load consistency for handoff/assign.
-    profiles = [p for p in profiles if p.get("loadable", True)]
+    profiles, corpus_tokens = _searchable_corpus(profiles)
     if not profiles:
         return []
 
-    corpus_tokens = [_tokenize(_searchable_text(p)) for p in profiles]
     if not any(corpus_tokens):
         # Every profile tokenized to empty text; BM25 would divide by zero
         # (avgdl == 0) and nothing could match anyway.
         return []
 
     try:
-        from rank_bm25 import BM25Plus  # type: ignore[import-untyped]
-
-        # BM25Plus lower-bounds term contributions so scores stay positive.
-        # Plain BM25Okapi produces zero/negative IDF for terms present in most
-        # of a small corpus, which can rank a profile matching every query
-        # term below partial matches.
-        scores = list(BM25Plus(corpus_tokens).get_scores(query_tokens))
+        scores = list(_bm25_index(corpus_tokens).get_scores(query_tokens))
     except ImportError:
         logger.debug("rank_bm25 not installed; using token-overlap fallback")
         scores = _overlap_scores(query_tokens, corpus_tokens)
@@ -19,6 +19,7 @@ import re
 from pathlib import Path
 
 from cli_agent_orchestrator.constants import LOCAL_AGENT_STORE_DIR
+from cli_agent_orchestrator.utils.agent_profiles import invalidate_profile_catalog
 from cli_agent_orchestrator.utils.atomic_file import locked_atomic_write
 
 # A profile name becomes a single filesystem segment under
@@ -137,6 +138,7 @@ def write_profile(name: str, content: str, *, overwrite: bool = False) -> Path:
             f"Profile '{name}' already exists in the local store. "
             f"Pass overwrite=True to replace it."
         ) from exc
+    invalidate_profile_catalog()
     return target
 
 
@@ -161,3 +163,4 @@ def delete_profile(name: str) -> None:
     if not target.exists():
         raise ProfileNotFoundError(f"Profile '{name}' not found in the local store.")
     target.unlink()
+    invalidate_profile_catalog()
@@ -1,13 +1,20 @@
 """Settings service for persisting user configuration."""
 
+import copy
+import inspect
 import json
 import logging
 import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 from cli_agent_orchestrator.constants import CAO_HOME_DIR
-from cli_agent_orchestrator.utils.paths import normalized_path
+from cli_agent_orchestrator.utils.paths import is_racy, normalized_path
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +48,8 @@ def _save(data: Dict[str, Any]) -> None:
     """Save settings to disk."""
     CAO_HOME_DIR.mkdir(parents=True, exist_ok=True)
     SETTINGS_FILE.write_text(json.dumps(data, indent=2))
+    # Publish now rather than at the next stat/watcher tick.
+    refresh_settings_snapshot()
 
 
 def get_agent_dirs() -> Dict[str, str]:
@@ -195,53 +204,8 @@ _SERVER_ENV_VARS = {
 }
 
 
-_server_settings_cache: Optional[Dict[str, Any]] = None
-_server_settings_mtime_ns: int = -1
-
-
-def get_server_settings() -> Dict[str, Any]:
-    """Get server tuning settings (cached; re-reads only when file changes).
-
-    Precedence per key: CAO_* env var > settings.json > built-in default.
-
-    Returns a dict with the following keys (defaults shown):
-      - mcp_request_timeout (30): Seconds to wait for MCP HTTP calls
-      - event_bus_max_queue_size (1024): Max events buffered per subscriber
-      - provider_init_timeout (60): Seconds to wait for a CLI agent to reach IDLE.
-        Also the hard outer cap on total time the startup-prompt handler may run.
-      - startup_prompt_handler_timeout (20): Idle gap, in seconds, between
-        consecutive startup prompts (e.g. workspace trust / bypass dialogs). The
-        handler keeps polling and resets this timer every time it answers a
-        prompt; it stops once no new prompt appears for this many seconds (so a
-        dialog a cold/containerized start renders late is still handled). Total
-        time is bounded by provider_init_timeout.
-      - state_buffer_max (32768): Bytes of raw terminal output StatusMonitor
-        keeps per terminal for raw-path status detection and
-        GET /terminals/{id}/output (mode=full)
-
-    Values can be set via CAO_* environment variables or in
-    ~/.aws/cli-agent-orchestrator/settings.json under the "server" key:
-
-        {
-          "server": {
-            "mcp_request_timeout": 120,
-            "event_bus_max_queue_size": 8192,
-            "provider_init_timeout": 90,
-            "startup_prompt_handler_timeout": 5,
-            "state_buffer_max": 65536
-          }
-        }
-    """
-    global _server_settings_cache, _server_settings_mtime_ns
-    # Cache: only re-read when the file has changed
-    try:
-        mtime_ns = SETTINGS_FILE.stat().st_mtime_ns if SETTINGS_FILE.exists() else -1
-    except OSError:
-        mtime_ns = -1
-    if _server_settings_cache is not None and mtime_ns == _server_settings_mtime_ns:
-        return dict(_server_settings_cache)
-
-    settings = _load()
+def _build_server_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve server settings from parsed settings.json plus CAO_* env overrides."""
     saved = settings.get("server", {})
     if not isinstance(saved, dict):
         logger.warning("Invalid settings.server=%r (expected object); using defaults", saved)
@@ -279,24 +243,11 @@ def get_server_settings() -> Dict[str, Any]:
     # generic isinstance(val, (int, float)) check above (e.g. a settings.json
     # value of 32768.0), and a float slice bound raises TypeError.
     result["state_buffer_max"] = int(result["state_buffer_max"])
-    _server_settings_cache = result
-    _server_settings_mtime_ns = mtime_ns
-    return dict(result)
-
+    return result
 
-def get_memory_settings() -> Dict[str, Any]:
-    """Get memory-related settings.
 
-    Precedence for most keys: CAO_* env var > settings.json > built-in
-    default. ``memory.lint_enabled`` intentionally uses
-    ``is_memory_lint_enabled()`` fail-closed semantics instead: any explicit
-    false in persisted settings or ``CAO_MEMORY_LINT_ENABLED`` disables lint.
-
-    ``enabled`` defaults to ``True`` (opt-out) to preserve current shipping
-    behavior. Setting it to ``False`` disables all memory subsystem
-    operations — see ``is_memory_enabled()``.
-    """
-    settings = _load()
+def _build_memory_settings(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolve memory settings from parsed settings.json plus CAO_MEMORY_* env overrides."""
     defaults: Dict[str, Any] = {
         "enabled": True,
         "flush_threshold": 0.85,
@@ -352,6 +303,243 @@ def get_memory_settings() -> Dict[str, Any]:
     return result
 
 
+# ---------------------------------------------------------------------------
+# Settings snapshot
+# ---------------------------------------------------------------------------
+#
+# Server and memory settings sit on hot paths (StatusMonitor reads
+# state_buffer_max per output chunk, the memory service checks its enable
+# switch per call), so they are resolved once into an immutable, versioned
+# SettingsSnapshot and re-resolved only when settings.json or one of the
+# env vars below changes. Without a watcher every read costs one stat();
+# while cao-server's settings watcher keeps the snapshot fresh, reads are a
+# plain global lookup.
+
+# Env vars the snapshot depends on; a change to any of them re-resolves it.
+_SNAPSHOT_ENV_VARS = tuple(_SERVER_ENV_VARS.values()) + (
+    "CAO_MEMORY_ENABLED",
+    "CAO_MEMORY_LEARNING_ENABLED",
+    "CAO_MEMORY_INSTRUCTION_PROMOTION_ENABLED",
+    "CAO_MEMORY_FLUSH_THRESHOLD",
+    "CAO_MEMORY_LINT_ENABLED",
+)
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Immutable view of the effective settings at one point in time.
+
+    ``version`` increases by one every time the effective settings change.
+    ``data`` is the parsed settings.json; ``server`` and ``memory`` are the
+    resolved (defaults + file + env) blocks returned by
+    ``get_server_settings()`` / ``get_memory_settings()``. All three are
+    read-only mappings shared by every reader, so never mutate nested values.
+    """
+
+    version: int
+    data: Mapping[str, Any]
+    server: Mapping[str, Any]
+    memory: Mapping[str, Any]
+    memory_enabled: bool
+    learning_enabled: bool
+    instruction_promotion_enabled: bool
+    memory_lint_enabled: bool
+
+
+SettingsListener = Callable[[SettingsSnapshot], None]
+
+_snapshot: Optional[SettingsSnapshot] = None
+# (path, file stat, env values) the snapshot was resolved from; None = re-check.
+_snapshot_stamp: Optional[Tuple[Any, ...]] = None
+# Parsed inputs of the snapshot, to tell a touched file from a changed one.
+_snapshot_inputs: Optional[Tuple[Dict[str, Any], Tuple[Optional[str], ...]]] = None
+_snapshot_file: Optional[Path] = None
+# Monotonic deadline until which readers may skip the stat (set by the watcher).
+_snapshot_trusted_until: float = 0.0
+_snapshot_lock = threading.Lock()
+_listeners: List[Callable[[], Optional[SettingsListener]]] = []
+_listeners_lock = threading.Lock()
+
+
+def _snapshot_env() -> Tuple[Optional[str], ...]:
+    return tuple(os.environ.get(name) for name in _SNAPSHOT_ENV_VARS)
+
+
+def _snapshot_stamp_for(path: Path, env: Tuple[Optional[str], ...]) -> Optional[Tuple[Any, ...]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (str(path), None, env)
+    except OSError:
+        return None
+    if is_racy(st):  # may be rewritten again within the same mtime tick
+        return None
+    return (str(path), st.st_ino, st.st_mtime_ns, st.st_size, env)
+
+
+def _build_snapshot(version: int, data: Dict[str, Any]) -> SettingsSnapshot:
+    server = _build_server_settings(data)
+    memory = _build_memory_settings(data)
+    memory_enabled = bool(memory.get("enabled", True))
+    learning_enabled = memory_enabled and bool(memory.get("learning_enabled", False))
+    return SettingsSnapshot(
+        version=version,
+        data=MappingProxyType(copy.deepcopy(data)),
+        server=MappingProxyType(server),
+        memory=MappingProxyType(memory),
+        memory_enabled=memory_enabled,
+        learning_enabled=learning_enabled,
+        instruction_promotion_enabled=learning_enabled
+        and bool(memory.get("instruction_promotion_enabled", False)),
+        memory_lint_enabled=bool(memory["lint_enabled"]),
+    )
+
+
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Return the current settings snapshot, re-resolving it if settings changed.
+
+    Cheap enough for per-chunk hot paths: a stat() of settings.json when no
+    watcher is running, and no I/O at all while ``cao-server``'s settings
+    watcher is keeping the snapshot fresh.
+    """
+    snapshot = _snapshot
+    if (
+        snapshot is not None
+        and _snapshot_file is SETTINGS_FILE
+        and time.monotonic() < _snapshot_trusted_until
+    ):
+        return snapshot
+    return refresh_settings_snapshot()
+
+
+def refresh_settings_snapshot(trust_for: Optional[float] = None) -> SettingsSnapshot:
+    """Re-check settings.json and the env, publishing a new snapshot on change.
+
+    Listeners registered with ``subscribe_settings`` are called (on this
+    thread) when the version changes. ``trust_for`` is for the settings
+    watcher: readers skip their own stat() for that many seconds, so the
+    watcher must refresh again before it elapses; ``0`` withdraws the trust.
+    """
+    global _snapshot, _snapshot_stamp, _snapshot_inputs, _snapshot_file
+    global _snapshot_trusted_until
+    path = SETTINGS_FILE
+    env = _snapshot_env()
+    stamp = _snapshot_stamp_for(path, env)
+    changed = False
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if snapshot is None or stamp is None or stamp != _snapshot_stamp:
+            data = _load()
+            if snapshot is None or (data, env) != _snapshot_inputs:
+                version = snapshot.version + 1 if snapshot is not None else 1
+                snapshot = _build_snapshot(version, data)
+                _snapshot = snapshot
+                _snapshot_inputs = (data, env)
+                changed = True
+            _snapshot_stamp = stamp
+            _snapshot_file = path
+        if trust_for is not None:
+            _snapshot_trusted_until = time.monotonic() + trust_for if trust_for > 0 else 0.0
+    if changed:
+        _notify_listeners(snapshot)
+    return snapshot
+
+
+def subscribe_settings(listener: SettingsListener) -> Callable[[], None]:
+    """Call ``listener(snapshot)`` each time the effective settings change.
+
+    Listeners run on whichever thread noticed the change (usually the
+    settings watcher's worker thread), so they must be quick and
+    thread-safe. Bound methods are held weakly: subscribing does not keep
+    the owning object alive. Returns a function that unsubscribes.
+    """
+    if inspect.ismethod(listener):
+        ref: Callable[[], Optional[SettingsListener]] = weakref.WeakMethod(listener)
+    else:
+
+        def ref() -> SettingsListener:
+            return listener
+
+    with _listeners_lock:
+        _listeners.append(ref)
+
+    def unsubscribe() -> None:
+        with _listeners_lock:
+            if ref in _listeners:
+                _listeners.remove(ref)
+
+    return unsubscribe
+
+
+def _notify_listeners(snapshot: SettingsSnapshot) -> None:
+    with _listeners_lock:
+        refs = list(_listeners)
+    dead = []
+    for ref in refs:
+        listener = ref()
+        if listener is None:
+            dead.append(ref)
+            continue
+        try:
+            listener(snapshot)
+        except Exception:
+            logger.exception("Settings listener failed")
+    if dead:
+        with _listeners_lock:
+            _listeners[:] = [ref for ref in _listeners if ref not in dead]
+
+
+def get_server_settings() -> Dict[str, Any]:
+    """Get server tuning settings (from the settings snapshot; see ``get_settings_snapshot``).
+
+    Precedence per key: CAO_* env var > settings.json > built-in default.
+
+    Returns a dict with the following keys (defaults shown):
+      - mcp_request_timeout (30): Seconds to wait for MCP HTTP calls
+      - event_bus_max_queue_size (1024): Max events buffered per subscriber
+      - provider_init_timeout (60): Seconds to wait for a CLI agent to reach IDLE.
+        Also the hard outer cap on total time the startup-prompt handler may run.
+      - startup_prompt_handler_timeout (20): Idle gap, in seconds, between
+        consecutive startup prompts (e.g. workspace trust / bypass dialogs). The
+        handler keeps polling and resets this timer every time it answers a
+        prompt; it stops once no new prompt appears for this many seconds (so a
+        dialog a cold/containerized start renders late is still handled). Total
+        time is bounded by provider_init_timeout.
+      - state_buffer_max (32768): Bytes of raw terminal output StatusMonitor
+        keeps per terminal for raw-path status detection and
+        GET /terminals/{id}/output (mode=full)
+
+    Values can be set via CAO_* environment variables or in
+    ~/.aws/cli-agent-orchestrator/settings.json under the "server" key:
+
+        {
+          "server": {
+            "mcp_request_timeout": 120,
+            "event_bus_max_queue_size": 8192,
+            "provider_init_timeout": 90,
+            "startup_prompt_handler_timeout": 5,
+            "state_buffer_max": 65536
+          }
+        }
+    """
+    return dict(get_settings_snapshot().server)
+
+
+def get_memory_settings() -> Dict[str, Any]:
+    """Get memory-related settings (from the settings snapshot).
+
+    Precedence for most keys: CAO_* env var > settings.json > built-in
+    default. ``memory.lint_enabled`` intentionally uses
+    ``is_memory_lint_enabled()`` fail-closed semantics instead: any explicit
+    false in persisted settings or ``CAO_MEMORY_LINT_ENABLED`` disables lint.
+
+    ``enabled`` defaults to ``True`` (opt-out) to preserve current shipping
+    behavior. Setting it to ``False`` disables all memory subsystem
+    operations — see ``is_memory_enabled()``.
+    """
+    return copy.deepcopy(dict(get_settings_snapshot().memory))
+
+
 def _coerce_optional_bool(value: Any, *, label: str) -> Optional[bool]:
     if isinstance(value, bool):
         return value
@@ -379,7 +567,9 @@ def is_memory_lint_enabled(settings: Optional[Dict[str, Any]] = None) -> bool:
     persisted true cannot override env false.
     """
     try:
-        data = settings if settings is not None else _load()
+        if settings is None:
+            return get_settings_snapshot().memory_lint_enabled
+        data = settings
         saved = data.get("memory", {}) if isinstance(data, dict) else {}
         if not isinstance(saved, dict):
             saved = {}
@@ -405,11 +595,10 @@ def is_memory_enabled() -> bool:
     > default (True).
     """
     try:
-        value = get_memory_settings().get("enabled", True)
+        return get_settings_snapshot().memory_enabled
     except Exception as e:
         logger.warning(f"Failed to read memory.enabled, defaulting to True: {e}")
         return True
-    return bool(value)
 
 
 def is_learning_enabled() -> bool:
@@ -424,8 +613,7 @@ def is_learning_enabled() -> bool:
     features fail closed, mirroring the default).
     """
     try:
-        settings = get_memory_settings()
-        return bool(settings.get("enabled", True)) and bool(settings.get("learning_enabled", False))
+        return get_settings_snapshot().learning_enabled
     except Exception as e:
         logger.warning(f"Failed to read memory.learning_enabled, defaulting to False: {e}")
         return False
@@ -443,10 +631,7 @@ def is_instruction_promotion_enabled() -> bool:
     errors default to False (fail closed).
     """
     try:
-        if not is_learning_enabled():
-            return False
-        settings = get_memory_settings()
-        return bool(settings.get("instruction_promotion_enabled", False))
+        return get_settings_snapshot().instruction_promotion_enabled
     except Exception as e:
         logger.warning(
             f"Failed to read memory.instruction_promotion_enabled, defaulting to False: {e}"
@@ -0,0 +1,147 @@
+"""Event-driven provider startup: output wake-ups and per-phase timings.
+
+Provider ``initialize()`` paths used to find their startup dialogs (bypass
+permissions, workspace trust) by capturing the pane and sleeping a fixed
+0.5–1.0s between captures, so every spawn paid up to a second of pure waiting
+per dialog on top of the CLI's own start time. A ``StartupSequencer``
+subscribes to the terminal's ``terminal.{id}.output`` topic for the duration
+of ``initialize()``: a provider's prompt loop parks in ``wait_for_output()``
+and is woken by the first chunk of the next repaint, lets the repaint settle
+for one ``STARTUP_COALESCE_WINDOW_S`` window, then re-checks its patterns. A
+dialog is therefore answered within one window of rendering.
+
+Matching still runs against the rendered ``get_history`` capture rather than
+the raw chunks: Ink TUIs redraw with cursor motion, so a prompt's text is only
+contiguous on the rendered screen. The output events decide *when* to capture.
+
+The sequencer also records when each startup phase ended (``STARTUP_PHASES``,
+seconds since ``initialize()`` began). Providers expose them as
+``BaseProvider.startup_timings``; terminal creation logs them and attaches
+them to ``PostCreateTerminalEvent``, which the fleet event log records.
+
+Without a live source of output events (event-inbox backends such as herdr,
+which run no FIFO reader, or a bus not attached to the running loop) the
+sequencer degrades to the old behaviour: ``wait_for_output()`` just sleeps.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from cli_agent_orchestrator.constants import STARTUP_COALESCE_WINDOW_S
+from cli_agent_orchestrator.services.event_bus import bus
+
+logger = logging.getLogger(__name__)
+
+# Startup phases in the order they complete.
+STARTUP_PHASES = ("shell_ready", "cli_launched", "prompts_handled", "first_idle")
+
+
+def subscribe_live(pattern: str, merge_output: bool = False) -> Optional[asyncio.Queue]:
+    """Subscribe to ``pattern`` when the bus dispatches on the running loop.
+
+    Returns None (nothing subscribed) when called off-loop or while the bus is
+    detached, where the queue would never be fed; callers then poll instead.
+    """
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    if bus.loop is not running:
+        return None
+    return bus.subscribe(pattern, merge_output=merge_output)
+
+
+class StartupSequencer:
+    """Output wake-ups and phase timings for one terminal's ``initialize()``.
+
+    Use as a context manager around the startup so the output subscription
+    is always released::
+
+        with StartupSequencer(self.terminal_id) as startup:
+            ...
+            startup.mark("shell_ready")
+    """
+
+    def __init__(self, terminal_id: str, coalesce_window: Optional[float] = None) -> None:
+        self.terminal_id = terminal_id
+        self._coalesce_window = (
+            STARTUP_COALESCE_WINDOW_S if coalesce_window is None else coalesce_window
+        )
+        self._topic = f"terminal.{terminal_id}.output"
+        self._queue: Optional[asyncio.Queue] = None
+        self._started = time.monotonic()
+        self._marks: Dict[str, float] = {}
+
+    def __enter__(self) -> "StartupSequencer":
+        from cli_agent_orchestrator.backends.registry import get_backend
+
+        # Event-inbox backends never start a FIFO reader, so nothing would
+        # ever be published on the output topic.
+        if not get_backend().supports_event_inbox():
+            # Merging queue: output that piles up while the caller is busy
+            # elsewhere (wait_for_shell, the status wait) is concatenated
+            # instead of tripping the bus's queue-full drop reporting.
+            self._queue = subscribe_live(self._topic, merge_output=True)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._queue is not None:
+            bus.unsubscribe(self._topic, self._queue)
+            self._queue = None
+
+    @property
+    def event_driven(self) -> bool:
+        """True while output events (rather than sleeps) drive the waits."""
+        return self._queue is not None
+
+    def _drain(self) -> None:
+        queue = self._queue
+        if queue is None:
+            return
+        while True:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+    async def wait_for_output(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for the terminal to print something.
+
+        Returns True once output arrived and one coalescing window has passed
+        (the rest of the repaint is drained, so the next capture sees it
+        whole); False on timeout. Output printed since the previous wait
+        counts, so a repaint that landed during the caller's own capture is
+        not missed. Without an event source this sleeps ``timeout`` and
+        returns False.
+        """
+        queue = self._queue
+        if queue is None:
+            await asyncio.sleep(timeout)
+            return False
+        try:
+            await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        if self._coalesce_window > 0:
+            await asyncio.sleep(self._coalesce_window)
+        self._drain()
+        return True
+
+    def mark(self, phase: str) -> None:
+        """Record that ``phase`` (one of ``STARTUP_PHASES``) just completed."""
+        self._marks[phase] = round(time.monotonic() - self._started, 3)
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """Completed phases -> seconds since the sequencer was created."""
+        return dict(self._marks)
+
+    def log_timings(self, provider: str) -> None:
+        """One INFO line with every recorded phase, for spawn-latency tracking."""
+        phases = " ".join(f"{phase}={secs:.3f}s" for phase, secs in self._marks.items())
+        logger.info(
+            f"provider_startup [{self.terminal_id}] provider={provider} "
+            f"event_driven={self.event_driven} {phases}"
+        )
@@ -18,8 +18,9 @@ from cli_agent_orchestrator.constants import (
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 from cli_agent_orchestrator.providers.manager import provider_manager
 from cli_agent_orchestrator.services.event_bus import bus
-from cli_agent_orchestrator.services.settings_service import get_server_settings
+from cli_agent_orchestrator.services.settings_service import get_settings_snapshot
 from cli_agent_orchestrator.utils.event import terminal_id_from_topic
+from cli_agent_orchestrator.utils.text import CleanLineBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +83,13 @@ class StatusMonitor:
         # stopped for PYTE_QUIESCENCE_DELAY_S) — never mid-burst, which is what
         # keeps status flap-free.
         self._screens: Dict[str, Tuple[object, object]] = {}
+        # --- incrementally cleaned line detection (providers that opt in via
+        # supports_line_detection) --- Escape-stripped lines fed chunk by chunk
+        # alongside the raw buffer, so detection never re-strips the whole
+        # rolling buffer. Each is paired with the raw buffer string it mirrors;
+        # when _buffers holds a different string (it was cleared or replaced
+        # outside _process_chunk) the line buffer is rebuilt from the raw one.
+        self._clean_lines: Dict[str, Tuple[str, CleanLineBuffer]] = {}
         self._bursting: Dict[str, bool] = {}
         # Pending quiescence-detect timer handle per terminal (loop.call_later).
         self._quiesce_handle: Dict[str, asyncio.TimerHandle] = {}
@@ -117,7 +125,7 @@ class StatusMonitor:
         # Capture the loop up front, on the loop thread, so the debounce timers
         # scheduled from the worker thread can be marshaled back onto it.
         self._loop = asyncio.get_running_loop()
-        queue = bus.subscribe("terminal.*.output")
+        queue = bus.subscribe("terminal.*.output", merge_output=True)
         logger.info("StatusMonitor started")
 
         while True:
@@ -147,13 +155,22 @@ class StatusMonitor:
             and provider is not None
             and getattr(provider, "supports_screen_detection", False)
         )
-        state_buffer_max = get_server_settings()["state_buffer_max"]
+        use_lines = getattr(provider, "supports_line_detection", False) is True
+        state_buffer_max = get_settings_snapshot().server["state_buffer_max"]
 
         with self._lock:
-            buffer = self._buffers.get(terminal_id, "") + chunk
+            previous = self._buffers.get(terminal_id, "")
+            buffer = previous + chunk
             if len(buffer) > state_buffer_max:
                 buffer = buffer[-state_buffer_max:]
             self._buffers[terminal_id] = buffer
+            if use_lines:
+                entry = self._clean_lines.get(terminal_id)
+                if entry is not None and entry[0] is previous:
+                    entry[1].feed(chunk)
+                    self._clean_lines[terminal_id] = (buffer, entry[1])
+                else:
+                    self._clean_lines_locked(terminal_id, buffer)
             if use_screen:
                 self._feed_screen_locked(terminal_id, chunk)
 
@@ -501,18 +518,44 @@ class StatusMonitor:
         """
         with self._lock:
             self._buffers[terminal_id] = ""
+            self._clean_lines.pop(terminal_id, None)
             epoch = self._buffer_epochs.get(terminal_id, 0) + 1
             self._buffer_epochs[terminal_id] = epoch
             if provider is not None:
                 provider.notify_status_buffer_reset(epoch)
 
+    def _clean_lines_locked(self, terminal_id: str, buffer: str) -> CleanLineBuffer:
+        """Return the terminal's cleaned line buffer. Caller holds the lock.
+
+        Reused while it still mirrors the current raw buffer; otherwise (first
+        use, or the raw buffer was reset/replaced) rebuilt from ``buffer``.
+        """
+        entry = self._clean_lines.get(terminal_id)
+        if entry is not None and entry[0] is self._buffers.get(terminal_id):
+            return entry[1]
+        lines = CleanLineBuffer(get_settings_snapshot().server["state_buffer_max"])
+        lines.feed(buffer)
+        self._clean_lines[terminal_id] = (buffer, lines)
+        return lines
+
     def _detect_status(self, terminal_id: str, buffer: str) -> TerminalStatus:
-        """Detect status: provider-specific patterns or UNKNOWN if no provider."""
+        """Detect status: provider-specific patterns or UNKNOWN if no provider.
+
+        Providers that opt into line detection are handed the tail of the
+        terminal's cleaned line buffer (which always reflects the latest chunk)
+        instead of ``buffer``.
+        """
         provider = provider_manager.get_provider(terminal_id)
         if provider is None:
             return TerminalStatus.UNKNOWN
 
         try:
+            if getattr(provider, "supports_line_detection", False) is True:
+                with self._lock:
+                    lines = self._clean_lines_locked(terminal_id, buffer).tail(
+                        provider.status_tail_lines
+                    )
+                return provider.get_status_from_lines(lines)
             return provider.get_status(buffer)
         except Exception as e:
             logger.error(f"Error detecting status for {terminal_id}: {e}")
@@ -522,6 +565,7 @@ class StatusMonitor:
         """Free buffer and status for a deleted terminal."""
         with self._lock:
             self._buffers.pop(terminal_id, None)
+            self._clean_lines.pop(terminal_id, None)
             self._buffer_epochs.pop(terminal_id, None)
             self._last_status.pop(terminal_id, None)
             self._allow_processing_revert.pop(terminal_id, None)
@@ -541,6 +585,7 @@ class StatusMonitor:
         """
         with self._lock:
             self._buffers[terminal_id] = ""
+            self._clean_lines.pop(terminal_id, None)
             self._last_status.pop(terminal_id, None)
             self._allow_processing_revert.pop(terminal_id, None)
             # Drop the rendered screen too so the relaunched CLI mode is
@@ -0,0 +1,226 @@
+"""Records terminal output streams for offline status-detection replay.
+
+Producer hooks: FifoManager's multiplexer (output batches), terminal_service
+(input boundaries)
+
+A recording holds exactly what the FIFO multiplexer handed to the event bus:
+one frame per coalesced ``terminal.{id}.output`` batch, timestamped when the
+batch was published, so a replay reproduces the chunk boundaries and gaps
+StatusMonitor saw live (the quiescence debounce and the per-chunk latch
+decisions both depend on them). Input boundaries are recorded too, because a
+provider's status depends on whether a turn was dispatched:
+
+- ``"i"`` — ``send_input`` pasted a message (notify + buffer clear + mark);
+- ``"m"`` — ``send_special_key`` sent a key (notify only).
+
+Files are asciicast v2 (a JSON header line, then one ``[t, code, data]`` JSON
+line per frame), gzip-compressed when the path ends in ``.gz``. Plain
+recordings play in any asciicast player; CAO's own metadata lives under the
+header's ``"cao"`` key. Replay with ``services/stream_replay.py``.
+
+Recording is opt-in (``CAO_STREAM_RECORD_DIR``) and never allowed to disturb
+the live pipeline: a write error drops that terminal's recording with a
+warning instead of raising into the multiplexer thread.
+"""
+
+import gzip
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from cli_agent_orchestrator.utils.event import terminal_id_from_topic
+
+logger = logging.getLogger(__name__)
+
+# Frame codes (asciicast v2 event types).
+OUTPUT = "o"
+INPUT = "i"
+MARKER = "m"
+
+# Nominal pane geometry for the asciicast header; see clients/tmux.py.
+_WIDTH = 220
+_HEIGHT = 50
+
+
+@dataclass
+class Recording:
+    """A loaded recording: header metadata plus ``(t, code, data)`` frames."""
+
+    terminal_id: str
+    provider: Optional[str]
+    agent_profile: Optional[str]
+    frames: List[Tuple[float, str, str]] = field(default_factory=list)
+
+    @property
+    def output_bytes(self) -> int:
+        return sum(len(data) for _, code, data in self.frames if code == OUTPUT)
+
+    @property
+    def duration(self) -> float:
+        return self.frames[-1][0] if self.frames else 0.0
+
+
+@dataclass
+class _Sink:
+    path: Path
+    handle: IO[str]
+    started: float
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    return open(path, mode, encoding="utf-8")
+
+
+class StreamRecorder:
+    """Per-terminal asciicast writers fed from the output and input paths."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sinks: Dict[str, _Sink] = {}
+
+    @property
+    def active(self) -> bool:
+        """Cheap check for the multiplexer's hot path (no lock, dict truthiness)."""
+        return bool(self._sinks)
+
+    def start(
+        self,
+        terminal_id: str,
+        path: Path,
+        provider: Optional[str] = None,
+        agent_profile: Optional[str] = None,
+    ) -> None:
+        """Begin recording ``terminal_id`` to ``path`` (replacing any open recording)."""
+        self.stop(terminal_id)
+        header: Dict[str, Any] = {
+            "version": 2,
+            "width": _WIDTH,
+            "height": _HEIGHT,
+            "timestamp": int(time.time()),
+            "cao": {
+                "terminal_id": terminal_id,
+                "provider": provider,
+                "agent_profile": agent_profile,
+            },
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            handle = _open(path, "w")
+            handle.write(json.dumps(header) + "\n")
+        except OSError as e:
+            logger.warning("Not recording terminal %s: %s", terminal_id, e)
+            return
+        with self._lock:
+            self._sinks[terminal_id] = _Sink(path, handle, time.monotonic())
+        logger.info("Recording terminal %s output to %s", terminal_id, path)
+
+    def record_output(self, events: List[Tuple[str, dict]]) -> None:
+        """Record a batch of ``terminal.{id}.output`` events as published."""
+        now = time.monotonic()
+        with self._lock:
+            for topic, payload in events:
+                self._write_locked(terminal_id_from_topic(topic), now, OUTPUT, payload["data"])
+
+    def record_input(self, terminal_id: str, message: str) -> None:
+        """Record a ``send_input`` paste (a new turn boundary)."""
+        self._record(terminal_id, INPUT, message)
+
+    def record_key(self, terminal_id: str, key: str) -> None:
+        """Record a ``send_special_key`` keystroke."""
+        self._record(terminal_id, MARKER, key)
+
+    def _record(self, terminal_id: str, code: str, data: str) -> None:
+        if terminal_id not in self._sinks:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self._write_locked(terminal_id, now, code, data)
+
+    def _write_locked(self, terminal_id: str, now: float, code: str, data: str) -> None:
+        sink = self._sinks.get(terminal_id)
+        if sink is None:
+            return
+        frame = [round(now - sink.started, 6), code, data]
+        try:
+            sink.handle.write(json.dumps(frame, ensure_ascii=False) + "\n")
+        except (OSError, ValueError) as e:
+            logger.warning("Stopped recording terminal %s: %s", terminal_id, e)
+            del self._sinks[terminal_id]
+            self._close(sink)
+
+    def stop(self, terminal_id: str) -> Optional[Path]:
+        """Finish ``terminal_id``'s recording; returns its path, or None if none was open."""
+        with self._lock:
+            sink = self._sinks.pop(terminal_id, None)
+        if sink is None:
+            return None
+        self._close(sink)
+        return sink.path
+
+    def stop_all(self) -> None:
+        with self._lock:
+            sinks = list(self._sinks.values())
+            self._sinks.clear()
+        for sink in sinks:
+            self._close(sink)
+
+    @staticmethod
+    def _close(sink: _Sink) -> None:
+        try:
+            sink.handle.close()
+        except OSError as e:
+            logger.warning("Failed to close recording %s: %s", sink.path, e)
+
+
+def load_recording(path: Path) -> Recording:
+    """Read a recording written by :class:`StreamRecorder` (or any asciicast v2 file).
+
+    Raises:
+        ValueError: If the file is not an asciicast v2 recording.
+    """
+    with _open(Path(path), "r") as handle:
+        try:
+            header = json.loads(handle.readline())
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: not an asciicast recording ({e})") from e
+        if not isinstance(header, dict) or header.get("version") != 2:
+            raise ValueError(f"{path}: expected an asciicast v2 header")
+        meta = header.get("cao") or {}
+        recording = Recording(
+            terminal_id=meta.get("terminal_id") or Path(path).name.split(".")[0],
+            provider=meta.get("provider"),
+            agent_profile=meta.get("agent_profile"),
+        )
+        for line in handle:
+            if line.strip():
+                t, code, data = json.loads(line)
+                recording.frames.append((float(t), code, data))
+    return recording
+
+
+def save_recording(recording: Recording, path: Path) -> None:
+    """Write ``recording`` in the format :class:`StreamRecorder` produces."""
+    header = {
+        "version": 2,
+        "width": _WIDTH,
+        "height": _HEIGHT,
+        "cao": {
+            "terminal_id": recording.terminal_id,
+            "provider": recording.provider,
+            "agent_profile": recording.agent_profile,
+        },
+    }
+    with _open(Path(path), "w") as handle:
+        handle.write(json.dumps(header) + "\n")
+        for t, code, data in recording.frames:
+            handle.write(json.dumps([t, code, data], ensure_ascii=False) + "\n")
+
+
+# Module-level singleton
+stream_recorder = StreamRecorder()
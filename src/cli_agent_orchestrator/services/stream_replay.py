@@ -0,0 +1,277 @@
+"""Replays recorded terminal streams through StatusMonitor and measures detection.
+
+Feeds a :class:`~cli_agent_orchestrator.services.stream_recorder.Recording`
+into a private ``StatusMonitor`` exactly as the live consumer would: output
+frames go through ``_process_chunk`` (so the raw/line/screen path, the
+rising-edge + quiescence debounce and the sticky latch all apply), ``"i"``
+frames repeat ``send_input``'s arm + buffer clear + ``mark_input_received``
+and ``"m"`` frames repeat ``send_special_key``'s arm. The provider is a fresh
+instance of the recorded type registered under a private terminal id; it is
+never initialized and never sent input, so provider fallbacks that consult the
+live pane (gated on init/dispatch) do not run and nothing touches tmux.
+
+Two pacing modes:
+
+- max speed (``speed=None``): no sleeping. Quiescence timers run on a virtual
+  clock that advances to each frame's recorded timestamp, so the debounce
+  fires exactly where it would have live, and the report is deterministic.
+- wall clock (``speed > 0``): recorded gaps are slept (divided by ``speed``)
+  on the real event loop with real timers and worker threads, like the
+  server. Only the gaps scale; the 200ms quiescence debounce does not.
+
+The report gives detection count and CPU time (``time.thread_time`` around
+every provider detection call), the status transition timeline on the
+recording's clock, and the latency from the last output frame to the final
+COMPLETED, so a detection change can be shown to produce the same timeline
+in less CPU.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from cli_agent_orchestrator.constants import CAO_PYTE_STATUS
+from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.services.status_monitor import StatusMonitor
+from cli_agent_orchestrator.services.stream_recorder import INPUT, MARKER, OUTPUT, Recording
+
+# How long a wall-clock replay waits, after its last frame, for pending
+# quiescence timers and detection tasks to drain.
+_SETTLE_TIMEOUT = 5.0
+
+
+@dataclass
+class ReplayReport:
+    """Outcome of one replay; ``timeline`` times are on the recording's clock."""
+
+    provider: str
+    detection_path: str
+    speed: Optional[float]
+    frames: int
+    output_bytes: int
+    duration_s: float
+    replay_wall_s: float
+    detections: int
+    detection_cpu_ms: float
+    timeline: List[Tuple[float, str]] = field(default_factory=list)
+    final_status: Optional[str] = None
+    final_completed_at_s: Optional[float] = None
+    completed_latency_ms: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _MeasuredMonitor(StatusMonitor):
+    """StatusMonitor that times every detection and logs latched transitions."""
+
+    def __init__(self, clock: Callable[[], float]) -> None:
+        super().__init__()
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self.detections = 0
+        self.detect_cpu = 0.0
+        self.timeline: List[Tuple[float, TerminalStatus]] = []
+
+    def _timed(self, detect: Callable[..., TerminalStatus], *args: Any) -> TerminalStatus:
+        t0 = time.thread_time()
+        try:
+            return detect(*args)
+        finally:
+            elapsed = time.thread_time() - t0
+            with self._stats_lock:
+                self.detections += 1
+                self.detect_cpu += elapsed
+
+    def _detect_status(self, terminal_id: str, buffer: str) -> TerminalStatus:
+        return self._timed(super()._detect_status, terminal_id, buffer)
+
+    def _detect_screen(self, terminal_id: str, provider) -> TerminalStatus:
+        return self._timed(super()._detect_screen, terminal_id, provider)
+
+    def _apply_detection(self, terminal_id: str, detected: TerminalStatus) -> None:
+        with self._lock:
+            before = self._last_status.get(terminal_id)
+            super()._apply_detection(terminal_id, detected)
+            after = self._last_status.get(terminal_id)
+            if after is not None and after != before:
+                self.timeline.append((self._clock(), after))
+
+
+@dataclass(order=True)
+class _VirtualTimer:
+    when: float
+    seq: int
+    callback: Callable[..., None] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class _VirtualClockLoop:
+    """Stands in for the monitor's loop in max-speed replay.
+
+    Timers (``call_later``) are kept on a virtual clock the replay advances
+    frame by frame; ``call_soon_threadsafe`` runs inline (the replay feeds
+    chunks on the loop thread, so there is nothing to marshal); detection tasks
+    go to the real loop.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+        self._timers: List[_VirtualTimer] = []
+        self._seq = itertools.count()
+        self.now = 0.0
+
+    def call_soon_threadsafe(self, callback: Callable[..., None], *args: Any) -> None:
+        callback(*args)
+
+    def call_later(self, delay: float, callback: Callable[..., None], *args: Any) -> _VirtualTimer:
+        timer = _VirtualTimer(self.now + delay, next(self._seq), callback, args)
+        heapq.heappush(self._timers, timer)
+        return timer
+
+    def create_task(self, coro: Any) -> "asyncio.Task[Any]":
+        return self._loop.create_task(coro)
+
+    async def advance(self, until: float, monitor: StatusMonitor) -> None:
+        """Fire every live timer due by ``until`` (in order), then move the clock there."""
+        while self._timers and self._timers[0].when <= until:
+            timer = heapq.heappop(self._timers)
+            if timer.cancelled:
+                continue
+            self.now = timer.when
+            timer.callback(*timer.args)
+            await _drain(monitor)
+        if until != math.inf:
+            self.now = max(self.now, until)
+
+
+async def _drain(monitor: StatusMonitor) -> None:
+    while monitor._detect_tasks:
+        await asyncio.gather(*list(monitor._detect_tasks))
+
+
+def _detection_path(provider: Any) -> str:
+    if CAO_PYTE_STATUS and getattr(provider, "supports_screen_detection", False):
+        return "screen"
+    if getattr(provider, "supports_line_detection", False) is True:
+        return "lines"
+    return "raw"
+
+
+def _apply_frame(monitor: StatusMonitor, terminal_id: str, provider: Any, code: str) -> None:
+    """Repeat the StatusMonitor side of an input boundary frame."""
+    monitor.notify_input_sent(terminal_id)
+    if code == INPUT:
+        monitor.clear_rolling_buffer(terminal_id, provider)
+        provider.mark_input_received()
+
+
+async def replay(
+    recording: Recording,
+    provider: Optional[str] = None,
+    speed: Optional[float] = None,
+    agent_profile: Optional[str] = None,
+) -> ReplayReport:
+    """Replay ``recording`` through a private StatusMonitor and report on detection.
+
+    Args:
+        recording: Loaded recording (see ``stream_recorder.load_recording``).
+        provider: Provider type to detect with; defaults to the recorded one.
+        speed: None for max speed on a virtual clock, otherwise the wall-clock
+            speed-up applied to recorded gaps (1.0 = real time).
+        agent_profile: Profile for providers that require one (kiro_cli);
+            defaults to the recorded one.
+
+    Raises:
+        ValueError: If no provider type is known or ``speed`` is not positive.
+    """
+    provider_type = provider or recording.provider
+    if not provider_type:
+        raise ValueError("recording has no provider; pass provider=")
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive (or None for max speed)")
+
+    loop = asyncio.get_running_loop()
+    virtual = _VirtualClockLoop(loop) if speed is None else None
+    wall0 = time.perf_counter()
+
+    def clock() -> float:
+        if virtual is not None:
+            return virtual.now
+        return (time.perf_counter() - wall0) * (speed or 1.0)
+
+    monitor = _MeasuredMonitor(clock)
+    monitor._loop = virtual if virtual is not None else loop  # type: ignore[assignment]
+    terminal_id = f"replay-{uuid.uuid4().hex[:8]}"
+    instance = provider_manager.create_provider(
+        provider_type,
+        terminal_id,
+        "cao-replay",
+        terminal_id,
+        agent_profile or recording.agent_profile or "replay",
+    )
+    last_output_at: List[float] = []
+    try:
+        for t, code, data in recording.frames:
+            if virtual is not None:
+                await virtual.advance(t, monitor)
+            else:
+                delay = t / speed - (time.perf_counter() - wall0)  # type: ignore[operator]
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if code == OUTPUT:
+                last_output_at.append(t)
+                if virtual is not None:
+                    monitor._process_chunk(terminal_id, data)
+                    await _drain(monitor)
+                else:
+                    await asyncio.to_thread(monitor._process_chunk, terminal_id, data)
+            elif code in (INPUT, MARKER):
+                _apply_frame(monitor, terminal_id, instance, code)
+        if virtual is not None:
+            await virtual.advance(math.inf, monitor)
+        else:
+            deadline = time.monotonic() + _SETTLE_TIMEOUT
+            while (monitor._quiesce_handle or monitor._detect_tasks) and (
+                time.monotonic() < deadline
+            ):
+                await asyncio.sleep(0.01)
+            await _drain(monitor)
+        wall = time.perf_counter() - wall0
+    finally:
+        monitor.clear_terminal(terminal_id)
+        provider_manager._providers.pop(terminal_id, None)
+
+    timeline = [(round(at, 4), status.value) for at, status in monitor.timeline]
+    completed = [at for at, status in monitor.timeline if status == TerminalStatus.COMPLETED]
+    report = ReplayReport(
+        provider=provider_type,
+        detection_path=_detection_path(instance),
+        speed=speed,
+        frames=len(recording.frames),
+        output_bytes=recording.output_bytes,
+        duration_s=round(recording.duration, 4),
+        replay_wall_s=round(wall, 4),
+        detections=monitor.detections,
+        detection_cpu_ms=round(monitor.detect_cpu * 1e3, 3),
+        timeline=timeline,
+        final_status=timeline[-1][1] if timeline else None,
+    )
+    if completed:
+        done = completed[-1]
+        report.final_completed_at_s = round(done, 4)
+        before = [at for at in last_output_at if at <= done]
+        if before:
+            report.completed_latency_ms = round((done - before[-1]) * 1e3, 3)
+    return report
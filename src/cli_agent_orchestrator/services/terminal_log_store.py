@@ -0,0 +1,597 @@
+"""Segmented, compressed storage for per-terminal output logs.
+
+LogWriter used to append every chunk to ``TERMINAL_LOG_DIR/{id}.log`` forever,
+reopening the file for each batch, and ``read_output_range`` seeked straight
+into that one file. A long-lived supervisor grew a multi-GB log that retention
+could only delete whole. The store keeps the same logical byte stream but
+splits it on disk:
+
+* ``{id}.log`` — the live segment. Plain bytes, appended through a cached
+  handle. Its logical start is the end of the last sealed segment, so a
+  terminal that has never rotated reads exactly like the old single-file log.
+* ``{id}.{seq:06d}.seg.gz`` (``.seg.zst`` when ``zstandard`` is installed) —
+  a sealed segment of ``TERMINAL_LOG_SEGMENT_BYTES``, compressed as a run of
+  independent ``TERMINAL_LOG_FRAME_BYTES`` frames.
+* ``{id}.idx`` — JSON index with one entry per sealed segment: logical start,
+  length, file name, codec and a sparse frame table of
+  ``[inner_offset, compressed_offset]`` pairs. A ranged read bisects the
+  segment list, then the frame table, and inflates only the frames it needs.
+
+Sealing renames the live file to ``{id}.{seq:06d}.seg`` (atomic), compresses
+it, publishes the index and only then unlinks the raw file. Every crash point
+leaves a readable tree: an unindexed raw segment is served uncompressed and
+sealed by the next append; a raw file whose compressed twin is already
+indexed is deleted.
+
+Retention prunes whole sealed segments. The index keeps a pruned entry with
+``file`` set to None so later offsets never shift; reads over a pruned range
+simply return fewer bytes.
+
+Readers take a ``LogSnapshot``: the index, the live segment's handle and the
+sealed segments' handles are captured together under the terminal lock and
+the live size is frozen, so a long streamed response sees one consistent byte
+stream however much is appended, sealed or pruned while it runs. A retained
+segment that cannot be read raises ``SegmentMissingError`` rather than being
+skipped, since skipping it would shift every later byte.
+
+Each log also has a ``generation``: an opaque token that changes whenever
+``remove`` deletes the log (and on server restart), so a caller holding a
+logical offset from an earlier log can tell that it no longer applies.
+"""
+
+import bisect
+import gzip
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from cli_agent_orchestrator.constants import (
+    TERMINAL_LOG_FRAME_BYTES,
+    TERMINAL_LOG_MAX_OPEN_FILES,
+    TERMINAL_LOG_SEGMENT_BYTES,
+)
+
+try:
+    import zstandard
+
+    _ZSTD_AVAILABLE = True
+except ImportError:  # optional: sealed segments fall back to gzip
+    zstandard = None  # type: ignore[assignment]
+    _ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Largest piece ``LogSnapshot.iter_range`` reads from a plain segment at once.
+STREAM_CHUNK_BYTES = 256 * 1024
+
+
+@dataclass
+class _Segment:
+    seq: int
+    start: int
+    length: int
+    file: Optional[str]
+    codec: str  # "gzip" | "zstd" | "raw" (unindexed, not yet compressed)
+    frames: List[List[int]] = field(default_factory=list)
+    sealed_at: float = 0.0
+
+    @property
+    def end(self) -> int:
+        return self.start + self.length
+
+
+@dataclass
+class _LiveHandle:
+    file: BinaryIO
+    start: int  # logical offset of the live segment's first byte
+    size: int
+
+
+class SegmentMissingError(OSError):
+    """A sealed segment inside a snapshot's retained range could not be opened."""
+
+
+def _compress_frame(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor().compress(data)
+    return gzip.compress(data, mtime=0)
+
+
+def _decompress_frame(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise OSError("terminal log segment is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def _live_path(log_dir: Path, terminal_id: str) -> Path:
+    return log_dir / f"{terminal_id}.log"
+
+
+def _index_path(log_dir: Path, terminal_id: str) -> Path:
+    return log_dir / f"{terminal_id}.idx"
+
+
+def _raw_segment_path(log_dir: Path, terminal_id: str, seq: int) -> Path:
+    return log_dir / f"{terminal_id}.{seq:06d}.seg"
+
+
+def _read_index(log_dir: Path, terminal_id: str) -> List[_Segment]:
+    try:
+        raw = _index_path(log_dir, terminal_id).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+    return [_Segment(**entry) for entry in json.loads(raw)["segments"]]
+
+
+def _write_index(log_dir: Path, terminal_id: str, segments: List[_Segment]) -> None:
+    path = _index_path(log_dir, terminal_id)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"segments": [asdict(seg) for seg in segments]}), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class TerminalLogStore:
+    """Appends to and reads from segmented per-terminal logs.
+
+    Every method takes the log directory explicitly so callers keep resolving
+    ``TERMINAL_LOG_DIR`` from their own module (tests point it at a tmp dir).
+    Appends, seals and index rewrites for one terminal are serialized by a
+    per-terminal lock; different terminals proceed in parallel.
+    """
+
+    def __init__(
+        self,
+        segment_bytes: Optional[int] = None,
+        frame_bytes: Optional[int] = None,
+        max_open_files: Optional[int] = None,
+    ) -> None:
+        self._segment_bytes = segment_bytes or TERMINAL_LOG_SEGMENT_BYTES
+        self._frame_bytes = frame_bytes or TERMINAL_LOG_FRAME_BYTES
+        self._max_open_files = max_open_files or TERMINAL_LOG_MAX_OPEN_FILES
+        self._codec = "zstd" if _ZSTD_AVAILABLE else "gzip"
+        # Guards _handles and _terminal_locks only; never held across file I/O.
+        self._lock = threading.Lock()
+        self._handles: "OrderedDict[Path, _LiveHandle]" = OrderedDict()
+        self._terminal_locks: Dict[Path, threading.Lock] = {}
+        # Generations are per process: nothing persists them, so a restart
+        # invalidates every outstanding offset (callers re-read from scratch).
+        self._generation_salt = os.urandom(4).hex()
+        self._generation_ids = itertools.count()
+        self._generations: Dict[Path, int] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, log_dir: Path, terminal_id: str, data: bytes) -> int:
+        """Append ``data`` to the terminal's live segment, sealing it when full.
+
+        Returns the logical offset ``data`` was written at.
+        """
+        live = _live_path(log_dir, terminal_id)
+        with self._terminal_lock(live):
+            handle = self._get_handle(log_dir, terminal_id)
+            offset = handle.start + handle.size
+            handle.file.write(data)
+            handle.file.flush()
+            handle.size += len(data)
+            if handle.size >= self._segment_bytes:
+                self._seal(log_dir, terminal_id)
+            return offset
+
+    def close(self, log_dir: Path, terminal_id: str) -> None:
+        """Close the terminal's cached append handle, if any."""
+        live = _live_path(log_dir, terminal_id)
+        with self._terminal_lock(live):
+            self._drop_handle(live)
+
+    def close_all(self) -> None:
+        """Close every cached append handle."""
+        with self._lock:
+            paths = list(self._handles)
+        for live in paths:
+            with self._terminal_lock(live):
+                self._drop_handle(live)
+
+    def _terminal_lock(self, live: Path) -> threading.Lock:
+        with self._lock:
+            lock = self._terminal_locks.get(live)
+            if lock is None:
+                lock = self._terminal_locks[live] = threading.Lock()
+            return lock
+
+    def _generation(self, live: Path) -> str:
+        with self._lock:
+            number = self._generations.get(live)
+            if number is None:
+                number = self._generations[live] = next(self._generation_ids)
+        return f"{self._generation_salt}{number:x}"
+
+    def _get_handle(self, log_dir: Path, terminal_id: str) -> _LiveHandle:
+        live = _live_path(log_dir, terminal_id)
+        with self._lock:
+            handle = self._handles.get(live)
+            if handle is not None:
+                self._handles.move_to_end(live)
+                return handle
+        # First write since start-up (or since eviction/seal): finish any seal
+        # a crash interrupted before the live file is reopened.
+        segments = self._finish_pending_seal(log_dir, terminal_id)
+        f = open(live, "ab")
+        handle = _LiveHandle(
+            file=f,
+            start=segments[-1].end if segments else 0,
+            size=os.fstat(f.fileno()).st_size,
+        )
+        with self._lock:
+            self._handles[live] = handle
+            evictable = [path for path in self._handles if path != live]
+            excess = len(self._handles) - self._max_open_files
+        for path in evictable[: max(excess, 0)]:
+            self._evict(path)
+        return handle
+
+    def _evict(self, live: Path) -> None:
+        # Another thread may be mid-write on this handle; skip it rather than
+        # wait (the cap is a soft bound, and waiting here could deadlock two
+        # writers evicting each other).
+        lock = self._terminal_lock(live)
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            self._drop_handle(live)
+        finally:
+            lock.release()
+
+    def _drop_handle(self, live: Path) -> None:
+        with self._lock:
+            handle = self._handles.pop(live, None)
+        if handle is not None:
+            handle.file.close()
+
+    def _seal(self, log_dir: Path, terminal_id: str) -> None:
+        live = _live_path(log_dir, terminal_id)
+        self._drop_handle(live)
+        segments = _read_index(log_dir, terminal_id)
+        raw = _raw_segment_path(log_dir, terminal_id, len(segments))
+        os.replace(live, raw)
+        self._compress_raw_segment(log_dir, terminal_id, segments, raw)
+
+    def _finish_pending_seal(self, log_dir: Path, terminal_id: str) -> List[_Segment]:
+        """Complete a crash-interrupted seal; return the (updated) index."""
+        segments = _read_index(log_dir, terminal_id)
+        if segments:
+            # Crash after the index was published but before the raw unlink.
+            _raw_segment_path(log_dir, terminal_id, len(segments) - 1).unlink(missing_ok=True)
+        raw = _raw_segment_path(log_dir, terminal_id, len(segments))
+        if raw.exists():
+            logger.info("Completing interrupted seal of %s", raw.name)
+            self._compress_raw_segment(log_dir, terminal_id, segments, raw)
+        return segments
+
+    def _compress_raw_segment(
+        self, log_dir: Path, terminal_id: str, segments: List[_Segment], raw: Path
+    ) -> None:
+        seq = len(segments)
+        suffix = "zst" if self._codec == "zstd" else "gz"
+        final = raw.with_name(f"{raw.name}.{suffix}")
+        tmp = final.with_name(final.name + ".tmp")
+        frames: List[List[int]] = []
+        length = 0
+        with open(raw, "rb") as src, open(tmp, "wb") as dst:
+            while True:
+                chunk = src.read(self._frame_bytes)
+                if not chunk:
+                    break
+                frames.append([length, dst.tell()])
+                dst.write(_compress_frame(self._codec, chunk))
+                length += len(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp, final)
+        segments.append(
+            _Segment(
+                seq=seq,
+                start=segments[-1].end if segments else 0,
+                length=length,
+                file=final.name,
+                codec=self._codec,
+                frames=frames,
+                sealed_at=time.time(),
+            )
+        )
+        _write_index(log_dir, terminal_id, segments)
+        raw.unlink()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _load_segments(self, log_dir: Path, terminal_id: str) -> List[_Segment]:
+        """Indexed segments plus an unindexed raw segment left by a crash."""
+        segments = _read_index(log_dir, terminal_id)
+        raw = _raw_segment_path(log_dir, terminal_id, len(segments))
+        try:
+            raw_size = raw.stat().st_size
+        except FileNotFoundError:
+            return segments
+        segments.append(
+            _Segment(
+                seq=len(segments),
+                start=segments[-1].end if segments else 0,
+                length=raw_size,
+                file=raw.name,
+                codec="raw",
+            )
+        )
+        return segments
+
+    def snapshot(
+        self, log_dir: Path, terminal_id: str, pin: Optional[Tuple[int, int]] = None
+    ) -> "LogSnapshot":
+        """Pin the terminal's log as it is now, for one or more ranged reads.
+
+        The caller must ``close()`` the snapshot (or use it as a context
+        manager). Bytes appended afterwards are not visible through it, and the
+        sealed segments are held open so retention can't delete them under
+        it: a response that has already announced a length serves exactly
+        those bytes. ``pin`` limits the held segments to those overlapping the
+        logical ``[start, end)`` window a caller is about to read.
+
+        Raises:
+            FileNotFoundError: Nothing has ever been logged for the terminal
+                (no live segment and no sealed segments).
+        """
+        live = _live_path(log_dir, terminal_id)
+        # Snapshot the index and pin the live inode together, so a concurrent
+        # seal can't make the live segment's start disagree with its contents.
+        with self._terminal_lock(live):
+            segments = self._load_segments(log_dir, terminal_id)
+            try:
+                live_file: Optional[BinaryIO] = open(live, "rb")
+            except FileNotFoundError:
+                live_file = None
+            if live_file is not None:
+                st = os.fstat(live_file.fileno())
+                inode, live_size = st.st_ino, st.st_size
+            elif segments:
+                # Sealed but not yet reopened: identify it by the newest file.
+                newest = segments[-1].file
+                anchor = log_dir / newest if newest else _index_path(log_dir, terminal_id)
+                inode, live_size = anchor.stat().st_ino, 0
+            else:
+                raise FileNotFoundError(str(live))
+            generation = self._generation(live)
+            pinned: Dict[int, BinaryIO] = {}
+            for seg in segments:
+                if seg.file is None or (
+                    pin is not None and not (seg.start < pin[1] and pin[0] < seg.end)
+                ):
+                    continue
+                try:
+                    pinned[seg.seq] = open(log_dir / seg.file, "rb")
+                except FileNotFoundError:
+                    pass  # reported by iter_range if the range is ever read
+                except OSError:
+                    for f in pinned.values():
+                        f.close()
+                    if live_file is not None:
+                        live_file.close()
+                    raise
+        return LogSnapshot(log_dir, segments, live_file, live_size, inode, generation, pinned)
+
+    def read_range(self, log_dir: Path, terminal_id: str, offset: int, length: int) -> bytes:
+        """Return up to ``length`` bytes starting at logical ``offset``.
+
+        Offsets address the terminal's whole output stream across segment
+        boundaries. Reading past the end returns the available tail (or
+        ``b""``).
+
+        Raises:
+            FileNotFoundError: Nothing has ever been logged for the terminal
+                (no live segment and no sealed segments).
+        """
+        with self.snapshot(log_dir, terminal_id, pin=(offset, offset + length)) as snap:
+            return b"".join(snap.iter_range(offset, length))
+
+    def logical_size(self, log_dir: Path, terminal_id: str) -> int:
+        """Total bytes ever logged for the terminal (pruned segments included)."""
+        live = _live_path(log_dir, terminal_id)
+        with self._terminal_lock(live):
+            segments = self._load_segments(log_dir, terminal_id)
+            try:
+                live_size = live.stat().st_size
+            except FileNotFoundError:
+                live_size = 0
+        return (segments[-1].end if segments else 0) + live_size
+
+    def position(self, log_dir: Path, terminal_id: str) -> Tuple[str, int]:
+        """``(generation, logical_size)``: where the next appended byte will land.
+
+        Works for a terminal that has logged nothing yet (size 0).
+        """
+        live = _live_path(log_dir, terminal_id)
+        with self._terminal_lock(live):
+            generation = self._generation(live)
+        return generation, self.logical_size(log_dir, terminal_id)
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def prune(self, log_dir: Path, terminal_id: str, cutoff: float) -> int:
+        """Delete sealed segments sealed before ``cutoff`` (epoch seconds).
+
+        Logical offsets are preserved. Once every segment is pruned and there is
+        no live segment, the index itself is removed. Returns the number of
+        segment files deleted.
+        """
+        live = _live_path(log_dir, terminal_id)
+        with self._terminal_lock(live):
+            segments = _read_index(log_dir, terminal_id)
+            pruned = 0
+            for seg in segments:
+                if seg.file is not None and seg.sealed_at < cutoff:
+                    (log_dir / seg.file).unlink(missing_ok=True)
+                    seg.file = None
+                    pruned += 1
+            if not pruned:
+                return 0
+            if all(seg.file is None for seg in segments) and not live.exists():
+                _index_path(log_dir, terminal_id).unlink(missing_ok=True)
+            else:
+                _write_index(log_dir, terminal_id, segments)
+            return pruned
+
+    def remove(self, log_dir: Path, terminal_id: str) -> int:
+        """Delete the terminal's live segment, sealed segments and index.
+
+        Returns the number of files deleted.
+        """
+        live = _live_path(log_dir, terminal_id)
+        lock = self._terminal_lock(live)
+        with lock:
+            self._drop_handle(live)
+            with self._lock:
+                self._generations.pop(live, None)
+                # Drop the terminal's lock too, or one entry per terminal ever
+                # created would accumulate for the life of the process.
+                if self._terminal_locks.get(live) is lock:
+                    del self._terminal_locks[live]
+            paths = [live, _index_path(log_dir, terminal_id)]
+            paths.extend(log_dir.glob(f"{terminal_id}.*.seg*"))
+            removed = 0
+            for path in paths:
+                try:
+                    path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+
+class LogSnapshot:
+    """A point-in-time, read-only view of one terminal's segmented log.
+
+    Holds the live segment and the sealed segments open (so a seal, rotation
+    or prune can't swap them out from under a reader) and freezes the size. ``iter_range`` yields the requested
+    bytes a chunk at a time: the live and raw segments are read with
+    ``os.pread`` and sealed segments are inflated one frame at a time, so
+    streaming a whole log never holds more than a frame in memory.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        segments: List[_Segment],
+        live_file: Optional[BinaryIO],
+        live_size: int,
+        inode: int,
+        generation: str = "",
+        pinned: Optional[Dict[int, BinaryIO]] = None,
+    ) -> None:
+        self._log_dir = log_dir
+        self._segments = segments
+        self._live_file = live_file
+        self._pinned = pinned if pinned is not None else {}
+        self._live_start = segments[-1].end if segments else 0
+        self.size = self._live_start + live_size
+        # First byte still on disk; everything before it was pruned. Retention
+        # always drops the oldest segments, so what remains is contiguous.
+        self.start = next((seg.start for seg in segments if seg.file is not None), self._live_start)
+        # The live segment's inode changes on every seal and the size on every
+        # append, so together they identify this exact byte stream.
+        self.inode = inode
+        self.generation = generation
+
+    def __enter__(self) -> "LogSnapshot":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._live_file is not None:
+            self._live_file.close()
+            self._live_file = None
+        pinned, self._pinned = self._pinned, {}
+        for f in pinned.values():
+            f.close()
+
+    def iter_range(
+        self, offset: int, length: int, chunk_size: int = STREAM_CHUNK_BYTES
+    ) -> Iterator[bytes]:
+        """Yield the bytes of ``[offset, offset + length)`` clipped to the snapshot.
+
+        Ranges pruned before the snapshot (below ``start``) yield nothing.
+
+        Raises:
+            SegmentMissingError: A sealed segment at or after ``start`` is
+                gone; the bytes yielded so far are all that can be served.
+        """
+        end = min(offset + length, self.size)
+        if offset >= end:
+            return
+        segments = self._segments
+        first = max(bisect.bisect_right([seg.start for seg in segments], offset) - 1, 0)
+        for seg in segments[first:]:
+            if seg.start >= end:
+                break
+            lo, hi = max(offset, seg.start), min(end, seg.end)
+            if lo < hi:
+                yield from self._iter_segment(seg, lo - seg.start, hi - seg.start, chunk_size)
+        if self._live_file is not None and end > self._live_start:
+            lo = max(offset, self._live_start)
+            yield from _iter_pread(
+                self._live_file.fileno(), lo - self._live_start, end - self._live_start, chunk_size
+            )
+
+    def _iter_segment(self, seg: _Segment, lo: int, hi: int, chunk_size: int) -> Iterator[bytes]:
+        if seg.file is None:
+            if seg.start < self.start:
+                return  # pruned by retention before the snapshot
+            raise SegmentMissingError(f"segment {seg.seq} of the log is missing")
+        f = self._pinned.get(seg.seq)
+        if f is None:
+            # Outside the pinned window: open it now, and never skip it.
+            try:
+                f = open(self._log_dir / seg.file, "rb")
+            except FileNotFoundError:
+                raise SegmentMissingError(f"segment {seg.file} was removed") from None
+            self._pinned[seg.seq] = f
+        if seg.codec == "raw":
+            yield from _iter_pread(f.fileno(), lo, hi, chunk_size)
+            return
+        inner = [frame[0] for frame in seg.frames]
+        i = bisect.bisect_right(inner, lo) - 1
+        j = bisect.bisect_left(inner, hi)
+        f.seek(seg.frames[i][1])
+        for k in range(i, j):
+            if k + 1 < len(seg.frames):
+                compressed = f.read(seg.frames[k + 1][1] - seg.frames[k][1])
+            else:
+                compressed = f.read()
+            data = _decompress_frame(seg.codec, compressed)
+            base = inner[k]
+            yield data[max(lo - base, 0) : hi - base]
+
+
+def _iter_pread(fd: int, lo: int, hi: int, chunk_size: int) -> Iterator[bytes]:
+    while lo < hi:
+        data = os.pread(fd, min(chunk_size, hi - lo), lo)
+        if not data:
+            return
+        yield data
+        lo += len(data)
+
+
+terminal_log_store = TerminalLogStore()
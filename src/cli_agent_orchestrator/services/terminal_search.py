@@ -0,0 +1,301 @@
+"""Full-text search across terminal logs and scrollback snapshots.
+
+Finding which worker printed a stack trace or a file path used to mean
+grepping every ``{id}.log`` and ``{id}.scrollback`` by hand. LogWriter now
+feeds each batch it persists into ``terminal_search_index`` (from its worker
+thread, never the event loop):
+
+* Output is escape-stripped incrementally (``IncrementalEscapeStripper``), so
+  every byte is cleaned once.
+* Each completed line is tokenized (``\\w+``, lower-cased) and recorded under
+  the logical log offset of the chunk the line started in, together with the
+  end offset of the chunk it finished in.
+* Postings live in buckets that close after ``TERMINAL_SEARCH_BUCKET_BYTES``
+  of log or ``TERMINAL_SEARCH_BUCKET_SECONDS`` of wall time. Each bucket knows
+  its offset range and first/last write time, which is what ``since`` filters
+  on. Only the newest ``TERMINAL_SEARCH_MAX_BUCKETS`` buckets are kept.
+
+A query intersects the postings of its tokens, then confirms each candidate
+by reading the log back through ``terminal_log_store`` and looking for the
+query as a case-insensitive substring of one cleaned line (the whole
+recorded span is read, however large the merged chunks were); the confirmed
+line becomes the snippet and the offset links straight into
+``read_output_range``. Scrollback snapshots are small and written once, so
+they are scanned at query time rather than indexed.
+
+The index is in memory: output logged before the server started is found
+only through scrollback snapshots.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from cli_agent_orchestrator.constants import (
+    TERMINAL_LOG_DIR,
+    TERMINAL_SEARCH_BUCKET_BYTES,
+    TERMINAL_SEARCH_BUCKET_SECONDS,
+    TERMINAL_SEARCH_MAX_BUCKETS,
+)
+from cli_agent_orchestrator.services.terminal_log_store import (
+    SegmentMissingError,
+    terminal_log_store,
+)
+from cli_agent_orchestrator.utils.text import IncrementalEscapeStripper, strip_terminal_escapes
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# A line longer than this is indexed in pieces so one never-ending line (a
+# progress bar without newlines) can't grow the pending text without bound.
+_MAX_LINE_CHARS = 4096
+
+# Characters of context kept on each side of the match in a snippet.
+_SNIPPET_CONTEXT = 80
+
+DEFAULT_SEARCH_LIMIT = 50
+MAX_SEARCH_LIMIT = 500
+
+
+@dataclass
+class SearchHit:
+    terminal_id: str
+    source: str  # "log" (offset links into read_output_range) | "scrollback"
+    offset: int
+    snippet: str
+    logged_at: Optional[datetime] = None
+
+
+@dataclass
+class _Bucket:
+    terminal_id: str
+    start_offset: int
+    end_offset: int
+    first_at: float
+    last_at: float
+    postings: Dict[str, List[int]] = field(default_factory=dict)
+    # Line start offset -> end offset of the chunk its last line finished in:
+    # the bytes a hit at that offset must read back to be confirmed.
+    spans: Dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class _Cursor:
+    stripper: IncrementalEscapeStripper = field(default_factory=IncrementalEscapeStripper)
+    partial: str = ""
+    partial_offset: int = 0
+    buckets: Deque[_Bucket] = field(default_factory=deque)
+
+
+def _tokens(text: str) -> Set[str]:
+    return {token.lower() for token in _TOKEN_RE.findall(text)}
+
+
+def _snippet(line: str, start: int, length: int) -> str:
+    lo = max(start - _SNIPPET_CONTEXT, 0)
+    hi = min(start + length + _SNIPPET_CONTEXT, len(line))
+    return ("…" if lo else "") + line[lo:hi].strip() + ("…" if hi < len(line) else "")
+
+
+def _find_line(text: str, needle: str) -> Optional[str]:
+    for line in text.split("\n"):
+        start = line.lower().find(needle)
+        if start >= 0:
+            return _snippet(line, start, len(needle))
+    return None
+
+
+class TerminalSearchIndex:
+    """Bucketed token index over every terminal's logged output."""
+
+    def __init__(
+        self,
+        bucket_bytes: int = TERMINAL_SEARCH_BUCKET_BYTES,
+        bucket_seconds: float = TERMINAL_SEARCH_BUCKET_SECONDS,
+        max_buckets: int = TERMINAL_SEARCH_MAX_BUCKETS,
+    ) -> None:
+        self._bucket_bytes = bucket_bytes
+        self._bucket_seconds = bucket_seconds
+        self._max_buckets = max_buckets
+        # Guards _cursors' bucket deques, _buckets and every bucket's postings.
+        # Stripping and tokenizing happen before it is taken.
+        self._lock = threading.Lock()
+        self._cursors: Dict[str, _Cursor] = {}
+        self._buckets: Deque[_Bucket] = deque()  # all terminals, oldest first
+
+    def add(self, terminal_id: str, chunks: Sequence[Tuple[int, str]], end_offset: int) -> None:
+        """Index chunks just appended to a terminal's log.
+
+        ``chunks`` are ``(logical_offset, text)`` pairs in log order and
+        ``end_offset`` is the log offset just past the last one. Called from
+        LogWriter's worker thread; calls for one terminal must not overlap.
+        """
+        if self._max_buckets <= 0 or not chunks:
+            return
+        cursor = self._cursors.get(terminal_id)
+        if cursor is None:
+            cursor = self._cursors.setdefault(terminal_id, _Cursor())
+
+        lines: List[Tuple[int, int, Set[str]]] = []
+        for i, (offset, chunk) in enumerate(chunks):
+            text = cursor.stripper.feed(chunk)
+            if not text:
+                continue
+            chunk_end = chunks[i + 1][0] if i + 1 < len(chunks) else end_offset
+            if not cursor.partial:
+                cursor.partial_offset = offset
+            *complete, rest = (cursor.partial + text).split("\n")
+            for line in complete:
+                lines.append((cursor.partial_offset, chunk_end, _tokens(line)))
+                cursor.partial_offset = offset
+            if len(rest) > _MAX_LINE_CHARS:
+                lines.append((cursor.partial_offset, chunk_end, _tokens(rest)))
+                cursor.partial_offset, rest = offset, ""
+            cursor.partial = rest
+        if not lines:
+            return
+
+        now = time.time()
+        with self._lock:
+            bucket = cursor.buckets[-1] if cursor.buckets else None
+            for offset, line_end, tokens in lines:
+                if (
+                    bucket is None
+                    or offset - bucket.start_offset >= self._bucket_bytes
+                    or now - bucket.first_at >= self._bucket_seconds
+                ):
+                    bucket = _Bucket(terminal_id, offset, offset, now, now)
+                    cursor.buckets.append(bucket)
+                    self._buckets.append(bucket)
+                for token in tokens:
+                    postings = bucket.postings.setdefault(token, [])
+                    if not postings or postings[-1] != offset:
+                        postings.append(offset)
+                if line_end > bucket.spans.get(offset, offset):
+                    bucket.spans[offset] = line_end
+            bucket.end_offset = end_offset
+            bucket.last_at = now
+            while len(self._buckets) > self._max_buckets:
+                oldest = self._buckets.popleft()
+                owner = self._cursors.get(oldest.terminal_id)
+                if owner is not None and owner.buckets and owner.buckets[0] is oldest:
+                    owner.buckets.popleft()
+
+    def discard(self, terminal_id: str) -> None:
+        """Forget a terminal whose logs were removed."""
+        with self._lock:
+            cursor = self._cursors.pop(terminal_id, None)
+            if cursor is not None and cursor.buckets:
+                dropped = {id(bucket) for bucket in cursor.buckets}
+                self._buckets = deque(b for b in self._buckets if id(b) not in dropped)
+
+    def _candidates(
+        self, tokens: Set[str], terminal_id: Optional[str], since: Optional[float]
+    ) -> List[Tuple[str, int, int, float]]:
+        """``(terminal_id, offset, end_offset, bucket_first_at)`` newest first."""
+        found: List[Tuple[str, int, int, float]] = []
+        with self._lock:
+            for bucket in reversed(self._buckets):
+                if terminal_id is not None and bucket.terminal_id != terminal_id:
+                    continue
+                if since is not None and bucket.last_at < since:
+                    continue
+                postings = [bucket.postings.get(token) for token in tokens]
+                if not all(postings):
+                    continue
+                postings.sort(key=len)
+                offsets = set(postings[0]).intersection(*postings[1:])
+                found.extend(
+                    (bucket.terminal_id, offset, bucket.spans[offset], bucket.first_at)
+                    for offset in sorted(offsets, reverse=True)
+                )
+        return found
+
+    def search(
+        self,
+        query: str,
+        terminal_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List[SearchHit]:
+        """Return up to ``limit`` hits for ``query``, newest log hits first.
+
+        Raises:
+            ValueError: ``query`` contains no word characters to look up.
+        """
+        tokens = _tokens(query)
+        if not tokens:
+            raise ValueError("query must contain at least one letter or digit")
+        needle = query.strip().lower()
+        since_ts = since.timestamp() if since is not None else None
+        limit = max(1, min(limit, MAX_SEARCH_LIMIT))
+
+        hits: List[SearchHit] = []
+        for hit in self._confirmed(self._candidates(tokens, terminal_id, since_ts), needle):
+            hits.append(hit)
+            if len(hits) >= limit:
+                return hits
+        for hit in _scan_scrollbacks(needle, terminal_id, since_ts):
+            hits.append(hit)
+            if len(hits) >= limit:
+                break
+        return hits
+
+    @staticmethod
+    def _confirmed(
+        candidates: List[Tuple[str, int, int, float]], needle: str
+    ) -> Iterator[SearchHit]:
+        for terminal_id, offset, end_offset, first_at in candidates:
+            try:
+                data = terminal_log_store.read_range(
+                    TERMINAL_LOG_DIR, terminal_id, offset, end_offset - offset
+                )
+            except (FileNotFoundError, SegmentMissingError):
+                continue
+            text = strip_terminal_escapes(data.decode("utf-8", errors="replace"))
+            snippet = _find_line(text, needle)
+            if snippet is not None:
+                yield SearchHit(
+                    terminal_id=terminal_id,
+                    source="log",
+                    offset=offset,
+                    snippet=snippet,
+                    logged_at=datetime.fromtimestamp(first_at),
+                )
+
+
+def _scan_scrollbacks(
+    needle: str, terminal_id: Optional[str], since: Optional[float]
+) -> Iterator[SearchHit]:
+    pattern = f"{terminal_id}.scrollback" if terminal_id is not None else "*.scrollback"
+    for path in sorted(TERMINAL_LOG_DIR.glob(pattern)):
+        try:
+            mtime = path.stat().st_mtime
+            if since is not None and mtime < since:
+                continue
+            raw = path.read_bytes()
+        except OSError as e:
+            logger.debug("Skipping unreadable scrollback %s: %s", path.name, e)
+            continue
+        offset = 0
+        for raw_line in raw.split(b"\n"):
+            line = raw_line.decode("utf-8", errors="replace")
+            start = line.lower().find(needle)
+            if start >= 0:
+                yield SearchHit(
+                    terminal_id=path.name[: -len(".scrollback")],
+                    source="scrollback",
+                    offset=offset,
+                    snippet=_snippet(line, start, len(needle)),
+                    logged_at=datetime.fromtimestamp(mtime),
+                )
+            offset += len(raw_line) + 1
+
+
+terminal_search_index = TerminalSearchIndex()
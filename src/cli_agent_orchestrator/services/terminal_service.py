@@ -23,9 +23,10 @@ import os
 import re
 import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, cast
 
 from cli_agent_orchestrator.backends.registry import get_backend
 from cli_agent_orchestrator.clients.database import (
@@ -46,6 +47,7 @@ from cli_agent_orchestrator.constants import (
     FIFO_DIR,
     PIPE_LIVENESS_TAIL_LINES,
     SESSION_PREFIX,
+    STREAM_RECORD_DIR,
     TERMINAL_LOG_DIR,
 )
 from cli_agent_orchestrator.models.agent_profile import AgentProfile
@@ -73,15 +75,20 @@ from cli_agent_orchestrator.providers.manager import provider_manager
 from cli_agent_orchestrator.services import worktree_service
 from cli_agent_orchestrator.services.fifo_reader import fifo_manager
 from cli_agent_orchestrator.services.herdr_inbox_registry import get_herdr_inbox_service
+from cli_agent_orchestrator.services.memory_prefetch import get_memory_prefetcher
 from cli_agent_orchestrator.services.memory_service import MemoryService
+from cli_agent_orchestrator.services.pane_process_tracker import pane_process_tracker
 from cli_agent_orchestrator.services.plugin_dispatch import dispatch_plugin_event
 from cli_agent_orchestrator.services.session_env import (
     clear_session_env,
     get_session_env,
     set_session_env,
 )
+from cli_agent_orchestrator.services.settings_service import is_memory_enabled
 from cli_agent_orchestrator.services.status_monitor import status_monitor
 from cli_agent_orchestrator.services.step_output_store import _validate_key_part
+from cli_agent_orchestrator.services.stream_recorder import stream_recorder
+from cli_agent_orchestrator.services.terminal_log_store import LogSnapshot, terminal_log_store
 from cli_agent_orchestrator.utils.agent_profiles import load_agent_profile
 from cli_agent_orchestrator.utils.path_validation import resolve_and_validate_path
 from cli_agent_orchestrator.utils.skills import build_skill_catalog
@@ -114,28 +121,56 @@ _memory_injected_lock = threading.Lock()
 _deferred_init_tasks: set = set()
 
 
+def prefetch_memory_context(terminal_id: str) -> None:
+    """Start building ``terminal_id``'s first-message memory block in the background.
+
+    Called by create_terminal once the terminal row exists, so the block is
+    ready (services/memory_prefetch.py) by the time the first message is sent.
+    """
+    if not is_memory_enabled():
+        return
+    get_memory_prefetcher().schedule(
+        terminal_id, lambda: MemoryService().get_prefetchable_memory_context(terminal_id)
+    )
+
+
 def inject_memory_context(first_message: str, terminal_id: str) -> str:
     """Prepend <cao-memory> context block to the first user message.
 
     Tracks which terminals have already been injected so that only the very
     first user message after init receives the memory block.
 
-    Calls MemoryService.get_memory_context_for_terminal() which returns
-    a formatted <cao-memory>...</cao-memory> block (or empty string if
-    no memories exist). Stateless — no file mutation, no backup/restore.
+    The block is normally prefetched at terminal creation
+    (``prefetch_memory_context``); otherwise the same prefetchable block is
+    built now. Either way the sender waits at most
+    ``MEMORY_PREFETCH_DEADLINE_S`` and the message goes out without memory
+    after that. Sessions with a memory_manager curator are curated here, on
+    the sender's thread within the curator's own time limit, since the
+    curated block depends on the message. Stateless — no file mutation, no
+    backup/restore.
     """
     with _memory_injected_lock:
         if terminal_id in _memory_injected_terminals:
             return first_message
         _memory_injected_terminals.add(terminal_id)
 
-    try:
-        svc = MemoryService()
-        context = svc.get_curated_memory_context(terminal_id, task_description=first_message[:200])
-        if context:
-            return context + "\n\n" + first_message
-    except Exception as e:
-        logger.warning(f"Failed to inject memory context for terminal {terminal_id}: {e}")
+    started = time.monotonic()
+    task_description = first_message[:200]
+    prefetcher = get_memory_prefetcher()
+    context, outcome = prefetcher.take(
+        terminal_id, lambda: MemoryService().get_prefetchable_memory_context(terminal_id)
+    )
+    if context is None and outcome in ("hit", "wait", "miss"):
+        outcome = "curated"
+        try:
+            context = MemoryService().get_curated_memory_context(
+                terminal_id, task_description=task_description
+            )
+        except Exception as e:
+            logger.warning(f"Failed to inject memory context for terminal {terminal_id}: {e}")
+    prefetcher.record(outcome, time.monotonic() - started)
+    if context:
+        return context + "\n\n" + first_message
     return first_message
 
 
@@ -174,6 +209,17 @@ SOFT_ENFORCEMENT_PROVIDERS = {
 }
 
 
+def probe_panes(targets: List[Hashable]) -> Dict[Hashable, str]:
+    """FIFO watchdog batch probe: capture every (session, window) tail at once.
+
+    Installed once per process with ``fifo_manager.set_batch_probe`` (the API
+    lifespan does it); ``create_terminal`` enrolls each pane under its
+    ``(session, window)`` key.
+    """
+    keys = cast(List[Tuple[str, str]], targets)
+    return dict(get_backend().get_histories(keys, tail_lines=PIPE_LIVENESS_TAIL_LINES))
+
+
 def _resolve_working_directory(working_directory: Optional[str]) -> str:
     """Resolve launch cwd exactly as the tmux backend does before creation."""
     return resolve_and_validate_path(
@@ -273,7 +319,7 @@ async def create_terminal(
     # Reassigned to the resolved repo root once a worktree is actually created
     # below (Step 1b), so the failure-cleanup path (the `except` block) knows
     # whether there is a worktree to roll back too. Still None if Step 1b never
-    # ran (use_worktree=False) or itself failed before create_worktree returned.
+    # ran (use_worktree=False) or itself failed before acquire_worktree returned.
     worktree_repo_root: Optional[str] = None
     try:
         # Resolve profile policy and Kiro engine BEFORE allocating any backend
@@ -347,9 +393,10 @@ async def create_terminal(
         # its own isolated checkout rather than the shared one it would
         # otherwise have used.
         if use_worktree:
-            # `find_repo_root`/`create_worktree` are synchronous `subprocess.run`
-            # calls (a full worktree checkout can take seconds to tens of
-            # seconds on a large repo); `create_terminal` is awaited directly on
+            # `find_repo_root`/`acquire_worktree` are synchronous `subprocess.run`
+            # calls (a cold worktree checkout can take seconds to tens of
+            # seconds on a large repo; a warm one from the worktree pool is a
+            # move plus a branch); `create_terminal` is awaited directly on
             # the shared event loop, so running them in-line here would freeze
             # every other cao-server request (status monitor ticks, inbox
             # delivery, unrelated terminal calls) for the duration. Offload to a
@@ -359,7 +406,7 @@ async def create_terminal(
                 worktree_service.find_repo_root, working_directory or os.getcwd()
             )
             working_directory = await asyncio.to_thread(
-                worktree_service.create_worktree, worktree_repo_root, terminal_id
+                worktree_service.acquire_worktree, worktree_repo_root, terminal_id
             )
 
         # Resolve AFTER the worktree block, not before: when `use_worktree` is set
@@ -416,6 +463,12 @@ async def create_terminal(
             )
             window_created = True  # only set after successful creation
 
+        # Step 2b: Record the pane's shell PID so providers can tell "the CLI
+        # has exited" from /proc instead of a tmux round-trip per get_status.
+        pane_pid = get_backend().get_pane_pid(session_name, window_name)
+        if isinstance(pane_pid, int) and pane_pid > 0:
+            pane_process_tracker.track(terminal_id, pane_pid)
+
         # Step 3: Build a runtime skill catalog only for providers that consume
         # it at launch time (see RUNTIME_SKILL_PROMPT_PROVIDERS).
         skill_prompt = (
@@ -453,6 +506,9 @@ async def create_terminal(
             metadata=metadata,
             working_directory=resolved_working_directory,
         )
+        # The first message's memory block needs only the row and the pane's
+        # cwd: build it while the provider starts.
+        prefetch_memory_context(terminal_id)
 
         # Step 4/5: Set up the FIFO event-driven output pipeline for pipe-pane
         # backends (tmux). Event-inbox backends (herdr) deliver via their own
@@ -475,7 +531,25 @@ async def create_terminal(
                 get_backend().stop_pipe_pane(s, w)
                 get_backend().pipe_pane(s, w, p)
 
-            fifo_manager.create_reader(terminal_id, pane_probe=_probe_pane, rearm=_rearm_pipe)
+            # The watchdog captures every enrolled pane per tick through one
+            # batched backend call (probe_panes), keyed by (session, window);
+            # _probe_pane is the per-terminal fallback for panes the batch could
+            # not capture or when no batch probe is installed.
+            fifo_manager.create_reader(
+                terminal_id,
+                pane_probe=_probe_pane,
+                rearm=_rearm_pipe,
+                probe_key=(session_name, window_name),
+            )
+            # Opt-in stream recording for offline status-detection replay
+            # (services/stream_replay.py); stop_reader ends it.
+            if STREAM_RECORD_DIR is not None:
+                stream_recorder.start(
+                    terminal_id,
+                    STREAM_RECORD_DIR / f"{terminal_id}.cast.gz",
+                    provider=provider,
+                    agent_profile=agent_profile,
+                )
 
             # Configure pipe-pane to stream output to the FIFO. This enables
             # real-time event-driven processing via StatusMonitor and LogWriter
@@ -560,6 +634,10 @@ async def create_terminal(
         logger.info(
             f"Created terminal: {terminal_id} in session: {session_name} (new_session={new_session})"
         )
+        # Only the synchronous path has finished initialize() by here.
+        startup_timings = provider_instance.startup_timings
+        if not isinstance(startup_timings, dict):
+            startup_timings = None
         dispatch_plugin_event(
             registry,
             "post_create_terminal",
@@ -568,6 +646,7 @@ async def create_terminal(
                 terminal_id=terminal.id,
                 agent_name=terminal.agent_profile,
                 provider=provider,
+                startup_timings=startup_timings,
             ),
         )
 
@@ -595,6 +674,10 @@ async def create_terminal(
                 status_monitor.clear_terminal(terminal_id)
         except Exception:
             pass  # Ignore cleanup errors
+        if terminal_id is not None:
+            pane_process_tracker.untrack(terminal_id)
+            # Drop the first-message memory block scheduled once the row existed.
+            get_memory_prefetcher().discard(terminal_id)
         # Roll back the DB terminal row so a failed create does not leave an
         # orphan record: the stale row would still be listed for the session
         # and report UNKNOWN status even though nothing is running. Idempotent
@@ -665,7 +748,7 @@ async def create_terminal(
             # `git worktree remove` is a blocking subprocess call and this
             # `except` block still runs on the shared event loop.
             await asyncio.to_thread(
-                worktree_service.remove_worktree, worktree_repo_root, terminal_id
+                worktree_service.release_worktree, worktree_repo_root, terminal_id
             )
         raise
 
@@ -1264,6 +1347,8 @@ def send_input(
         # same dispatch boundary above.
         if provider:
             provider.mark_input_received()
+        if stream_recorder.active:
+            stream_recorder.record_input(terminal_id, message)
 
         get_backend().send_keys(
             metadata["tmux_session"],
@@ -1337,6 +1422,8 @@ def send_special_key(terminal_id: str, key: str) -> bool:
         # processing cycle that must be allowed to push past any latched
         # ready status.
         status_monitor.notify_input_sent(terminal_id)
+        if stream_recorder.active:
+            stream_recorder.record_key(terminal_id, key)
         get_backend().send_special_key(metadata["tmux_session"], metadata["tmux_window"], key)
 
         update_last_active(terminal_id)
@@ -1384,7 +1471,7 @@ def get_output(terminal_id: str, mode: OutputMode = OutputMode.FULL) -> str:
     is empty. This is a deliberate trade-off in the
     event-driven architecture (instant, no tmux call) — it is *not* unbounded
     scrollback, so very long sessions are truncated to the tail. Use the
-    on-disk ``{id}.log`` (LogWriter) or the delete-time ``{id}.scrollback``
+    on-disk segmented log (LogWriter, ``read_output_range``) or the delete-time ``{id}.scrollback``
     snapshot when complete history is required.
 
     For ``LAST`` mode, if the provider declares ``extraction_retries > 0``,
@@ -1543,8 +1630,11 @@ def read_output_range(terminal_id: str, offset: int, length: int) -> str:
 
     This is a SEPARATE read path from ``get_output``: that function returns the
     bounded rolling buffer / tmux tail, whereas this reads an exact byte window
-    from ``TERMINAL_LOG_DIR / f"{terminal_id}.log"`` — the append-only,
-    monotonic file LogWriter maintains (BR-1). Playback (FR-4.3 / FR-7.3) uses
+    from the append-only, monotonic log LogWriter maintains (BR-1). Offsets are
+    logical: they address the terminal's whole output stream, and
+    ``terminal_log_store`` maps them onto the live ``{terminal_id}.log`` and
+    any sealed, compressed segments, so a range may span a segment boundary.
+    Playback (FR-4.3 / FR-7.3) uses
     the ``terminal_offset_start`` / ``terminal_offset_len`` an event carries to
     fetch exactly the output produced around that event, without copying the
     log into the journal (BR-3).
@@ -1567,7 +1657,9 @@ def read_output_range(terminal_id: str, offset: int, length: int) -> str:
         range that starts or ends mid-multibyte-sequence never raises (BR-5,
         matching LogWriter's write encoding). Returns ``""`` for a valid
         terminal whose log does not exist yet (nothing has been logged) — a
-        missing log is NOT a playback-breaking error (BR-4).
+        missing log is NOT a playback-breaking error (BR-4). A range over a
+        segment already pruned by retention comes back short for the same
+        reason.
 
     Raises:
         ValueError: ``terminal_id`` fails id validation, or ``offset`` is
@@ -1590,12 +1682,9 @@ def read_output_range(terminal_id: str, offset: int, length: int) -> str:
     # than raising — the route enforces length >= 1, so this is defense in depth.
     capped_length = max(0, min(length, TERMINAL_RANGE_MAX_LENGTH))
 
-    log_path = TERMINAL_LOG_DIR / f"{terminal_id}.log"
-
     try:
-        with open(log_path, "rb") as f:
-            f.seek(offset)  # seeking past EOF is legal; the read below yields b""
-            data = f.read(capped_length)
+        # Reading past the end is legal; it yields the tail or b"".
+        data = terminal_log_store.read_range(TERMINAL_LOG_DIR, terminal_id, offset, capped_length)
     except FileNotFoundError:
         # Valid terminal that has not logged anything yet (or whose log has been
         # cleaned up): an empty range, never an error (BR-4).
@@ -1623,6 +1712,128 @@ def read_output_range(terminal_id: str, offset: int, length: int) -> str:
     return data.decode("utf-8", errors="replace")
 
 
+def open_output_log(terminal_id: str) -> Optional[LogSnapshot]:
+    """Pin a terminal's on-disk log for a raw, streamed read.
+
+    The byte-oriented sibling of ``read_output_range``: the caller gets a
+    ``LogSnapshot`` to stream ``iter_range`` chunks from without decoding or
+    joining them, and must close it. Offsets are the same logical offsets.
+
+    Returns:
+        The snapshot, or None for a valid terminal that has not logged anything
+        yet (BR-4: not an error).
+
+    Raises:
+        ValueError: ``terminal_id`` fails id validation.
+        OSError: A genuine file I/O failure opening the log.
+    """
+    _validate_key_part(terminal_id, "terminal_id")
+    try:
+        return terminal_log_store.snapshot(TERMINAL_LOG_DIR, terminal_id)
+    except FileNotFoundError:
+        return None
+
+
+class OutputCursorError(ValueError):
+    """A ``since`` cursor that ``output_cursor`` / ``read_output_since`` did not issue."""
+
+
+@dataclass
+class OutputSince:
+    """Output appended to a terminal's log after a cursor."""
+
+    output: str
+    cursor: str  # pass back as ``since`` on the next read
+    truncated: bool  # output between the cursor and the returned tail was skipped
+    reset: bool  # the cursor belonged to an earlier log; read from its first byte
+
+
+def _format_output_cursor(generation: str, offset: int) -> str:
+    return f"{generation}.{offset:x}"
+
+
+def _parse_output_cursor(cursor: str) -> Tuple[str, int]:
+    generation, _, offset = cursor.partition(".")
+    try:
+        value = int(offset, 16) if generation else -1
+    except ValueError:
+        value = -1
+    if value < 0:
+        raise OutputCursorError(f"Malformed output cursor: {cursor!r}")
+    return generation, value
+
+
+def output_cursor(terminal_id: str) -> str:
+    """Return an opaque cursor for the current end of a terminal's log.
+
+    Take it BEFORE reading the rolling buffer: LogWriter persists output a
+    batch after StatusMonitor buffers it, so a cursor taken first can only
+    make the next ``read_output_since`` repeat a few bytes, never skip any.
+
+    Raises:
+        ValueError: ``terminal_id`` fails id validation.
+    """
+    _validate_key_part(terminal_id, "terminal_id")
+    generation, size = terminal_log_store.position(TERMINAL_LOG_DIR, terminal_id)
+    return _format_output_cursor(generation, size)
+
+
+def read_output_since(
+    terminal_id: str, cursor: str, max_chars: Optional[int] = None
+) -> OutputSince:
+    """Return what a terminal logged after ``cursor``, plus the next cursor.
+
+    The incremental sibling of ``get_output``: a supervisor polling a chatty
+    worker transfers only new output instead of the whole rolling buffer. At
+    most ``max_chars`` characters (and never more than
+    ``TERMINAL_RANGE_MAX_LENGTH`` bytes) are returned, taken from the tail;
+    ``truncated`` says older new output was skipped. A cursor from a log that
+    has since been removed, or from before a server restart, is answered from
+    the first retained byte with ``reset`` set.
+
+    Raises:
+        ValueError: ``terminal_id`` fails id validation or names no terminal
+            (a deleted worker must not look like one with no new output).
+        OutputCursorError: ``cursor`` is malformed.
+        OSError: A genuine file I/O failure reading the log.
+    """
+    _validate_key_part(terminal_id, "terminal_id")
+    if not get_terminal_metadata(terminal_id):
+        raise ValueError(f"Terminal '{terminal_id}' not found")
+    generation, offset = _parse_output_cursor(cursor)
+    budget = TERMINAL_RANGE_MAX_LENGTH
+    if max_chars is not None and max_chars > 0:
+        budget = min(budget, max_chars * 4)  # a UTF-8 character is at most 4 bytes
+
+    try:
+        snap = terminal_log_store.snapshot(TERMINAL_LOG_DIR, terminal_id)
+    except FileNotFoundError:
+        current, size = terminal_log_store.position(TERMINAL_LOG_DIR, terminal_id)
+        reset = generation != current or offset > size
+        return OutputSince("", _format_output_cursor(current, size), False, reset)
+    with snap:
+        reset = generation != snap.generation or offset > snap.size
+        if reset:
+            offset = 0
+        lo = max(offset, snap.start, snap.size - budget)
+        data = b"".join(snap.iter_range(lo, snap.size - lo))
+        next_cursor = _format_output_cursor(snap.generation, snap.size)
+
+    truncated = lo > offset
+    if truncated:
+        # The tail may start inside a multi-byte character: drop its
+        # continuation bytes rather than decode them to U+FFFD.
+        skip = 0
+        while skip < min(len(data), 3) and data[skip] & 0xC0 == 0x80:
+            skip += 1
+        data = data[skip:]
+    output = data.decode("utf-8", errors="replace")
+    if max_chars is not None and 0 < max_chars < len(output):
+        output = output[-max_chars:]
+        truncated = True
+    return OutputSince(output, next_cursor, truncated, reset)
+
+
 def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) -> bool:
     """Delete terminal and kill its tmux window."""
     try:
@@ -1690,8 +1901,8 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
                 logger.warning(f"Failed to stop pipe-pane for {terminal_id}: {e}")
 
             # Stop FIFO reader and cleanup FIFO file. Must run BEFORE kill_window
-            # so the reader thread (which reopens the FIFO on EOF) unblocks and
-            # joins before the pane disappears.
+            # so the multiplexer has flushed and released the FIFO before the
+            # pane disappears.
             try:
                 fifo_manager.stop_reader(terminal_id)
             except Exception as e:
@@ -1702,6 +1913,8 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
                 status_monitor.clear_terminal(terminal_id)
             except Exception as e:
                 logger.warning(f"Failed to clear state detector for {terminal_id}: {e}")
+            pane_process_tracker.untrack(terminal_id)
+            terminal_log_store.close(TERMINAL_LOG_DIR, terminal_id)
 
             # Kill the tmux window (this terminates the agent process)
             try:
@@ -1712,7 +1925,9 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
             # issue #100 Phase 1: if this terminal was worktree-backed (its live
             # cwd matched the CAO-managed worktree path shape), remove the
             # worktree + branch now that the process using it is gone.
-            # `remove_worktree` is itself best-effort/never-raises, matching
+            # With the worktree pool enabled the checkout is scrubbed and parked
+            # for reuse instead (in the background); the branch is safe-deleted
+            # either way. `release_worktree` is best-effort/never-raises, matching
             # every other step in this teardown.
             #
             # The parsed terminal_id MUST match the terminal actually being
@@ -1731,7 +1946,7 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
             if parsed is not None:
                 worktree_repo_root, worktree_terminal_id = parsed
                 if worktree_terminal_id == terminal_id:
-                    worktree_service.remove_worktree(worktree_repo_root, worktree_terminal_id)
+                    worktree_service.release_worktree(worktree_repo_root, worktree_terminal_id)
 
         # Grok cleanup can be deferred when a private-home owner cannot yet be
         # inspected/stopped.  Keep both the provider mapping and DB metadata so
@@ -1744,6 +1959,7 @@ def delete_terminal(terminal_id: str, registry: PluginRegistry | None = None) ->
             return False
         with _memory_injected_lock:
             _memory_injected_terminals.discard(terminal_id)
+        get_memory_prefetcher().discard(terminal_id)
         # Drop any per-curator dispatch lock so the registry doesn't grow
         # forever as memory_manager terminals come and go.
         from cli_agent_orchestrator.services.memory_service import _curator_locks
@@ -29,6 +29,11 @@ Diff granularity (per the design):
   than a per-element patch and avoids brittle index math.
 * scalar / nested-scalar keys (``counts``, ``scopes``) are **per-key replaced**
   so a change to one counter does not resend the whole object.
+
+``diff_snapshot_by_id`` is the finer variant the AG-UI ``STATE_DELTA`` stream
+uses: ``terminals`` / ``sessions`` are matched element-by-element on ``id``, so
+one terminal changing status costs one ``replace`` of that field rather than
+the whole array.
 """
 
 from typing import Any, Dict, List, Optional
@@ -172,6 +177,63 @@ def diff_snapshot(prev: Dict[str, Any], curr: Dict[str, Any]) -> List[Dict[str,
     return ops
 
 
+def diff_snapshot_by_id(prev: Dict[str, Any], curr: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Like ``diff_snapshot``, but diff ``terminals`` / ``sessions`` by element ``id``.
+
+    Removed elements become index ``remove`` ops (highest index first), new ones
+    ``add`` ops at their final index, and elements present on both sides are
+    diffed per-field at their new index. A collection whose surviving elements
+    changed order, or whose ids are not unique, falls back to one whole-value
+    ``replace``, as does a patch that would be longer than the new array.
+    Applying the ops to ``prev`` still yields ``curr``.
+    """
+
+    keyed = [
+        key
+        for key in sorted(_WHOLE_KEY_REPLACE)
+        if isinstance(prev.get(key), list) and isinstance(curr.get(key), list)
+    ]
+    ops = diff_snapshot(
+        {k: v for k, v in prev.items() if k not in keyed},
+        {k: v for k, v in curr.items() if k not in keyed},
+    )
+    for key in keyed:
+        if prev[key] != curr[key]:
+            ops.extend(_diff_keyed_list(prev[key], curr[key], "/" + _escape_token(key)))
+    return ops
+
+
+def _diff_keyed_list(
+    prev: List[Dict[str, Any]], curr: List[Dict[str, Any]], pointer: str
+) -> List[Dict[str, Any]]:
+    """Index-addressed RFC 6902 ops turning ``prev`` into ``curr``, matched on ``id``."""
+
+    whole = [{"op": "replace", "path": pointer, "value": curr}]
+    prev_ids = [item.get("id") for item in prev]
+    curr_ids = [item.get("id") for item in curr]
+    if len(set(prev_ids)) != len(prev_ids) or len(set(curr_ids)) != len(curr_ids):
+        return whole
+    wanted = set(curr_ids)
+
+    ops: List[Dict[str, Any]] = []
+    for index in range(len(prev) - 1, -1, -1):
+        if prev_ids[index] not in wanted:
+            ops.append({"op": "remove", "path": f"{pointer}/{index}"})
+    kept = [item for item in prev if item.get("id") in wanted]
+    kept_ids = {item.get("id") for item in kept}
+    if [i for i in curr_ids if i in kept_ids] != [item.get("id") for item in kept]:
+        return whole
+
+    k = 0
+    for index, item in enumerate(curr):
+        if k < len(kept) and kept[k].get("id") == item.get("id"):
+            ops.extend(_diff_dict(kept[k], item, f"{pointer}/{index}"))
+            k += 1
+        else:
+            ops.append({"op": "add", "path": f"{pointer}/{index}", "value": item})
+    return ops if len(ops) <= len(curr) else whole
+
+
 def _diff_dict(
     prev: Dict[str, Any], curr: Dict[str, Any], base_pointer: str
 ) -> List[Dict[str, Any]]:
@@ -1031,10 +1031,11 @@ def max_event_seq(run_id: str) -> int:
 def list_run_ids_by_age() -> List[Tuple[str, str]]:
     """Return ``(run_id, started_at)`` for every run, most-recent first (U7, NFR-SEC-3).
 
-    A minimal read used only by ``workflow_retention.sweep_runs`` for its age +
-    run-count bounds — NOT the ``list_runs`` full-run-listing surface owned by
+    A minimal read of the order the retention bounds are defined over
+    (``workflow_retention.sweep_runs`` computes its prune set in SQL through
+    ``list_prunable_run_ids``) — NOT the ``list_runs`` full-run-listing surface owned by
     sibling intent #505 (that returns rich rows and its own indexes; this returns
-    just the two fields the sweep needs). Ordered by ``started_at`` descending so a
+    just the two fields the bounds need). Ordered by ``started_at`` descending so a
     "keep the most-recent N" slice is a simple ``rows[N:]`` (the sweep's count
     bound). ``run_id`` is the tie-break so the order is deterministic when two runs
     share a ``started_at``. Uses the same self-connecting ``_connect`` as the other
@@ -1101,3 +1102,107 @@ def delete_run(run_id: str) -> None:
         conn.execute("DELETE FROM workflow_run_seq WHERE run_id = ?", (run_id,))
         conn.execute("DELETE FROM workflow_run_step WHERE run_id = ?", (run_id,))
         conn.execute("DELETE FROM workflow_run WHERE run_id = ?", (run_id,))
+
+
+# ---------------------------------------------------------------------------
+# Set-based retention (workflow_retention.sweep_runs). The prune set is one
+# query and the cascade runs in chunks over a single connection, instead of a
+# Python-side filter plus one ``delete_run`` connection + transaction per run.
+# ---------------------------------------------------------------------------
+
+# Run ids per ``DELETE ... WHERE run_id IN (...)`` chunk: far below SQLite's
+# bound-parameter limit, and small enough that each chunk's transaction holds
+# the write lock only briefly.
+_DELETE_CHUNK = 500
+
+# The cascade tables, children first (same order as ``delete_run``).
+_CASCADE_TABLES: Tuple[str, ...] = (
+    "workflow_run_event",
+    "workflow_run_seq",
+    "workflow_run_step",
+    "workflow_run",
+)
+
+
+def list_prunable_run_ids(cutoff: Optional[str], keep: int) -> List[str]:
+    """Run ids past either retention bound, most-recent first.
+
+    The union of runs whose ``started_at`` sorts before ``cutoff`` and runs
+    beyond the ``keep`` most recent (``ORDER BY started_at DESC, run_id DESC``
+    — the ``list_run_ids_by_age`` order — with ``LIMIT -1 OFFSET keep``). A
+    ``None`` cutoff or a non-positive ``keep`` leaves that bound out; with both
+    out the set is empty. Both parts are served by ``idx_workflow_run_started_at``.
+    """
+    parts: List[str] = []
+    params: List[object] = []
+    if cutoff is not None:
+        parts.append("SELECT run_id FROM workflow_run WHERE started_at != '' AND started_at < ?")
+        params.append(cutoff)
+    if keep > 0:
+        parts.append(
+            "SELECT run_id FROM (SELECT run_id FROM workflow_run "
+            "ORDER BY started_at DESC, run_id DESC LIMIT -1 OFFSET ?)"
+        )
+        params.append(keep)
+    if not parts:
+        return []
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT run_id FROM workflow_run WHERE run_id IN ({' UNION '.join(parts)}) "
+            "ORDER BY started_at DESC, run_id DESC",
+            params,
+        ).fetchall()
+    return [r[0] for r in rows]
+
+
+def delete_runs(run_ids: Sequence[str]) -> int:
+    """Remove many runs with the ``delete_run`` cascade; return how many were removed.
+
+    One connection for the whole batch. Each chunk of ``_DELETE_CHUNK`` ids is
+    one transaction that clears the event, seq, step and run rows with
+    ``DELETE ... WHERE run_id IN (...)`` — the placeholders are generated, the
+    ids still bind through ``?``. A failing chunk is rolled back, logged and
+    skipped so the rest of the batch still goes (the sweep's best-effort
+    contract); only runs whose chunk committed are counted. Afterwards
+    ``PRAGMA incremental_vacuum`` returns the freed pages to the filesystem
+    (a no-op on a database not created with ``auto_vacuum=INCREMENTAL``).
+
+    Raises ``sqlite3.Error`` only if the connection itself cannot be opened.
+    """
+    from cli_agent_orchestrator.clients.database import (
+        _migrate_workflow_run,
+        _migrate_workflow_run_step,
+    )
+
+    _migrate_workflow_run()
+    _migrate_workflow_run_step()
+    deleted = 0
+    conn = _connect_event()
+    try:
+        for start in range(0, len(run_ids), _DELETE_CHUNK):
+            chunk = list(run_ids[start : start + _DELETE_CHUNK])
+            marks = ",".join("?" * len(chunk))
+            try:
+                with conn:
+                    for table in _CASCADE_TABLES:
+                        cursor = conn.execute(
+                            f"DELETE FROM {table} WHERE run_id IN ({marks})", chunk
+                        )
+                    deleted += cursor.rowcount
+            except sqlite3.Error as e:
+                logger.warning(
+                    "workflow run delete failed for %d runs starting at '%s': %s",
+                    len(chunk),
+                    chunk[0],
+                    e,
+                )
+        if deleted:
+            try:
+                # Each VM step frees one page and ``execute`` steps only once;
+                # ``executescript`` runs the pragma to completion.
+                conn.executescript("PRAGMA incremental_vacuum")
+            except sqlite3.Error as e:
+                logger.debug(f"incremental_vacuum after run delete skipped: {e}")
+    finally:
+        conn.close()
+    return deleted
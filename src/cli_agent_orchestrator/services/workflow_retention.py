@@ -25,9 +25,10 @@ six binding Q3 security rules (NFR-SEC-1..6) and backing the FR-11 per-run delet
   instead; do not describe its output as "redacted".
 - **Age + run-count retention (NFR-SEC-3).** ``sweep_runs`` prunes runs older than an
   age default AND beyond a most-recent run-count default (whichever bound is hit
-  first prunes); both are settings-overridable. Each pruned run is removed via U1's
-  ``workflow_journal.delete_run`` cascade — this module does NOT reimplement it.
-  Scheduled from the API lifespan at startup
+  first prunes); both are settings-overridable. The prune set is one query and the
+  pruned runs go through the journal's chunked ``delete_runs`` cascade (the set
+  form of U1's ``delete_run``) — this module does NOT reimplement it. Scheduled
+  in the background from the API lifespan at startup
   (``api.main._sweep_workflow_runs_at_startup``); without that call site the sweep
   is dead code and the journal grows unbounded.
 
@@ -247,14 +248,16 @@ def sweep_runs(
 
     Row-based (the journal is SQLite rows, not day-partitioned files), so this is its
     OWN capping — NOT ``audit_log.sweep_old_audit_logs`` (that sweeps day-files).
-    Enumeration reuses ``workflow_journal.list_run_ids_by_age`` (run_id + started_at,
-    most-recent first). Each pruned run_id is removed via U1's
-    ``workflow_journal.delete_run`` cascade (run + step + event + seq rows) — U7 does
-    NOT reimplement the cascade.
-
-    Best-effort per run: a ``delete_run`` failure on one run is logged and the sweep
-    continues (a maintenance sweep must not abort on a single bad row); only
-    successful deletes are counted. Read/enumeration failures degrade to a no-op sweep
+    Set-based: ``workflow_journal.list_prunable_run_ids`` computes the prune set in
+    one query (age cutoff UNION an ``OFFSET``-based count bound) and
+    ``workflow_journal.delete_runs`` removes it with the run + step + event + seq
+    cascade in chunked ``DELETE ... WHERE run_id IN (...)`` transactions over one
+    connection, then runs ``PRAGMA incremental_vacuum``. A sweep over tens of
+    thousands of runs is a handful of statements, not a connection per run.
+
+    Best-effort per chunk: a failing chunk is rolled back, logged and skipped, and the
+    sweep continues (a maintenance sweep must not abort on a bad batch); only
+    committed deletes are counted. Read/enumeration failures degrade to a no-op sweep
     (0) rather than raising.
 
     **``0`` DISABLES a bound — it does not mean "keep nothing"** (PR #526 review).
@@ -273,37 +276,20 @@ def sweep_runs(
     days = retention_days if retention_days is not None else _default_retention_days()
     count = retention_count if retention_count is not None else _default_retention_count()
 
+    # days == 0 disables the age bound (a cutoff of *now* would match every run
+    # ever started) and count == 0 the count bound (OFFSET 0 is every row), so a
+    # disabled bound is left out of the prune query rather than run degenerate.
+    cutoff = _age_cutoff(days) if days > 0 else None
     try:
-        rows = workflow_journal.list_run_ids_by_age()
+        to_prune = workflow_journal.list_prunable_run_ids(cutoff, count)
     except Exception as e:  # noqa: BLE001 — a maintenance sweep must not raise on a read failure
         logger.warning("workflow retention sweep: run enumeration failed (skipped): %s", e)
         return 0
+    if not to_prune:
+        return 0
 
-    to_prune: set[str] = set()
-    # Age bound: started_at strictly before the cutoff. days == 0 disables the
-    # bound (a cutoff of *now* would match every run ever started), so the age
-    # pass is SKIPPED rather than run with a degenerate cutoff.
-    if days > 0:
-        cutoff = _age_cutoff(days)
-        for run_id, started_at in rows:
-            if started_at and started_at < cutoff:
-                to_prune.add(run_id)
-    # Count bound: everything beyond the most-recent ``count`` runs (rows are
-    # most-recent-first, so index >= count is "beyond the window"). count == 0
-    # disables the bound — the slice must never be allowed to become rows[0:],
-    # which is every row.
-    if count > 0:
-        for run_id, _started in rows[count:]:
-            to_prune.add(run_id)
-
-    pruned = 0
-    # Iterate the enumerated order for determinism; delete those in the prune set.
-    for run_id, _started in rows:
-        if run_id not in to_prune:
-            continue
-        try:
-            workflow_journal.delete_run(run_id)
-            pruned += 1
-        except Exception as e:  # noqa: BLE001 — best-effort: log and continue the sweep
-            logger.warning("workflow retention sweep: delete_run('%s') failed: %s", run_id, e)
-    return pruned
+    try:
+        return workflow_journal.delete_runs(to_prune)
+    except Exception as e:  # noqa: BLE001 — best-effort: a sweep never raises
+        logger.warning("workflow retention sweep: delete failed (skipped): %s", e)
+        return 0
@@ -0,0 +1,425 @@
+"""Pre-provisioned git worktrees for ``use_worktree`` terminals.
+
+``create_worktree`` runs ``git worktree add``, a full checkout of the repo,
+inside ``create_terminal``; on a large monorepo that is seconds per worker
+spawn, and ``remove_worktree`` pays again deleting the tree on teardown.
+``WorktreePool`` keeps up to ``WORKTREE_POOL_SIZE`` detached worktrees per
+repository warm instead. The pool is opt-in (the default size is 0): each
+parked worktree is a full extra checkout on disk.
+
+* ``acquire`` moves a warm worktree to the terminal's usual
+  ``.cao/worktrees/<terminal_id>`` path and checks out ``cao/<terminal_id>``
+  at the repo's current HEAD -- only files that changed since the worktree
+  was warmed are rewritten. An empty pool falls back to ``create_worktree``.
+  Both run on the caller's thread, since the terminal needs the worktree
+  before it can start.
+* ``release`` scrubs the worktree (``reset --hard`` + ``clean -fdx``),
+  detaches it, safe-deletes its branch exactly as ``remove_worktree`` does,
+  and parks it back in the pool -- all on a background thread.
+* Hand-outs and teardowns queue a refill; a worktree idle for longer than
+  ``WORKTREE_POOL_IDLE_TTL`` is removed, so a repo nobody spawns into stops
+  holding checkouts.
+
+Because a handed-out worktree lives at the same path and branch a cold one
+would, the rest of CAO (``parse_worktree_path`` at teardown included) cannot
+tell the two apart. Pool state is in memory, so ``shutdown_worktree_pool``
+(called from the API lifespan) lets queued scrubs finish and removes every
+parked worktree; any ``.cao/worktrees/_pool-*`` left by a server that died
+without it is adopted the first time its repo is used again.
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from cli_agent_orchestrator.constants import WORKTREE_POOL_IDLE_TTL, WORKTREE_POOL_SIZE
+from cli_agent_orchestrator.services import worktree_service
+from cli_agent_orchestrator.services.worktree_service import (
+    WORKTREE_SUBDIR,
+    branch_for,
+    worktree_path_for,
+)
+
+logger = logging.getLogger(__name__)
+
+POOL_PREFIX = "_pool-"
+
+# Weight of the newest sample in the running cold-checkout estimate.
+_COLD_EWMA_ALPHA = 0.3
+
+# Upper bound on how long the background worker sleeps between idle sweeps.
+_MAX_SWEEP_INTERVAL = 60.0
+
+
+class WorktreePool:
+    """Per-repository pools of warm, detached worktrees.
+
+    Pool bookkeeping is guarded by a ``threading.Lock``. The git commands
+    that build, scrub or remove parked worktrees run on one background
+    thread, so they never contend with each other for the repo's locks;
+    ``acquire`` (claiming a warm worktree, or the cold ``create_worktree``
+    fallback) runs git on the caller's thread and may overlap with them.
+    """
+
+    def __init__(self, size: int = WORKTREE_POOL_SIZE, idle_ttl: float = WORKTREE_POOL_IDLE_TTL):
+        self._size = size
+        self._idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        # repo_root -> [(path, parked_at)], oldest first.
+        self._idle: Dict[str, List[Tuple[str, float]]] = {}
+        # repo_root -> worktrees being built or scrubbed for the pool.
+        self._pending: Dict[str, int] = {}
+        self._known_repos: Set[str] = set()
+        # Running estimate of one cold ``git worktree add``, in seconds.
+        self._cold_seconds: Optional[float] = None
+        self._stats = {"hits": 0, "misses": 0, "recycled": 0, "expired": 0, "saved_seconds": 0.0}
+        self._tasks: "queue.Queue[Optional[Tuple[Callable[..., None], Tuple[Any, ...]]]]" = (
+            queue.Queue()
+        )
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def acquire(self, repo_root: str, terminal_id: str) -> str:
+        """Return a worktree for ``terminal_id`` on branch ``cao/<terminal_id>``.
+
+        Takes a warm worktree when one is parked, otherwise runs
+        ``create_worktree``; either way a refill is queued.
+
+        Raises:
+            WorktreeError: The cold fallback failed.
+        """
+        self._ensure_known(repo_root)
+        started = time.monotonic()
+        while (parked := self._take(repo_root)) is not None:
+            if self._claim(repo_root, parked, terminal_id):
+                self._record_hit(time.monotonic() - started)
+                self._submit(self._fill, repo_root)
+                return worktree_path_for(repo_root, terminal_id)
+        path = worktree_service.create_worktree(repo_root, terminal_id)
+        self._observe_cold(time.monotonic() - started)
+        with self._lock:
+            self._stats["misses"] += 1
+        self._submit(self._fill, repo_root)
+        return path
+
+    def release(self, repo_root: str, terminal_id: str) -> None:
+        """Queue ``terminal_id``'s worktree to be scrubbed and parked. Never raises."""
+        self._ensure_known(repo_root)
+        self._submit(self._recycle, repo_root, terminal_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters plus the current number of parked worktrees."""
+        with self._lock:
+            return {
+                **self._stats,
+                "idle": sum(len(entries) for entries in self._idle.values()),
+                "cold_seconds": self._cold_seconds,
+            }
+
+    def join(self) -> None:
+        """Block until every queued background task has run (tests, shutdown)."""
+        self._tasks.join()
+
+    def close(self) -> None:
+        """Stop the background worker after the tasks already queued."""
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            self._tasks.put(None)
+            worker.join()
+        self._worker = None
+
+    def shutdown(self) -> None:
+        """Finish queued tasks, stop the worker and remove every parked worktree."""
+        self.close()
+        with self._lock:
+            parked = [
+                (repo_root, path)
+                for repo_root, entries in self._idle.items()
+                for path, _ in entries
+            ]
+            self._idle.clear()
+        for repo_root, path in parked:
+            self._discard(repo_root, path)
+
+    # ------------------------------------------------------------------
+    # Hand-out
+    # ------------------------------------------------------------------
+
+    def _take(self, repo_root: str) -> Optional[str]:
+        with self._lock:
+            entries = self._idle.get(repo_root)
+            if not entries:
+                return None
+            # Newest first: the oldest entries are the next to expire.
+            return entries.pop()[0]
+
+    def _claim(self, repo_root: str, parked: str, terminal_id: str) -> bool:
+        """Move ``parked`` to ``terminal_id``'s path and branch it off HEAD."""
+        target = worktree_path_for(repo_root, terminal_id)
+        head = self._head(repo_root)
+        if head is None:
+            self._submit(self._discard, repo_root, parked)
+            return False
+        result = worktree_service._run_git(["worktree", "move", parked, target], cwd=repo_root)
+        if result.returncode != 0:
+            logger.warning(
+                "worktree pool: 'git worktree move %s' failed: %s", parked, result.stderr.strip()
+            )
+            self._submit(self._discard, repo_root, parked)
+            return False
+        result = worktree_service._run_git(
+            ["checkout", "--quiet", "-b", branch_for(terminal_id), head], cwd=target
+        )
+        if result.returncode != 0:
+            logger.warning(
+                "worktree pool: branching %s failed: %s", terminal_id, result.stderr.strip()
+            )
+            # Synchronously: the cold fallback is about to reuse this path.
+            self._discard(repo_root, target)
+            return False
+        return True
+
+    def _record_hit(self, elapsed: float) -> None:
+        with self._lock:
+            self._stats["hits"] += 1
+            cold = self._cold_seconds
+            saved = max(cold - elapsed, 0.0) if cold is not None else None
+            if saved is not None:
+                self._stats["saved_seconds"] += saved
+        if saved is not None:
+            from cli_agent_orchestrator.telemetry import record_worktree_spawn_saved
+
+            record_worktree_spawn_saved(saved)
+
+    def _observe_cold(self, seconds: float) -> None:
+        with self._lock:
+            if self._cold_seconds is None:
+                self._cold_seconds = seconds
+            else:
+                self._cold_seconds += _COLD_EWMA_ALPHA * (seconds - self._cold_seconds)
+
+    # ------------------------------------------------------------------
+    # Background tasks (worker thread only)
+    # ------------------------------------------------------------------
+
+    def _fill(self, repo_root: str) -> None:
+        """Build detached worktrees at HEAD until the pool is full."""
+        while self._reserve(repo_root):
+            path = os.path.join(repo_root, WORKTREE_SUBDIR, f"{POOL_PREFIX}{uuid.uuid4().hex[:8]}")
+            started = time.monotonic()
+            result = worktree_service._run_git(
+                ["worktree", "add", "--detach", path, "HEAD"], cwd=repo_root
+            )
+            if result.returncode != 0:
+                self._unreserve(repo_root)
+                logger.warning(
+                    "worktree pool: warming %s failed: %s", repo_root, result.stderr.strip()
+                )
+                return
+            self._observe_cold(time.monotonic() - started)
+            worktree_service._ensure_worktree_subdir_gitignored(repo_root)
+            self._park(repo_root, path)
+
+    def _recycle(self, repo_root: str, terminal_id: str) -> None:
+        """Scrub a released worktree and park it, or remove it if the pool is full."""
+        if not self._reserve(repo_root):
+            worktree_service.remove_worktree(repo_root, terminal_id)
+            return
+        path = worktree_path_for(repo_root, terminal_id)
+        parked = os.path.join(repo_root, WORKTREE_SUBDIR, f"{POOL_PREFIX}{terminal_id}")
+        if not self._scrub(repo_root, path):
+            self._unreserve(repo_root)
+            worktree_service.remove_worktree(repo_root, terminal_id)
+            return
+        # Now detached, the branch is free for the same safe delete
+        # remove_worktree does: committed work keeps its branch.
+        branch = branch_for(terminal_id)
+        result = worktree_service._run_git(["branch", "-d", branch], cwd=repo_root)
+        if result.returncode != 0:
+            logger.warning(
+                "worktree cleanup: 'git branch -d %s' failed (left in place -- likely has "
+                "unmerged commits; merge/push the work, then delete it manually): %s",
+                branch,
+                result.stderr.strip(),
+            )
+        result = worktree_service._run_git(["worktree", "move", path, parked], cwd=repo_root)
+        if result.returncode != 0:
+            self._unreserve(repo_root)
+            self._discard(repo_root, path)
+            return
+        with self._lock:
+            self._stats["recycled"] += 1
+        self._park(repo_root, parked)
+
+    def _adopt(self, repo_root: str) -> None:
+        """Reclaim worktrees an earlier server parked in this repo."""
+        marker = f"{os.sep}{WORKTREE_SUBDIR}{os.sep}{POOL_PREFIX}"
+        try:
+            entries = worktree_service.list_worktrees(repo_root)
+        except worktree_service.WorktreeError:
+            return
+        for entry in entries:
+            path = entry.get("worktree")
+            if not isinstance(path, str) or marker not in path:
+                continue
+            if os.path.dirname(os.path.dirname(os.path.dirname(path))) != repo_root:
+                continue  # parked by a worktree nested inside this repo
+            if self._reserve(repo_root) and self._scrub(repo_root, path):
+                self._park(repo_root, path)
+            else:
+                self._discard(repo_root, path)
+
+    def _scrub(self, repo_root: str, path: str) -> bool:
+        """Reset ``path`` to a clean, detached checkout of the repo's HEAD."""
+        head = self._head(repo_root)
+        if head is None:
+            return False
+        for args in (
+            ["reset", "--hard", "--quiet"],
+            ["clean", "-fdxq"],
+            ["checkout", "--quiet", "--detach", head],
+        ):
+            result = worktree_service._run_git(args, cwd=path)
+            if result.returncode != 0:
+                logger.warning(
+                    "worktree pool: 'git %s' in %s failed: %s",
+                    " ".join(args),
+                    path,
+                    result.stderr.strip(),
+                )
+                return False
+        return True
+
+    def _discard(self, repo_root: str, path: str) -> None:
+        result = worktree_service._run_git(["worktree", "remove", "--force", path], cwd=repo_root)
+        if result.returncode != 0:
+            logger.warning(
+                "worktree pool: 'git worktree remove --force %s' failed: %s",
+                path,
+                result.stderr.strip(),
+            )
+            worktree_service._run_git(["worktree", "prune"], cwd=repo_root)
+
+    def _expire(self) -> None:
+        cutoff = time.monotonic() - self._idle_ttl
+        expired: List[Tuple[str, str]] = []
+        with self._lock:
+            for repo_root, entries in self._idle.items():
+                while entries and entries[0][1] <= cutoff:
+                    expired.append((repo_root, entries.pop(0)[0]))
+            self._stats["expired"] += len(expired)
+        for repo_root, path in expired:
+            self._discard(repo_root, path)
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    def _ensure_known(self, repo_root: str) -> None:
+        with self._lock:
+            if repo_root in self._known_repos:
+                return
+            self._known_repos.add(repo_root)
+        self._submit(self._adopt, repo_root)
+
+    def _reserve(self, repo_root: str) -> bool:
+        """Claim a pool slot for a worktree about to be built or scrubbed."""
+        with self._lock:
+            held = len(self._idle.get(repo_root, ())) + self._pending.get(repo_root, 0)
+            if held >= self._size:
+                return False
+            self._pending[repo_root] = self._pending.get(repo_root, 0) + 1
+            return True
+
+    def _unreserve(self, repo_root: str) -> None:
+        with self._lock:
+            self._pending[repo_root] -= 1
+
+    def _park(self, repo_root: str, path: str) -> None:
+        with self._lock:
+            self._pending[repo_root] -= 1
+            self._idle.setdefault(repo_root, []).append((path, time.monotonic()))
+
+    @staticmethod
+    def _head(repo_root: str) -> Optional[str]:
+        result = worktree_service._run_git(["rev-parse", "HEAD"], cwd=repo_root)
+        if result.returncode != 0:
+            logger.warning("worktree pool: resolving HEAD failed: %s", result.stderr.strip())
+            return None
+        head: str = result.stdout.strip()
+        return head
+
+    # ------------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------------
+
+    def _submit(self, fn: Callable[..., None], *args: Any) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="cao-worktree-pool", daemon=True
+                )
+                self._worker.start()
+        self._tasks.put((fn, args))
+
+    def _run(self) -> None:
+        interval = min(self._idle_ttl, _MAX_SWEEP_INTERVAL)
+        while True:
+            try:
+                task = self._tasks.get(timeout=interval)
+            except queue.Empty:
+                self._expire()
+                continue
+            try:
+                if task is None:
+                    return
+                fn, args = task
+                try:
+                    fn(*args)
+                except Exception:
+                    logger.warning("worktree pool: background task failed", exc_info=True)
+                self._expire()
+            finally:
+                self._tasks.task_done()
+
+
+_pool: Optional[WorktreePool] = None
+_pool_lock = threading.Lock()
+
+
+def get_worktree_pool() -> WorktreePool:
+    """Return the process-wide ``WorktreePool`` (lazily created)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = WorktreePool()
+    return _pool
+
+
+def shutdown_worktree_pool() -> None:
+    """Drain the process-wide pool, if one was created, and remove its parked worktrees."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
+
+
+def reset_worktree_pool() -> None:
+    """Stop and drop the singleton pool (used by tests to start with a clean slate)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -186,6 +186,29 @@ def remove_worktree(repo_root: str, terminal_id: str) -> None:
         )
 
 
+def acquire_worktree(repo_root: str, terminal_id: str) -> str:
+    """``create_worktree``, served from the warm pool (``worktree_pool``) when
+    it is enabled. Same path, branch and ``WorktreeError`` contract."""
+    from cli_agent_orchestrator.services.worktree_pool import get_worktree_pool
+
+    pool = get_worktree_pool()
+    if not pool.enabled:
+        return create_worktree(repo_root, terminal_id)
+    return pool.acquire(repo_root, terminal_id)
+
+
+def release_worktree(repo_root: str, terminal_id: str) -> None:
+    """``remove_worktree``, or hand the worktree back to the warm pool to be
+    scrubbed and reused when the pool is enabled. Never raises."""
+    from cli_agent_orchestrator.services.worktree_pool import get_worktree_pool
+
+    pool = get_worktree_pool()
+    if not pool.enabled:
+        remove_worktree(repo_root, terminal_id)
+        return
+    pool.release(repo_root, terminal_id)
+
+
 def list_worktrees(repo_root: str) -> list[dict[str, str | bool]]:
     """Parsed ``git worktree list --porcelain`` for ``repo_root`` -- the AC's
     'list' operation. No CAO-side persistence to query: git's own
@@ -20,7 +20,11 @@ from typing import Any, Iterator, Optional
 
 try:
     from cli_agent_orchestrator.telemetry.context import extract_traceparent, inject_traceparent
-    from cli_agent_orchestrator.telemetry.metrics import record_orchestration_dispatch
+    from cli_agent_orchestrator.telemetry.metrics import (
+        record_memory_injection,
+        record_orchestration_dispatch,
+        record_worktree_spawn_saved,
+    )
     from cli_agent_orchestrator.telemetry.otel import init_telemetry, shutdown_telemetry
     from cli_agent_orchestrator.telemetry.spans import (
         chat_span,
@@ -58,6 +62,12 @@ except ImportError as exc:  # opentelemetry not installed (base install, no [ote
     def record_orchestration_dispatch(orchestration_type: str) -> None:
         """No-op: no metric instruments without the [otel] extra."""
 
+    def record_worktree_spawn_saved(seconds: float) -> None:
+        """No-op: no metric instruments without the [otel] extra."""
+
+    def record_memory_injection(seconds: float, outcome: str) -> None:
+        """No-op: no metric instruments without the [otel] extra."""
+
     def inject_traceparent() -> Optional[str]:
         """No-op: no recording span can exist without the [otel] extra."""
         return None
@@ -99,6 +109,8 @@ __all__ = [
     "init_telemetry",
     "invoke_agent_span",
     "inject_traceparent",
+    "record_memory_injection",
     "record_orchestration_dispatch",
+    "record_worktree_spawn_saved",
     "shutdown_telemetry",
 ]
@@ -12,12 +12,14 @@ from __future__ import annotations
 from typing import Optional
 
 from opentelemetry import metrics
-from opentelemetry.metrics import Counter
+from opentelemetry.metrics import Counter, Histogram
 
 from cli_agent_orchestrator.telemetry import semconv
 
 _METER_NAME = "cli_agent_orchestrator"
 _dispatch_counter: Optional[Counter] = None
+_worktree_saved_histogram: Optional[Histogram] = None
+_memory_injection_histogram: Optional[Histogram] = None
 
 
 def _dispatch_counter_instrument() -> Counter:
@@ -40,3 +42,47 @@ def record_orchestration_dispatch(orchestration_type: str) -> None:
     """Increment the orchestration-dispatch counter (no-op when telemetry off)."""
 
     _dispatch_counter_instrument().add(1, {semconv.CAO_ORCHESTRATION_TYPE: orchestration_type})
+
+
+def _worktree_saved_instrument() -> Histogram:
+    """Lazily create (once) the worktree-pool spawn-latency-saved histogram."""
+
+    global _worktree_saved_histogram
+    if _worktree_saved_histogram is None:
+        _worktree_saved_histogram = metrics.get_meter(_METER_NAME).create_histogram(
+            "cao.worktree.spawn_latency_saved",
+            unit="s",
+            description=(
+                "Seconds a use_worktree spawn saved by taking a warm worktree from "
+                "the pool instead of running 'git worktree add'."
+            ),
+        )
+    return _worktree_saved_histogram
+
+
+def record_worktree_spawn_saved(seconds: float) -> None:
+    """Record one pooled worktree hand-out (no-op when telemetry off)."""
+
+    _worktree_saved_instrument().record(seconds)
+
+
+def _memory_injection_instrument() -> Histogram:
+    """Lazily create (once) the first-message memory injection histogram."""
+
+    global _memory_injection_histogram
+    if _memory_injection_histogram is None:
+        _memory_injection_histogram = metrics.get_meter(_METER_NAME).create_histogram(
+            "cao.memory.injection_latency",
+            unit="s",
+            description=(
+                "Seconds memory injection added to a worker's first send_input, by "
+                "prefetch outcome (hit / wait / miss / timeout / error / curated)."
+            ),
+        )
+    return _memory_injection_histogram
+
+
+def record_memory_injection(seconds: float, outcome: str) -> None:
+    """Record one first-message memory injection (no-op when telemetry off)."""
+
+    _memory_injection_instrument().record(seconds, {semconv.CAO_MEMORY_PREFETCH: outcome})
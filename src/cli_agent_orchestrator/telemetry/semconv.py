@@ -32,3 +32,4 @@ OPERATION_CHAT: Final[str] = "chat"
 # --- CAO extensions (namespaced under cao.*) ---
 CAO_TIER: Final[str] = "cao.tier"
 CAO_ORCHESTRATION_TYPE: Final[str] = "cao.orchestration.type"
+CAO_MEMORY_PREFETCH: Final[str] = "cao.memory.prefetch"
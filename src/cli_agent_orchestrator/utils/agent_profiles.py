@@ -1,21 +1,92 @@
 """Agent profile utilities."""
 
+import copy
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
 from importlib import resources
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
 
 import frontmatter
 
 from cli_agent_orchestrator.constants import LOCAL_AGENT_STORE_DIR, PROVIDERS
 from cli_agent_orchestrator.models.agent_profile import AgentProfile
 from cli_agent_orchestrator.utils.env import resolve_env_vars
-from cli_agent_orchestrator.utils.paths import normalized_path
+from cli_agent_orchestrator.utils.paths import FileStamp, normalized_path, trusted_stamp
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Profile catalog cache
+# ---------------------------------------------------------------------------
+# Discovery (``list_agent_profiles``) and loading (``load_agent_profile``) used
+# to re-read and re-parse every profile on every call, and both sit on hot
+# paths: ``/agents/profiles``, ``find_profiles``, provider resolution and every
+# terminal creation. Parsed results are now reused while a file's
+# ``(st_mtime_ns, st_size)`` stamp is unchanged, and directory listings while
+# the directory's ``st_mtime_ns`` is, so a warm call costs stats, not reads.
+#
+# Stamps come from ``utils.paths.trusted_stamp``, which never trusts a racily
+# recent one: those files are re-read on every call until they have been quiet
+# for ``RACY_WINDOW_NS``.
+_PARSED_PROFILE_CACHE_SIZE = 256
+
+
+class _CatalogSnapshot(NamedTuple):
+    expires_at: float  # time.monotonic() deadline
+    settings_stamp: Optional[FileStamp]
+    profiles: List[Dict]
+
+
+_cache_lock = threading.Lock()
+# (path, profile name) -> (stamp, discovery fields, loadable)
+_scan_cache: Dict[Tuple[str, str], Tuple[FileStamp, Dict, bool]] = {}
+# directory -> (mtime_ns, [(entry name, is_dir)])
+_listing_cache: Dict[str, Tuple[int, List[Tuple[str, bool]]]] = {}
+# profile path -> (stamp, raw text)
+_text_cache: Dict[str, Tuple[FileStamp, str]] = {}
+# (profile name, env-resolved text) -> parsed profile, LRU-bounded
+_parsed_cache: "OrderedDict[Tuple[str, str], AgentProfile]" = OrderedDict()
+_catalog_snapshot: Optional[_CatalogSnapshot] = None
+
+
+def _settings_stamp() -> Optional[FileStamp]:
+    from cli_agent_orchestrator.services import settings_service
+
+    try:
+        st = settings_service.SETTINGS_FILE.stat()
+    except OSError:
+        return None
+    return FileStamp(st.st_mtime_ns, st.st_size)
+
+
+def clear_profile_cache() -> None:
+    """Drop every cached listing, parse result and catalog snapshot."""
+    global _catalog_snapshot
+    with _cache_lock:
+        _scan_cache.clear()
+        _listing_cache.clear()
+        _text_cache.clear()
+        _parsed_cache.clear()
+        _catalog_snapshot = None
+
+
+def invalidate_profile_catalog() -> None:
+    """Make the next ``list_agent_profiles()`` rescan instead of using a snapshot.
+
+    Called after CAO itself writes or deletes a profile so a running catalog
+    daemon's snapshot never hides the change for up to one poll interval.
+    Per-file caches need no invalidation: they revalidate against stamps.
+    """
+    global _catalog_snapshot
+    with _cache_lock:
+        _catalog_snapshot = None
+
+
 def _validate_agent_name(agent_name: str) -> None:
     """Reject agent names that could cause path traversal."""
     if "/" in agent_name or "\\" in agent_name or ".." in agent_name:
@@ -89,7 +160,31 @@ def _discovery_fields(metadata: dict) -> Dict:
     }
 
 
+def _copy_discovery(discovery: Dict) -> Dict:
+    return {k: list(v) if isinstance(v, list) else v for k, v in discovery.items()}
+
+
 def _scan_profile_source(source, profile_name: str) -> "tuple[Dict, bool]":
+    """Return discovery fields and loadability, reusing the last parse if unchanged.
+
+    Cached per ``(source, profile_name)`` against the source's stamp; see
+    ``_parse_profile_source`` for what is extracted.
+    """
+    stamp = trusted_stamp(source)
+    key = (str(source), profile_name)
+    if stamp is not None:
+        with _cache_lock:
+            hit = _scan_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            return _copy_discovery(hit[1]), hit[2]
+    discovery, loadable = _parse_profile_source(source, profile_name)
+    if stamp is not None:
+        with _cache_lock:
+            _scan_cache[key] = (stamp, discovery, loadable)
+    return _copy_discovery(discovery), loadable
+
+
+def _parse_profile_source(source, profile_name: str) -> "tuple[Dict, bool]":
     """Extract discovery fields and loadability for a scanned profile source.
 
     ``loadable`` mirrors what ``load_agent_profile()`` will accept: the text
@@ -124,6 +219,7 @@ def _scan_directory(
     profiles: Dict[str, Dict],
     name_sources: Dict[str, List[str]] | None = None,
     dir_profiles_loadable: bool = True,
+    seen: Set[str] | None = None,
 ) -> None:
     """Scan a directory for agent profiles (.md files, .json files, or subdirectories).
 
@@ -138,20 +234,35 @@ def _scan_directory(
     from provider and extra directories, not from the local store, so the
     local-store scan passes ``False`` to keep such entries listable but never
     recommendable.
+
+    ``seen``, when given, collects the directory and every profile file found
+    in it, under both the scanned and the resolved path (the load path reads
+    through ``_safe_join``, which resolves), for ``_prune_caches``.
     """
     if not directory.exists():
         return
     seen_here: Set[str] = set()
+    if seen is not None:
+        seen.add(str(directory))
+        scanned_root, resolved_root = str(directory), str(directory.resolve())
 
     def _record(profile_name: str) -> None:
         if name_sources is not None and profile_name not in seen_here:
             seen_here.add(profile_name)
             name_sources.setdefault(profile_name, []).append(source_label)
 
-    for item in directory.iterdir():
-        if item.is_dir():
+    def _note(source: Path) -> None:
+        if seen is not None:
+            path = str(source)
+            seen.add(path)
+            seen.add(resolved_root + path[len(scanned_root) :])
+
+    for entry_name, is_dir in _list_directory(directory):
+        item = directory / entry_name
+        if is_dir:
             profile_name = item.name
             agent_md = item / "agent.md"
+            _note(agent_md)
             if agent_md.exists() and dir_profiles_loadable:
                 discovery, loadable = _scan_profile_source(agent_md, profile_name)
             elif agent_md.exists():
@@ -173,8 +284,9 @@ def _scan_directory(
                     "loadable": loadable,
                     **discovery,
                 }
-        elif item.suffix == ".md" and item.is_file():
+        elif item.suffix == ".md":
             profile_name = item.stem
+            _note(item)
             discovery, loadable = _scan_profile_source(item, profile_name)
             _record(profile_name)
             if profile_name not in profiles:
@@ -186,12 +298,72 @@ def _scan_directory(
                 }
 
 
+def _list_directory(directory: Path) -> List[Tuple[str, bool]]:
+    """Return ``(name, is_dir)`` for the profile candidates in ``directory``.
+
+    Subdirectories and regular ``*.md`` files only, reused while the
+    directory's mtime is unchanged (adding, removing or renaming an entry
+    bumps it; editing a file in place does not, but file contents are
+    revalidated separately in ``_scan_profile_source``).
+    """
+    key = str(directory)
+    stamp = trusted_stamp(directory)
+    if stamp is not None:
+        with _cache_lock:
+            hit = _listing_cache.get(key)
+        if hit is not None and hit[0] == stamp.mtime_ns:
+            return hit[1]
+    entries: List[Tuple[str, bool]] = []
+    for item in directory.iterdir():
+        if item.is_dir():
+            entries.append((item.name, True))
+        elif item.suffix == ".md" and item.is_file():
+            entries.append((item.name, False))
+    if stamp is not None:
+        with _cache_lock:
+            _listing_cache[key] = (stamp.mtime_ns, entries)
+    return entries
+
+
 def list_agent_profiles() -> List[Dict]:
     """Discover all available agent profiles from all configured directories.
 
     Scans built-in store, local store, and all provider agent directories
     (from settings or defaults). Returns deduplicated list sorted by name.
+
+    Unchanged files are not re-parsed (see "Profile catalog cache" above).
+    While ``refresh_profile_catalog`` keeps a snapshot fresh (the cao-server
+    catalog daemon), the snapshot is returned without touching the
+    filesystem, unless settings.json has changed since it was taken.
+    """
+    snapshot = _catalog_snapshot
+    if (
+        snapshot is not None
+        and time.monotonic() < snapshot.expires_at
+        and _settings_stamp() == snapshot.settings_stamp
+    ):
+        return copy.deepcopy(snapshot.profiles)
+    return _scan_catalog()
+
+
+def refresh_profile_catalog(max_age: float) -> List[Dict]:
+    """Rescan the catalog and serve it from memory for the next ``max_age`` seconds.
+
+    Used by cao-server's catalog daemon, which calls it more often than
+    ``max_age`` so listing never waits on a scan; once the daemon stops the
+    snapshot expires and listing falls back to scanning on demand.
     """
+    global _catalog_snapshot
+    settings_stamp = _settings_stamp()
+    profiles = _scan_catalog()
+    with _cache_lock:
+        _catalog_snapshot = _CatalogSnapshot(
+            time.monotonic() + max_age, settings_stamp, copy.deepcopy(profiles)
+        )
+    return profiles
+
+
+def _scan_catalog() -> List[Dict]:
     from cli_agent_orchestrator.services.settings_service import (
         get_agent_dirs,
         get_disabled_agent_dirs,
@@ -204,6 +376,8 @@ def list_agent_profiles() -> List[Dict]:
     name_sources: Dict[str, List[str]] = {}
     disabled = {normalized_path(d) for d in get_disabled_agent_dirs()}
     scanned_paths: Set[str] = set()
+    # Every directory and profile path this scan found, for _prune_caches.
+    seen: Set[str] = set()
 
     # 1. Local agent store (derives from CAO_HOME_DIR, default
     # ~/.aws/cli-agent-orchestrator/agent-store/).
@@ -218,6 +392,7 @@ def list_agent_profiles() -> List[Dict]:
             profiles,
             name_sources,
             dir_profiles_loadable=False,
+            seen=seen,
         )
         scanned_paths.add(local_norm)
 
@@ -234,7 +409,7 @@ def list_agent_profiles() -> List[Dict]:
         if norm in disabled or norm in scanned_paths:
             continue
         label = provider_source_labels.get(provider, provider)
-        _scan_directory(Path(dir_path), label, profiles, name_sources)
+        _scan_directory(Path(dir_path), label, profiles, name_sources, seen=seen)
         scanned_paths.add(norm)
 
     # 3. Extra user-added directories
@@ -242,7 +417,7 @@ def list_agent_profiles() -> List[Dict]:
         norm = normalized_path(extra_dir)
         if norm in disabled or norm in scanned_paths:
             continue
-        _scan_directory(Path(extra_dir), "custom", profiles, name_sources)
+        _scan_directory(Path(extra_dir), "custom", profiles, name_sources, seen=seen)
         scanned_paths.add(norm)
 
     # 4. Built-in agent store — scanned LAST so on-disk copies win (matches
@@ -254,6 +429,7 @@ def list_agent_profiles() -> List[Dict]:
             if name.endswith(".md"):
                 profile_name = name[:-3]
                 name_sources.setdefault(profile_name, []).append("built-in")
+                seen.add(str(item))
                 if profile_name in profiles:
                     continue
                 discovery, loadable = _scan_profile_source(item, profile_name)
@@ -273,11 +449,47 @@ def list_agent_profiles() -> List[Dict]:
         srcs = name_sources.get(profile_name, [])
         profile["duplicated_in"] = srcs[1:] if len(srcs) > 1 else []
 
+    _prune_caches(seen)
     return sorted(profiles.values(), key=lambda p: p["name"])
 
 
+def _prune_caches(seen: Set[str]) -> None:
+    """Evict listings, scans and texts for paths a full catalog scan no longer finds.
+
+    Entries are keyed by path and revalidated by stamp, so without this a
+    deleted or renamed profile (or a removed directory) would stay cached for
+    the life of the server.
+    """
+    with _cache_lock:
+        for key in [key for key in _scan_cache if key[0] not in seen]:
+            del _scan_cache[key]
+        for path in [path for path in _text_cache if path not in seen]:
+            del _text_cache[path]
+        for path in [path for path in _listing_cache if path not in seen]:
+            del _listing_cache[path]
+
+
 def parse_agent_profile_text(resolved_text: str, profile_name: str) -> AgentProfile:
-    """Parse an AgentProfile from already-resolved markdown text."""
+    """Parse an AgentProfile from already-resolved markdown text.
+
+    Memoized on ``(profile_name, resolved_text)``; each call returns its own
+    deep copy, so callers may mutate the result.
+    """
+    key = (profile_name, resolved_text)
+    with _cache_lock:
+        cached = _parsed_cache.get(key)
+        if cached is not None:
+            _parsed_cache.move_to_end(key)
+    if cached is None:
+        cached = _parse_agent_profile_text(resolved_text, profile_name)
+        with _cache_lock:
+            _parsed_cache[key] = cached
+            while len(_parsed_cache) > _PARSED_PROFILE_CACHE_SIZE:
+                _parsed_cache.popitem(last=False)
+    return cached.model_copy(deep=True)
+
+
+def _parse_agent_profile_text(resolved_text: str, profile_name: str) -> AgentProfile:
     profile_data = frontmatter.loads(resolved_text)
     meta = profile_data.metadata
     meta["system_prompt"] = profile_data.content.strip()
@@ -324,17 +536,17 @@ def _read_agent_profile_source(agent_name: str) -> str:
     if normalized_path(LOCAL_AGENT_STORE_DIR) not in disabled:
         local_profile = _safe_join(LOCAL_AGENT_STORE_DIR, f"{agent_name}.md")
         if local_profile is not None and local_profile.exists():
-            return local_profile.read_text(encoding="utf-8")
+            return _read_profile_text(local_profile)
 
     def _lookup_in_directory(directory: Path) -> str | None:
         if not directory.exists():
             return None
         flat = _safe_join(directory, f"{agent_name}.md")
         if flat is not None and flat.exists():
-            return flat.read_text(encoding="utf-8")
+            return _read_profile_text(flat)
         nested = _safe_join(directory, agent_name, "agent.md")
         if nested is not None and nested.exists():
-            return nested.read_text(encoding="utf-8")
+            return _read_profile_text(nested)
         return None
 
     for dir_path in get_agent_dirs().values():
@@ -357,11 +569,27 @@ def _read_agent_profile_source(agent_name: str) -> str:
     agent_store = resources.files("cli_agent_orchestrator.agent_store")
     built_in = agent_store / f"{agent_name}.md"
     if built_in.name == f"{agent_name}.md" and built_in.is_file():
-        return built_in.read_text(encoding="utf-8")
+        return _read_profile_text(built_in)
 
     raise FileNotFoundError(f"Agent profile not found: {agent_name}")
 
 
+def _read_profile_text(source) -> str:
+    """Read a profile's raw text, reusing the last read while its stamp holds."""
+    stamp = trusted_stamp(source)
+    key = str(source)
+    if stamp is not None:
+        with _cache_lock:
+            hit = _text_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            return hit[1]
+    text = source.read_text(encoding="utf-8")
+    if stamp is not None:
+        with _cache_lock:
+            _text_cache[key] = (stamp, text)
+    return text
+
+
 def load_agent_profile(agent_name: str) -> AgentProfile:
     """Load an agent profile from the configured stores."""
     try:
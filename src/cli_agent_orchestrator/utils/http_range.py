@@ -0,0 +1,59 @@
+"""HTTP ``Range`` / ``ETag`` helpers for routes that serve raw byte streams."""
+
+import re
+from typing import Optional, Tuple
+
+_RANGE_RE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+class RangeNotSatisfiable(ValueError):
+    """A well-formed ``Range`` that selects no byte of the representation (416)."""
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a ``Range`` header against a representation of ``size`` bytes.
+
+    Supports a single ``bytes=first-last``, ``bytes=first-`` or ``bytes=-suffix``
+    range and returns it as a half-open ``(start, end)`` clipped to ``size``.
+    Returns None when the whole representation should be sent instead: no
+    header, a unit other than bytes, a malformed value, or a multi-range
+    request (RFC 9110 lets a server ignore any ``Range`` it does not support).
+
+    Raises:
+        RangeNotSatisfiable: The range starts at or beyond ``size``, or is an
+            empty suffix.
+    """
+    if not header:
+        return None
+    match = _RANGE_RE.match(header)
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - suffix, 0), size
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    end = min(int(last) + 1, size) if last else size
+    return start, end
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """True when an ``If-None-Match`` / ``If-Range`` value names ``etag``.
+
+    Comparison is weak (a ``W/`` prefix is ignored), as RFC 9110 requires for
+    ``If-None-Match``.
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
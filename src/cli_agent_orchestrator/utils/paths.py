@@ -1,7 +1,16 @@
 """Filesystem-path helpers shared across services and utils."""
 
 import os
+import time
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+# File timestamps are coarse (kernel tick granularity), so a file rewritten
+# twice within one tick can keep the same stamp. As with git's "racily clean"
+# index entries, a stamp younger than this is never trusted by the stat-keyed
+# caches (profiles, skills, settings): such files are re-read until they have
+# been quiet that long.
+RACY_WINDOW_NS = 2_000_000_000
 
 
 def normalized_path(path: "str | Path") -> str:
@@ -19,3 +28,30 @@ def normalized_path(path: "str | Path") -> str:
     each other's private API.
     """
     return os.path.realpath(os.path.expanduser(str(path)))
+
+
+class FileStamp(NamedTuple):
+    mtime_ns: int
+    size: int
+
+
+def is_racy(st: os.stat_result) -> bool:
+    """True when ``st`` was modified too recently for its stamp to be trusted."""
+    return time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS
+
+
+def trusted_stamp(path: object) -> Optional[FileStamp]:
+    """Return ``path``'s cache stamp, or None when it must not be trusted.
+
+    None covers a missing file, a source that is not a filesystem path (e.g. a
+    zipped ``importlib.resources`` traversable) and a racily recent modification.
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if is_racy(st):
+        return None
+    return FileStamp(st.st_mtime_ns, st.st_size)
@@ -2,14 +2,17 @@
 
 import fnmatch
 import logging
+import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 import frontmatter
 from pydantic import ValidationError
 
 from cli_agent_orchestrator.constants import SKILLS_DIR
 from cli_agent_orchestrator.models.skill import SkillMetadata
+from cli_agent_orchestrator.utils.paths import FileStamp, trusted_stamp
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,38 @@ SKILL_CATALOG_INSTRUCTION = (
 )
 
 
+# ---------------------------------------------------------------------------
+# Skill catalog cache
+# ---------------------------------------------------------------------------
+# Every terminal creation builds the catalog (``build_skill_catalog``) and every
+# ``load_skill`` resolves from disk, so a 20-worker team used to read and parse
+# the same SKILL.md files 20 times. Parsed files are now reused while their
+# ``(st_mtime_ns, st_size)`` stamp is unchanged, directory listings while the
+# directory's ``st_mtime_ns`` is, and the rendered catalog per filter set while
+# the skills it lists are the same — a warm call costs stats, not reads.
+#
+# As in ``agent_profiles``, stamps come from ``utils.paths.trusted_stamp``,
+# so a racily recent file is re-read until it has been quiet long enough.
+# Resolution order and "first valid match wins" are unchanged; only the parse
+# behind each candidate is cached.
+
+_cache_lock = threading.Lock()
+# SKILL.md path -> (stamp, metadata, content)
+_parse_cache: Dict[str, Tuple[FileStamp, SkillMetadata, str]] = {}
+# skill store directory -> (mtime_ns, subdirectory names)
+_listing_cache: Dict[str, Tuple[int, List[str]]] = {}
+# filter patterns (None = unfiltered) -> ((name, description) listed, rendered catalog)
+_catalog_cache: Dict[Optional[FrozenSet[str]], Tuple[Tuple[Tuple[str, str], ...], str]] = {}
+
+
+def clear_skill_cache() -> None:
+    """Drop every cached parse, directory listing and rendered catalog."""
+    with _cache_lock:
+        _parse_cache.clear()
+        _listing_cache.clear()
+        _catalog_cache.clear()
+
+
 class SkillNameError(ValueError):
     """Raised when a skill name is empty or unsafe to resolve on disk."""
 
@@ -37,7 +72,37 @@ def validate_skill_name(skill_name: str) -> str:
 
 
 def _parse_skill_file(skill_file: Path) -> Tuple[SkillMetadata, str]:
-    """Parse a skill file and return validated metadata plus Markdown content."""
+    """Parse a skill file and return validated metadata plus Markdown content.
+
+    Reuses the last parse while the file's stamp holds. The stamp is taken
+    before the read, so a file changed mid-read is re-read on the next call.
+    Failures are not cached: an invalid file is re-parsed (and re-reported).
+    """
+    key = str(skill_file)
+    stamp = trusted_stamp(key)
+    hit = _cached_parse(key, stamp)
+    if hit is not None:
+        return hit
+    metadata, content = _read_skill_file(skill_file)
+    if stamp is not None:
+        with _cache_lock:
+            _parse_cache[key] = (stamp, metadata, content)
+    return metadata, content
+
+
+def _cached_parse(key: str, stamp: Optional[FileStamp]) -> Optional[Tuple[SkillMetadata, str]]:
+    """The cached parse of the SKILL.md at ``key`` if ``stamp`` still matches it."""
+    if stamp is None:
+        return None
+    with _cache_lock:
+        hit = _parse_cache.get(key)
+    if hit is None or hit[0] != stamp:
+        return None
+    return hit[1], hit[2]
+
+
+def _read_skill_file(skill_file: Path) -> Tuple[SkillMetadata, str]:
+    """Read and validate a skill file, uncached."""
     try:
         parsed_skill = frontmatter.loads(skill_file.read_text())
     except Exception as exc:
@@ -53,13 +118,13 @@ def _parse_skill_file(skill_file: Path) -> Tuple[SkillMetadata, str]:
 
 def _load_skill_folder(skill_path: Path) -> Tuple[SkillMetadata, str]:
     """Load and validate a skill folder from the filesystem."""
-    if not skill_path.exists():
-        raise FileNotFoundError(f"Skill folder does not exist: {skill_path}")
-    if not skill_path.is_dir():
-        raise ValueError(f"Skill path is not a directory: {skill_path}")
-
     skill_file = skill_path / "SKILL.md"
+    # One stat on the common path: a SKILL.md that is a file implies the folder.
     if not skill_file.is_file():
+        if not skill_path.exists():
+            raise FileNotFoundError(f"Skill folder does not exist: {skill_path}")
+        if not skill_path.is_dir():
+            raise ValueError(f"Skill path is not a directory: {skill_path}")
         raise FileNotFoundError(f"Missing SKILL.md in skill folder: {skill_path}")
 
     metadata, content = _parse_skill_file(skill_file)
@@ -144,9 +209,18 @@ def list_skills() -> List[SkillMetadata]:
     for directory in _skill_search_dirs():
         if not directory.is_dir():
             continue
-        for item in directory.iterdir():
-            if not item.is_dir() or item.name in skills_by_name:
+        prefix = str(directory)
+        for name in _list_skill_dirs(directory):
+            if name in skills_by_name:
+                continue
+            # Warm path: one stat confirms the cached parse (plain strings;
+            # building Paths dominates the cost of a warm scan otherwise).
+            skill_key = os.path.join(prefix, name, "SKILL.md")
+            hit = _cached_parse(skill_key, trusted_stamp(skill_key))
+            if hit is not None and hit[0].name == name:
+                skills_by_name[name] = hit[0]
                 continue
+            item = directory / name
             # extra_skill_dirs may point at a broad project root, so only treat a
             # subdirectory as a skill when it actually contains a SKILL.md;
             # unrelated folders are skipped silently. A folder that has a
@@ -162,6 +236,35 @@ def list_skills() -> List[SkillMetadata]:
     return sorted(skills_by_name.values(), key=lambda skill: skill.name)
 
 
+def _list_skill_dirs(directory: Path) -> List[str]:
+    """Return the subdirectory names of a skill store directory.
+
+    Reused while the directory's mtime is unchanged: adding, removing or
+    renaming a skill folder bumps it. Adding or editing a SKILL.md inside an
+    existing folder does not, which is why callers still check each folder's
+    SKILL.md (and ``_parse_skill_file`` revalidates its stamp).
+    """
+    key = str(directory)
+    stamp = trusted_stamp(directory)
+    if stamp is not None:
+        with _cache_lock:
+            hit = _listing_cache.get(key)
+        if hit is not None and hit[0] == stamp.mtime_ns:
+            return hit[1]
+    names: List[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    names.append(entry.name)
+            except OSError:
+                continue
+    if stamp is not None:
+        with _cache_lock:
+            _listing_cache[key] = (stamp.mtime_ns, names)
+    return names
+
+
 def build_skill_catalog(skill_filter: Optional[List[str]] = None) -> str:
     """Build the injected skill catalog block.
 
@@ -173,8 +276,25 @@ def build_skill_catalog(skill_filter: Optional[List[str]] = None) -> str:
             least one pattern are listed; an empty list advertises no skills at
             all. Patterns that match no installed skill are logged (usually a
             typo or a stale skill name).
+
+    The rendered block is memoized per filter set and reused while the listed
+    skills (names and descriptions) are unchanged, so the unmatched-pattern
+    warning is logged once per catalog change rather than on every spawn.
     """
     skills = list_skills()
+    key = frozenset(skill_filter) if skill_filter is not None else None
+    listed = tuple((skill.name, skill.description) for skill in skills)
+    with _cache_lock:
+        hit = _catalog_cache.get(key)
+    if hit is not None and hit[0] == listed:
+        return hit[1]
+    catalog = _render_skill_catalog(skills, skill_filter)
+    with _cache_lock:
+        _catalog_cache[key] = (listed, catalog)
+    return catalog
+
+
+def _render_skill_catalog(skills: List[SkillMetadata], skill_filter: Optional[List[str]]) -> str:
     if skill_filter is not None:
         matched_patterns: Set[str] = set()
         selected: List[SkillMetadata] = []
@@ -7,8 +7,7 @@ import time
 import uuid
 from typing import Optional, Union
 
-import requests
-
+from cli_agent_orchestrator.clients import api_client as requests
 from cli_agent_orchestrator.constants import API_BASE_URL, SESSION_PREFIX
 from cli_agent_orchestrator.models.terminal import TerminalStatus
 
@@ -163,13 +162,19 @@ async def wait_until_status(
     timeout: float = 30.0,
     polling_interval: float = 1.0,
 ) -> bool:
-    """Wait until terminal reaches target status by polling status_monitor.
+    """Wait until terminal reaches target status, as reported by status_monitor.
 
     status_monitor.get_status() is backend-aware: for pipe-pane backends (tmux)
     it returns the pushed pipeline status, and for event-inbox backends (herdr)
     it derives status on demand from the provider's native status. So this poll
     works for both backends without special-casing here.
+
+    When the event bus dispatches on the running loop, the wait also listens
+    on ``terminal.{id}.status``: a status change re-checks immediately instead
+    of on the next ``polling_interval`` tick, which stays the fallback cadence.
     """
+    from cli_agent_orchestrator.services.event_bus import bus
+    from cli_agent_orchestrator.services.startup_sequencer import subscribe_live
     from cli_agent_orchestrator.services.status_monitor import status_monitor
 
     targets = target_status if isinstance(target_status, set) else {target_status}
@@ -177,13 +182,26 @@ async def wait_until_status(
     logger.info(
         f"wait_until_status [{terminal_id}]: waiting for {{{target_str}}}, timeout={timeout}s"
     )
-    start = time.time()
-    while time.time() - start < timeout:
-        current = status_monitor.get_status(terminal_id)
-        if current in targets:
-            logger.info(f"wait_until_status [{terminal_id}]: reached {current.value}")
-            return True
-        await asyncio.sleep(polling_interval)
+    topic = f"terminal.{terminal_id}.status"
+    changes = subscribe_live(topic)
+    try:
+        start = time.time()
+        while time.time() - start < timeout:
+            current = status_monitor.get_status(terminal_id)
+            if current in targets:
+                logger.info(f"wait_until_status [{terminal_id}]: reached {current.value}")
+                return True
+            if changes is None:
+                await asyncio.sleep(polling_interval)
+                continue
+            remaining = timeout - (time.time() - start)
+            try:
+                await asyncio.wait_for(changes.get(), max(min(polling_interval, remaining), 0))
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        if changes is not None:
+            bus.unsubscribe(topic, changes)
     logger.warning(f"wait_until_status [{terminal_id}]: timeout waiting for {{{target_str}}}")
     return False
 
@@ -1,6 +1,9 @@
 """Text utilities for cleaning raw terminal output."""
 
 import re
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Optional, Tuple
 
 # Cursor-to-column-1 sequences that semantically start a new logical line.
 # Must be replaced with \n BEFORE the general CSI strip, otherwise the text
@@ -71,3 +74,141 @@ def strip_terminal_escapes(text: str) -> str:
     # detection, each redraw is a new logical line of output.
     text = text.replace("\r\n", "\n").replace("\r", "\n")
     return text
+
+
+# A sequence that may still be incomplete at the end of a chunk: a lone ESC,
+# an unterminated CSI (ESC [ / C1 CSI, parameters and intermediates but no
+# final byte yet), or an unterminated OSC (possibly ending on the ESC of its
+# ESC \\ terminator). Matched with fullmatch() against a chunk's suffix.
+_PENDING_SEQUENCE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?)?|\x9b[0-?]*[ -/]*")
+
+# Held-back bytes beyond this are released as-is: a malformed stream (an OSC
+# that is never terminated) must not make the stripper buffer without bound.
+_MAX_PENDING_CHARS = 4096
+
+
+class IncrementalEscapeStripper:
+    """``strip_terminal_escapes`` for a stream delivered in chunks.
+
+    Every pattern ``strip_terminal_escapes`` applies is local to one escape
+    sequence (or one ``\\r\\n`` pair), so the stream can be cleaned chunk by
+    chunk as long as no chunk is cut inside one. ``feed`` holds back a
+    trailing sequence that may still be incomplete and prepends it to the
+    next chunk; everything before it is cleaned once and never revisited.
+    The concatenated output equals ``strip_terminal_escapes`` of the
+    concatenated input, except for OSC payloads that themselves contain
+    escape sequences (which the one-shot function resolves order-dependently).
+    """
+
+    def __init__(self) -> None:
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Clean ``chunk`` and return the text that is now final."""
+        text = self._pending + chunk
+        cut = self._pending_start(text)
+        if cut is not None and len(text) - cut <= _MAX_PENDING_CHARS:
+            self._pending = text[cut:]
+            text = text[:cut]
+        else:
+            self._pending = ""
+        return strip_terminal_escapes(text) if text else ""
+
+    def peek(self) -> str:
+        """Clean the held-back tail as if the stream ended here (not consumed)."""
+        return strip_terminal_escapes(self._pending) if self._pending else ""
+
+    @staticmethod
+    def _pending_start(text: str) -> Optional[int]:
+        cut = len(text)
+        # Only the last ESC / OSC introducer / C1 CSI can start an incomplete
+        # sequence; the OSC introducer is checked separately because the last
+        # ESC may be the first half of that OSC's ESC \\ terminator.
+        candidates = {text.rfind("\x1b]"), text.rfind("\x1b"), text.rfind("\x9b")}
+        for start in sorted(c for c in candidates if c >= 0):
+            if _PENDING_SEQUENCE.fullmatch(text, start):
+                cut = start
+                break
+        # A \r followed only by bytes that strip to nothing can still pair
+        # with a later \n (or a cursor-to-column-1 CSI) into a single newline.
+        cr = text.rfind("\r", max(0, cut - _MAX_PENDING_CHARS), cut)
+        if cr >= 0 and not strip_terminal_escapes(text[cr + 1 : cut]):
+            return cr
+        return cut if cut < len(text) else None
+
+
+class CleanLineBuffer:
+    """Rolling, escape-stripped view of a terminal's output, kept as lines.
+
+    Fed the raw stream chunk by chunk; each byte is cleaned exactly once (see
+    ``IncrementalEscapeStripper``) and split into a ring of completed lines
+    plus the line still being written. ``tail()`` returns the same lines as
+    ``strip_terminal_escapes(stream).split("\\n")`` would, but costs time
+    proportional to the lines requested, not the buffer, and is cached until
+    the next ``feed``.
+
+    The ring mirrors a raw rolling buffer capped at ``max_raw`` characters
+    (the StatusMonitor's ``state_buffer_max``): a line is evicted once the raw
+    text it came from has left that window. Line ends are tracked per fed
+    chunk, so the ring keeps at most the rest of the chunk that straddles the
+    window's start beyond what the raw buffer holds; a single chunk of
+    ``max_raw`` or more restarts the ring from that chunk's last ``max_raw``
+    characters, exactly as the raw buffer is cut.
+    """
+
+    def __init__(self, max_raw: int) -> None:
+        self._max_raw = max_raw
+        self._stripper = IncrementalEscapeStripper()
+        self._lines: Deque[str] = deque()
+        # Raw characters fed when each line in _lines was completed (an upper
+        # bound on the raw offset of its "\n").
+        self._line_ends: Deque[int] = deque()
+        self._raw_fed = 0
+        self._partial = ""
+        self._tails: Dict[Optional[int], Tuple[str, ...]] = {}
+
+    def feed(self, chunk: str) -> None:
+        """Append a raw chunk of terminal output."""
+        self._tails.clear()
+        if len(chunk) >= self._max_raw:
+            self._stripper = IncrementalEscapeStripper()
+            self._lines.clear()
+            self._line_ends.clear()
+            self._partial = ""
+            chunk = chunk[-self._max_raw :]
+        self._raw_fed += len(chunk)
+        text = self._stripper.feed(chunk)
+        if text:
+            parts = text.split("\n")
+            parts[0] = self._partial + parts[0]
+            self._partial = parts.pop()
+            for line in parts:
+                self._lines.append(line)
+                self._line_ends.append(self._raw_fed)
+            if len(self._partial) > self._max_raw:
+                self._partial = self._partial[-self._max_raw :]
+        window_start = self._raw_fed - self._max_raw
+        while self._line_ends and self._line_ends[0] <= window_start:
+            self._lines.popleft()
+            self._line_ends.popleft()
+
+    def tail(self, count: Optional[int] = None) -> Tuple[str, ...]:
+        """The last ``count`` cleaned lines (all retained lines when None).
+
+        The final element is the line currently being written (empty right
+        after a newline), matching ``str.split("\\n")``. The returned tuple is
+        shared between callers until the next ``feed``.
+        """
+        cached = self._tails.get(count)
+        if cached is not None:
+            return cached
+        current = (self._partial + self._stripper.peek()).split("\n")
+        if count is None:
+            lines = (*self._lines, *current)
+        else:
+            older = max(count - len(current), 0)
+            recent = list(islice(reversed(self._lines), older))
+            recent.reverse()
+            lines = (*recent, *current)[-count:] if count > 0 else ()
+        self._tails[count] = lines
+        return lines
@@ -6,7 +6,7 @@ populated fleet) live in ``test_agui_stream_endpoint.py``. This module targets
 the failure-isolation branches that keep the stream alive when a backend hiccups:
 
 * a token-validation exception mapping to a clean 401,
-* ``_fleet_snapshot`` swallowing a per-session terminal-listing error,
+* the fleet projection's loader swallowing a per-session terminal-listing error,
 * the ``?since=`` history replay swallowing a log error,
 * the connect STATE_SNAPSHOT and per-event STATE_DELTA swallowing snapshot errors,
 * the replay/live de-duplication ``continue`` when the same event id appears in
@@ -141,7 +141,7 @@ def test_history_replay_failure_is_isolated(monkeypatch):
 
 
 def test_snapshot_and_delta_failures_are_isolated(monkeypatch):
-    """If ``_fleet_snapshot`` raises, both the connect STATE_SNAPSHOT and the
+    """If the fleet projection's loader raises, both the connect STATE_SNAPSHOT and the
     per-event STATE_DELTA branches swallow the error and the live event frame
     is still delivered."""
     monkeypatch.setattr(main, "is_auth_enabled", lambda: False)
@@ -149,7 +149,7 @@ def test_snapshot_and_delta_failures_are_isolated(monkeypatch):
     def _boom():
         raise RuntimeError("session backend down")
 
-    # list_sessions raises inside _fleet_snapshot -> both snapshot & delta except.
+    # list_sessions raises inside the fleet loader -> both snapshot & delta except.
     monkeypatch.setattr("cli_agent_orchestrator.services.session_service.list_sessions", _boom)
 
     live_event = {
@@ -147,11 +147,11 @@ def test_stream_replays_history_and_emits_state_frames(monkeypatch):
 
 
 def test_stream_fleet_snapshot_with_terminals_emits_delta(monkeypatch):
-    """Exercise ``_fleet_snapshot`` over a session that HAS terminals, and the
+    """Exercise the fleet projection over a session that HAS terminals, and the
     STATE_DELTA branch when the fleet snapshot changes between events."""
     monkeypatch.setattr(main, "is_auth_enabled", lambda: False)
 
-    # A live session so the terminal-listing loop inside _fleet_snapshot runs.
+    # A live session so the fleet loader's terminal-listing loop runs.
     monkeypatch.setattr(
         "cli_agent_orchestrator.services.session_service.list_sessions",
         lambda: [{"id": "sess-1", "name": "sess-1"}],
@@ -212,4 +212,4 @@ def test_stream_fleet_snapshot_with_terminals_emits_delta(monkeypatch):
 
     assert "STATE_SNAPSHOT" in body  # connect snapshot (over a populated fleet)
     assert "STATE_DELTA" in body  # snapshot moved after the live event
-    assert calls["n"] >= 2  # _fleet_snapshot ran on connect and after the event
+    assert calls["n"] >= 2  # the fleet was read on connect and after the launch event
@@ -6,7 +6,11 @@ flow_daemon, lifespan, and the main() entry point.
 """
 
 import asyncio
+import os
+import socket
+import stat
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call, patch
 
 import pytest
@@ -16,6 +20,8 @@ from cli_agent_orchestrator.api.main import (
     flow_daemon,
     inbox_reconciliation_daemon,
     opencode_inbox_delivery_daemon,
+    profile_catalog_daemon,
+    settings_watcher_daemon,
 )
 from cli_agent_orchestrator.models.inbox import OrchestrationType
 from cli_agent_orchestrator.models.terminal import Terminal
@@ -58,6 +64,24 @@ class TestHealthCheck:
         data = response.json()
         assert data["terminal_backend"] == "herdr"
 
+    def test_event_bus_stats_lists_subscribers(self, client):
+        """GET /health/event-bus exposes the bus's per-subscriber counters."""
+        stats = [{"pattern": "terminal.*.output", "lag": 3, "dropped": 0}]
+        with patch("cli_agent_orchestrator.api.main.bus") as mock_bus:
+            mock_bus.subscriber_stats.return_value = stats
+            response = client.get("/health/event-bus")
+        assert response.status_code == 200
+        assert response.json() == {"subscribers": stats}
+
+    def test_memory_injection_stats(self, client):
+        """GET /health/memory-injection exposes the memory prefetch counters."""
+        stats = {"hit": 3, "timeout": 1, "injections": 4, "hit_rate": 0.75}
+        with patch("cli_agent_orchestrator.api.main.get_memory_prefetcher") as mock_prefetcher:
+            mock_prefetcher.return_value.stats.return_value = stats
+            response = client.get("/health/memory-injection")
+        assert response.status_code == 200
+        assert response.json() == stats
+
 
 # ── Agent profiles endpoint ──────────────────────────────────────────
 
@@ -1068,6 +1092,7 @@ class TestGetTerminalOutput:
     def test_get_output_full_mode(self, client):
         """GET /terminals/{id}/output returns full output by default."""
         with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.output_cursor.return_value = "g.0"
             mock_svc.get_output.return_value = "Hello from terminal"
 
             response = client.get("/terminals/abcd1234/output")
@@ -1080,6 +1105,7 @@ class TestGetTerminalOutput:
     def test_get_output_last_mode(self, client):
         """GET /terminals/{id}/output with mode=last returns last response."""
         with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.output_cursor.return_value = "g.0"
             mock_svc.get_output.return_value = "Last response"
 
             response = client.get("/terminals/abcd1234/output?mode=last")
@@ -1092,6 +1118,7 @@ class TestGetTerminalOutput:
     def test_get_output_terminal_not_found(self, client):
         """GET /terminals/{id}/output returns 404 for nonexistent terminal."""
         with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.output_cursor.return_value = "g.0"
             mock_svc.get_output.side_effect = ValueError("Terminal not found")
 
             response = client.get("/terminals/deadbeef/output")
@@ -1102,6 +1129,7 @@ class TestGetTerminalOutput:
     def test_get_output_server_error(self, client):
         """GET /terminals/{id}/output returns 500 on error."""
         with patch("cli_agent_orchestrator.api.main.terminal_service") as mock_svc:
+            mock_svc.output_cursor.return_value = "g.0"
             mock_svc.get_output.side_effect = Exception("Read failed")
 
             response = client.get("/terminals/abcd1234/output")
@@ -1303,6 +1331,64 @@ class TestInboxReconciliationDaemon:
         assert mock_to_thread.await_args.args[1] is registry
 
 
+class TestProfileCatalogDaemon:
+    """Tests for the opt-in profile catalog rescan daemon."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_snapshot_then_warms_index(self):
+        """Each tick rescans with a snapshot lifetime above the interval, then warms BM25."""
+        profiles = [{"name": "dev"}]
+        calls = []
+
+        async def fake_to_thread(func, *args):
+            calls.append((func.__name__, args))
+            return profiles if func.__name__ == "refresh_profile_catalog" else None
+
+        async def fake_sleep(_seconds):
+            raise asyncio.CancelledError
+
+        with (
+            patch("asyncio.sleep", new=fake_sleep),
+            patch("asyncio.to_thread", new=fake_to_thread),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await profile_catalog_daemon(5.0)
+
+        assert calls == [
+            ("refresh_profile_catalog", (15.0,)),
+            ("warm_profile_index", (profiles,)),
+        ]
+
+
+class TestSettingsWatcherDaemon:
+    """Tests for the settings.json watcher daemon."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_with_trust_then_withdraws_it_on_exit(self):
+        """Each tick trusts the snapshot past the next tick; stopping withdraws the trust."""
+        calls = []
+
+        async def fake_to_thread(func, *args):
+            calls.append((func, args))
+            return SimpleNamespace(version=1)
+
+        async def fake_sleep(_seconds):
+            raise asyncio.CancelledError
+
+        with (
+            patch("asyncio.sleep", new=fake_sleep),
+            patch("asyncio.to_thread", new=fake_to_thread),
+            patch(
+                "cli_agent_orchestrator.services.settings_service.refresh_settings_snapshot"
+            ) as mock_refresh,
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await settings_watcher_daemon(2.0)
+
+        assert calls == [(mock_refresh, (6.0,))]
+        mock_refresh.assert_called_once_with(trust_for=0)
+
+
 # ── lifespan ─────────────────────────────────────────────────────────
 
 
@@ -1362,6 +1448,9 @@ class TestLifespan:
             ),
             patch("cli_agent_orchestrator.plugins.PluginRegistry.load", mock_load),
             patch("cli_agent_orchestrator.plugins.PluginRegistry.teardown", mock_teardown),
+            patch.object(main_module.fifo_manager, "stop_multiplexer") as mock_stop_mux,
+            patch.object(main_module, "shutdown_worktree_pool") as mock_pool_shutdown,
+            patch.object(main_module.fifo_manager, "set_batch_probe") as mock_batch_probe,
         ):
             async with lifespan(app):
                 # Inside the lifespan — startup completed.
@@ -1374,9 +1463,15 @@ class TestLifespan:
                 mock_bus.set_loop.assert_called_once()
                 loop_arg = mock_bus.set_loop.call_args.args[0]
                 assert loop_arg is asyncio.get_running_loop()
+                # The watchdog's batched pane probe is installed once, here.
+                mock_batch_probe.assert_called_once_with(main_module.terminal_service.probe_panes)
 
-            # After exit — shutdown tears down the plugin registry.
+            # After exit — shutdown tears down the plugin registry, stops
+            # the FIFO multiplexer thread and drains the worktree pool.
             mock_teardown.assert_awaited_once()
+            mock_stop_mux.assert_called_once_with()
+            mock_pool_shutdown.assert_called_once_with()
+            mock_batch_probe.assert_called_with(None)
 
     @pytest.mark.asyncio
     async def test_lifespan_cancels_inbox_reconciliation_on_shutdown(self):
@@ -1457,7 +1552,9 @@ class TestMainEntryPoint:
             patch("argparse.ArgumentParser.parse_args") as mock_args,
             patch("uvicorn.run") as mock_uvicorn,
         ):
-            mock_args.return_value = MagicMock(agents_dir=None, host=None, port=None, terminal=None)
+            mock_args.return_value = MagicMock(
+                agents_dir=None, host=None, port=None, terminal=None, uds=None
+            )
 
             from cli_agent_orchestrator.api.main import main
 
@@ -1475,7 +1572,7 @@ class TestMainEntryPoint:
             patch("uvicorn.run") as mock_uvicorn,
         ):
             mock_args.return_value = MagicMock(
-                agents_dir=None, host="0.0.0.0", port=9999, terminal=None
+                agents_dir=None, host="0.0.0.0", port=9999, terminal=None, uds=None
             )
 
             from cli_agent_orchestrator.api.main import main
@@ -1498,7 +1595,7 @@ class TestMainEntryPoint:
             patch("cli_agent_orchestrator.constants.KIRO_AGENTS_DIR") as _,
         ):
             mock_args.return_value = MagicMock(
-                agents_dir="/custom/agents", host=None, port=None, terminal=None
+                agents_dir="/custom/agents", host=None, port=None, terminal=None, uds=None
             )
 
             from cli_agent_orchestrator.api.main import main
@@ -1522,7 +1619,7 @@ class TestMainEntryPoint:
             parent.attach_mock(mock_add, "add_cors")
             parent.attach_mock(mock_uvicorn, "uvicorn_run")
             mock_args.return_value = MagicMock(
-                agents_dir=None, host="0.0.0.0", port=9999, terminal=None
+                agents_dir=None, host="0.0.0.0", port=9999, terminal=None, uds=None
             )
 
             from cli_agent_orchestrator.api.main import main
@@ -1549,7 +1646,7 @@ class TestMainEntryPoint:
             patch("cli_agent_orchestrator.backends.registry.set_backend") as mock_set,
         ):
             mock_args.return_value = MagicMock(
-                agents_dir=None, host=None, port=None, terminal="herdr"
+                agents_dir=None, host=None, port=None, terminal="herdr", uds=None
             )
 
             from cli_agent_orchestrator.api.main import main
@@ -1566,10 +1663,67 @@ class TestMainEntryPoint:
             patch("uvicorn.run"),
             patch("cli_agent_orchestrator.backends.registry.set_backend") as mock_set,
         ):
-            mock_args.return_value = MagicMock(agents_dir=None, host=None, port=None, terminal=None)
+            mock_args.return_value = MagicMock(
+                agents_dir=None, host=None, port=None, terminal=None, uds=None
+            )
 
             from cli_agent_orchestrator.api.main import main
 
             main()
 
             mock_set.assert_not_called()
+
+    def test_main_uds_listens_on_tcp_and_unix_socket(self, tmp_path):
+        """--uds serves the app on a 0600 Unix socket alongside TCP and removes it on exit."""
+        sock_path = str(tmp_path / "cao.sock")
+        with (
+            patch("argparse.ArgumentParser.parse_args") as mock_args,
+            patch("uvicorn.run") as mock_run,
+            patch("uvicorn.Config.bind_socket") as mock_bind_tcp,
+            patch("uvicorn.Server") as mock_server,
+        ):
+            mock_args.return_value = MagicMock(
+                agents_dir=None, host=None, port=None, terminal=None, uds=sock_path
+            )
+            seen = {}
+
+            def fake_run(sockets):
+                seen["sockets"] = sockets
+                seen["mode"] = stat.S_IMODE(os.stat(sock_path).st_mode)
+
+            mock_server.return_value.run.side_effect = fake_run
+
+            from cli_agent_orchestrator.api.main import main
+
+            main()
+
+        mock_run.assert_not_called()
+        tcp_sock, unix_sock = seen["sockets"]
+        try:
+            assert tcp_sock is mock_bind_tcp.return_value
+            assert unix_sock.family == socket.AF_UNIX
+            assert seen["mode"] == 0o600
+            assert mock_server.call_args.args[0].app is app
+        finally:
+            unix_sock.close()
+        assert not os.path.exists(sock_path)
+
+    def test_main_uds_refuses_to_replace_regular_file(self, tmp_path):
+        """A non-socket file at the --uds path is never deleted."""
+        target = tmp_path / "not-a-socket"
+        target.write_text("keep me")
+        with (
+            patch("argparse.ArgumentParser.parse_args") as mock_args,
+            patch("uvicorn.Config.bind_socket"),
+            patch("uvicorn.Server"),
+        ):
+            mock_args.return_value = MagicMock(
+                agents_dir=None, host=None, port=None, terminal=None, uds=str(target)
+            )
+
+            from cli_agent_orchestrator.api.main import main
+
+            with pytest.raises(FileExistsError):
+                main()
+
+        assert target.read_text() == "keep me"
@@ -258,6 +258,7 @@ def test_auth_disabled_returns_200(client, monkeypatch, url):
             resp = client.get(url)
     else:
         with patch("cli_agent_orchestrator.api.main.terminal_service") as svc:
+            svc.output_cursor.return_value = "g.0"
             svc.get_output.return_value = "hello"
             resp = client.get(url)
     assert resp.status_code == 200
@@ -185,6 +185,9 @@ _GATED_RUN_READ_ROUTES = [
     "/workflows/runs/{run_id}/compare",
     "/workflows/runs/{run_id}/diagnostics",
     "/terminals/{terminal_id}/output/range",
+    "/terminals/{terminal_id}/output/raw",
+    # Snippets are terminal output, so the search route joins its range sibling.
+    "/search/terminal-output",
 ]
 
 
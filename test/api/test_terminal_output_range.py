@@ -17,7 +17,10 @@ import pytest
 from cli_agent_orchestrator.services import terminal_service
 from cli_agent_orchestrator.services.terminal_service import (
     TERMINAL_RANGE_MAX_LENGTH,
+    OutputCursorError,
+    output_cursor,
     read_output_range,
+    read_output_since,
 )
 
 # A valid 8-char-hex terminal id (matches the route's TerminalId pattern AND the
@@ -37,6 +40,16 @@ def log_dir(monkeypatch, tmp_path):
     return d
 
 
+@pytest.fixture
+def known_terminal():
+    """Make ``TID`` an existing terminal for the ``since`` reads."""
+    with patch(
+        "cli_agent_orchestrator.services.terminal_service.get_terminal_metadata",
+        side_effect=lambda terminal_id: {"id": TID} if terminal_id == TID else None,
+    ):
+        yield
+
+
 def _write_log(log_dir, terminal_id: str, data: bytes) -> None:
     (log_dir / f"{terminal_id}.log").write_bytes(data)
 
@@ -126,13 +139,85 @@ class TestReadOutputRange:
         # Simulate a real read failure (permission, etc.): open() raises PermissionError
         # (an OSError subclass), which must propagate, NOT collapse to "".
         with patch(
-            "cli_agent_orchestrator.services.terminal_service.open",
+            "cli_agent_orchestrator.services.terminal_log_store.open",
             side_effect=PermissionError("denied"),
             create=True,
         ):
             with pytest.raises(OSError):
                 read_output_range(TID, offset=0, length=4)
 
+    def test_range_spans_sealed_segments(self, log_dir, monkeypatch):
+        """Logical offsets survive rotation: a range across the sealed/live
+        boundary returns the same bytes the single-file log would have."""
+        from cli_agent_orchestrator.services.terminal_log_store import TerminalLogStore
+
+        store = TerminalLogStore(segment_bytes=8, frame_bytes=4)
+        monkeypatch.setattr(terminal_service, "terminal_log_store", store)
+        for chunk in (b"01234567", b"89abcdef", b"ghij"):
+            store.append(log_dir, TID, chunk)
+        store.close_all()
+
+        assert read_output_range(TID, offset=6, length=8) == "6789abcd"
+        assert read_output_range(TID, offset=14, length=100) == "efghij"
+
+
+# ---------------------------------------------------------------------------
+# read_output_since — cursor-based incremental reads
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.usefixtures("known_terminal")
+class TestReadOutputSince:
+    def test_returns_only_bytes_logged_after_the_cursor(self, log_dir):
+        _write_log(log_dir, TID, b"first ")
+        cursor = output_cursor(TID)
+        _write_log(log_dir, TID, b"first second")
+
+        result = read_output_since(TID, cursor)
+
+        assert (result.output, result.truncated, result.reset) == ("second", False, False)
+        again = read_output_since(TID, result.cursor)
+        assert (again.output, again.cursor) == ("", result.cursor)
+
+    def test_max_chars_keeps_the_tail_and_flags_truncation(self, log_dir):
+        _write_log(log_dir, TID, b"")
+        cursor = output_cursor(TID)
+        _write_log(log_dir, TID, "abc\u00e9\u00e9xyz".encode())
+
+        result = read_output_since(TID, cursor, max_chars=4)
+
+        assert result.output == "\u00e9xyz"
+        assert result.truncated is True
+        assert result.cursor == read_output_since(TID, cursor).cursor
+
+    def test_cursor_from_a_previous_log_resets_to_the_start(self, log_dir):
+        _write_log(log_dir, TID, b"old output")
+        cursor = output_cursor(TID)
+        terminal_service.terminal_log_store.remove(log_dir, TID)
+        _write_log(log_dir, TID, b"new")
+
+        result = read_output_since(TID, cursor)
+
+        assert (result.output, result.reset) == ("new", True)
+
+    def test_unlogged_terminal_returns_empty_with_a_cursor(self, log_dir):
+        result = read_output_since(TID, output_cursor(TID))
+
+        assert (result.output, result.reset) == ("", False)
+        _write_log(log_dir, TID, b"later")
+        assert read_output_since(TID, result.cursor).output == "later"
+
+    @pytest.mark.parametrize("cursor", ["", "nodot", "g.zz", "g.-1", ".10"])
+    def test_malformed_cursor_raises(self, log_dir, cursor):
+        with pytest.raises(OutputCursorError):
+            read_output_since(TID, cursor)
+
+    def test_unknown_terminal_raises_not_found(self, log_dir):
+        cursor = output_cursor("deadbeef")
+
+        with pytest.raises(ValueError, match="not found"):
+            read_output_since("deadbeef", cursor)
+
 
 # ---------------------------------------------------------------------------
 # GET /terminals/{terminal_id}/output/range — route
@@ -199,3 +284,139 @@ class TestOutputRangeRoute:
 
         assert resp.status_code == 500
         assert "Failed to read output range" in resp.json()["detail"]
+
+
+# ---------------------------------------------------------------------------
+# GET /terminals/{terminal_id}/output — since / max_chars
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.usefixtures("known_terminal")
+class TestIncrementalOutputRoute:
+    def test_full_read_returns_a_cursor_that_since_continues_from(self, client, log_dir):
+        _write_log(log_dir, TID, b"boot\n")
+        with patch(
+            "cli_agent_orchestrator.api.main.terminal_service.get_output",
+            return_value="boot\n",
+        ):
+            first = client.get(f"/terminals/{TID}/output", params={"mode": "full"}).json()
+        _write_log(log_dir, TID, b"boot\nstep 1\n")
+
+        resp = client.get(
+            f"/terminals/{TID}/output", params={"mode": "full", "since": first["cursor"]}
+        )
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["output"], body["reset"], body["truncated"]) == ("step 1\n", False, False)
+        assert body["cursor"] != first["cursor"]
+
+    def test_max_chars_tails_the_buffer_on_the_server(self, client, log_dir):
+        with patch(
+            "cli_agent_orchestrator.api.main.terminal_service.get_output",
+            return_value="0123456789",
+        ):
+            resp = client.get(f"/terminals/{TID}/output", params={"max_chars": 4})
+
+        body = resp.json()
+        assert (body["output"], body["truncated"], body["total_chars"]) == ("6789", True, 10)
+
+    def test_since_with_last_mode_is_400(self, client, log_dir):
+        resp = client.get(f"/terminals/{TID}/output", params={"mode": "last", "since": "g.0"})
+        assert resp.status_code == 400
+
+    def test_malformed_cursor_is_400(self, client, log_dir):
+        resp = client.get(f"/terminals/{TID}/output", params={"since": "garbage"})
+        assert resp.status_code == 400
+
+    def test_since_for_a_deleted_terminal_is_404(self, client, log_dir):
+        resp = client.get("/terminals/deadbeef/output", params={"since": "g.0"})
+        assert resp.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# GET /terminals/{terminal_id}/output/raw — streamed bytes with HTTP Range
+# ---------------------------------------------------------------------------
+
+
+class TestRawOutputRoute:
+    def test_full_log_streams_as_octet_stream(self, client, log_dir):
+        _write_log(log_dir, TID, b"\xff\x00raw bytes")
+
+        resp = client.get(f"/terminals/{TID}/output/raw")
+
+        assert resp.status_code == 200
+        assert resp.content == b"\xff\x00raw bytes"
+        assert resp.headers["content-type"] == "application/octet-stream"
+        assert resp.headers["accept-ranges"] == "bytes"
+        assert resp.headers["content-length"] == "11"
+
+    def test_range_returns_206_with_content_range(self, client, log_dir):
+        _write_log(log_dir, TID, b"0123456789")
+
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"Range": "bytes=3-6"})
+
+        assert resp.status_code == 206
+        assert resp.content == b"3456"
+        assert resp.headers["content-range"] == "bytes 3-6/10"
+
+    def test_suffix_range(self, client, log_dir):
+        _write_log(log_dir, TID, b"0123456789")
+
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"Range": "bytes=-3"})
+
+        assert resp.status_code == 206
+        assert resp.content == b"789"
+
+    def test_range_past_end_is_416(self, client, log_dir):
+        _write_log(log_dir, TID, b"tiny")
+
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"Range": "bytes=10-"})
+
+        assert resp.status_code == 416
+        assert resp.headers["content-range"] == "bytes */4"
+
+    def test_matching_etag_is_304_until_the_log_grows(self, client, log_dir):
+        _write_log(log_dir, TID, b"first")
+        etag = client.get(f"/terminals/{TID}/output/raw").headers["etag"]
+
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        with open(log_dir / f"{TID}.log", "ab") as f:
+            f.write(b" more")
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
+    def test_etag_changes_when_the_log_is_recreated_at_the_same_size(self, client, log_dir):
+        _write_log(log_dir, TID, b"first")
+        etag = client.get(f"/terminals/{TID}/output/raw").headers["etag"]
+
+        terminal_service.terminal_log_store.remove(log_dir, TID)
+        _write_log(log_dir, TID, b"again")
+        resp = client.get(f"/terminals/{TID}/output/raw", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 200
+        assert resp.content == b"again"
+
+    def test_stale_if_range_sends_the_whole_log(self, client, log_dir):
+        _write_log(log_dir, TID, b"0123456789")
+
+        resp = client.get(
+            f"/terminals/{TID}/output/raw",
+            headers={"Range": "bytes=0-1", "If-Range": '"stale"'},
+        )
+
+        assert resp.status_code == 200
+        assert resp.content == b"0123456789"
+
+    def test_unlogged_terminal_returns_200_empty(self, client, log_dir):
+        resp = client.get(f"/terminals/{TID}/output/raw")
+
+        assert resp.status_code == 200
+        assert resp.content == b""
+
+    def test_malformed_terminal_id_is_422(self, client, log_dir):
+        resp = client.get("/terminals/not-a-valid-id/output/raw")
+        assert resp.status_code == 422
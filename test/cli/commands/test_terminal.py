@@ -350,3 +350,59 @@ class TestRestoreCommand:
         call_kwargs = mock_tmux.create_window.call_args[1]
         assert call_kwargs["window_shell"].startswith("exec ")
         assert call_kwargs["window_shell"].endswith(" -l")
+
+
+# ---------------------------------------------------------------------------
+# Search command tests
+# ---------------------------------------------------------------------------
+
+
+class TestTerminalSearch:
+    def test_search_prints_hits_with_offsets(self, runner):
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.json.return_value = [
+            {
+                "terminal_id": "abc12345",
+                "source": "log",
+                "offset": 4096,
+                "snippet": "Traceback (most recent call last)",
+                "logged_at": None,
+            }
+        ]
+
+        with patch(
+            "cli_agent_orchestrator.cli.commands.terminal.requests.get", return_value=mock_resp
+        ) as mock_get:
+            result = runner.invoke(terminal, ["search", "Traceback", "--terminal", "abc12345"])
+
+        assert result.exit_code == 0
+        assert "abc12345  log@4096  Traceback (most recent call last)" in result.output
+        assert mock_get.call_args[1]["params"] == {
+            "q": "Traceback",
+            "limit": 50,
+            "terminal_id": "abc12345",
+        }
+
+    def test_search_reports_no_matches(self, runner):
+        mock_resp = MagicMock(status_code=200)
+        mock_resp.json.return_value = []
+
+        with patch(
+            "cli_agent_orchestrator.cli.commands.terminal.requests.get", return_value=mock_resp
+        ):
+            result = runner.invoke(terminal, ["search", "nothing"])
+
+        assert result.exit_code == 0
+        assert "No matches." in result.output
+
+    def test_search_surfaces_server_errors(self, runner):
+        mock_resp = MagicMock(status_code=400)
+        mock_resp.json.return_value = {"detail": "query must contain at least one letter or digit"}
+
+        with patch(
+            "cli_agent_orchestrator.cli.commands.terminal.requests.get", return_value=mock_resp
+        ):
+            result = runner.invoke(terminal, ["search", "::"])
+
+        assert result.exit_code != 0
+        assert "at least one letter" in result.output
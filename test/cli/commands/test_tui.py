@@ -19,6 +19,7 @@ import os
 import subprocess
 from pathlib import Path
 
+import click
 from click.testing import CliRunner
 
 from cli_agent_orchestrator.cli import main as cli_main
@@ -32,8 +33,8 @@ class TestTuiCommandRegistered:
 
     def test_tui_is_registered_on_the_cli_group(self):
         """`cao tui` must be reachable from the top-level group, not just importable."""
-        assert "tui" in cli.commands
-        assert cli.commands["tui"] is cli_main.tui
+        assert "tui" in cli_main.LAZY_COMMANDS
+        assert cli.get_command(click.Context(cli), "tui") is tui
 
     def test_tui_help_exits_zero(self):
         """`cao tui --help` works. This command did not exist before issue #321."""
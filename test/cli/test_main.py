@@ -3,6 +3,8 @@
 import importlib
 from importlib.metadata import PackageNotFoundError, version
 
+import click
+import pytest
 from click.testing import CliRunner
 
 from cli_agent_orchestrator.cli.main import cli
@@ -138,3 +140,53 @@ class TestCliMain:
             assert result.exit_code == 0
 
         importlib.reload(main_module)  # patch is undone here — real version restored
+
+
+class TestLazyCommandLoading:
+    """Tests for the lazily-imported command registry."""
+
+    def test_every_lazy_command_resolves_to_click_command(self):
+        """Each registry entry imports to the Click command of the same name."""
+        main_module = importlib.import_module("cli_agent_orchestrator.cli.main")
+        ctx = click.Context(main_module.cli)
+        for name in main_module.LAZY_COMMANDS:
+            command = main_module.cli.get_command(ctx, name)
+            assert isinstance(command, click.Command), name
+            assert command.name == name
+
+    def test_static_summaries_match_command_help(self):
+        """`cao --help` summaries are static; they must not drift from the docstrings."""
+        main_module = importlib.import_module("cli_agent_orchestrator.cli.main")
+        ctx = click.Context(main_module.cli)
+        for name, entry in main_module.LAZY_COMMANDS.items():
+            command = main_module.cli.get_command(ctx, name)
+            assert command.get_short_help_str(limit=1000) == entry.summary, name
+            assert command.hidden == entry.hidden, name
+
+    def test_help_lists_commands_without_importing_them(self):
+        """Top-level help renders every visible command from the registry alone."""
+        main_module = importlib.import_module("cli_agent_orchestrator.cli.main")
+        group = main_module.LazyGroup(
+            name="cao", lazy_commands=dict(main_module.LAZY_COMMANDS), callback=lambda: None
+        )
+
+        result = CliRunner().invoke(group, ["--help"])
+
+        assert result.exit_code == 0
+        assert group.commands == {}
+        assert "terminal" in result.output
+        assert "Manage CAO terminals." in result.output
+        assert "  flow " not in result.output
+
+    def test_unknown_lazy_target_is_reported(self):
+        """A registry entry pointing at a non-command fails loudly, not as a silent no-op."""
+        main_module = importlib.import_module("cli_agent_orchestrator.cli.main")
+        group = main_module.LazyGroup(
+            name="cao",
+            lazy_commands={
+                "bogus": main_module.LazyCommand("cli_agent_orchestrator.cli.main:__version__", "x")
+            },
+        )
+
+        with pytest.raises(TypeError, match="bogus"):
+            group.get_command(click.Context(group), "bogus")
@@ -0,0 +1,93 @@
+"""Cold-start budget for the most frequently invoked ``cao`` commands.
+
+Agents and scripts shell out to ``cao`` constantly, so start-up cost is paid on
+every call. ``cli/main.py`` resolves subcommand modules lazily; these tests run
+``python -X importtime`` in a fresh interpreter and guard two things:
+
+1. the heavy server-side stacks (FastAPI, SQLAlchemy, FastMCP, libtmux,
+   frontmatter, jsonschema) never load for the commands below, which is the
+   deterministic regression signal; and
+2. total import time stays within a budget, which catches a new eager import
+   the module list does not name.
+
+Wall-clock import time swings by an order of magnitude between an idle laptop
+and a loaded ``pytest -n auto`` runner, so budgets are expressed relative to
+a reference interpreter that imports only ``click`` and ``requests`` (the
+floor every HTTP-backed command pays). Measured ratios are ~0.7 for the bare
+group and ~2.5 for ``terminal``/``session``; budgets leave headroom above
+that. The minimum of a few runs is compared on both sides.
+"""
+
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import pytest
+
+HEAVY_MODULES = frozenset(
+    {"fastapi", "sqlalchemy", "fastmcp", "mcp", "libtmux", "frontmatter", "jsonschema"}
+)
+
+REFERENCE_SCRIPT = "import click, requests\n"
+
+# command path -> import-time budget as a multiple of the reference interpreter
+COMMON_COMMANDS: Dict[Tuple[str, ...], float] = {
+    (): 1.5,  # `cao --version` / `cao --help`
+    ("terminal",): 5.0,
+    ("session",): 5.0,
+    ("info",): 3.0,
+    ("shutdown",): 3.0,
+}
+
+RUNS = 3
+
+
+def _command_script(command_path: Tuple[str, ...]) -> str:
+    return (
+        "import click\n"
+        "from cli_agent_orchestrator.cli.main import cli\n"
+        "cmd = cli\n"
+        f"for name in {list(command_path)!r}:\n"
+        "    cmd = cmd.get_command(click.Context(cmd), name)\n"
+    )
+
+
+def _import_profile(script: str) -> Tuple[int, set]:
+    """Return (total import µs, top-level package names) for running ``script``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    total_us = 0
+    packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|", 2)
+        total_us += int(self_us)
+        packages.add(name.strip().split(".", 1)[0])
+    return total_us, packages
+
+
+@pytest.mark.parametrize(
+    "command_path", list(COMMON_COMMANDS), ids=lambda p: " ".join(("cao",) + p)
+)
+def test_common_command_cold_start(command_path):
+    """Resolving a common command stays off the heavy stacks and within budget."""
+    reference_us = []
+    command_us = []
+    loaded: set = set()
+    for _ in range(RUNS):
+        reference_us.append(_import_profile(REFERENCE_SCRIPT)[0])
+        total, loaded = _import_profile(_command_script(command_path))
+        command_us.append(total)
+
+    assert not (loaded & HEAVY_MODULES), sorted(loaded & HEAVY_MODULES)
+    ratio = min(command_us) / max(min(reference_us), 1)
+    assert ratio <= COMMON_COMMANDS[command_path], (
+        f"cao {' '.join(command_path)} imports took {min(command_us) / 1000:.1f}ms, "
+        f"{ratio:.2f}x the click+requests reference (budget {COMMON_COMMANDS[command_path]}x)"
+    )
@@ -0,0 +1,187 @@
+"""Tests for the pooled API client (clients/api_client.py)."""
+
+import json
+import os
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests as real_requests
+
+from cli_agent_orchestrator.clients import api_client
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # One handler instance serves one connection for its whole keep-alive life.
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        if self.path == "/set-cookie":
+            self._reply(200, {"ok": True}, extra_headers={"Set-Cookie": "sid=abc; Path=/"})
+        elif self.path == "/missing":
+            self._reply(404, {"detail": "not found"})
+        else:
+            self._reply(
+                200,
+                {
+                    "path": self.path,
+                    "cookie": self.headers.get("Cookie"),
+                    "host": self.headers["Host"],
+                },
+            )
+
+    def _reply(self, status, payload, extra_headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (extra_headers or {}).items():
+            self.send_header(key, value)
+        # Queue the body behind the buffered headers so each response is one
+        # write (split writes on keep-alive stall on Nagle + delayed ACK).
+        self._headers_buffer.append(b"\r\n" + body)
+        self.flush_headers()
+
+    def address_string(self):
+        return "local"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def _start(server):
+    server.connections = 0
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+@pytest.fixture
+def tcp_server():
+    server = _start(ThreadingHTTPServer(("127.0.0.1", 0), _Handler))
+    server.daemon_threads = True
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    api_client.close_session()
+    yield
+    api_client.close_session()
+
+
+class TestPooledSession:
+    def test_sequential_calls_reuse_one_connection(self, tcp_server):
+        """Keep-alive: many calls from one process share a single TCP connection."""
+        base = f"http://127.0.0.1:{tcp_server.server_address[1]}"
+
+        for i in range(20):
+            response = api_client.get(f"{base}/terminals/t{i}", timeout=5)
+            assert response.json()["path"] == f"/terminals/t{i}"
+
+        assert tcp_server.connections == 1
+
+    def test_session_is_shared_and_rebuilt_after_close(self):
+        first = api_client.get_session()
+        assert api_client.get_session() is first
+
+        api_client.close_session()
+
+        assert api_client.get_session() is not first
+
+    def test_reset_after_fork_drops_parent_session(self):
+        parent = api_client.get_session()
+
+        api_client._reset_after_fork()
+
+        assert api_client.get_session() is not parent
+
+    def test_cookies_are_not_carried_between_calls(self, tcp_server):
+        """Like one-shot requests.get(), the shared session never replays cookies."""
+        base = f"http://127.0.0.1:{tcp_server.server_address[1]}"
+
+        api_client.get(f"{base}/set-cookie", timeout=5)
+        response = api_client.get(f"{base}/echo", timeout=5)
+
+        assert response.json()["cookie"] is None
+
+    def test_facade_exposes_requests_exceptions(self, tcp_server):
+        """Call sites catch api_client.HTTPError etc. exactly as they did requests.*."""
+        base = f"http://127.0.0.1:{tcp_server.server_address[1]}"
+
+        with pytest.raises(api_client.HTTPError):
+            api_client.get(f"{base}/missing", timeout=5).raise_for_status()
+
+        assert api_client.RequestException is real_requests.RequestException
+        assert api_client.ConnectionError is real_requests.ConnectionError
+        assert api_client.exceptions is real_requests.exceptions
+
+    @pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete"])
+    def test_verb_helpers_delegate_to_session(self, method):
+        with patch.object(api_client, "get_session") as mock_session:
+            getattr(api_client, method)("http://x/y", timeout=1)
+
+        getattr(mock_session.return_value, method).assert_called_once_with("http://x/y", timeout=1)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Unix domain sockets are POSIX-only")
+class TestUnixSocketTransport:
+    @pytest.fixture
+    def unix_server(self, tmp_path):
+        path = str(tmp_path / "cao.sock")
+        server = _start(_UnixHTTPServer(path, _Handler))
+        yield server, path
+        server.shutdown()
+        server.server_close()
+
+    def test_api_base_url_routes_over_socket(self, unix_server):
+        """With CAO_API_SOCKET set, API_BASE_URL requests travel over the Unix socket."""
+        server, path = unix_server
+        with (
+            patch.object(api_client, "API_SOCKET_PATH", path),
+            patch.object(api_client, "API_BASE_URL", "http://localhost:9889"),
+        ):
+            api_client.close_session()
+            for _ in range(5):
+                response = api_client.get("http://localhost:9889/terminals/abc", timeout=5)
+
+        payload = response.json()
+        assert payload["path"] == "/terminals/abc"
+        # The URL is unchanged, so the Host header the server validates is too.
+        assert payload["host"] == "localhost:9889"
+        assert server.connections == 1
+
+    def test_missing_socket_falls_back_to_tcp(self, tmp_path):
+        with patch.object(api_client, "API_SOCKET_PATH", str(tmp_path / "absent.sock")):
+            session = api_client._build_session()
+
+        assert not any(
+            isinstance(adapter, api_client.UnixSocketAdapter)
+            for adapter in session.adapters.values()
+        )
+
+    def test_connection_error_when_server_is_gone(self, tmp_path):
+        path = str(tmp_path / "gone.sock")
+        server = _UnixHTTPServer(path, _Handler)
+        server.server_close()
+        with (
+            patch.object(api_client, "API_SOCKET_PATH", path),
+            patch.object(api_client, "API_BASE_URL", "http://localhost:9889"),
+        ):
+            api_client.close_session()
+            with pytest.raises(api_client.ConnectionError):
+                api_client.get("http://localhost:9889/health", timeout=1)
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
+from cli_agent_orchestrator.constants import TMUX_HISTORY_LINES
+
 
 @pytest.fixture
 def tmux():
@@ -742,6 +744,106 @@ class TestGetPaneCurrentCommand:
         assert result is None
 
 
+class TestGetPanePid:
+    def test_get_pane_pid_reads_listing_without_display_message(self, tmux):
+        mock_session = MagicMock()
+        mock_window = MagicMock()
+        mock_pane = MagicMock()
+        mock_pane.pane_pid = "4242"
+        mock_window.active_pane = mock_pane
+        mock_session.windows.get.return_value = mock_window
+        tmux.server.sessions.get.return_value = mock_session
+
+        assert tmux.get_pane_pid("ses", "win") == 4242
+        mock_pane.cmd.assert_not_called()
+
+    def test_get_pane_pid_session_not_found(self, tmux):
+        tmux.server.sessions.get.return_value = None
+
+        assert tmux.get_pane_pid("nonexistent", "win") is None
+
+    def test_get_pane_pid_exception_returns_none(self, tmux):
+        tmux.server.sessions.get.side_effect = Exception("tmux error")
+
+        assert tmux.get_pane_pid("ses", "win") is None
+
+
+# Split window w1: its first pane is %1 even though %2 may be active.
+PANES = "ses:w1:%1\nses:w1:%2\nses:w2:%3\nses:w3:%4\nother:w1:%5\n"
+
+
+def _tmux_run(capture_returncode, capture_stdout):
+    def run(args, **kwargs):
+        if "list-panes" in args:
+            return MagicMock(returncode=0, stdout=PANES)
+        marker = args[args.index("display-message") + 2]
+        return MagicMock(returncode=capture_returncode, stdout=capture_stdout(marker))
+
+    return run
+
+
+class TestGetHistories:
+    @patch("cli_agent_orchestrator.clients.tmux.subprocess")
+    def test_captures_all_windows_in_one_invocation(self, mock_subprocess, tmux):
+        mock_subprocess.run.side_effect = _tmux_run(
+            0, lambda marker: f"a1\na2\n\n\n{marker}\nb1\n{marker}\n"
+        )
+
+        result = tmux.get_histories([("ses", "w1"), ("ses", "w2")], tail_lines=5)
+
+        assert result == {("ses", "w1"): "a1\na2", ("ses", "w2"): "b1"}
+        # One pane listing plus one chained capture, however many windows.
+        assert mock_subprocess.run.call_count == 2
+        args = mock_subprocess.run.call_args[0][0]
+        assert args.count("capture-pane") == 2
+        assert "-5" in args
+        tmux.server.sessions.get.assert_not_called()
+
+    @patch("cli_agent_orchestrator.clients.tmux.subprocess")
+    def test_captures_the_first_pane_like_get_history(self, mock_subprocess, tmux):
+        """Split windows are captured at the pane get_history reads
+        (Window.panes[0]), not at tmux's default target, the active pane."""
+        mock_subprocess.run.side_effect = _tmux_run(0, lambda marker: f"a1\n{marker}\n")
+
+        tmux.get_histories([("ses", "w1")])
+
+        args = mock_subprocess.run.call_args[0][0]
+        assert args[args.index("-t") + 1] == "%1"
+
+    @patch("cli_agent_orchestrator.clients.tmux.subprocess")
+    def test_unlisted_window_is_read_through_get_history(self, mock_subprocess, tmux):
+        mock_subprocess.run.side_effect = _tmux_run(0, lambda marker: f"a1\n{marker}\n")
+
+        with patch.object(tmux, "get_history", return_value="new") as mock_history:
+            result = tmux.get_histories([("ses", "w1"), ("ses", "late")])
+
+        assert result == {("ses", "w1"): "a1", ("ses", "late"): "new"}
+        mock_history.assert_called_once_with("ses", "late", tail_lines=TMUX_HISTORY_LINES)
+
+    @patch("cli_agent_orchestrator.clients.tmux.subprocess")
+    def test_failed_chain_falls_back_per_window(self, mock_subprocess, tmux):
+        """tmux aborts the chain at a window closed since the listing;
+        uncaptured windows are retried through get_history, and gone ones are
+        omitted."""
+        mock_subprocess.run.side_effect = _tmux_run(1, lambda marker: f"a1\n{marker}\n")
+
+        def history(session_name, window_name, tail_lines=None):
+            if window_name == "gone":
+                raise ValueError("Window 'gone' not found")
+            return "c1"
+
+        with patch.object(tmux, "get_history", side_effect=history) as mock_history:
+            result = tmux.get_histories([("ses", "w1"), ("ses", "gone"), ("ses", "w3")])
+
+        assert result == {("ses", "w1"): "a1", ("ses", "w3"): "c1"}
+        assert mock_history.call_count == 2
+
+    @patch("cli_agent_orchestrator.clients.tmux.subprocess")
+    def test_empty_targets_run_nothing(self, mock_subprocess, tmux):
+        assert tmux.get_histories([]) == {}
+        mock_subprocess.run.assert_not_called()
+
+
 class TestPaneIsBracketedPasteIncompatible:
     @pytest.mark.parametrize(
         "shell", ["sh", "dash", "bash", "zsh", "ksh", "mksh", "csh", "tcsh", "fish", "ash"]
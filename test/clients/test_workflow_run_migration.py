@@ -27,6 +27,7 @@ from pathlib import Path
 import pytest
 
 from cli_agent_orchestrator.clients.database import (
+    _enable_incremental_auto_vacuum,
     _migrate_workflow_run,
     _migrate_workflow_run_event,
     _migrate_workflow_run_indexes,
@@ -279,3 +280,18 @@ def test_workflow_run_indexes_failure_is_logged_not_raised(
     monkeypatch.setattr(sqlite3, "connect", _boom, raising=True)
     # Must return without raising.
     _migrate_workflow_run_indexes()
+
+
+def test_fresh_database_gets_incremental_auto_vacuum(patched_db):
+    """A new file is created INCREMENTAL so the retention sweep can reclaim pages."""
+    _enable_incremental_auto_vacuum()
+    _migrate_workflow_run()
+    with sqlite3.connect(str(patched_db)) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_existing_database_keeps_its_auto_vacuum_mode(patched_db):
+    _migrate_workflow_run()
+    _enable_incremental_auto_vacuum()
+    with sqlite3.connect(str(patched_db)) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
@@ -0,0 +1,92 @@
+"""Start-up time and RSS budget for one ``cao-mcp-server`` process.
+
+Every provider CLI launches its own ``cao-mcp-server``, so a 30-worker team pays
+for 30 cold starts. Loading ``mcp_server.server`` (module import, FastMCP
+construction, tool registration and ``cao.plugins`` surface discovery) must stay
+close to the floor set by FastMCP itself:
+
+- the server-side stacks that only ``cao-server`` needs (FastAPI, SQLAlchemy,
+  libtmux, BM25, APScheduler) must never load; and
+- CPU time and peak RSS are compared with a reference interpreter that imports
+  only ``fastmcp`` and ``requests``. CPU rather than wall time keeps the ratio
+  stable when ``pytest -n auto`` saturates the runner. Measured on Linux the server adds ~0.1s and
+  ~5MB over that floor; before the import graph was split it added ~1.5s and
+  ~40MB. Budgets leave headroom for noisy CI runners.
+
+Each side runs in a fresh interpreter a few times and the minimum is compared.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = frozenset({"fastapi", "sqlalchemy", "libtmux", "rank_bm25", "apscheduler"})
+
+REFERENCE_IMPORT = "from fastmcp import FastMCP; import requests"
+SERVER_IMPORT = "import cli_agent_orchestrator.mcp_server.server"
+
+MAX_TIME_RATIO = 1.5
+MAX_EXTRA_RSS_MB = 25
+RUNS = 3
+
+_PROBE = """
+import json, resource, sys, time
+start = time.process_time()
+{statement}
+elapsed = time.process_time() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is KiB on Linux and bytes on macOS.
+rss_mb = rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+print(json.dumps({{"elapsed": elapsed, "rss_mb": rss_mb,
+                  "modules": sorted({{m.split(".")[0] for m in sys.modules}})}}))
+"""
+
+
+def _probe(statement: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        check=True,
+        env={**os.environ, "CAO_MCP_APPS_ENABLED": "false"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def samples():
+    reference = []
+    server = []
+    for _ in range(RUNS):
+        reference.append(_probe(REFERENCE_IMPORT))
+        server.append(_probe(SERVER_IMPORT))
+    return reference, server
+
+
+def test_mcp_server_skips_cao_server_stacks(samples):
+    """Loading the MCP server never imports the API server's heavy dependencies."""
+    _, server = samples
+    loaded = set(server[0]["modules"])
+
+    assert not (loaded & HEAVY_MODULES), sorted(loaded & HEAVY_MODULES)
+
+
+def test_mcp_server_start_up_time_budget(samples):
+    """Server start-up stays within MAX_TIME_RATIO of the bare FastMCP import."""
+    reference, server = samples
+    ratio = min(s["elapsed"] for s in server) / min(r["elapsed"] for r in reference)
+
+    assert ratio <= MAX_TIME_RATIO, f"cao-mcp-server start-up is {ratio:.2f}x the FastMCP floor"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="resource module is POSIX-only")
+def test_mcp_server_rss_budget(samples):
+    """Server start-up adds at most MAX_EXTRA_RSS_MB over the bare FastMCP import."""
+    reference, server = samples
+    extra = min(s["rss_mb"] for s in server) - min(r["rss_mb"] for r in reference)
+
+    assert extra <= MAX_EXTRA_RSS_MB, f"cao-mcp-server adds {extra:.1f}MB RSS over FastMCP"
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from cli_agent_orchestrator.ops_mcp_server import server as ops_server
 from cli_agent_orchestrator.ops_mcp_server.server import (
     _read_session_output_impl,
     read_session_output,
@@ -271,3 +272,61 @@ async def test_read_session_output_tool_delegates_to_impl() -> None:
     assert result["success"] is True
     assert result["output"] == "data"
     assert result["total_chars"] == 4
+
+
+class TestIncrementalReads:
+    """Repeated full reads continue from the cursor the server returned."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cursors(self):
+        ops_server._output_cursors.clear()
+        yield
+        ops_server._output_cursors.clear()
+
+    def test_second_full_read_passes_the_remembered_cursor(self) -> None:
+        responses = [
+            _response(json_data={"output": "boot\n", "mode": "full", "cursor": "g.5"}),
+            _response(json_data={"output": "step\n", "mode": "full", "cursor": "g.a"}),
+        ]
+        with patch(REQUEST, side_effect=responses) as mock_request:
+            first = _read_session_output_impl("term-1", None, "full", 100)
+            second = _read_session_output_impl("term-1", None, "full", 100)
+
+        assert mock_request.call_args_list[0].kwargs["params"] == {"mode": "full", "max_chars": 100}
+        assert mock_request.call_args_list[1].kwargs["params"] == {
+            "mode": "full",
+            "max_chars": 100,
+            "since": "g.5",
+        }
+        assert first["incremental"] is False
+        assert (second["output"], second["incremental"]) == ("step\n", True)
+        assert ops_server._output_cursors["term-1"] == "g.a"
+
+    def test_new_output_only_false_rereads_the_whole_buffer(self) -> None:
+        ops_server._output_cursors["term-1"] = "g.5"
+        with patch(
+            REQUEST,
+            return_value=_response(json_data={"output": "all", "mode": "full", "cursor": "g.9"}),
+        ) as mock_request:
+            _read_session_output_impl("term-1", None, "full", None, new_output_only=False)
+
+        assert mock_request.call_args.kwargs["params"] == {"mode": "full"}
+
+    def test_last_mode_neither_uses_nor_advances_the_cursor(self) -> None:
+        ops_server._output_cursors["term-1"] = "g.5"
+        with patch(
+            REQUEST,
+            return_value=_response(json_data={"output": "done", "mode": "last", "cursor": "g.9"}),
+        ) as mock_request:
+            _read_session_output_impl("term-1", None, "last", None)
+
+        assert mock_request.call_args.kwargs["params"] == {"mode": "last"}
+        assert ops_server._output_cursors["term-1"] == "g.5"
+
+    def test_server_reset_is_not_reported_as_incremental(self) -> None:
+        ops_server._output_cursors["term-1"] = "old.5"
+        payload = {"output": "fresh", "mode": "full", "cursor": "new.5", "reset": True}
+        with patch(REQUEST, return_value=_response(json_data=payload)):
+            result = _read_session_output_impl("term-1", None, "full", None)
+
+        assert result["incremental"] is False
@@ -30,7 +30,7 @@ async def test_ignores_non_claude_code_providers(
 
     called: list[str] = []
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: called.append(terminal_id) or None,
     )
 
@@ -49,7 +49,7 @@ async def test_writes_memory_block_on_post_create_terminal(
     """On a claude_code terminal, the plugin should write the memory block."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -68,7 +68,7 @@ async def test_writes_memory_block_on_post_create_terminal(
             return "<cao-memory>\n## Context\n- stan prefers pytest\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -101,7 +101,7 @@ async def test_replaces_existing_memory_block_on_rerun(
     )
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -120,7 +120,7 @@ async def test_replaces_existing_memory_block_on_rerun(
             return "<cao-memory>NEW</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -142,7 +142,7 @@ async def test_skips_write_when_memory_context_empty(
     """Empty memory context must NOT create or modify CLAUDE.md."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -156,7 +156,7 @@ async def test_skips_write_when_memory_context_empty(
         )(),
     )
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type("F", (), {"get_memory_context_for_terminal": lambda self, t: ""})(),
     )
 
@@ -177,7 +177,7 @@ async def test_disabled_memory_writes_nothing(
     """
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -211,7 +211,7 @@ async def test_memory_fetch_failure_is_logged_not_raised(
     """Memory-service exceptions must be caught and logged."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -230,7 +230,7 @@ async def test_memory_fetch_failure_is_logged_not_raised(
             raise RuntimeError("db on fire")
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: ExplodingMemoryService(),
     )
 
@@ -251,7 +251,7 @@ async def test_missing_terminal_metadata_short_circuits(
     """No metadata → no write, no crash."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: None,
     )
 
@@ -259,9 +259,7 @@ async def test_missing_terminal_metadata_short_circuits(
     def _boom(*args, **kwargs):
         raise AssertionError("MemoryService must not be constructed when metadata missing")
 
-    monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService", _boom
-    )
+    monkeypatch.setattr("cli_agent_orchestrator.services.memory_service.MemoryService", _boom)
 
     plugin = ClaudeCodeMemoryPlugin()
     await plugin.on_post_create_terminal(_event())
@@ -290,7 +288,7 @@ async def test_path_containment_guard_rejects_escape(
     (real_cwd / ".claude").symlink_to(sibling, target_is_directory=True)
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -309,7 +307,7 @@ async def test_path_containment_guard_rejects_escape(
             return "<cao-memory>NEW</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -358,7 +356,7 @@ async def test_missing_working_dir_does_not_escape_handler(
     """
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -374,7 +372,7 @@ async def test_missing_working_dir_does_not_escape_handler(
         )(),
     )
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type(
             "F",
             (),
@@ -529,7 +527,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
     set_backend(RecordingBackend())
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -542,7 +540,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
             return "<cao-memory>\n## Context\n- routed via backend\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.claude_code_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
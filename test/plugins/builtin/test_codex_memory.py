@@ -28,7 +28,7 @@ async def test_ignores_non_codex_providers(monkeypatch: pytest.MonkeyPatch, tmp_
 
     called: list[str] = []
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: called.append(terminal_id) or None,
     )
 
@@ -47,7 +47,7 @@ async def test_writes_memory_block_on_post_create_terminal(
     """On a codex terminal, the plugin should write the memory block."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -66,7 +66,7 @@ async def test_writes_memory_block_on_post_create_terminal(
             return "<cao-memory>\n## Context\n- stan prefers pytest\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -97,7 +97,7 @@ async def test_replaces_existing_memory_block_on_rerun(
     )
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -116,7 +116,7 @@ async def test_replaces_existing_memory_block_on_rerun(
             return "<cao-memory>NEW</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -138,7 +138,7 @@ async def test_skips_write_when_memory_context_empty(
     """Empty memory context must NOT create or modify AGENTS.md."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -152,7 +152,7 @@ async def test_skips_write_when_memory_context_empty(
         )(),
     )
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type("F", (), {"get_memory_context_for_terminal": lambda self, t: ""})(),
     )
 
@@ -174,7 +174,7 @@ async def test_disabled_memory_writes_nothing(
     """
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -208,7 +208,7 @@ async def test_memory_fetch_failure_is_logged_not_raised(
     """Memory-service exceptions must be caught and logged."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -227,7 +227,7 @@ async def test_memory_fetch_failure_is_logged_not_raised(
             raise RuntimeError("db on fire")
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: ExplodingMemoryService(),
     )
 
@@ -246,7 +246,7 @@ async def test_missing_terminal_metadata_short_circuits(
     """No metadata → no write, no crash."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: None,
     )
 
@@ -254,7 +254,7 @@ async def test_missing_terminal_metadata_short_circuits(
     def _boom(*args, **kwargs):
         raise AssertionError("MemoryService must not be constructed when metadata missing")
 
-    monkeypatch.setattr("cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService", _boom)
+    monkeypatch.setattr("cli_agent_orchestrator.services.memory_service.MemoryService", _boom)
 
     plugin = CodexMemoryPlugin()
     await plugin.on_post_create_terminal(_event())
@@ -283,7 +283,7 @@ async def test_path_containment_guard_rejects_escape(
     (real_cwd / "AGENTS.md").symlink_to(sibling / "AGENTS.md")
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -302,7 +302,7 @@ async def test_path_containment_guard_rejects_escape(
             return "<cao-memory>NEW</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -346,7 +346,7 @@ async def test_missing_working_dir_does_not_escape_handler(
     """
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -362,7 +362,7 @@ async def test_missing_working_dir_does_not_escape_handler(
         )(),
     )
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type(
             "F",
             (),
@@ -516,7 +516,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
     set_backend(RecordingBackend())
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -529,7 +529,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
             return "<cao-memory>\n## Context\n- routed via backend\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.codex_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -76,6 +76,21 @@ class TestPublisherHooks:
         # Relayed to SSE bus.
         assert relayed == history
 
+    @pytest.mark.asyncio
+    async def test_create_terminal_records_startup_timings(self, wired_publisher) -> None:
+        publisher, log, _ = wired_publisher
+        timings = {"shell_ready": 2.1, "cli_launched": 2.2, "prompts_handled": 3.0}
+        await publisher.on_post_create_terminal(
+            PostCreateTerminalEvent(
+                terminal_id="t1", provider="claude_code", startup_timings=timings
+            )
+        )
+        await publisher.on_post_create_terminal(PostCreateTerminalEvent(terminal_id="t2"))
+
+        first, second = sorted(log.history(), key=lambda row: row["terminal_id"])
+        assert first["detail"]["startup_timings"] == timings
+        assert "startup_timings" not in second["detail"]
+
     @pytest.mark.asyncio
     async def test_create_session_appends_launch(self, wired_publisher) -> None:
         publisher, log, relayed = wired_publisher
@@ -25,7 +25,7 @@ def _event(provider: str = "kiro_cli", terminal_id: str = "t1") -> PostCreateTer
 
 def _install_metadata_and_cwd(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -52,7 +52,7 @@ async def test_ignores_non_kiro_cli_providers(
 
     called: list[str] = []
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: called.append(terminal_id) or None,
     )
 
@@ -75,7 +75,7 @@ async def test_writes_steering_file_on_post_create_terminal(
             return "<cao-memory>\n## Context\n- stan prefers pytest\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -107,7 +107,7 @@ async def test_overwrites_previous_memory_file(
             return "<cao-memory>fresh</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -137,7 +137,7 @@ async def test_does_not_touch_agent_identity_steering_file(
             return "<cao-memory>hi</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -156,7 +156,7 @@ async def test_skips_write_when_memory_context_empty(
 
     _install_metadata_and_cwd(monkeypatch, tmp_path)
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type("F", (), {"get_memory_context_for_terminal": lambda self, t: ""})(),
     )
 
@@ -204,7 +204,7 @@ async def test_memory_fetch_failure_is_logged_not_raised(
             raise RuntimeError("db on fire")
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: ExplodingMemoryService(),
     )
 
@@ -225,16 +225,14 @@ async def test_missing_terminal_metadata_short_circuits(
     """No metadata → no write, no crash, no MemoryService call."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: None,
     )
 
     def _boom(*args, **kwargs):
         raise AssertionError("MemoryService must not be constructed when metadata missing")
 
-    monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService", _boom
-    )
+    monkeypatch.setattr("cli_agent_orchestrator.services.memory_service.MemoryService", _boom)
 
     plugin = KiroCliMemoryPlugin()
     await plugin.on_post_create_terminal(_event())
@@ -255,7 +253,7 @@ async def test_path_containment_guard_rejects_symlink_escape(
     (real_cwd / ".kiro").symlink_to(sibling, target_is_directory=True)
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -278,7 +276,7 @@ async def test_path_containment_guard_rejects_symlink_escape(
             return "<cao-memory>NEW</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -312,7 +310,7 @@ async def test_missing_working_dir_does_not_escape_handler(
     """An ephemeral/missing cwd must be logged-and-skipped, never raised."""
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -330,7 +328,7 @@ async def test_missing_working_dir_does_not_escape_handler(
         lambda: FakeBackend(),
     )
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: type(
             "F",
             (),
@@ -356,7 +354,7 @@ async def test_steering_write_is_atomic_no_tmp_left_behind(
             return "<cao-memory>X</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
@@ -446,7 +444,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
     set_backend(RecordingBackend())
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.get_terminal_metadata",
+        "cli_agent_orchestrator.clients.database.get_terminal_metadata",
         lambda terminal_id: {
             "tmux_session": "cao-test-session",
             "tmux_window": "developer-abcd",
@@ -459,7 +457,7 @@ async def test_writes_via_configured_backend_not_tmux_directly(
             return "<cao-memory>\n## Context\n- routed via backend\n</cao-memory>"
 
     monkeypatch.setattr(
-        "cli_agent_orchestrator.plugins.builtin.kiro_cli_memory.MemoryService",
+        "cli_agent_orchestrator.services.memory_service.MemoryService",
         lambda: FakeMemoryService(),
     )
 
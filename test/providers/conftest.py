@@ -30,9 +30,7 @@ async def event_pipeline():
     loop = asyncio.get_running_loop()
 
     # Clear stale subscriptions from previous tests (each test gets a new loop)
-    with bus._lock:
-        bus._exact.clear()
-        bus._wildcard.clear()
+    bus.clear()
     bus.set_loop(loop)
 
     # Start StatusMonitor as a background task
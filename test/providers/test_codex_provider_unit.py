@@ -21,6 +21,7 @@ from cli_agent_orchestrator.providers.codex import (
     _toml_override,
     _toml_scalar,
 )
+from cli_agent_orchestrator.utils.text import strip_terminal_escapes
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
@@ -1186,6 +1187,38 @@ class TestCodexRenderedScreenStatusDetection:
         assert provider.get_status_from_screen(screen_lines) == TerminalStatus.COMPLETED
 
 
+class TestCodexLineStatusDetection:
+    """``get_status_from_lines`` must agree with ``get_status`` on the same stream."""
+
+    def test_provider_opts_into_line_detection(self):
+        provider = CodexProvider("test1234", "test-session", "window-0")
+
+        assert provider.supports_line_detection is True
+
+    @pytest.mark.parametrize(
+        "fixture",
+        [
+            "codex_idle_output.txt",
+            "codex_completed_output.txt",
+            "codex_processing_output.txt",
+            "codex_permission_output.txt",
+            "codex_error_output.txt",
+            "codex_approval_modal_raw.txt",
+        ],
+    )
+    def test_lines_match_raw_buffer(self, fixture):
+        output = load_fixture(fixture)
+        provider = CodexProvider("test1234", "test-session", "window-0")
+        lines = tuple(strip_terminal_escapes(output).split("\n"))
+
+        assert provider.get_status_from_lines(lines) == provider.get_status(output)
+
+    def test_empty_stream_is_unknown(self):
+        provider = CodexProvider("test1234", "test-session", "window-0")
+
+        assert provider.get_status_from_lines(("",)) == TerminalStatus.UNKNOWN
+
+
 class TestCodexBulletFormatStatusDetection:
     """Tests for Codex's real interactive output format using › prompt and • bullets."""
 
@@ -3931,6 +3964,29 @@ class TestCodexProviderExitDetection:
 
         assert status == TerminalStatus.IDLE
 
+    @patch("cli_agent_orchestrator.providers.codex.pane_process_tracker")
+    @patch("cli_agent_orchestrator.providers.codex.get_backend")
+    def test_tracked_pane_answers_exit_check_without_tmux(self, mock_tmux, mock_tracker):
+        """A tracked pane answers from the /proc tracker; tmux is never asked."""
+        mock_tmux.return_value.get_native_status.return_value = None
+        provider = CodexProvider("test1234", "test-session", "window-0")
+        provider._initialized = True
+        provider.shell_baseline = "zsh"
+
+        mock_tracker.shell_in_foreground.return_value = True
+        assert provider.get_status("OpenAI Codex (v0.98.0)\n› \n% \n") == TerminalStatus.ERROR
+
+        mock_tracker.shell_in_foreground.return_value = False
+        output = (
+            "OpenAI Codex (v0.98.0)\n"
+            "› \n"
+            "  ? for shortcuts                     100% context left\n"
+        )
+        assert provider.get_status(output) == TerminalStatus.IDLE
+
+        mock_tracker.shell_in_foreground.assert_called_with("test1234")
+        mock_tmux.return_value.get_pane_current_command.assert_not_called()
+
     @patch("cli_agent_orchestrator.providers.codex.get_backend")
     def test_get_status_skips_exit_check_before_init(self, mock_tmux):
         """Exit check skipped before initialization (avoids false ERROR on launch)."""
@@ -1806,6 +1806,22 @@ class TestKiroCliCheck3ShellBaseline:
             "test-session", "window-0"
         )
 
+    @patch("cli_agent_orchestrator.providers.kiro_cli.pane_process_tracker")
+    @patch("cli_agent_orchestrator.providers.kiro_cli.get_backend")
+    def test_check3_tracked_pane_skips_pane_command_query(self, mock_tmux, mock_tracker):
+        """A tracked pane answers Check 3 from the /proc tracker, not tmux."""
+        output = "Some processing output without idle prompt"
+        provider = KiroCliProvider("test1234", "test-session", "window-0", "developer")
+        provider.shell_baseline = "bash"
+        provider._initialized = True
+
+        mock_tracker.shell_in_foreground.return_value = True
+        assert provider.get_status(output) == TerminalStatus.IDLE
+        mock_tracker.shell_in_foreground.return_value = False
+        assert provider.get_status(output) == TerminalStatus.PROCESSING
+
+        mock_tmux.return_value.get_pane_current_command.assert_not_called()
+
     @patch("cli_agent_orchestrator.providers.kiro_cli.get_backend")
     def test_check3_pre_init_shell_match_returns_processing(self, mock_backend):
         """Pre-init (`_initialized=False`) + current command matches shell_baseline → PROCESSING.
@@ -0,0 +1,82 @@
+"""Tests for the benchmark suite runner's baseline comparison (benchmarks/run_suite.py).
+
+The scenarios themselves are timing runs and are not executed here; these tests
+pin the part CI gates on — which metrics count as regressions.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+BENCHMARKS_DIR = REPO_ROOT / "benchmarks"
+
+
+def _load_runner():
+    path = BENCHMARKS_DIR / "run_suite.py"
+    spec = importlib.util.spec_from_file_location("_cao_benchmarks_run_suite", path)
+    assert spec is not None and spec.loader is not None, f"cannot load {path}"
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+run_suite = _load_runner()
+
+
+def _report(**results: Any) -> Dict[str, Any]:
+    return {"scenarios": {"demo": {"benchmark": "demo", "results": results}}}
+
+
+def test_every_scenario_script_exists_with_both_profiles():
+    for name, (script, profiles) in run_suite.SCENARIOS.items():
+        assert (BENCHMARKS_DIR / script).is_file(), name
+        assert set(profiles) == {"quick", "full"}, name
+
+
+def test_slower_latency_beyond_tolerance_is_a_regression():
+    comparison = run_suite.compare(
+        _report(latency={"p99_ms": 30.0}), _report(latency={"p99_ms": 20.0}), 0.25
+    )
+
+    assert [r["metric"] for r in comparison["regressions"]] == ["demo.latency.p99_ms"]
+
+
+def test_lower_throughput_is_a_regression_and_higher_an_improvement():
+    worse = run_suite.compare(_report(calls_per_s=50.0), _report(calls_per_s=100.0), 0.25)
+    better = run_suite.compare(_report(calls_per_s=200.0), _report(calls_per_s=100.0), 0.25)
+
+    assert [r["metric"] for r in worse["regressions"]] == ["demo.calls_per_s"]
+    assert [r["metric"] for r in better["improvements"]] == ["demo.calls_per_s"]
+    assert better["regressions"] == []
+
+
+def test_cpu_rate_is_lower_is_better():
+    comparison = run_suite.compare(
+        _report(idle_cpu_ms_per_s=40.0), _report(idle_cpu_ms_per_s=10.0), 0.25
+    )
+
+    assert [r["metric"] for r in comparison["regressions"]] == ["demo.idle_cpu_ms_per_s"]
+
+
+def test_sub_floor_timing_jitter_is_ignored():
+    comparison = run_suite.compare(_report(p50_us=30.0), _report(p50_us=12.0), 0.25)
+
+    assert comparison["regressions"] == []
+
+
+def test_any_new_dropped_event_is_a_regression():
+    comparison = run_suite.compare(_report(dropped_events=1), _report(dropped_events=0), 0.25)
+
+    assert [r["metric"] for r in comparison["regressions"]] == ["demo.dropped_events"]
+
+
+def test_informational_values_and_failed_scenarios_are_not_compared():
+    assert run_suite.compare(_report(nodes=500), _report(nodes=100), 0.25)["compared"] == 0
+
+    failed = {"scenarios": {"demo": {"error": "exit 1"}}}
+    assert run_suite.compare(failed, _report(p99_ms=1.0), 0.25)["compared"] == 0
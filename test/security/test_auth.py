@@ -509,3 +509,100 @@ def test_jwks_cache_reuses_within_max_staleness(monkeypatch):
     cache._fetched_at = datetime.now(timezone.utc) - timedelta(minutes=1)
     state["fail"] = True
     assert cache.get_client("https://idp/jwks") is first
+
+
+# --- verified-token cache -------------------------------------------------
+
+
+class _VerifyCounter(_FakeClient):
+    """Fake JWKS client counting signing-key lookups (one per full verify)."""
+
+    def __init__(self, public_key) -> None:
+        super().__init__(public_key)
+        self.lookups = 0
+
+    def get_signing_key_from_jwt(self, token):  # noqa: ANN001
+        self.lookups += 1
+        return super().get_signing_key_from_jwt(token)
+
+
+def _enable_counting_auth(monkeypatch, rsa_key) -> _VerifyCounter:
+    monkeypatch.setenv("AUTH0_DOMAIN", "example.auth0.com")
+    monkeypatch.setenv("CAO_AUTH_AUDIENCE", AUDIENCE)
+    fake = _VerifyCounter(rsa_key.public_key())
+    monkeypatch.setattr(auth.get_jwks_cache(), "get_client", lambda uri: fake)
+    return fake
+
+
+def test_valid_token_is_verified_once(monkeypatch, rsa_key):
+    fake = _enable_counting_auth(monkeypatch, rsa_key)
+    token = _make_token(rsa_key, _base_claims({"scope": "cao:read"}))
+
+    assert auth.extract_scopes_from_token(token) == ["cao:read"]
+    scopes = auth.extract_scopes_from_token(token)
+    scopes.append("mutated")  # callers get a copy
+    assert auth.extract_scopes_from_token(token) == ["cao:read"]
+    assert fake.lookups == 1
+
+
+def test_invalid_token_is_not_cached(monkeypatch, rsa_key):
+    fake = _enable_counting_auth(monkeypatch, rsa_key)
+    token = _make_token(rsa_key, _base_claims({"aud": "someone-else"}))
+    for _ in range(2):
+        with pytest.raises(jwt.PyJWTError):
+            auth.extract_scopes_from_token(token)
+    assert fake.lookups == 2
+
+
+def test_cached_token_expires_before_exp(monkeypatch, rsa_key):
+    fake = _enable_counting_auth(monkeypatch, rsa_key)
+    token = _make_token(rsa_key, _base_claims({"scope": "cao:read"}))
+    auth.extract_scopes_from_token(token)
+
+    exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+    monkeypatch.setattr(auth.time, "time", lambda: exp - auth._TOKEN_CACHE_EXPIRY_SKEW)
+    auth.extract_scopes_from_token(token)
+    assert fake.lookups == 2
+
+
+def test_audience_change_does_not_reuse_verdict(monkeypatch, rsa_key):
+    _enable_counting_auth(monkeypatch, rsa_key)
+    token = _make_token(rsa_key, _base_claims({"scope": "cao:read"}))
+    auth.extract_scopes_from_token(token)
+
+    monkeypatch.setenv("CAO_AUTH_AUDIENCE", "another-resource")
+    with pytest.raises(jwt.PyJWTError):
+        auth.extract_scopes_from_token(token)
+
+
+def test_jwks_clear_flushes_verified_tokens(monkeypatch, rsa_key):
+    fake = _enable_counting_auth(monkeypatch, rsa_key)
+    token = _make_token(rsa_key, _base_claims({"scope": "cao:read"}))
+    auth.extract_scopes_from_token(token)
+
+    auth.get_jwks_cache().clear()
+    auth.extract_scopes_from_token(token)
+    assert fake.lookups == 2
+
+
+def test_jwks_refetch_bumps_generation(monkeypatch):
+    monkeypatch.setattr(auth, "PyJWKClient", _CountingClient)
+    cache = auth._JWKSCache(ttl=timedelta(hours=1))
+    start = cache.generation
+    cache.get_client("https://idp/jwks")
+    cache.get_client("https://idp/jwks")  # within TTL: same keys
+    assert cache.generation == start + 1
+
+
+def test_verified_token_cache_evicts_least_recently_used():
+    cache = auth._VerifiedTokenCache(max_entries=2)
+    exp = time.time() + 3600
+    cache.get("a", 1)  # adopt generation 1
+    for key in ("a", "b"):
+        cache.put(key, ["cao:read"], exp, 1)
+    assert cache.get("a", 1) == ["cao:read"]  # "b" is now least recently used
+    cache.put("c", ["cao:write"], exp, 1)
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == ["cao:read"]
+    assert len(cache) == 2
@@ -22,8 +22,12 @@ import asyncio
 import logging
 import os
 import platform
+import queue
 import re
 import stat
+import subprocess
+import sys
+import textwrap
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -782,3 +786,167 @@ class TestCrossCuttingSanitiserCallers:
         body = read_audit_log()
         assert " " not in body
         assert "\\n" in body
+
+
+# ===========================================================================
+# Background writer + offset index
+# ===========================================================================
+
+
+class TestBackgroundWriter:
+    def test_nowait_burst_lands_in_order_with_one_open(self, audit_base, monkeypatch):
+        opens: List[str] = []
+        real_open = os.open
+
+        def _spy(path, flags, mode=0o777):
+            if str(path).endswith(".md") and flags & os.O_WRONLY:
+                opens.append(str(path))
+            return real_open(path, flags, mode)
+
+        monkeypatch.setattr(os, "open", _spy)
+        for i in range(50):
+            write_audit_nowait("memory_stored", f"burst {i}", n=i)
+        assert audit_log.flush_audit_log()
+
+        lines = _read_log(audit_base).splitlines()
+        assert [ln.split("`")[1] for ln in lines] == [f"burst {i}" for i in range(50)]
+        assert len(opens) == 1
+
+    def test_nowait_needs_no_running_loop(self, audit_base):
+        write_audit_nowait("memory_forgot", "from sync code")
+        assert audit_log.flush_audit_log()
+        assert "from sync code" in read_audit_log()
+
+    def test_full_queue_drops_nowait_events(self, audit_base, monkeypatch, caplog):
+        monkeypatch.setattr(audit_log, "_writer", audit_log._AuditWriter())
+        monkeypatch.setattr(audit_log._writer, "_queue", queue.Queue(maxsize=1))
+        monkeypatch.setattr(audit_log._writer, "_ensure_thread", lambda: None)
+
+        with caplog.at_level(logging.WARNING, logger="cli_agent_orchestrator.services.audit_log"):
+            write_audit_nowait("memory_stored", "queued")
+            write_audit_nowait("memory_stored", "dropped")
+
+        assert any("queue_full" in r.getMessage() for r in caplog.records)
+        assert audit_log._writer._queue.qsize() == 1
+
+    def test_day_cap_is_tracked_across_a_batch(self, audit_base, monkeypatch):
+        monkeypatch.setattr(audit_log, "_audit_day_cap_bytes", lambda: 100)
+        for i in range(5):
+            write_audit_nowait("memory_stored", f"cap {i}")
+        assert audit_log.flush_audit_log()
+
+        # Each line is well over 50 bytes: the first two fit under 100.
+        assert len(_read_log(audit_base).splitlines()) == 2
+
+
+class TestOffsetIndex:
+    def _index(self, base: Path) -> List[List[str]]:
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        path = base / "logs" / "memory" / f"{date_str}.idx"
+        return [ln.split("\t") for ln in path.read_text().splitlines()]
+
+    def test_index_points_at_each_line(self, audit_base):
+        _run(write_audit("memory_stored", "one"))
+        _run(write_audit("lint_run_completed", "two"))
+
+        body = _read_log(audit_base).encode()
+        rows = self._index(audit_base)
+        assert [row[1] for row in rows] == ["memory_stored", "lint_run_completed"]
+        for ts, ev, off, ln in rows:
+            line = body[int(off) : int(off) + int(ln)]
+            assert line.startswith(f"- {ts} [{ev}]".encode()) and line.endswith(b"\n")
+
+    def test_query_by_event_type(self, audit_base):
+        _run(write_audit("memory_stored", "a"))
+        _run(write_audit("memory_recalled", "b"))
+        _run(write_audit("memory_stored", "c"))
+
+        lines = audit_log.query_audit_log(event_type="memory_stored")
+
+        assert [ln.split("`")[1] for ln in lines] == ["a", "c"]
+        assert not any(ln.endswith("\n") for ln in lines)
+
+    def test_query_by_time_window(self, audit_base):
+        log_dir = audit_base / "logs" / "memory"
+        log_dir.mkdir(parents=True)
+        day = "2026-05-15"
+        (log_dir / f"{day}.md").write_text(
+            "".join(
+                f"- 2026-05-15T{h:02d}:00:00Z [memory_stored] — `h{h}`\n" for h in range(0, 24, 6)
+            )
+        )
+        since = datetime(2026, 5, 15, 5, tzinfo=timezone.utc)
+        until = datetime(2026, 5, 15, 12, tzinfo=timezone.utc)
+
+        lines = audit_log.query_audit_log(since=since, until=until)
+
+        # No index yet: the pre-index day is scanned, with the same answer.
+        assert [ln.split("`")[1] for ln in lines] == ["h6", "h12"]
+
+    def test_writer_catches_up_an_index_behind_the_log(self, audit_base):
+        _run(write_audit("memory_stored", "indexed"))
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        log_path = audit_base / "logs" / "memory" / f"{date_str}.md"
+        with open(log_path, "a", encoding="utf-8") as f:  # a line the index never saw
+            f.write(f"- {date_str}T00:00:01Z [memory_forgot] — `outside`\n")
+
+        _run(write_audit("memory_recalled", "after"))
+
+        assert [row[1] for row in self._index(audit_base)] == [
+            "memory_stored",
+            "memory_forgot",
+            "memory_recalled",
+        ]
+
+    def test_sweep_removes_the_index_with_its_day(self, audit_base):
+        log_dir = audit_base / "logs" / "memory"
+        log_dir.mkdir(parents=True)
+        old = (datetime.now(timezone.utc).date() - timedelta(days=40)).strftime("%Y-%m-%d")
+        (log_dir / f"{old}.md").write_text("- old\n")
+        (log_dir / f"{old}.idx").write_text("")
+
+        assert sweep_old_audit_logs(retention_days=30) == 1
+        assert list(log_dir.iterdir()) == []
+
+    def test_misaligned_index_falls_back_to_a_scan(self, audit_base):
+        _run(write_audit("memory_stored", "a"))
+        _run(write_audit("memory_stored", "b"))
+        date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        idx_path = audit_base / "logs" / "memory" / f"{date_str}.idx"
+        rows = self._index(audit_base)
+        rows[1][2] = str(int(rows[1][2]) + 3)  # points into the middle of a line
+        idx_path.write_text("".join("\t".join(row) + "\n" for row in rows))
+
+        lines = audit_log.query_audit_log(event_type="memory_stored")
+
+        assert [ln.split("`")[1] for ln in lines] == ["a", "b"]
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="flock is POSIX-only")
+    def test_concurrent_processes_keep_the_index_aligned(self, audit_base):
+        # MCP servers run their own writer against the same day file.
+        child = textwrap.dedent(f"""
+            import sys
+            from pathlib import Path
+            from cli_agent_orchestrator.services import audit_log
+
+            audit_log.MEMORY_BASE_DIR = Path({str(audit_base)!r})
+            audit_log._audit_log_flock_enabled = lambda: False
+            audit_log._is_memory_enabled_safe = lambda: True
+            for i in range(400):
+                audit_log.write_audit_nowait("memory_stored", f"p{{sys.argv[1]}}-{{i}}")
+                if i % 7 == 0:
+                    audit_log.flush_audit_log()
+            assert audit_log.flush_audit_log()
+            """)
+        procs = [
+            subprocess.Popen([sys.executable, "-c", child, str(n)], env=dict(os.environ))
+            for n in range(3)
+        ]
+        assert [proc.wait(timeout=60) for proc in procs] == [0, 0, 0]
+
+        lines = audit_log.query_audit_log()
+
+        summaries = [ln.split("`")[1] for ln in lines]
+        assert len(_read_log(audit_base).splitlines()) == 1200
+        assert len(summaries) == len(set(summaries)) == 1200
+        assert all(re.match(r"^- \S+Z \[memory_stored\] — `p\d-\d+`$", ln) for ln in lines)
@@ -209,6 +209,7 @@ class TestInjectUsesGetCurated:
         from cli_agent_orchestrator.services.terminal_service import inject_memory_context
 
         mock_svc = MockService.return_value
+        mock_svc.get_prefetchable_memory_context.return_value = None  # curator session
         mock_svc.get_curated_memory_context.return_value = "<cao-memory>\ncurated\n</cao-memory>"
 
         result = inject_memory_context("Fix the bug", "t-new")
@@ -224,6 +225,7 @@ class TestInjectUsesGetCurated:
         from cli_agent_orchestrator.services.terminal_service import inject_memory_context
 
         mock_svc = MockService.return_value
+        mock_svc.get_prefetchable_memory_context.return_value = None  # curator session
         mock_svc.get_curated_memory_context.return_value = "<cao-memory>\ncurated\n</cao-memory>"
 
         inject_memory_context("First message", "t-repeat")
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -36,6 +37,52 @@ class TestEventBusSubscribe:
         queue = bus.subscribe("terminal.*.output")
         assert queue.maxsize == 4096
 
+    @patch("cli_agent_orchestrator.services.event_bus.get_server_settings")
+    def test_settings_change_resizes_later_subscriptions(self, mock_settings):
+        """A settings change reaches the bus through its listener, without a re-read."""
+        mock_settings.return_value = {"event_bus_max_queue_size": 4096}
+        bus = EventBus()
+        first = bus.subscribe("terminal.a.output")
+
+        bus._on_settings_changed(SimpleNamespace(server={"event_bus_max_queue_size": 16}))
+        second = bus.subscribe("terminal.b.output")
+
+        assert first.maxsize == 4096
+        assert second.maxsize == 16
+        mock_settings.assert_called_once()
+
+
+class TestPublishBatch:
+    @pytest.mark.asyncio
+    async def test_batch_is_delivered_in_order_with_one_loop_wakeup(self, small_queue_settings):
+        """publish_batch fans events out like publish() but schedules one callback."""
+        bus = EventBus()
+        loop = asyncio.get_running_loop()
+        bus.set_loop(loop)
+        queue_a = bus.subscribe("terminal.a.output")
+        queue_all = bus.subscribe("terminal.*.output")
+        events = [
+            ("terminal.a.output", {"data": "1"}),
+            ("terminal.b.output", {"data": "2"}),
+            ("terminal.a.output", {"data": "3"}),
+        ]
+
+        with patch.object(loop, "call_soon_threadsafe", wraps=loop.call_soon_threadsafe) as spy:
+            bus.publish_batch(events)
+        await asyncio.sleep(0)
+
+        assert spy.call_count == 1
+        assert [queue_a.get_nowait()["data"]["data"] for _ in range(queue_a.qsize())] == ["1", "3"]
+        assert [queue_all.get_nowait()["data"]["data"] for _ in range(queue_all.qsize())] == [
+            "1",
+            "2",
+            "3",
+        ]
+
+    def test_batch_without_loop_is_dropped(self, small_queue_settings):
+        bus = EventBus()
+        bus.publish_batch([("terminal.a.output", {"data": "x"})])
+
 
 class TestQueueFullRateLimit:
     """Regression: under a real output burst _dispatch was called thousands of
@@ -217,3 +264,126 @@ class TestDropStatePruning:
 
         # Old entry survives (map was below cap, so _prune_drop_state not called).
         assert "terminal.old.output" in bus._drop_last_logged
+
+
+class TestTopicRouting:
+    @staticmethod
+    def _bus() -> EventBus:
+        bus = EventBus()
+        bus.set_loop(asyncio.get_running_loop())
+        return bus
+
+    @pytest.mark.asyncio
+    async def test_wildcard_matches_exactly_one_segment(self, small_queue_settings):
+        bus = self._bus()
+        output = bus.subscribe("terminal.*.output")
+        anything = bus.subscribe("terminal.*.*")
+        exact = bus.subscribe("terminal.a.status")
+
+        bus._dispatch("terminal.a.output", {"data": "1"})
+        bus._dispatch("terminal.a.status", {"status": "idle"})
+        bus._dispatch("terminal.a.b.output", {"data": "nested"})
+        bus._dispatch("terminal..output", {"data": "empty segment"})
+
+        assert [output.get_nowait()["topic"] for _ in range(output.qsize())] == [
+            "terminal.a.output"
+        ]
+        assert anything.qsize() == 2
+        assert exact.get_nowait()["data"] == {"status": "idle"}
+        assert exact.empty()
+
+    def test_partial_segment_wildcard_is_rejected(self, small_queue_settings):
+        with pytest.raises(ValueError):
+            EventBus().subscribe("terminal.a*.output")
+
+    @pytest.mark.asyncio
+    async def test_resolved_routes_follow_subscription_changes(self, small_queue_settings):
+        """A cached resolution never outlives a subscribe/unsubscribe."""
+        bus = self._bus()
+        first = bus.subscribe("terminal.*.output")
+        bus._dispatch("terminal.a.output", {"data": "1"})
+        assert "terminal.a.output" in bus._routes.cache
+
+        second = bus.subscribe("terminal.a.output")
+        bus._dispatch("terminal.a.output", {"data": "2"})
+        bus.unsubscribe("terminal.*.output", first)
+        bus._dispatch("terminal.a.output", {"data": "3"})
+
+        assert [first.get_nowait()["data"]["data"] for _ in range(first.qsize())] == ["1", "2"]
+        assert [second.get_nowait()["data"]["data"] for _ in range(second.qsize())] == ["2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_clear_removes_every_subscription(self, small_queue_settings):
+        bus = self._bus()
+        queue = bus.subscribe("terminal.*.output")
+        bus.clear()
+        bus._dispatch("terminal.a.output", {"data": "1"})
+        assert queue.empty()
+        assert bus.subscriber_stats() == []
+
+
+class TestMergeOnFull:
+    @pytest.mark.asyncio
+    async def test_full_output_queue_merges_instead_of_dropping(self, small_queue_settings):
+        """Every byte survives back-pressure, in order per terminal."""
+        bus = EventBus()
+        bus.set_loop(asyncio.get_running_loop())
+        queue = bus.subscribe("terminal.*.output", merge_output=True)
+
+        for i in range(10):
+            bus._dispatch("terminal.a.output", {"data": str(i)})
+        bus._dispatch("terminal.b.output", {"data": "b"})
+        bus._dispatch("terminal.b.output", {"data": "B"})
+
+        events = [queue.get_nowait() for _ in range(queue.qsize())]
+        assert [(e["topic"], e["data"]["data"]) for e in events] == [
+            ("terminal.a.output", "0"),
+            ("terminal.a.output", "1"),
+            ("terminal.a.output", "2"),
+            ("terminal.a.output", "3456789"),
+            ("terminal.b.output", "bB"),
+        ]
+        assert queue.merged == 7
+        assert bus._drop_counts == {}
+
+    @pytest.mark.asyncio
+    async def test_merging_leaves_other_subscribers_events_untouched(self, small_queue_settings):
+        bus = EventBus()
+        bus.set_loop(asyncio.get_running_loop())
+        merging = bus.subscribe("terminal.*.output", merge_output=True)
+        plain = bus.subscribe("terminal.*.output")
+
+        for i in range(6):
+            bus._dispatch("terminal.a.output", {"data": str(i)})
+
+        assert [plain.get_nowait()["data"]["data"] for _ in range(plain.qsize())] == [
+            "0",
+            "1",
+            "2",
+            "3",
+        ]
+        assert merging.qsize() == 4
+
+    @pytest.mark.asyncio
+    async def test_subscriber_stats_report_lag_and_losses(self, small_queue_settings):
+        bus = EventBus()
+        bus.set_loop(asyncio.get_running_loop())
+        merging = bus.subscribe("terminal.*.output", merge_output=True)
+        bus.subscribe("terminal.*.output")
+
+        for i in range(6):
+            bus._dispatch("terminal.a.output", {"data": str(i)})
+        merging.get_nowait()
+
+        merged_stats, plain_stats = bus.subscriber_stats()
+        assert merged_stats == {
+            "pattern": "terminal.*.output",
+            "merge_output": True,
+            "lag": 3,
+            "capacity": 4,
+            "high_water": 4,
+            "delivered": 6,
+            "dropped": 0,
+            "merged": 2,
+        }
+        assert (plain_stats["lag"], plain_stats["delivered"], plain_stats["dropped"]) == (4, 4, 2)
@@ -34,7 +34,7 @@ class TestStopReader:
         os.mkfifo(fifo_path)
         assert fifo_path.exists()
 
-        # No create_reader() was called, so _readers/_threads are empty.
+        # No create_reader() was called, so _readers is empty.
         manager.stop_reader("term-stale")
 
         assert not fifo_path.exists()
@@ -49,43 +49,72 @@ class TestStopReader:
         manager.stop_reader("term-missing")
 
 
-class TestReaderThreadLifecycle:
-    """Issue #382 regressions: reader threads must never leak, no matter when
-    stop_reader is called relative to writer activity. The old blocking-open
-    loop stranded threads in the kernel's ``wait_for_partner`` whenever the
-    stop-time wakeup missed the reader's reopen window; leaked threads
-    accumulated across create/delete cycles until the server wedged."""
+def _capture_batches(monkeypatch):
+    """Record (topic, data) pairs handed to the bus by the multiplexer."""
+    received = []
+    batches = []
 
-    def _manager(self, tmp_path, monkeypatch):
+    def fake_publish_batch(events):
+        batches.append(list(events))
+        received.extend((topic, data["data"]) for topic, data in events)
+
+    monkeypatch.setattr(fr.bus, "publish_batch", fake_publish_batch)
+    return received, batches
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not predicate():
+        time.sleep(0.01)
+    return predicate()
+
+
+def _write(fifo_path, payload: bytes) -> None:
+    wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+    try:
+        os.write(wfd, payload)
+    finally:
+        os.close(wfd)
+
+
+class TestReaderLifecycle:
+    """Issue #382 regressions: a stopped reader must never keep its FIFO fds,
+    no matter when stop_reader is called relative to writer activity. The old
+    blocking-open loop stranded reader threads in the kernel's
+    ``wait_for_partner`` whenever the stop-time wakeup missed the reader's
+    reopen window; leaked readers accumulated across create/delete cycles
+    until the server wedged."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
         monkeypatch.setattr("cli_agent_orchestrator.services.fifo_reader.FIFO_DIR", tmp_path)
-        return FifoManager()
+        manager = FifoManager()
+        yield manager
+        manager.stop_multiplexer()
 
-    def _thread(self, manager, terminal_id):
+    def _stream(self, manager, terminal_id):
         with manager._lock:
-            return manager._threads.get(terminal_id)
+            return manager._readers.get(terminal_id)
 
-    def test_stop_with_no_writer_ever_attached_does_not_leak(self, tmp_path, monkeypatch):
+    def test_stop_with_no_writer_ever_attached_does_not_leak(self, manager, tmp_path):
         """The #382 leak case: reader parked with no writer, then stopped.
 
         The old loop blocked inside ``open(O_RDONLY)`` here; if the wakeup
         raced, join timed out and the unlink stranded the thread forever."""
-        manager = self._manager(tmp_path, monkeypatch)
         manager.create_reader("term-nolock")
-        thread = self._thread(manager, "term-nolock")
-        assert thread is not None and thread.is_alive()
+        stream = self._stream(manager, "term-nolock")
+        assert stream is not None and not stream.closed
 
         manager.stop_reader("term-nolock")
 
-        thread.join(timeout=3.0)
-        assert not thread.is_alive()
+        assert stream.closed
         assert not (tmp_path / "term-nolock.fifo").exists()
 
-    def test_stop_right_after_writer_eof_does_not_leak(self, tmp_path, monkeypatch):
+    def test_stop_right_after_writer_eof_does_not_leak(self, manager, tmp_path):
         """The race window of the old design: a writer connects and disconnects
         (EOF pulse — what stop_pipe_pane produces) immediately before
         stop_reader. The old loop was mid-reopen at that point and the wakeup
         open failed with ENXIO, leaking the thread."""
-        manager = self._manager(tmp_path, monkeypatch)
         manager.create_reader("term-race")
         fifo_path = tmp_path / "term-race.fifo"
 
@@ -93,62 +122,135 @@ class TestReaderThreadLifecycle:
         wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
         os.close(wfd)
 
-        thread = self._thread(manager, "term-race")
+        stream = self._stream(manager, "term-race")
         manager.stop_reader("term-race")
 
-        thread.join(timeout=3.0)
-        assert not thread.is_alive()
+        assert stream.closed
         assert not fifo_path.exists()
 
-    def test_data_received_across_writer_reconnects(self, tmp_path, monkeypatch):
+    def test_data_received_across_writer_reconnects(self, manager, tmp_path, monkeypatch):
         """Chunks written by successive writers (tmux re-attaching pipe-pane)
-        are all published; writer disconnects must not kill the reader."""
-        received = []
-        monkeypatch.setattr(
-            fr.bus, "publish", lambda topic, data: received.append((topic, data["data"]))
-        )
-        manager = self._manager(tmp_path, monkeypatch)
+        are all published; writer disconnects must not stop the reader."""
+        received, _ = _capture_batches(monkeypatch)
         manager.create_reader("term-data")
         fifo_path = tmp_path / "term-data.fifo"
 
         for payload in (b"first", b"second"):
-            wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
-            os.write(wfd, payload)
-            os.close(wfd)
-            # Wait for the reader's select loop to pick the chunk up.
-            deadline = time.monotonic() + 3.0
-            while time.monotonic() < deadline and not any(
-                payload.decode() in d for _, d in received
-            ):
-                time.sleep(0.02)
+            _write(fifo_path, payload)
+            assert _wait_for(lambda: payload.decode() in "".join(d for _, d in received))
 
         manager.stop_reader("term-data")
 
         data = "".join(d for _, d in received)
-        assert "first" in data
-        assert "second" in data
+        assert data == "firstsecond"
         assert all(t == "terminal.term-data.output" for t, _ in received)
 
-    def test_repeated_create_stop_cycles_leave_no_threads(self, tmp_path, monkeypatch):
-        """Accumulation guard: the #382 report showed 26+ leaked reader threads
+    def test_repeated_create_stop_cycles_leave_no_open_fds(self, manager):
+        """Accumulation guard: the #382 report showed 26+ leaked readers
         after repeated session create/delete cycles."""
-        manager = self._manager(tmp_path, monkeypatch)
-        threads = []
+        streams = []
         for i in range(5):
             tid = f"term-cycle{i}"
             manager.create_reader(tid)
-            threads.append(self._thread(manager, tid))
+            streams.append(self._stream(manager, tid))
             manager.stop_reader(tid)
 
-        for t in threads:
-            t.join(timeout=3.0)
-        assert all(not t.is_alive() for t in threads)
-        leftover = [t.name for t in threading.enumerate() if t.name.startswith("fifo-term-cycle")]
-        assert leftover == []
+        assert all(stream.closed for stream in streams)
+        assert manager._readers == {}
+
+    def test_many_terminals_share_one_thread(self, manager, tmp_path, monkeypatch):
+        """Readers no longer cost a thread each: 50 terminals, one multiplexer."""
+        received, _ = _capture_batches(monkeypatch)
+        threads_before = threading.active_count()
+
+        for i in range(50):
+            manager.create_reader(f"term-many{i}")
+        for i in range(50):
+            _write(tmp_path / f"term-many{i}.fifo", f"hello-{i}".encode())
+
+        assert _wait_for(lambda: len({t for t, _ in received}) == 50)
+        # The multiplexer itself, started by the first create_reader.
+        assert threading.active_count() <= threads_before + 1
+        for i in range(50):
+            manager.stop_reader(f"term-many{i}")
+
+    def test_stop_reader_publishes_pending_bytes_before_returning(
+        self, manager, tmp_path, monkeypatch
+    ):
+        """The last frame of a torn-down terminal is flushed, not dropped."""
+        monkeypatch.setattr(fr, "_COALESCE_WINDOW", 30.0)
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-last")
+        _write(tmp_path / "term-last.fifo", b"final frame")
+        assert _wait_for(lambda: manager._ever_delivered.get("term-last") is True)
+
+        manager.stop_reader("term-last")
+
+        assert received == [("terminal.term-last.output", "final frame")]
+
+    def test_stop_multiplexer_closes_everything_and_restarts_on_demand(
+        self, manager, tmp_path, monkeypatch
+    ):
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-a")
+        stream = self._stream(manager, "term-a")
+
+        manager.stop_multiplexer()
+
+        assert stream.closed
+        assert not manager._mux_thread.is_alive()
+        manager.stop_reader("term-a")
+
+        manager.create_reader("term-b")
+        _write(tmp_path / "term-b.fifo", b"after restart")
+        assert _wait_for(lambda: ("terminal.term-b.output", "after restart") in received)
+        manager.stop_reader("term-b")
 
+    def _crash_multiplexer(self, manager, tmp_path, monkeypatch, terminal_id):
+        """Make the next publish raise, so the multiplexer loop dies on an error."""
+        real_publish = fr.bus.publish_batch
 
-class TestReaderLoopCoalescing:
-    """Tests for chunk coalescing in _reader_loop.
+        def boom(events):
+            monkeypatch.setattr(fr.bus, "publish_batch", real_publish)
+            raise RuntimeError("subscriber blew up")
+
+        monkeypatch.setattr(fr.bus, "publish_batch", boom)
+        _write(tmp_path / f"{terminal_id}.fifo", b"lost")
+        assert _wait_for(lambda: not manager._mux_thread.is_alive())
+
+    def test_existing_terminal_recovers_when_a_new_reader_restarts_the_multiplexer(
+        self, manager, tmp_path, monkeypatch
+    ):
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-a")
+        self._crash_multiplexer(manager, tmp_path, monkeypatch, "term-a")
+        assert self._stream(manager, "term-a").closed
+
+        manager.create_reader("term-b")
+        _write(tmp_path / "term-a.fifo", b"still here")
+
+        assert _wait_for(lambda: ("terminal.term-a.output", "still here") in received)
+        assert not self._stream(manager, "term-a").closed
+        manager.stop_reader("term-a")
+        manager.stop_reader("term-b")
+
+    def test_watchdog_restarts_a_crashed_multiplexer(self, manager, tmp_path, monkeypatch):
+        monkeypatch.setattr(fr, "PIPE_LIVENESS_CHECK_INTERVAL_S", 0.02)
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-a", pane_probe=lambda: "", rearm=lambda: None)
+        try:
+            self._crash_multiplexer(manager, tmp_path, monkeypatch, "term-a")
+
+            assert _wait_for(lambda: not self._stream(manager, "term-a").closed)
+            _write(tmp_path / "term-a.fifo", b"recovered")
+            assert _wait_for(lambda: ("terminal.term-a.output", "recovered") in received)
+        finally:
+            manager.stop_watchdog()
+            manager.stop_reader("term-a")
+
+
+class TestReaderCoalescing:
+    """Tests for per-terminal chunk coalescing in the multiplexer.
 
     kiro-cli's TUI animates a spinner at ~10 fps and each frame is a separate
     FIFO write. Publishing one event per raw read floods the shared async
@@ -157,117 +259,87 @@ class TestReaderLoopCoalescing:
     _COALESCE_WINDOW into one publish.
     """
 
-    def test_rapid_writes_produce_fewer_publishes_than_writes(self, tmp_path, monkeypatch):
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("cli_agent_orchestrator.services.fifo_reader.FIFO_DIR", tmp_path)
+        manager = FifoManager()
+        yield manager
+        manager.stop_multiplexer()
+
+    def test_rapid_writes_produce_fewer_publishes_than_writes(self, manager, tmp_path, monkeypatch):
         """10 back-to-back small writes must not produce 10 publishes.
 
         Regression guard for the queue-overflow bug that broke assign/handoff:
         each spinner frame was a separate publish, dropping worker completion
         events on the floor.
         """
-        monkeypatch.setattr("cli_agent_orchestrator.services.fifo_reader.FIFO_DIR", tmp_path)
-
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-coalesce")
         fifo_path = tmp_path / "term-coalesce.fifo"
-        os.mkfifo(fifo_path)
-
-        published: list[dict] = []
-
-        def fake_publish(topic, payload):
-            published.append({"topic": topic, "data": payload["data"]})
-
-        # _reader_loop is an instance method (it records per-terminal liveness
-        # on self for the #388 watchdog), so it needs a bound manager, not the
-        # bare unbound function.
-        manager = FifoManager()
-        stop_flag = threading.Event()
-        with patch(
-            "cli_agent_orchestrator.services.fifo_reader.bus.publish",
-            side_effect=fake_publish,
-        ):
-            reader = threading.Thread(
-                target=manager._reader_loop,
-                args=("term-coalesce", fifo_path, stop_flag),
-                daemon=True,
-            )
-            reader.start()
-
-            # Give reader time to open its fds.
-            time.sleep(0.1)
 
-            # Simulate spinner-frame bursts: 10 tiny writes within one window,
-            # separated by short pauses that mimic ~100Hz TUI redraws.
-            wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
-            try:
-                for i in range(10):
-                    os.write(wfd, f"frame-{i}".encode())
-                    time.sleep(0.002)  # 2ms — well below the coalesce window
-                # Let the reader flush.
-                time.sleep(0.2)
-            finally:
-                os.close(wfd)
-                stop_flag.set()
-                reader.join(timeout=2.0)
+        # Simulate spinner-frame bursts: 10 tiny writes within one window,
+        # separated by short pauses that mimic ~100Hz TUI redraws.
+        wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+        try:
+            for i in range(10):
+                os.write(wfd, f"frame-{i}".encode())
+                time.sleep(0.002)  # 2ms — well below the coalesce window
+            # Let the reader flush.
+            time.sleep(0.2)
+        finally:
+            os.close(wfd)
 
         # 10 writes must NOT produce 10 publishes.
-        assert len(published) < 10, (
-            f"Coalescing failed: got {len(published)} publishes for 10 writes. "
+        assert len(received) < 10, (
+            f"Coalescing failed: got {len(received)} publishes for 10 writes. "
             f"Expected fewer than 10 (ideally 1-3)."
         )
         # All the bytes must still get through, in order.
-        combined = "".join(p["data"] for p in published)
-        assert combined == "".join(f"frame-{i}" for i in range(10))
-        # All publishes are on the right topic.
-        assert all(p["topic"] == "terminal.term-coalesce.output" for p in published)
+        assert "".join(d for _, d in received) == "".join(f"frame-{i}" for i in range(10))
+        assert all(t == "terminal.term-coalesce.output" for t, _ in received)
 
-    def test_pending_flushes_on_writer_idle(self, tmp_path, monkeypatch):
+    def test_pending_flushes_on_writer_idle(self, manager, tmp_path, monkeypatch):
         """When the writer pauses, pending data flushes within one window.
 
         Otherwise kiro's TUI pausing between spinner frames or waiting for an
         LLM response would strand bytes in the pending buffer, leaving the
         status monitor with a stale view.
         """
-        monkeypatch.setattr("cli_agent_orchestrator.services.fifo_reader.FIFO_DIR", tmp_path)
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-flush")
 
-        fifo_path = tmp_path / "term-flush.fifo"
-        os.mkfifo(fifo_path)
+        # One write, then long silence — the coalesce timer must trigger a
+        # flush without needing a follow-up write.
+        _write(tmp_path / "term-flush.fifo", b"lonely-chunk")
+        time.sleep(0.3)
 
-        published: list[dict] = []
+        assert "lonely-chunk" in "".join(d for _, d in received)
 
-        def fake_publish(topic, payload):
-            published.append({"topic": topic, "data": payload["data"]})
+    def test_size_cap_flushes_before_window(self, manager, tmp_path, monkeypatch):
+        """A sustained burst publishes once the batch reaches _COALESCE_MAX_BYTES."""
+        monkeypatch.setattr(fr, "_COALESCE_WINDOW", 30.0)
+        monkeypatch.setattr(fr, "_COALESCE_MAX_BYTES", 1024)
+        received, _ = _capture_batches(monkeypatch)
+        manager.create_reader("term-cap")
 
-        # _reader_loop is an instance method (it records per-terminal liveness
-        # on self for the #388 watchdog), so it needs a bound manager, not the
-        # bare unbound function.
-        manager = FifoManager()
-        stop_flag = threading.Event()
-        with patch(
-            "cli_agent_orchestrator.services.fifo_reader.bus.publish",
-            side_effect=fake_publish,
-        ):
-            reader = threading.Thread(
-                target=manager._reader_loop,
-                args=("term-flush", fifo_path, stop_flag),
-                daemon=True,
-            )
-            reader.start()
+        _write(tmp_path / "term-cap.fifo", b"x" * 4096)
 
-            time.sleep(0.1)
+        assert _wait_for(lambda: sum(len(d) for _, d in received) == 4096)
 
-            # One write, then long silence — the coalesce timer must trigger
-            # a flush without needing a follow-up write.
-            wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
-            try:
-                os.write(wfd, b"lonely-chunk")
-                # Wait well beyond the coalesce window.
-                time.sleep(0.3)
-            finally:
-                os.close(wfd)
-                stop_flag.set()
-                reader.join(timeout=2.0)
+    def test_terminals_flushing_together_share_one_batch(self, manager, tmp_path, monkeypatch):
+        """Output from several terminals in one window reaches the bus as one batch."""
+        _, batches = _capture_batches(monkeypatch)
+        for i in range(3):
+            manager.create_reader(f"term-batch{i}")
+        time.sleep(0.05)
+
+        for i in range(3):
+            _write(tmp_path / f"term-batch{i}.fifo", f"out-{i}".encode())
 
-        assert len(published) >= 1, "Pending data was never flushed"
-        combined = "".join(p["data"] for p in published)
-        assert "lonely-chunk" in combined
+        assert _wait_for(lambda: sum(len(b) for b in batches) == 3)
+        assert len(batches) < 3
+        topics = sorted(topic for batch in batches for topic, _ in batch)
+        assert topics == [f"terminal.term-batch{i}.output" for i in range(3)]
 
 
 class TestPipeLivenessWatchdog:
@@ -578,6 +650,7 @@ class TestPipeLivenessWatchdog:
             assert "term-enroll" not in manager._liveness
         finally:
             manager.stop_watchdog()
+            manager.stop_multiplexer()
 
     def test_create_reader_without_callbacks_is_not_watched(self, tmp_path, monkeypatch):
         """Backward compat: callers that omit probe/rearm (or backends without
@@ -589,6 +662,74 @@ class TestPipeLivenessWatchdog:
             assert manager._watchdog_thread is None
         finally:
             manager.stop_reader("term-plain")
+            manager.stop_multiplexer()
+
+    def test_baseline_is_kept_as_fixed_size_digest(self, tmp_path, monkeypatch):
+        """The pinned baseline is a digest, not the capture, so watchdog memory
+        does not grow with the probed tail; divergence is still detected."""
+        monkeypatch.setattr(fr, "PIPE_LIVENESS_STALL_CHECKS", 1)
+        manager = self._manager(tmp_path, monkeypatch)
+        pane = {"content": "x" * 100_000}
+        rearm_calls: list = []
+        self._enroll(manager, "term", pane, rearm_calls, last_data_at=time.monotonic())
+
+        manager._check_pipe_liveness("term")  # baseline
+        baseline = manager._liveness["term"][0]
+        assert isinstance(baseline, bytes) and len(baseline) == 16
+
+        pane["content"] = "x" * 99_999 + "y"
+        manager._check_pipe_liveness("term")
+        assert rearm_calls == [True]
+
+    def test_watchdog_tick_probes_batched_terminals_in_one_call(self, tmp_path, monkeypatch):
+        """Terminals enrolled with a probe_key are captured through the single
+        batch probe; only those the batch could not capture fall back to their
+        own probe."""
+        manager = self._manager(tmp_path, monkeypatch)
+        batch_calls: list = []
+
+        def batch_probe(keys):
+            batch_calls.append(list(keys))
+            return {key: f"content {key}" for key in keys if key != ("s", "gone")}
+
+        for tid, key in (("t1", ("s", "w1")), ("t2", ("s", "w2")), ("t3", ("s", "gone"))):
+            manager._pane_probe[tid] = lambda: "fallback"
+            manager._rearm[tid] = lambda: None
+            manager._probe_keys[tid] = key
+            manager._last_data_at[tid] = time.monotonic()
+        manager.set_batch_probe(batch_probe)
+
+        checked: dict = {}
+        monkeypatch.setattr(
+            manager,
+            "_check_pipe_liveness",
+            lambda tid, content=None, probed_at=None: checked.__setitem__(tid, content),
+        )
+        waits = iter([False, True])
+        monkeypatch.setattr(manager._watchdog_stop, "wait", lambda timeout: next(waits))
+
+        manager._watchdog_loop()
+
+        assert batch_calls == [[("s", "w1"), ("s", "w2"), ("s", "gone")]]
+        assert checked == {"t1": "content ('s', 'w1')", "t2": "content ('s', 'w2')", "t3": None}
+
+    def test_batch_probe_failure_falls_back_to_single_probes(self, tmp_path, monkeypatch):
+        manager = self._manager(tmp_path, monkeypatch)
+        pane = {"content": "l0"}
+        rearm_calls: list = []
+        self._enroll(manager, "term", pane, rearm_calls, last_data_at=time.monotonic())
+        manager._probe_keys["term"] = ("s", "w")
+
+        def broken_batch(keys):
+            raise RuntimeError("tmux gone")
+
+        manager.set_batch_probe(broken_batch)
+        waits = iter([False, True])
+        monkeypatch.setattr(manager._watchdog_stop, "wait", lambda timeout: next(waits))
+
+        manager._watchdog_loop()  # one tick: baseline taken via the terminal's own probe
+        assert "term" in manager._liveness
+        assert rearm_calls == []
 
 
 class TestColdStartStallDetection:
@@ -764,6 +905,7 @@ class TestColdStartStallDetection:
         finally:
             manager.stop_reader("term-e2e")
             manager.stop_watchdog()
+            manager.stop_multiplexer()
 
     def test_cold_start_gives_up_after_max_attempts_instead_of_retrying_forever(
         self, tmp_path, monkeypatch
@@ -849,7 +991,7 @@ class TestConcurrencyRaces:
     """
 
     def test_reader_loop_last_data_at_write_is_atomic_with_stop(self, tmp_path, monkeypatch):
-        """The reader loop's ``if terminal_id in self._readers:
+        """The multiplexer's ``if terminal_id in self._readers:
         self._last_data_at[terminal_id] = time.monotonic()`` must check and
         write under the same ``_lock`` acquisition. If the check and the write
         are not atomic, a ``stop_reader()`` that pops both dicts between them
@@ -858,21 +1000,20 @@ class TestConcurrencyRaces:
         ``_pane_probe``) will never revisit or clean up.
 
         This forces the exact interleaving via a synchronization barrier
-        (blocking ``time.monotonic()`` while the reader thread holds the lock
-        for the write) instead of relying on timing luck, and additionally
+        (blocking ``time.monotonic()`` while the multiplexer thread holds the
+        lock for the write) instead of relying on timing luck, and additionally
         asserts that ``stop_reader()`` is provably blocked on the held lock
         during that window — a mechanical proof the two sections share a
         critical section, not just a probabilistic absence of the bug.
         """
         monkeypatch.setattr("cli_agent_orchestrator.services.fifo_reader.FIFO_DIR", tmp_path)
         fifo_path = tmp_path / "term-race.fifo"
-        os.mkfifo(fifo_path)
 
         manager = FifoManager()
         terminal_id = "term-race"
-        # Enroll by hand (no create_reader/watchdog needed for this race).
-        manager._readers[terminal_id] = threading.Event()
-        manager._last_data_at[terminal_id] = 0.0
+        # Registered before the patch below: with nothing pending, the idle
+        # multiplexer never reads the clock until the first byte arrives.
+        manager.create_reader(terminal_id)
 
         entered_write_section = threading.Event()
         release_write_section = threading.Event()
@@ -883,48 +1024,38 @@ class TestConcurrencyRaces:
             release_write_section.wait(timeout=2.0)
             return real_monotonic()
 
-        stop_flag = threading.Event()
-
         with (
-            patch("cli_agent_orchestrator.services.fifo_reader.bus.publish"),
+            patch("cli_agent_orchestrator.services.fifo_reader.bus.publish_batch"),
             patch(
                 "cli_agent_orchestrator.services.fifo_reader.time.monotonic",
                 side_effect=blocking_monotonic,
             ),
         ):
-            reader = threading.Thread(
-                target=manager._reader_loop,
-                args=(terminal_id, fifo_path, stop_flag),
-                daemon=True,
-            )
-            reader.start()
-            time.sleep(0.1)  # let the reader open its fds
-
             wfd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
             try:
                 os.write(wfd, b"x")
                 assert entered_write_section.wait(timeout=2.0), (
-                    "reader thread never reached the _last_data_at write — "
+                    "multiplexer never reached the _last_data_at write — "
                     "test setup is broken, not exercising the race"
                 )
 
                 stopper = threading.Thread(target=manager.stop_reader, args=(terminal_id,))
                 stopper.start()
                 # If the check-then-write is atomic under _lock, stop_reader
-                # must block trying to acquire it (held by the reader thread,
+                # must block trying to acquire it (held by the multiplexer,
                 # parked in blocking_monotonic) rather than racing ahead.
                 time.sleep(0.1)
                 assert stopper.is_alive(), (
-                    "stop_reader must be blocked on the lock held by the reader "
-                    "thread's check-then-write, not proceeding concurrently"
+                    "stop_reader must be blocked on the lock held by the "
+                    "multiplexer's check-then-write, not proceeding concurrently"
                 )
 
                 release_write_section.set()
                 stopper.join(timeout=2.0)
             finally:
                 os.close(wfd)
-                stop_flag.set()
-                reader.join(timeout=2.0)
+                release_write_section.set()
+                manager.stop_multiplexer()
 
         assert terminal_id not in manager._last_data_at, (
             "stop_reader's pop must win the race — an atomic check-then-write "
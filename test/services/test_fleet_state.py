@@ -0,0 +1,181 @@
+"""Tests for the shared AG-UI fleet projection (services/fleet_state.py)."""
+
+import asyncio
+
+import pytest
+
+from cli_agent_orchestrator.services.fleet_state import FleetState
+
+
+class _Fleet:
+    """Mutable fake backend; ``load`` counts how often the fleet is read."""
+
+    def __init__(self):
+        self.sessions = [{"id": "s1", "name": "s1", "status": "active"}]
+        self.terminals = [
+            {"id": "t1", "tmux_session": "s1", "provider": "q_cli", "agent_profile": "dev"},
+        ]
+        self.loads = 0
+        self.fail = False
+
+    def load(self):
+        self.loads += 1
+        if self.fail:
+            raise RuntimeError("backend down")
+        return list(self.sessions), list(self.terminals)
+
+
+def _refresh(state):
+    asyncio.run(state.refresh())
+
+
+def test_first_refresh_is_a_baseline_then_deltas_follow():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    _refresh(state)
+    version, snapshot = state.current()
+    assert [t["id"] for t in snapshot["terminals"]] == ["t1"]
+    assert "scopes" not in snapshot
+    assert state.deltas_since(version) == []
+    assert state.deltas_since(version - 1) is None  # nothing before the baseline
+
+    fleet.terminals.append(
+        {"id": "t2", "tmux_session": "s1", "provider": "q_cli", "agent_profile": "rev"}
+    )
+    state.mark_dirty()
+    _refresh(state)
+
+    ops = state.deltas_since(version)
+    assert ("add", "/terminals/1") in [(op["op"], op["path"]) for op in ops]
+    assert not any(op["path"] == "/terminals" for op in ops)
+    assert state.current()[0] == version + 1
+
+
+def test_refresh_is_skipped_until_something_marks_it_dirty():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    _refresh(state)
+    _refresh(state)
+    assert fleet.loads == 1
+
+    state.observe({"id": "e1", "kind": "output", "data": {}})
+    _refresh(state)
+    assert fleet.loads == 1
+
+
+def test_lifecycle_record_seen_by_many_streams_dirties_once():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    _refresh(state)
+    record = {"id": "e1", "kind": "launch", "data": {}}
+
+    state.observe(record)
+    _refresh(state)
+    state.observe(record)  # a second stream draining the same record
+    _refresh(state)
+
+    assert fleet.loads == 2
+
+
+def test_set_status_patches_one_field_without_loading():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    _refresh(state)
+    version, _ = state.current()
+
+    state.set_status("t1", "processing")
+    state.set_status("t1", "processing")  # unchanged: no new version
+    state.set_status("unknown", "idle")
+
+    assert fleet.loads == 1
+    assert state.current()[0] == version + 1
+    assert state.deltas_since(version) == [
+        {"op": "replace", "path": "/terminals/0/status", "value": "processing"}
+    ]
+
+
+def test_known_status_survives_a_reread():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    state.set_status("t1", "completed")  # arrives before the first read
+    _refresh(state)
+    assert state.current()[1]["terminals"][0]["status"] == "completed"
+
+    state.mark_dirty()
+    _refresh(state)
+    assert state.current()[1]["terminals"][0]["status"] == "completed"
+
+
+def test_history_runs_out_after_too_many_versions():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    _refresh(state)
+    version, _ = state.current()
+
+    for i in range(100):
+        state.set_status("t1", f"s{i}")
+
+    assert state.deltas_since(version) is None
+    assert len(state.deltas_since(state.current()[0] - 3)) == 3
+
+
+def test_loader_failure_leaves_the_projection_dirty():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load)
+    fleet.fail = True
+    with pytest.raises(RuntimeError):
+        _refresh(state)
+    assert state.current() == (0, None)
+
+    fleet.fail = False
+    _refresh(state)
+    assert state.current()[0] == 1
+
+
+def test_watchers_are_woken_on_change():
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load, reconcile_interval=60)
+
+    async def scenario():
+        watch = state.attach()
+        try:
+            await state.refresh()
+            await asyncio.sleep(0)
+            assert watch.changed.is_set()
+            watch.changed.clear()
+            state.set_status("t1", "idle")
+            await asyncio.sleep(0)
+            assert watch.changed.is_set()
+        finally:
+            state.detach(watch)
+        assert state._follower is None
+
+    asyncio.run(scenario())
+
+
+def test_reconcile_runs_while_status_events_keep_arriving():
+    """Events more frequent than the reconcile interval must not postpone it."""
+    from unittest.mock import patch
+
+    from cli_agent_orchestrator.services.event_bus import EventBus
+
+    fleet = _Fleet()
+    state = FleetState(loader=fleet.load, reconcile_interval=0.1)
+    bus = EventBus()
+
+    async def scenario():
+        bus.set_loop(asyncio.get_running_loop())
+        watch = state.attach()
+        try:
+            await state.refresh()
+            loads = fleet.loads
+            for i in range(25):  # an event every 20ms for 0.5s
+                bus.publish("terminal.t1.status", {"status": "processing" if i % 2 else "idle"})
+                await asyncio.sleep(0.02)
+            assert fleet.loads >= loads + 2
+        finally:
+            state.detach(watch)
+            bus.set_loop(None)
+
+    with patch("cli_agent_orchestrator.services.event_bus.bus", bus):
+        asyncio.run(scenario())
@@ -249,7 +249,7 @@ class TestFailClosed:
         from cli_agent_orchestrator.services import settings_service
 
         with patch.object(
-            settings_service, "get_memory_settings", side_effect=RuntimeError("boom")
+            settings_service, "get_settings_snapshot", side_effect=RuntimeError("boom")
         ):
             assert settings_service.is_learning_enabled() is False
 
@@ -258,6 +258,6 @@ class TestFailClosed:
 
         settings_file.write_text(json.dumps({"memory": {"learning_enabled": True}}))
         with patch.object(
-            settings_service, "get_memory_settings", side_effect=RuntimeError("boom")
+            settings_service, "get_settings_snapshot", side_effect=RuntimeError("boom")
         ):
             assert settings_service.is_instruction_promotion_enabled() is False
@@ -8,6 +8,7 @@ export test file.
 
 import asyncio
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy import create_engine
@@ -565,3 +566,47 @@ class TestHeaderCommentOnlySpoofEscaped:
         memory = svc._parse_wiki_file(wiki_path, text, entry)
         assert memory is not None
         assert memory.id != "deadbeef"
+
+
+class TestBulkImport:
+    """Imports run in one bulk session: one index rewrite, one metadata commit."""
+
+    def test_index_and_metadata_written_once(self, svc, backend, bundle):
+        for i in range(12):
+            _write_topic(bundle, f"topic-{i:02d}", f"Body {i}.")
+        with (
+            patch.object(svc, "_write_index", wraps=svc._write_index) as write_index,
+            patch.object(
+                svc, "_upsert_metadata_batch", wraps=svc._upsert_metadata_batch
+            ) as upsert_batch,
+        ):
+            report = backend.import_bundle(bundle, "global", "skip", False)
+
+        assert report.imported == 12
+        assert write_index.call_count == 1
+        assert upsert_batch.call_count == 1
+        index_keys = [e["key"] for e in svc._parse_index(svc.get_index_path("global", None))]
+        assert sorted(index_keys) == [f"topic-{i:02d}" for i in range(12)]
+        assert _metadata_row(svc, "topic-11") is not None
+
+    def test_replace_policy_within_the_session(self, svc, backend, bundle):
+        _write_topic(bundle, "alpha", "New body.")
+        _run(svc.store("Old body.", scope="global", memory_type="reference", key="alpha"))
+
+        report = backend.import_bundle(bundle, "global", "replace", False)
+
+        assert report.replaced == 1
+        text = _stored_text(svc, "alpha")
+        assert "New body." in text and "Old body." not in text
+        index_keys = [e["key"] for e in svc._parse_index(svc.get_index_path("global", None))]
+        assert index_keys == ["alpha"]
+
+    def test_federated_bodies_are_scanned_once(self, svc, backend, bundle):
+        _write_topic(bundle, "clean", "Nothing secret here.")
+        with patch(
+            "cli_agent_orchestrator.services.memory_bulk.scan_for_secrets", return_value=None
+        ) as scan:
+            report = backend.import_bundle(bundle, "federated", "skip", False)
+
+        assert report.imported == 1
+        assert scan.call_count == 1
@@ -0,0 +1,130 @@
+"""Tests for bulk memory sessions (services/memory_bulk.py, MemoryService.bulk)."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine
+
+from cli_agent_orchestrator.clients.database import Base, MemoryMetadataModel
+from cli_agent_orchestrator.services.memory_service import MemoryService
+
+
+def _make_svc(tmp_path: Path, name: str) -> MemoryService:
+    engine = create_engine(
+        f"sqlite:///{tmp_path / f'{name}.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    return MemoryService(base_dir=tmp_path / f"{name}-memory", db_engine=engine)
+
+
+@pytest.fixture
+def svc(tmp_path):
+    return _make_svc(tmp_path, "main")
+
+
+def _store(svc: MemoryService, key: str, content: str = "body text") -> None:
+    asyncio.run(svc.store(content, scope="global", memory_type="reference", key=key))
+
+
+def _rows(svc: MemoryService) -> list:
+    with svc._get_db_session() as db:
+        return sorted(row.key for row in db.query(MemoryMetadataModel).all())
+
+
+def _index_keys(svc: MemoryService) -> list:
+    return [entry["key"] for entry in svc._parse_index(svc.get_index_path("global", None))]
+
+
+def test_writes_land_at_exit(svc):
+    with svc.bulk():
+        _store(svc, "alpha")
+        _store(svc, "beta")
+        assert not svc.get_wiki_path("global", None, "alpha").exists()
+        assert not svc.get_index_path("global", None).exists()
+        assert _rows(svc) == []
+
+    assert "body text" in svc.get_wiki_path("global", None, "alpha").read_text()
+    assert _rows(svc) == ["alpha", "beta"]
+
+
+def test_index_matches_sequential_stores(svc, tmp_path):
+    plain = _make_svc(tmp_path, "plain")
+    _store(plain, "old")
+    _store(svc, "old")
+    keys = ["k1", "k2", "old", "k3"]
+    for key in keys:
+        _store(plain, key)
+    with svc.bulk():
+        for key in keys:
+            _store(svc, key)
+
+    assert _index_keys(svc) == _index_keys(plain) == ["k3", "old", "k2", "k1"]
+
+
+def test_each_index_and_the_metadata_are_written_once(svc):
+    with (
+        patch.object(svc, "_write_index", wraps=svc._write_index) as write_index,
+        patch.object(
+            svc, "_upsert_metadata_batch", wraps=svc._upsert_metadata_batch
+        ) as upsert_batch,
+    ):
+        with svc.bulk():
+            for i in range(20):
+                _store(svc, f"topic-{i}")
+
+    assert write_index.call_count == 1
+    assert upsert_batch.call_count == 1
+    assert len(_index_keys(svc)) == 20
+
+
+def test_repeat_store_merges_the_buffered_topic(svc):
+    with svc.bulk():
+        _store(svc, "topic", "first entry")
+        _store(svc, "topic", "second entry")
+
+    text = svc.get_wiki_path("global", None, "topic").read_text()
+    assert "first entry" in text and "second entry" in text
+    assert _index_keys(svc) == ["topic"]
+
+
+def test_forget_drops_a_buffered_topic(svc):
+    _store(svc, "kept")
+    with svc.bulk():
+        _store(svc, "gone")
+        assert asyncio.run(svc.forget("gone", scope="global")) is True
+
+    assert not svc.get_wiki_path("global", None, "gone").exists()
+    assert _index_keys(svc) == ["kept"]
+    assert _rows(svc) == ["kept"]
+
+
+def test_other_services_are_not_batched(svc, tmp_path):
+    other = _make_svc(tmp_path, "other")
+    with svc.bulk():
+        _store(other, "direct")
+        assert other.get_wiki_path("global", None, "direct").exists()
+
+
+def test_buffered_writes_survive_an_error(svc):
+    with pytest.raises(RuntimeError):
+        with svc.bulk():
+            _store(svc, "saved")
+            raise RuntimeError("import aborted")
+
+    assert svc.get_wiki_path("global", None, "saved").exists()
+    assert _rows(svc) == ["saved"]
+
+
+def test_map_preserves_order_and_scan_is_memoized(svc):
+    with svc.bulk() as session:
+        assert session.map(lambda n: n * n, range(50)) == [n * n for n in range(50)]
+        with patch(
+            "cli_agent_orchestrator.services.memory_bulk.scan_for_secrets", return_value=None
+        ) as scan:
+            session.scan("same body")
+            session.scan("same body")
+        assert scan.call_count == 1
@@ -0,0 +1,165 @@
+"""Tests for speculative first-message memory blocks (services/memory_prefetch.py)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from cli_agent_orchestrator.services import terminal_service
+from cli_agent_orchestrator.services.memory_prefetch import (
+    MemoryContextPrefetcher,
+    reset_memory_prefetcher,
+)
+
+BLOCK = "<cao-memory>\n- [global] prefer-pytest: Always use pytest\n</cao-memory>"
+
+
+@pytest.fixture
+def prefetcher():
+    p = MemoryContextPrefetcher(deadline=0.2, ttl=60)
+    yield p
+    p.close()
+
+
+def _unreachable():
+    raise AssertionError("on-demand build should not run")
+
+
+def test_prefetched_block_is_a_hit(prefetcher):
+    prefetcher.schedule("t1", lambda: BLOCK)
+    time.sleep(0.05)
+
+    assert prefetcher.take("t1", _unreachable) == (BLOCK, "hit")
+    assert prefetcher.stats()["pending"] == 0
+
+
+def test_build_in_flight_is_awaited_within_the_deadline(prefetcher):
+    release = threading.Event()
+    prefetcher.schedule("t1", lambda: release.wait(5) and BLOCK)
+    threading.Timer(0.05, release.set).start()
+
+    assert prefetcher.take("t1", _unreachable) == (BLOCK, "wait")
+
+
+def test_deadline_sends_without_memory(prefetcher):
+    release = threading.Event()
+    prefetcher.schedule("t1", lambda: release.wait(5) and BLOCK)
+    try:
+        t0 = time.monotonic()
+        assert prefetcher.take("t1", _unreachable) == (None, "timeout")
+        assert time.monotonic() - t0 < 1.0
+    finally:
+        release.set()
+
+
+def test_missing_or_stale_prefetch_is_built_on_demand():
+    prefetcher = MemoryContextPrefetcher(deadline=1.0, ttl=0.01)
+    try:
+        assert prefetcher.take("t1", lambda: "fresh") == ("fresh", "miss")
+
+        prefetcher.schedule("t2", lambda: "old")
+        time.sleep(0.05)
+        assert prefetcher.take("t2", lambda: "rebuilt") == ("rebuilt", "miss")
+    finally:
+        prefetcher.close()
+
+
+def test_failed_build_is_an_error(prefetcher):
+    def boom():
+        raise RuntimeError("db locked")
+
+    assert prefetcher.take("t1", boom) == (None, "error")
+
+
+def test_stats_report_hit_rate_and_latency(prefetcher):
+    prefetcher.record("hit", 0.001)
+    prefetcher.record("hit", 0.001)
+    prefetcher.record("wait", 0.1)
+    prefetcher.record("timeout", 0.2)
+
+    stats = prefetcher.stats()
+    assert stats["injections"] == 4
+    assert stats["hit_rate"] == 0.75
+    assert stats["mean_latency_seconds"] == pytest.approx(0.0755)
+
+
+class TestInjectMemoryContext:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        terminal_service._memory_injected_terminals.clear()
+        reset_memory_prefetcher()
+        yield
+        reset_memory_prefetcher()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_prefetched_block_skips_the_send_time_build(self, mock_svc_cls):
+        mock_svc_cls.return_value.get_prefetchable_memory_context.return_value = BLOCK
+        terminal_service.prefetch_memory_context("t1")
+        time.sleep(0.05)
+
+        result = terminal_service.inject_memory_context("Fix the bug", "t1")
+
+        assert result == BLOCK + "\n\nFix the bug"
+        mock_svc_cls.return_value.get_curated_memory_context.assert_not_called()
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_curator_sessions_are_curated_at_send_time(self, mock_svc_cls):
+        svc = mock_svc_cls.return_value
+        svc.get_prefetchable_memory_context.return_value = None
+        svc.get_curated_memory_context.return_value = "<cao-memory>\ncurated\n</cao-memory>"
+        terminal_service.prefetch_memory_context("t1")
+        time.sleep(0.05)
+
+        result = terminal_service.inject_memory_context("Fix the bug", "t1")
+
+        assert result.startswith("<cao-memory>\ncurated")
+        svc.get_curated_memory_context.assert_called_once_with("t1", task_description="Fix the bug")
+        assert terminal_service.get_memory_prefetcher().stats()["curated"] == 1
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_curator_session_without_prefetch_is_curated_on_the_sender(self, mock_svc_cls):
+        svc = mock_svc_cls.return_value
+        svc.get_prefetchable_memory_context.return_value = None
+        svc.get_curated_memory_context.side_effect = lambda *_a, **_kw: (
+            threading.current_thread().name + "\n<cao-memory>\ncurated\n</cao-memory>"
+        )
+
+        result = terminal_service.inject_memory_context("Fix the bug", "t1")
+
+        assert result.startswith(threading.current_thread().name + "\n<cao-memory>\ncurated")
+        svc.get_curated_memory_context.assert_called_once_with("t1", task_description="Fix the bug")
+        assert terminal_service.get_memory_prefetcher().stats()["curated"] == 1
+
+    @patch("cli_agent_orchestrator.services.terminal_service.MemoryService")
+    def test_slow_block_does_not_hold_the_message(self, mock_svc_cls):
+        release = threading.Event()
+        mock_svc_cls.return_value.get_prefetchable_memory_context.side_effect = lambda _: (
+            release.wait(5) and BLOCK
+        )
+        try:
+            with patch.object(terminal_service.get_memory_prefetcher(), "deadline", 0.05):
+                terminal_service.prefetch_memory_context("t1")
+                result = terminal_service.inject_memory_context("Fix the bug", "t1")
+        finally:
+            release.set()
+
+        assert result == "Fix the bug"
+        assert terminal_service.get_memory_prefetcher().stats()["timeout"] == 1
+
+    @patch("cli_agent_orchestrator.services.memory_service._is_memory_enabled", return_value=True)
+    def test_curator_lookup_error_falls_back_to_the_direct_block(self, _enabled):
+        from cli_agent_orchestrator.services.memory_service import MemoryService
+
+        svc = MemoryService()
+        with (
+            patch.object(svc, "_get_terminal_context", return_value={"session_name": "s"}),
+            patch.object(
+                svc, "_find_context_manager_terminal", side_effect=RuntimeError("db locked")
+            ),
+            patch.object(svc, "get_memory_context_for_terminal", return_value=BLOCK) as direct,
+        ):
+            assert svc.get_prefetchable_memory_context("t1") == BLOCK
+        direct.assert_called_once_with("t1")
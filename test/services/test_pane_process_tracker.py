@@ -0,0 +1,124 @@
+"""Tests for the pane foreground-process tracker."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from cli_agent_orchestrator.services import pane_process_tracker as ppt
+from cli_agent_orchestrator.services.pane_process_tracker import PaneProcessTracker
+
+
+def _write_stat(proc_root, pid, pgrp, tpgid, comm="bash"):
+    proc_dir = proc_root / str(pid)
+    proc_dir.mkdir(parents=True, exist_ok=True)
+    # pid (comm) state ppid pgrp session tty_nr tpgid ...
+    (proc_dir / "stat").write_text(f"{pid} ({comm}) S 1 {pgrp} {pgrp} 34816 {tpgid} 4194560 0\n")
+
+
+@pytest.fixture
+def proc_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(ppt, "_PROC_ROOT", tmp_path)
+    return tmp_path
+
+
+class TestShellInForeground:
+    def test_untracked_terminal_is_unknown(self, proc_root):
+        assert PaneProcessTracker().shell_in_foreground("t1") is None
+
+    def test_missing_proc_entry_is_unknown(self, proc_root):
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+
+        assert tracker.shell_in_foreground("t1") is None
+
+    def test_shell_owning_foreground_group(self, proc_root):
+        _write_stat(proc_root, 100, pgrp=100, tpgid=100)
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+
+        assert tracker.shell_in_foreground("t1") is True
+
+    def test_comm_with_parenthesis_and_spaces(self, proc_root):
+        _write_stat(proc_root, 100, pgrp=100, tpgid=100, comm="we ird) name")
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+
+        assert tracker.shell_in_foreground("t1") is True
+
+    def test_no_controlling_tty_is_unknown(self, proc_root):
+        _write_stat(proc_root, 100, pgrp=100, tpgid=-1)
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+
+        assert tracker.shell_in_foreground("t1") is None
+
+    def test_cli_in_foreground_is_cached_without_pidfd(self, proc_root, monkeypatch):
+        monkeypatch.setattr(ppt, "_open_pidfd", lambda pid: None)
+        _write_stat(proc_root, 100, pgrp=100, tpgid=200)
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+
+        assert tracker.shell_in_foreground("t1") is False
+
+        # Within the TTL the cached answer is served without reading /proc.
+        _write_stat(proc_root, 100, pgrp=100, tpgid=100)
+        assert tracker.shell_in_foreground("t1") is False
+
+        monkeypatch.setattr(ppt.time, "monotonic", lambda: float("inf"))
+        assert tracker.shell_in_foreground("t1") is True
+
+    @pytest.mark.skipif(
+        not hasattr(os, "pidfd_open") or not sys.platform.startswith("linux"),
+        reason="pidfd_open requires Linux 5.3+",
+    )
+    def test_pidfd_exit_invalidates_cached_answer(self, proc_root):
+        cli = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdin.read()"], stdin=subprocess.PIPE
+        )
+        try:
+            _write_stat(proc_root, 100, pgrp=100, tpgid=cli.pid)
+            tracker = PaneProcessTracker()
+            tracker.track("t1", 100)
+
+            assert tracker.shell_in_foreground("t1") is False
+            _write_stat(proc_root, 100, pgrp=100, tpgid=100)
+            # CLI still alive: the pinned pidfd keeps the answer cached.
+            assert tracker.shell_in_foreground("t1") is False
+
+            cli.stdin.close()
+            cli.wait(timeout=10)
+            assert tracker.shell_in_foreground("t1") is True
+        finally:
+            if cli.poll() is None:
+                cli.kill()
+                cli.wait()
+
+
+class TestTrackLifecycle:
+    def test_untrack_forgets_terminal(self, proc_root):
+        _write_stat(proc_root, 100, pgrp=100, tpgid=100)
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+        assert tracker.is_tracked("t1")
+
+        tracker.untrack("t1")
+
+        assert not tracker.is_tracked("t1")
+        assert tracker.shell_in_foreground("t1") is None
+
+    def test_untrack_unknown_terminal_is_noop(self):
+        PaneProcessTracker().untrack("missing")
+
+    def test_retrack_replaces_pane_pid(self, proc_root, monkeypatch):
+        monkeypatch.setattr(ppt, "_open_pidfd", lambda pid: None)
+        _write_stat(proc_root, 100, pgrp=100, tpgid=200)
+        _write_stat(proc_root, 300, pgrp=300, tpgid=300)
+        tracker = PaneProcessTracker()
+        tracker.track("t1", 100)
+        assert tracker.shell_in_foreground("t1") is False
+
+        tracker.track("t1", 300)
+
+        assert tracker.shell_in_foreground("t1") is True
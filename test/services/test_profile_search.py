@@ -601,3 +601,37 @@ class TestLoadabilityExclusion:
         for r in results:
             profile = ap.load_agent_profile(r["name"])
             assert profile.name == r["name"]
+
+
+class TestWarmIndex:
+    """The BM25 index is reused while the corpus is unchanged."""
+
+    @pytest.fixture(autouse=True)
+    def _cold_index(self, monkeypatch):
+        from cli_agent_orchestrator.services import profile_search
+
+        monkeypatch.setattr(profile_search, "_index_cache", None)
+
+    def test_index_reused_for_identical_corpus(self, sample_profiles):
+        import rank_bm25
+
+        with patch.object(rank_bm25, "BM25Plus", wraps=rank_bm25.BM25Plus) as bm25:
+            first = search_profiles("sqs", profiles=sample_profiles)
+            second = search_profiles("monitoring", profiles=sample_profiles)
+
+        assert bm25.call_count == 1
+        assert first and second
+
+    def test_index_rebuilt_when_corpus_changes(self, sample_profiles):
+        import rank_bm25
+
+        from cli_agent_orchestrator.services.profile_search import warm_profile_index
+
+        edited = [dict(p) for p in sample_profiles]
+        edited[0]["description"] = "completely new words"
+        with patch.object(rank_bm25, "BM25Plus", wraps=rank_bm25.BM25Plus) as bm25:
+            warm_profile_index(sample_profiles)
+            search_profiles("sqs", profiles=sample_profiles)
+            search_profiles("sqs", profiles=edited)
+
+        assert bm25.call_count == 2
@@ -1,6 +1,8 @@
 """Tests for settings_service module."""
 
+import gc
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,19 +26,15 @@ from cli_agent_orchestrator.services.settings_service import (
 def settings_file(tmp_path):
     """Patch SETTINGS_FILE and CAO_HOME_DIR to use a temp directory.
 
-    Also resets get_server_settings()'s module-global cache
-    (_server_settings_cache/_server_settings_mtime_ns), which is keyed only
-    on SETTINGS_FILE's st_mtime_ns. Without this reset, back-to-back tests
-    that each write their own tmp_path/settings.json can collide on a
-    coarse-clock filesystem (two writes to DIFFERENT files landing on the
-    same st_mtime_ns tick) and a test would silently read the PRIOR test's
-    cached settings instead of its own -- flaky (~3-4 failures per run on
-    WSL2), not reproducible on every host, and each failing test passes in
-    isolation, which is exactly what a stale-cache bug looks like.
+    Also resets the module-global settings snapshot (and any watcher trust)
+    so every test resolves settings from its own file. The snapshot stamp
+    includes the file path, but an earlier cache keyed only on st_mtime_ns
+    made back-to-back tests collide on coarse-clock filesystems (~3-4 flaky
+    failures per run on WSL2), so isolation stays explicit.
     """
     fake_settings = tmp_path / "settings.json"
-    settings_service._server_settings_cache = None
-    settings_service._server_settings_mtime_ns = -1
+    settings_service._snapshot = None
+    settings_service._snapshot_trusted_until = 0.0
     with (
         patch(
             "cli_agent_orchestrator.services.settings_service.SETTINGS_FILE",
@@ -48,8 +46,8 @@ def settings_file(tmp_path):
         ),
     ):
         yield fake_settings
-    settings_service._server_settings_cache = None
-    settings_service._server_settings_mtime_ns = -1
+    settings_service._snapshot = None
+    settings_service._snapshot_trusted_until = 0.0
 
 
 class TestLoad:
@@ -402,11 +400,6 @@ class TestGetServerSettings:
     def test_state_buffer_max_env_override(self, settings_file, monkeypatch):
         from cli_agent_orchestrator.services.settings_service import get_server_settings
 
-        # Write the (empty) file so SETTINGS_FILE.exists() is True and this
-        # test's mtime is distinct from a prior test's -- get_server_settings()
-        # caches purely on file mtime, and a nonexistent file always hashes to
-        # mtime_ns=-1, so two tests that never call _save() could otherwise
-        # collide on the cache and silently return a stale prior result.
         _save({})
         monkeypatch.setenv("CAO_STATE_BUFFER_MAX", "65536")
         result = get_server_settings()
@@ -423,12 +416,153 @@ class TestGetServerSettings:
     def test_state_buffer_max_env_zero_falls_back_to_default(self, settings_file, monkeypatch):
         from cli_agent_orchestrator.services.settings_service import get_server_settings
 
-        _save({})  # see test_state_buffer_max_env_override for why
+        _save({})
         monkeypatch.setenv("CAO_STATE_BUFFER_MAX", "0")
         result = get_server_settings()
         assert result["state_buffer_max"] == 32768
 
 
+def _age(path: Path) -> None:
+    """Backdate ``path`` past the racy-mtime window so its stat stamp is trusted."""
+    old = path.stat().st_mtime - 60
+    os.utime(path, (old, old))
+
+
+class TestSettingsSnapshot:
+    """Tests for the versioned settings snapshot and its listeners."""
+
+    def test_unchanged_settings_reuse_snapshot_without_reparsing(self, settings_file):
+        _save({"server": {"mcp_request_timeout": 45}})
+        _age(settings_file)
+        first = settings_service.get_settings_snapshot()
+
+        with patch.object(settings_service, "_load", wraps=settings_service._load) as load:
+            for _ in range(5):
+                assert settings_service.get_settings_snapshot() is first
+                assert settings_service.is_memory_enabled() is True
+            assert settings_service.get_server_settings()["mcp_request_timeout"] == 45
+
+        load.assert_not_called()
+
+    def test_version_bumps_only_when_content_changes(self, settings_file):
+        _save({"memory": {"enabled": True}})
+        first = settings_service.get_settings_snapshot()
+
+        # Rewriting identical content is a touch, not a change.
+        settings_file.write_text(json.dumps({"memory": {"enabled": True}}))
+        assert settings_service.get_settings_snapshot().version == first.version
+
+        settings_file.write_text(json.dumps({"memory": {"enabled": False}}))
+        second = settings_service.get_settings_snapshot()
+        assert second.version == first.version + 1
+        assert second.memory_enabled is False
+
+    def test_env_change_re_resolves_snapshot(self, settings_file, monkeypatch):
+        _save({})
+        _age(settings_file)
+        assert settings_service.get_settings_snapshot().learning_enabled is False
+
+        monkeypatch.setenv("CAO_MEMORY_LEARNING_ENABLED", "true")
+
+        assert settings_service.get_settings_snapshot().learning_enabled is True
+
+    def test_snapshot_is_read_only(self, settings_file):
+        snapshot = settings_service.get_settings_snapshot()
+
+        with pytest.raises(TypeError):
+            snapshot.server["state_buffer_max"] = 1  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            snapshot.memory_enabled = False  # type: ignore[misc]
+
+    def test_getters_return_independent_copies(self, settings_file):
+        _save({"memory": {"project_id": "p1"}})
+
+        settings_service.get_memory_settings()["project_id"] = "mutated"
+        settings_service.get_server_settings()["state_buffer_max"] = 1
+
+        assert settings_service.get_memory_settings()["project_id"] == "p1"
+        assert settings_service.get_server_settings()["state_buffer_max"] == 32768
+
+    def test_trusted_snapshot_skips_stat_until_trust_withdrawn(self, settings_file):
+        _save({})
+        settings_service.refresh_settings_snapshot(trust_for=60)
+        # Written behind the service's back: invisible while the watcher's trust holds.
+        settings_file.write_text(json.dumps({"memory": {"enabled": False}}))
+
+        assert settings_service.is_memory_enabled() is True
+
+        settings_service.refresh_settings_snapshot(trust_for=0)
+        assert settings_service.is_memory_enabled() is False
+
+    def test_save_publishes_immediately_even_while_trusted(self, settings_file):
+        settings_service.refresh_settings_snapshot(trust_for=60)
+
+        settings_service.set_memory_setting("enabled", False)
+
+        assert settings_service.is_memory_enabled() is False
+
+
+class TestSubscribeSettings:
+    """Tests for settings change listeners."""
+
+    def test_listener_called_on_change_only(self, settings_file):
+        _save({})
+        seen = []
+        unsubscribe = settings_service.subscribe_settings(seen.append)
+        try:
+            settings_service.refresh_settings_snapshot()
+            assert seen == []
+
+            _save({"server": {"event_bus_max_queue_size": 8}})
+        finally:
+            unsubscribe()
+
+        assert [s.server["event_bus_max_queue_size"] for s in seen] == [8]
+
+    def test_unsubscribe_stops_notifications(self, settings_file):
+        seen = []
+        unsubscribe = settings_service.subscribe_settings(seen.append)
+        unsubscribe()
+
+        _save({"memory": {"enabled": False}})
+
+        assert seen == []
+
+    def test_bound_method_listener_is_held_weakly(self, settings_file):
+        class Consumer:
+            calls = 0
+
+            def on_change(self, snapshot):
+                Consumer.calls += 1
+
+        consumer = Consumer()
+        settings_service.subscribe_settings(consumer.on_change)
+        _save({"memory": {"enabled": False}})
+        assert Consumer.calls == 1
+
+        del consumer
+        gc.collect()
+        _save({"memory": {"enabled": True}})
+
+        assert Consumer.calls == 1
+
+    def test_failing_listener_does_not_block_others(self, settings_file):
+        seen = []
+
+        def boom(snapshot):
+            raise RuntimeError("boom")
+
+        unsubscribe_boom = settings_service.subscribe_settings(boom)
+        unsubscribe_seen = settings_service.subscribe_settings(seen.append)
+        try:
+            _save({"memory": {"enabled": False}})
+        finally:
+            unsubscribe_boom()
+            unsubscribe_seen()
+
+        assert len(seen) == 1
+
+
 # ===========================================================================
 # PR 526 human review — IMPORTANT: the four workflow_journal_* settings had ZERO
 # write-path test coverage.
@@ -441,7 +575,7 @@ class TestGetServerSettings:
 #
 # These drive set_memory_setting directly against the isolated tmp settings file
 # (the `settings_file` fixture patches SETTINGS_FILE + CAO_HOME_DIR and resets the
-# get_server_settings cache), so no test here can read or write a real ~/.cao.
+# settings snapshot), so no test here can read or write a real ~/.cao.
 # ===========================================================================
 _WF_INT_KEYS = [
     "workflow_journal_output_cap_bytes",
@@ -0,0 +1,111 @@
+"""Tests for event-driven provider startup (services/startup_sequencer.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+
+from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.providers.claude_code import ClaudeCodeProvider
+from cli_agent_orchestrator.services.event_bus import EventBus
+from cli_agent_orchestrator.services.startup_sequencer import StartupSequencer
+from cli_agent_orchestrator.utils.terminal import wait_until_status
+
+TERMINAL = "abcd1234"
+TRUST_SCREEN = "Quick safety check\n❯ 1. Yes, I trust this folder\n  2. No, exit\n"
+
+
+@pytest_asyncio.fixture
+async def live_bus():
+    """A fresh EventBus dispatching on the test's loop, with a tmux-style backend."""
+    bus = EventBus()
+    bus.set_loop(asyncio.get_running_loop())
+    backend = MagicMock()
+    backend.supports_event_inbox.return_value = False
+    with (
+        patch("cli_agent_orchestrator.services.startup_sequencer.bus", bus),
+        patch("cli_agent_orchestrator.services.event_bus.bus", bus),
+        patch("cli_agent_orchestrator.backends.registry.get_backend", return_value=backend),
+    ):
+        yield bus
+    bus.set_loop(None)
+
+
+def _publish_later(bus: EventBus, topic: str, data: dict, delay: float = 0.05) -> None:
+    asyncio.get_running_loop().call_later(delay, bus.publish, topic, data)
+
+
+@pytest.mark.asyncio
+async def test_output_event_wakes_the_wait(live_bus):
+    with StartupSequencer(TERMINAL, coalesce_window=0.01) as startup:
+        assert startup.event_driven
+        _publish_later(live_bus, f"terminal.{TERMINAL}.output", {"data": "x"})
+        t0 = time.monotonic()
+        assert await startup.wait_for_output(5.0) is True
+        assert time.monotonic() - t0 < 1.0
+
+        assert await startup.wait_for_output(0.05) is False  # burst was drained
+
+    assert live_bus.subscriber_stats() == []
+
+
+@pytest.mark.asyncio
+async def test_event_inbox_backend_falls_back_to_sleeping(live_bus):
+    backend = MagicMock()
+    backend.supports_event_inbox.return_value = True
+    with patch("cli_agent_orchestrator.backends.registry.get_backend", return_value=backend):
+        with StartupSequencer(TERMINAL) as startup:
+            assert not startup.event_driven
+            with patch("asyncio.sleep") as sleep:
+                assert await startup.wait_for_output(1.0) is False
+            sleep.assert_awaited_once_with(1.0)
+
+
+def test_phase_timings_are_recorded_in_order():
+    startup = StartupSequencer(TERMINAL)
+    for phase in ("shell_ready", "cli_launched", "prompts_handled", "first_idle"):
+        startup.mark(phase)
+
+    timings = startup.timings
+    assert list(timings) == ["shell_ready", "cli_launched", "prompts_handled", "first_idle"]
+    assert sorted(timings.values()) == list(timings.values())
+
+
+@pytest.mark.asyncio
+async def test_trust_prompt_is_answered_when_it_renders(live_bus):
+    backend = MagicMock()
+    screens = iter(["$ claude", TRUST_SCREEN])
+    backend.get_history.side_effect = lambda *a, **k: next(screens)
+    provider = ClaudeCodeProvider(TERMINAL, "cao-test", "w")
+
+    with (
+        patch("cli_agent_orchestrator.providers.claude_code.get_backend", return_value=backend),
+        StartupSequencer(TERMINAL, coalesce_window=0.01) as startup,
+    ):
+        provider._startup = startup
+        _publish_later(live_bus, f"terminal.{TERMINAL}.output", {"data": "trust dialog"})
+        t0 = time.monotonic()
+        await provider._handle_startup_prompts(idle_gap=5.0, outer_timeout=5.0)
+
+    # Woken by the repaint, not by the 1s fallback tick.
+    assert time.monotonic() - t0 < 0.5
+    backend.send_special_key.assert_called_once_with("cao-test", "w", "Enter")
+
+
+@pytest.mark.asyncio
+async def test_wait_until_status_wakes_on_status_event(live_bus):
+    monitor = MagicMock()
+    monitor.get_status.side_effect = [TerminalStatus.PROCESSING, TerminalStatus.IDLE]
+    with patch("cli_agent_orchestrator.services.status_monitor.status_monitor", monitor):
+        _publish_later(live_bus, f"terminal.{TERMINAL}.status", {"status": "idle"})
+        t0 = time.monotonic()
+        assert await wait_until_status(
+            TERMINAL, TerminalStatus.IDLE, timeout=5.0, polling_interval=2.0
+        )
+
+    assert time.monotonic() - t0 < 1.0
+    assert live_bus.subscriber_stats() == []
@@ -7,9 +7,16 @@ provider's native status. These tests pin both paths.
 """
 
 import threading
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from cli_agent_orchestrator.models.terminal import TerminalStatus
+from cli_agent_orchestrator.providers.claude_code import ClaudeCodeProvider
+from cli_agent_orchestrator.providers.codex import CodexProvider
+from cli_agent_orchestrator.providers.omp import OmpProvider
 from cli_agent_orchestrator.services.status_monitor import StatusMonitor
 
 
@@ -403,7 +410,7 @@ class TestProcessChunkBufferTruncation:
     """_process_chunk truncates the rolling buffer to the live
     state_buffer_max server setting, not a fixed constant."""
 
-    @patch("cli_agent_orchestrator.services.status_monitor.get_server_settings")
+    @patch("cli_agent_orchestrator.services.status_monitor.get_settings_snapshot")
     @patch("cli_agent_orchestrator.services.status_monitor.provider_manager")
     @patch("cli_agent_orchestrator.backends.registry.get_backend")
     def test_truncates_to_configured_state_buffer_max(
@@ -413,7 +420,7 @@ class TestProcessChunkBufferTruncation:
         provider = MagicMock()
         provider.supports_screen_detection = False
         mock_pm.get_provider.return_value = provider
-        mock_get_settings.return_value = {"state_buffer_max": 10}
+        mock_get_settings.return_value = SimpleNamespace(server={"state_buffer_max": 10})
 
         sm = StatusMonitor()
         sm._detect_status = lambda tid, buf: TerminalStatus.UNKNOWN
@@ -422,7 +429,7 @@ class TestProcessChunkBufferTruncation:
 
         assert sm.get_buffer("t1") == "6789ABCDEF"
 
-    @patch("cli_agent_orchestrator.services.status_monitor.get_server_settings")
+    @patch("cli_agent_orchestrator.services.status_monitor.get_settings_snapshot")
     @patch("cli_agent_orchestrator.services.status_monitor.provider_manager")
     @patch("cli_agent_orchestrator.backends.registry.get_backend")
     def test_marker_evicted_at_small_cap_survives_at_larger_cap(
@@ -440,14 +447,123 @@ class TestProcessChunkBufferTruncation:
 
         payload = "MARKER" + "x" * 20  # 26 bytes total, marker is the first 6
 
-        mock_get_settings.return_value = {"state_buffer_max": 10}
+        mock_get_settings.return_value = SimpleNamespace(server={"state_buffer_max": 10})
         sm_small = StatusMonitor()
         sm_small._detect_status = lambda tid, buf: TerminalStatus.UNKNOWN
         sm_small._process_chunk("t1", payload)
         assert "MARKER" not in sm_small.get_buffer("t1")
 
-        mock_get_settings.return_value = {"state_buffer_max": 32768}
+        mock_get_settings.return_value = SimpleNamespace(server={"state_buffer_max": 32768})
         sm_large = StatusMonitor()
         sm_large._detect_status = lambda tid, buf: TerminalStatus.UNKNOWN
         sm_large._process_chunk("t1", payload)
         assert "MARKER" in sm_large.get_buffer("t1")
+
+
+class _LineProvider:
+    supports_screen_detection = False
+    supports_line_detection = True
+    status_tail_lines = 2
+
+    def __init__(self):
+        self.seen = []
+
+    def get_status(self, buffer):
+        raise AssertionError("line-detecting providers must not be handed the raw buffer")
+
+    def get_status_from_lines(self, lines):
+        self.seen.append(lines)
+        return TerminalStatus.IDLE
+
+
+class TestLineDetection:
+    """Providers opting into supports_line_detection get the incrementally
+    cleaned tail instead of re-stripping the whole rolling buffer."""
+
+    @patch("cli_agent_orchestrator.services.status_monitor.provider_manager")
+    @patch("cli_agent_orchestrator.backends.registry.get_backend")
+    def test_detects_from_cleaned_tail_across_split_escapes(self, mock_get_backend, mock_pm):
+        mock_get_backend.return_value = _backend(event_inbox=False)
+        provider = _LineProvider()
+        mock_pm.get_provider.return_value = provider
+        sm = StatusMonitor()
+
+        sm._process_chunk("t1", "\x1b[31mfirst\x1b[0m\r\nsecond\x1b[46")
+        sm._process_chunk("t1", ";1H› ")
+
+        assert provider.seen[-1] == ("second", "› ")
+        assert sm.get_buffer("t1").endswith(";1H› ")
+
+    @patch("cli_agent_orchestrator.services.status_monitor.provider_manager")
+    @patch("cli_agent_orchestrator.backends.registry.get_backend")
+    def test_cleared_or_replaced_buffer_rebuilds_lines(self, mock_get_backend, mock_pm):
+        mock_get_backend.return_value = _backend(event_inbox=False)
+        provider = _LineProvider()
+        mock_pm.get_provider.return_value = provider
+        sm = StatusMonitor()
+
+        sm._process_chunk("t1", "stale turn\n")
+        sm.clear_rolling_buffer("t1")
+        sm._process_chunk("t1", "fresh")
+        assert provider.seen[-1] == ("fresh",)
+
+        sm._buffers["t1"] = "a\nb\nc"
+        sm._detect_status("t1", sm._buffers["t1"])
+        assert provider.seen[-1] == ("b", "c")
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "providers" / "fixtures"
+
+
+class TestLineDetectionMatchesRawDetection:
+    """The opted-in providers classify the bounded cleaned tail exactly as
+    ``get_status`` classifies the raw rolling buffer, chunk after chunk, with a
+    default-sized state buffer holding more lines than the tail bound."""
+
+    @pytest.mark.parametrize(
+        "provider_cls, fixtures",
+        [
+            (ClaudeCodeProvider, ["claude_code_new_tui_completed_raw.txt"]),
+            (
+                CodexProvider,
+                [
+                    "codex_idle_output.txt",
+                    "codex_processing_output.txt",
+                    "codex_approval_modal_raw.txt",
+                    "codex_completed_output.txt",
+                    "codex_update_dialog.txt",
+                    "codex_error_output.txt",
+                ],
+            ),
+            (
+                OmpProvider,
+                ["omp_idle.txt", "omp_processing.raw.txt", "omp_waiting.txt", "omp_completed.txt"],
+            ),
+        ],
+    )
+    @patch("cli_agent_orchestrator.services.status_monitor.get_settings_snapshot")
+    @patch("cli_agent_orchestrator.services.status_monitor.provider_manager")
+    @patch("cli_agent_orchestrator.backends.registry.get_backend")
+    def test_same_status_as_raw_buffer(
+        self, mock_get_backend, mock_pm, mock_get_settings, provider_cls, fixtures
+    ):
+        mock_get_backend.return_value = _backend(event_inbox=False)
+        mock_get_backend.return_value.get_native_status.return_value = None
+        mock_get_settings.return_value = SimpleNamespace(server={"state_buffer_max": 32768})
+        provider = provider_cls("abcd1234", "cao-test", "w")
+        mock_pm.get_provider.return_value = provider
+        sm = StatusMonitor()
+        sm._apply_detection = MagicMock()
+        stream = "".join((FIXTURES_DIR / name).read_text(encoding="utf-8") for name in fixtures)
+        stream *= -(-2 * 32768 // len(stream))
+
+        seen = set()
+        for start in range(0, len(stream), 2311):
+            sm._process_chunk("t1", stream[start : start + 2311])
+            buffer = sm.get_buffer("t1")
+            status = sm._detect_status("t1", buffer)
+            assert status == provider.get_status(buffer), start
+            seen.add(status)
+        assert len(seen) > 1
+
+        assert len(sm._clean_lines["t1"][1].tail()) > provider.status_tail_lines
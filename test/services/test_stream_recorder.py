@@ -0,0 +1,158 @@
+"""Tests for terminal stream recording and loading."""
+
+import gzip
+import json
+import os
+import time
+
+import pytest
+
+from cli_agent_orchestrator.services import fifo_reader as fr
+from cli_agent_orchestrator.services.fifo_reader import FifoManager
+from cli_agent_orchestrator.services.stream_recorder import (
+    INPUT,
+    MARKER,
+    OUTPUT,
+    Recording,
+    StreamRecorder,
+    load_recording,
+    save_recording,
+)
+
+
+@pytest.fixture
+def recorder():
+    recorder = StreamRecorder()
+    yield recorder
+    recorder.stop_all()
+
+
+class TestStreamRecorder:
+    def test_round_trip_preserves_frames_and_metadata(self, recorder, tmp_path):
+        path = tmp_path / "abc.cast.gz"
+        recorder.start("abc", path, provider="codex", agent_profile="developer")
+        recorder.record_output([("terminal.abc.output", {"data": "hello\r\n"})])
+        recorder.record_input("abc", "do the thing")
+        recorder.record_key("abc", "C-c")
+        recorder.record_output([("terminal.abc.output", {"data": "› \x1b[2K"})])
+        assert recorder.stop("abc") == path
+
+        recording = load_recording(path)
+        assert (recording.terminal_id, recording.provider, recording.agent_profile) == (
+            "abc",
+            "codex",
+            "developer",
+        )
+        assert [(code, data) for _, code, data in recording.frames] == [
+            (OUTPUT, "hello\r\n"),
+            (INPUT, "do the thing"),
+            (MARKER, "C-c"),
+            (OUTPUT, "› \x1b[2K"),
+        ]
+        times = [t for t, _, _ in recording.frames]
+        assert times == sorted(times) and times[0] >= 0.0
+        assert recording.output_bytes == len("hello\r\n") + len("› \x1b[2K")
+
+    def test_file_is_asciicast_v2(self, recorder, tmp_path):
+        """Plain-text recordings are standard asciicast v2 (playable elsewhere)."""
+        path = tmp_path / "abc.cast"
+        recorder.start("abc", path, provider="kiro_cli")
+        recorder.record_output([("terminal.abc.output", {"data": "x"})])
+        recorder.stop("abc")
+
+        header, frame = path.read_text().splitlines()
+        header = json.loads(header)
+        assert header["version"] == 2 and header["width"] and header["height"]
+        assert header["cao"]["provider"] == "kiro_cli"
+        assert json.loads(frame)[1:] == ["o", "x"]
+
+    def test_gz_suffix_compresses(self, recorder, tmp_path):
+        path = tmp_path / "abc.cast.gz"
+        recorder.start("abc", path)
+        recorder.record_output([("terminal.abc.output", {"data": "x" * 10_000})])
+        recorder.stop("abc")
+        assert path.stat().st_size < 1_000
+        with gzip.open(path, "rt") as handle:
+            assert json.loads(handle.readline())["version"] == 2
+
+    def test_only_started_terminals_are_recorded(self, recorder, tmp_path):
+        assert not recorder.active
+        recorder.start("abc", tmp_path / "abc.cast")
+        assert recorder.active
+        recorder.record_output(
+            [
+                ("terminal.other.output", {"data": "not mine"}),
+                ("terminal.abc.output", {"data": "mine"}),
+            ]
+        )
+        recorder.record_input("other", "ignored")
+        recorder.stop("abc")
+
+        assert not recorder.active
+        assert [data for _, _, data in load_recording(tmp_path / "abc.cast").frames] == ["mine"]
+        assert not (tmp_path / "other.cast").exists()
+        assert recorder.stop("abc") is None
+
+    def test_write_error_drops_the_recording_instead_of_raising(self, recorder, tmp_path):
+        recorder.start("abc", tmp_path / "abc.cast")
+        recorder._sinks["abc"].handle.close()
+
+        recorder.record_output([("terminal.abc.output", {"data": "x"})])
+
+        assert not recorder.active
+
+    def test_unwritable_path_is_not_recorded(self, recorder, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        recorder.start("abc", blocker / "abc.cast")
+        assert not recorder.active
+
+    def test_save_recording_matches_loader(self, tmp_path):
+        original = Recording("t1", "mock_cli", None, [(0.0, OUTPUT, "a"), (0.25, INPUT, "b")])
+        save_recording(original, tmp_path / "t1.cast")
+        assert load_recording(tmp_path / "t1.cast") == original
+
+    def test_load_rejects_non_asciicast(self, tmp_path):
+        path = tmp_path / "bad.cast"
+        path.write_text("not json\n")
+        with pytest.raises(ValueError):
+            load_recording(path)
+        path.write_text(json.dumps({"version": 1}) + "\n")
+        with pytest.raises(ValueError):
+            load_recording(path)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs require a POSIX platform")
+class TestMultiplexerRecording:
+    def test_records_published_batches_and_stops_with_reader(self, tmp_path, monkeypatch):
+        """The recording holds exactly the batches handed to the bus, and
+        stop_reader closes it after the final flush."""
+        monkeypatch.setattr(fr, "FIFO_DIR", tmp_path)
+        recorder = StreamRecorder()
+        monkeypatch.setattr(fr, "stream_recorder", recorder)
+        published = []
+        monkeypatch.setattr(
+            fr.bus, "publish_batch", lambda events: published.extend(e[1]["data"] for e in events)
+        )
+        manager = FifoManager()
+        try:
+            manager.create_reader("rec")
+            path = tmp_path / "rec.cast"
+            recorder.start("rec", path, provider="mock_cli")
+            wfd = os.open(tmp_path / "rec.fifo", os.O_WRONLY | os.O_NONBLOCK)
+            try:
+                os.write(wfd, b"one\r\n")
+                os.write(wfd, b"two\r\n")
+            finally:
+                os.close(wfd)
+            deadline = time.monotonic() + 3.0
+            while "".join(published) != "one\r\ntwo\r\n" and time.monotonic() < deadline:
+                time.sleep(0.01)
+            manager.stop_reader("rec")
+        finally:
+            manager.stop_multiplexer()
+
+        assert not recorder.active
+        frames = load_recording(path).frames
+        assert [data for _, _, data in frames] == published
+        assert "".join(published) == "one\r\ntwo\r\n"
@@ -0,0 +1,99 @@
+"""Tests for replaying recorded terminal streams through StatusMonitor."""
+
+import pytest
+
+from cli_agent_orchestrator.providers.manager import provider_manager
+from cli_agent_orchestrator.services.stream_recorder import INPUT, MARKER, OUTPUT, Recording
+from cli_agent_orchestrator.services.stream_replay import replay
+
+_SPINNER = "".join(f"\x1b[2K\r{glyph} Working..." for glyph in "⠋⠙⠹⠸")
+_REPLY = "\x1b[2K\r\n> MOCK: hello\r\n❯ "
+
+
+def _turn(spinner_frames: int = 4, reply_gap: float = 0.05) -> Recording:
+    """mock_cli: ready prompt, input, echo, spinner frames 50ms apart, reply."""
+    frames = [
+        (0.0, OUTPUT, "MockCli ready.\r\n❯ "),
+        (0.5, INPUT, "hello"),
+        (0.52, OUTPUT, "hello\r\n"),
+    ]
+    t = 0.55
+    for _ in range(spinner_frames):
+        frames.append((round(t, 3), OUTPUT, _SPINNER))
+        t += 0.05
+    frames.append((round(t - 0.05 + reply_gap, 3), OUTPUT, _REPLY))
+    return Recording("rec", "mock_cli", None, frames)
+
+
+class TestMaxSpeedReplay:
+    @pytest.mark.asyncio
+    async def test_reports_timeline_and_completed_latency(self):
+        report = await replay(_turn())
+
+        assert report.provider == "mock_cli"
+        assert report.detection_path == "raw"
+        assert report.timeline == [(0.0, "idle"), (0.52, "processing"), (0.95, "completed")]
+        assert report.final_status == "completed"
+        # The reply lands mid-burst (50ms after a spinner frame), so COMPLETED
+        # is only detected when the 200ms quiescence timer fires.
+        assert report.final_completed_at_s == 0.95
+        assert report.completed_latency_ms == pytest.approx(200.0)
+        assert report.detections > 0 and report.detection_cpu_ms >= 0.0
+        assert report.frames == 8
+
+    @pytest.mark.asyncio
+    async def test_is_deterministic_and_leaves_no_state_behind(self):
+        before = dict(provider_manager._providers)
+        first = await replay(_turn())
+        second = await replay(_turn())
+
+        assert first.timeline == second.timeline
+        assert first.detections == second.detections
+        assert provider_manager._providers == before
+
+    @pytest.mark.asyncio
+    async def test_reply_after_quiet_is_detected_on_the_rising_edge(self):
+        report = await replay(_turn(reply_gap=0.5))
+        assert report.timeline[-1] == (1.2, "completed")
+        assert report.completed_latency_ms == 0.0
+
+    @pytest.mark.asyncio
+    async def test_without_input_boundary_the_latch_hides_processing(self):
+        """Input frames re-arm the sticky latch; drop them and the latched IDLE
+        refuses the turn's PROCESSING, exactly as it would live."""
+        recording = _turn()
+        recording.frames = [frame for frame in recording.frames if frame[1] != INPUT]
+        report = await replay(recording)
+        assert [status for _, status in report.timeline] == ["idle", "completed"]
+
+    @pytest.mark.asyncio
+    async def test_marker_frames_arm_the_latch(self):
+        recording = _turn()
+        recording.frames = [
+            (t, MARKER if code == INPUT else code, data) for t, code, data in recording.frames
+        ]
+        report = await replay(recording)
+        assert [status for _, status in report.timeline] == ["idle", "processing", "completed"]
+
+
+class TestReplayOptions:
+    @pytest.mark.asyncio
+    async def test_wall_clock_replay_follows_recorded_gaps(self):
+        report = await replay(_turn(), speed=4.0)
+
+        assert [status for _, status in report.timeline] == ["idle", "processing", "completed"]
+        assert report.speed == 4.0
+        # ~0.8s of recording at 4x, plus the real 200ms debounce and settling.
+        assert 0.2 <= report.replay_wall_s < 2.0
+
+    @pytest.mark.asyncio
+    async def test_provider_override_and_validation(self):
+        recording = _turn()
+        recording.provider = None
+        with pytest.raises(ValueError):
+            await replay(recording)
+        with pytest.raises(ValueError):
+            await replay(recording, provider="mock_cli", speed=0)
+
+        report = await replay(recording, provider="mock_cli")
+        assert report.final_status == "completed"
@@ -0,0 +1,199 @@
+"""Tests for the segmented terminal log store."""
+
+import json
+import os
+import time
+
+import pytest
+
+from cli_agent_orchestrator.services.terminal_log_store import SegmentMissingError, TerminalLogStore
+
+TID = "abcd1234"
+
+
+@pytest.fixture
+def store():
+    s = TerminalLogStore(segment_bytes=100, frame_bytes=16, max_open_files=2)
+    yield s
+    s.close_all()
+
+
+def _stream(n: int) -> bytes:
+    return bytes(i % 251 for i in range(n))
+
+
+def _append_in_chunks(store, log_dir, data: bytes, chunk: int = 10) -> None:
+    for i in range(0, len(data), chunk):
+        store.append(log_dir, TID, data[i : i + chunk])
+
+
+class TestSegmentedWrites:
+    def test_small_log_stays_a_single_plain_file(self, store, tmp_path):
+        store.append(tmp_path, TID, b"hello ")
+        store.append(tmp_path, TID, b"world")
+
+        assert (tmp_path / f"{TID}.log").read_bytes() == b"hello world"
+        assert not (tmp_path / f"{TID}.idx").exists()
+
+    def test_full_live_segment_is_sealed_compressed_and_indexed(self, store, tmp_path):
+        data = _stream(350)
+        _append_in_chunks(store, tmp_path, data)
+
+        index = json.loads((tmp_path / f"{TID}.idx").read_text())["segments"]
+        assert [seg["seq"] for seg in index] == [0, 1, 2]
+        # Each segment starts where the previous one ended.
+        for prev, seg in zip(index, index[1:]):
+            assert seg["start"] == prev["start"] + prev["length"]
+        # Sparse frame table: one entry per frame_bytes of input.
+        assert [frame[0] for frame in index[0]["frames"]] == list(range(0, index[0]["length"], 16))
+        assert all(seg["file"].endswith((".seg.gz", ".seg.zst")) for seg in index)
+        assert not list(tmp_path.glob("*.seg"))
+        live_start = index[-1]["start"] + index[-1]["length"]
+        assert (tmp_path / f"{TID}.log").read_bytes() == data[live_start:]
+
+    def test_cached_handle_is_reused_across_appends(self, store, tmp_path, monkeypatch):
+        import builtins
+
+        opens = []
+        real_open = builtins.open
+
+        def counting_open(path, *args, **kwargs):
+            if str(path).endswith(".log"):
+                opens.append(path)
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        for _ in range(10):
+            store.append(tmp_path, TID, b"x")
+
+        assert len(opens) == 1
+
+    def test_open_handles_are_capped(self, store, tmp_path):
+        for tid in ("aaaaaaaa", "bbbbbbbb", "cccccccc"):
+            store.append(tmp_path, tid, b"data")
+
+        assert len(store._handles) == 2
+        # The evicted terminal reopens and keeps appending.
+        store.append(tmp_path, "aaaaaaaa", b"more")
+        assert (tmp_path / "aaaaaaaa.log").read_bytes() == b"datamore"
+
+
+class TestLogicalReads:
+    def test_ranges_span_segment_and_frame_boundaries(self, store, tmp_path):
+        data = _stream(350)
+        _append_in_chunks(store, tmp_path, data)
+
+        for offset, length in [(0, 350), (95, 10), (15, 3), (199, 2), (290, 100), (0, 1)]:
+            assert store.read_range(tmp_path, TID, offset, length) == data[offset : offset + length]
+        assert store.logical_size(tmp_path, TID) == 350
+
+    def test_offset_past_end_returns_empty(self, store, tmp_path):
+        store.append(tmp_path, TID, b"short")
+
+        assert store.read_range(tmp_path, TID, 999, 10) == b""
+
+    def test_missing_log_raises_file_not_found(self, store, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            store.read_range(tmp_path, TID, 0, 10)
+
+    def test_interrupted_seal_is_readable_and_completed_by_next_append(self, store, tmp_path):
+        data = _stream(150)
+        _append_in_chunks(store, tmp_path, data)
+        store.close_all()
+        # Simulate a crash right after the live file was renamed for sealing.
+        (tmp_path / f"{TID}.log").rename(tmp_path / f"{TID}.000001.seg")
+
+        assert store.read_range(tmp_path, TID, 0, 150) == data
+
+        store.append(tmp_path, TID, b"tail")
+        assert not (tmp_path / f"{TID}.000001.seg").exists()
+        assert store.read_range(tmp_path, TID, 0, 200) == data + b"tail"
+
+
+class TestSnapshots:
+    def test_iter_range_streams_across_segments_in_bounded_chunks(self, store, tmp_path):
+        data = _stream(350)
+        _append_in_chunks(store, tmp_path, data)
+
+        with store.snapshot(tmp_path, TID) as snap:
+            chunks = list(snap.iter_range(5, 340, chunk_size=8))
+
+        assert b"".join(chunks) == data[5:345]
+        assert max(len(chunk) for chunk in chunks) <= 16  # one frame or one pread
+
+    def test_appends_after_the_snapshot_are_not_visible(self, store, tmp_path):
+        store.append(tmp_path, TID, b"before")
+        snap = store.snapshot(tmp_path, TID)
+        store.append(tmp_path, TID, b"after")
+
+        with snap:
+            assert snap.size == 6
+            assert b"".join(snap.iter_range(0, 100)) == b"before"
+
+    def test_identity_changes_and_start_tracks_pruning(self, store, tmp_path):
+        store.append(tmp_path, TID, b"x" * 50)
+        with store.snapshot(tmp_path, TID) as before:
+            pass
+        _append_in_chunks(store, tmp_path, _stream(100))
+        store.prune(tmp_path, TID, cutoff=time.time() + 1)
+
+        with store.snapshot(tmp_path, TID) as after:
+            assert after.start == 100
+            assert after.size == 150
+            # The freed inode may be reused by the new live file; the size is not.
+            assert (after.inode, after.size) != (before.inode, before.size)
+            assert b"".join(after.iter_range(0, 150)) == _stream(100)[50:]
+
+    def test_segments_pruned_after_the_snapshot_are_still_served(self, store, tmp_path):
+        data = _stream(250)
+        _append_in_chunks(store, tmp_path, data)
+
+        with store.snapshot(tmp_path, TID) as snap:
+            store.prune(tmp_path, TID, cutoff=time.time() + 1)
+            assert b"".join(snap.iter_range(0, 250)) == data
+
+    def test_missing_retained_segment_raises_instead_of_shifting_bytes(self, store, tmp_path):
+        _append_in_chunks(store, tmp_path, _stream(250))
+
+        with store.snapshot(tmp_path, TID, pin=(200, 250)) as snap:
+            for seg in tmp_path.glob(f"{TID}.000000.seg*"):
+                seg.unlink()
+            with pytest.raises(SegmentMissingError):
+                b"".join(snap.iter_range(0, 250))
+
+
+class TestRetention:
+    def test_prune_drops_old_segments_but_keeps_offsets(self, store, tmp_path):
+        data = _stream(250)
+        _append_in_chunks(store, tmp_path, data)
+
+        assert store.prune(tmp_path, TID, cutoff=time.time() + 1) == 2
+
+        assert store.read_range(tmp_path, TID, 0, 200) == b""
+        assert store.read_range(tmp_path, TID, 200, 50) == data[200:]
+        assert store.logical_size(tmp_path, TID) == 250
+
+    def test_remove_deletes_every_file_for_the_terminal(self, store, tmp_path):
+        _append_in_chunks(store, tmp_path, _stream(250))
+        other = tmp_path / "ffffffff.log"
+        other.write_bytes(b"keep")
+
+        store.remove(tmp_path, TID)
+
+        assert os.listdir(tmp_path) == ["ffffffff.log"]
+        assert store._terminal_locks == {}
+
+
+class TestPosition:
+    def test_generation_is_stable_until_the_log_is_removed(self, store, tmp_path):
+        store.append(tmp_path, TID, b"hello")
+        generation, size = store.position(tmp_path, TID)
+        with store.snapshot(tmp_path, TID) as snap:
+            assert (snap.generation, snap.size) == (generation, 5)
+        assert size == 5
+
+        store.remove(tmp_path, TID)
+        store.append(tmp_path, TID, b"hello")
+
+        assert store.position(tmp_path, TID) != (generation, 5)
+        assert store.position(tmp_path, TID)[1] == 5
@@ -0,0 +1,141 @@
+"""Tests for the terminal output search index."""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from cli_agent_orchestrator.services.terminal_log_store import TerminalLogStore
+from cli_agent_orchestrator.services.terminal_search import TerminalSearchIndex
+
+TID = "abcd1234"
+OTHER = "ef567890"
+
+
+@pytest.fixture
+def log_dir(monkeypatch, tmp_path):
+    """Point the index and a private log store at a temp dir."""
+    store = TerminalLogStore(segment_bytes=64, frame_bytes=16)
+    monkeypatch.setattr(
+        "cli_agent_orchestrator.services.terminal_search.TERMINAL_LOG_DIR", tmp_path
+    )
+    monkeypatch.setattr("cli_agent_orchestrator.services.terminal_search.terminal_log_store", store)
+    yield tmp_path, store
+    store.close_all()
+
+
+def _log(index, store, log_dir, terminal_id, chunks):
+    """Mirror LogWriter._write: append the batch, then index it by offset."""
+    encoded = [chunk.encode("utf-8") for chunk in chunks]
+    offset = store.append(log_dir, terminal_id, b"".join(encoded))
+    located = []
+    for chunk, raw in zip(chunks, encoded):
+        located.append((offset, chunk))
+        offset += len(raw)
+    index.add(terminal_id, located, offset)
+
+
+class TestIndexing:
+    def test_hit_offset_links_into_the_log(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex()
+        _log(
+            index,
+            store,
+            tmp_path,
+            TID,
+            ["booting\n", "\x1b[31mTraceback (most recent", " call last)\x1b[0m\n"],
+        )
+
+        hits = index.search("traceback (most recent call")
+
+        assert len(hits) == 1
+        hit = hits[0]
+        assert (hit.terminal_id, hit.source) == (TID, "log")
+        assert hit.snippet == "Traceback (most recent call last)"
+        # The line began in the second chunk; its offset is where that chunk was logged.
+        assert hit.offset == len("booting\n")
+        assert store.read_range(tmp_path, TID, hit.offset, 9) == b"\x1b[31mTrac"
+
+    def test_hit_deep_inside_a_merged_chunk_is_confirmed(self, log_dir):
+        """A queue-merged chunk can be far larger than one pipe read; the whole
+        recorded span is read back, not a fixed prefix of it."""
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex()
+        merged = "filler line\n" * 4000 + "deep needle here\n"
+        _log(index, store, tmp_path, TID, ["booting\n", merged, "after\n"])
+
+        hits = index.search("deep needle")
+
+        assert [(h.offset, h.snippet) for h in hits] == [(len("booting\n"), "deep needle here")]
+
+    def test_tokens_in_different_lines_are_not_a_match(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex()
+        _log(index, store, tmp_path, TID, ["src/app.py ok\nnothing here\n"])
+
+        assert index.search("app.py ok")[0].snippet == "src/app.py ok"
+        assert index.search("ok nothing") == []
+
+    def test_terminal_filter_and_newest_first(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex(bucket_bytes=1)
+        _log(index, store, tmp_path, TID, ["error one\n"])
+        _log(index, store, tmp_path, OTHER, ["error two\n"])
+
+        assert [h.terminal_id for h in index.search("error")] == [OTHER, TID]
+        assert [h.snippet for h in index.search("error", terminal_id=TID)] == ["error one"]
+
+    def test_hits_survive_segment_rotation(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex()
+        for i in range(20):
+            _log(index, store, tmp_path, TID, [f"line {i} needle{i}\n"])
+
+        hit = index.search("needle3")[0]
+        assert list(tmp_path.glob(f"{TID}.*.seg.*"))
+        assert store.read_range(tmp_path, TID, hit.offset, 14) == b"line 3 needle3"
+
+    def test_oldest_buckets_are_evicted_at_the_cap(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex(bucket_bytes=1, max_buckets=2)
+        for word in ("alpha", "beta", "gamma"):
+            _log(index, store, tmp_path, TID, [f"{word}\n"])
+
+        assert index.search("alpha") == []
+        assert index.search("gamma")[0].snippet == "gamma"
+
+    def test_since_skips_older_buckets(self, log_dir):
+        tmp_path, store = log_dir
+        index = TerminalSearchIndex()
+        _log(index, store, tmp_path, TID, ["deploy done\n"])
+
+        assert index.search("deploy", since=datetime.now() + timedelta(minutes=1)) == []
+        assert len(index.search("deploy", since=datetime.now() - timedelta(minutes=1))) == 1
+
+    def test_query_without_words_is_rejected(self, log_dir):
+        with pytest.raises(ValueError):
+            TerminalSearchIndex().search("::")
+
+
+class TestScrollback:
+    def test_scrollback_snapshots_are_scanned(self, log_dir):
+        tmp_path, _ = log_dir
+        (tmp_path / f"{OTHER}.scrollback").write_text("$ make\nFAILED test_x\n", encoding="utf-8")
+
+        hits = TerminalSearchIndex().search("failed")
+
+        assert [(h.terminal_id, h.source, h.offset, h.snippet) for h in hits] == [
+            (OTHER, "scrollback", len("$ make\n"), "FAILED test_x")
+        ]
+
+    def test_since_filters_scrollbacks_by_mtime(self, log_dir):
+        tmp_path, _ = log_dir
+        path = tmp_path / f"{OTHER}.scrollback"
+        path.write_text("old failure\n", encoding="utf-8")
+        old = (datetime.now() - timedelta(days=2)).timestamp()
+        os.utime(path, (old, old))
+
+        assert (
+            TerminalSearchIndex().search("failure", since=datetime.now() - timedelta(days=1)) == []
+        )
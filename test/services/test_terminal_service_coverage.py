@@ -63,7 +63,12 @@ class TestCreateTerminalCleanup:
         mock_tmux.kill_session.side_effect = lambda *_: lifecycle.append("kill")
         mock_pm.cleanup_provider.side_effect = lambda *_: lifecycle.append("cleanup")
 
-        with pytest.raises(Exception, match="Provider init failed"):
+        with (
+            patch(
+                "cli_agent_orchestrator.services.terminal_service.get_memory_prefetcher"
+            ) as mock_prefetcher,
+            pytest.raises(Exception, match="Provider init failed"),
+        ):
             await create_terminal(
                 provider="kiro_cli",
                 agent_profile="dev",
@@ -76,6 +81,8 @@ class TestCreateTerminalCleanup:
         mock_tmux.kill_session.assert_called_once()
         assert lifecycle == ["kill", "cleanup"]
         mock_db_delete.assert_called_once_with("tid1")
+        # The first-message memory block scheduled for the row is dropped too.
+        mock_prefetcher.return_value.discard.assert_called_once_with("tid1")
 
     @pytest.mark.asyncio
     @patch("cli_agent_orchestrator.services.terminal_service.status_monitor")
@@ -938,7 +938,7 @@ class TestCreateTerminalWorktree:
         worktree_dir = tmp_path / "worktrees" / "test1234"
         worktree_dir.mkdir(parents=True)
         mock_worktree_service.find_repo_root.return_value = "/repo"
-        mock_worktree_service.create_worktree.return_value = str(worktree_dir)
+        mock_worktree_service.acquire_worktree.return_value = str(worktree_dir)
 
         result = await create_terminal(
             "kiro_cli",
@@ -950,7 +950,7 @@ class TestCreateTerminalWorktree:
 
         assert result.id == "test1234"
         mock_worktree_service.find_repo_root.assert_called_once_with(str(source_dir))
-        mock_worktree_service.create_worktree.assert_called_once_with("/repo", "test1234")
+        mock_worktree_service.acquire_worktree.assert_called_once_with("/repo", "test1234")
         # The worktree path -- NOT the originally-given working_directory -- is
         # what actually reaches the tmux window (create_window's 4th positional
         # arg, per its own call site in terminal_service.py).
@@ -1002,7 +1002,7 @@ class TestCreateTerminalWorktree:
         await create_terminal("kiro_cli", "developer", session_name="cao-existing")
 
         mock_worktree_service.find_repo_root.assert_not_called()
-        mock_worktree_service.create_worktree.assert_not_called()
+        mock_worktree_service.acquire_worktree.assert_not_called()
 
     @pytest.mark.asyncio
     @patch("cli_agent_orchestrator.services.terminal_service.worktree_service")
@@ -1076,7 +1076,7 @@ class TestCreateTerminalWorktree:
         worktree_dir = tmp_path / "worktrees" / "test1234"
         worktree_dir.mkdir(parents=True)
         mock_worktree_service.find_repo_root.return_value = "/repo"
-        mock_worktree_service.create_worktree.return_value = str(worktree_dir)
+        mock_worktree_service.acquire_worktree.return_value = str(worktree_dir)
 
         with pytest.raises(TimeoutError):
             await create_terminal(
@@ -1086,7 +1086,7 @@ class TestCreateTerminalWorktree:
                 use_worktree=True,
             )
 
-        mock_worktree_service.remove_worktree.assert_called_once_with("/repo", "test1234")
+        mock_worktree_service.release_worktree.assert_called_once_with("/repo", "test1234")
 
 
 class TestCreateTerminalEnvVars:
@@ -2016,7 +2016,7 @@ class TestDeleteTerminalWorktree:
         result = delete_terminal("test1234")
 
         assert result is True
-        mock_worktree_service.remove_worktree.assert_called_once_with("/repo", "test1234")
+        mock_worktree_service.release_worktree.assert_called_once_with("/repo", "test1234")
 
     @patch("cli_agent_orchestrator.services.terminal_service.worktree_service")
     @patch("cli_agent_orchestrator.services.terminal_service.status_monitor")
@@ -2059,7 +2059,7 @@ class TestDeleteTerminalWorktree:
         result = delete_terminal("terminalB")
 
         assert result is True
-        mock_worktree_service.remove_worktree.assert_not_called()
+        mock_worktree_service.release_worktree.assert_not_called()
 
     @patch("cli_agent_orchestrator.services.terminal_service.worktree_service")
     @patch("cli_agent_orchestrator.services.terminal_service.status_monitor")
@@ -2093,7 +2093,7 @@ class TestDeleteTerminalWorktree:
         result = delete_terminal("test1234")
 
         assert result is True
-        mock_worktree_service.remove_worktree.assert_not_called()
+        mock_worktree_service.release_worktree.assert_not_called()
 
     @patch("cli_agent_orchestrator.services.terminal_service.worktree_service")
     @patch("cli_agent_orchestrator.services.terminal_service.status_monitor")
@@ -2135,7 +2135,7 @@ class TestDeleteTerminalWorktree:
         result = delete_terminal("test1234")  # must not raise
 
         assert result is True
-        mock_worktree_service.remove_worktree.assert_not_called()
+        mock_worktree_service.release_worktree.assert_not_called()
 
 
 class TestDeferredInitFailureNotification:
@@ -1,7 +1,8 @@
 """Unit tests for the snapshot projection + RFC 6902 diff service.
 
 Covers ``build_dashboard_snapshot`` / ``build_agent_detail_snapshot`` field
-mapping and ``diff_snapshot`` for scalar and collection changes, including
+mapping and ``diff_snapshot`` / ``diff_snapshot_by_id`` for scalar and
+collection changes, including
 round-tripping the produced patch back onto the previous snapshot
 (Correctness Property 5).
 """
@@ -13,6 +14,7 @@ from cli_agent_orchestrator.services.ui_state_service import (
     build_agent_detail_snapshot,
     build_dashboard_snapshot,
     diff_snapshot,
+    diff_snapshot_by_id,
 )
 
 
@@ -30,10 +32,15 @@ def apply_patch(doc: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any
     result = copy.deepcopy(doc)
     for op in ops:
         tokens = [_unescape(t) for t in op["path"].split("/")[1:]]
-        target = result
+        target: Any = result
         for token in tokens[:-1]:
-            target = target[token]
-        leaf = tokens[-1]
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        leaf: Any = tokens[-1]
+        if isinstance(target, list):
+            leaf = int(leaf)
+            if op["op"] == "add":
+                target.insert(leaf, copy.deepcopy(op["value"]))
+                continue
         if op["op"] in ("add", "replace"):
             target[leaf] = copy.deepcopy(op["value"])
         elif op["op"] == "remove":
@@ -147,3 +154,43 @@ def test_diff_snapshot_pointer_escaping_round_trip() -> None:
     curr = {"a/b": 9, "c~d": 2, "new": 3}
     ops = diff_snapshot(prev, curr)
     assert apply_patch(prev, ops) == curr
+
+
+def _terms(*rows: tuple) -> List[Dict[str, Any]]:
+    return [{"id": tid, "tmux_session": "cao-foo", "status": st} for tid, st in rows]
+
+
+def test_diff_by_id_touches_only_the_changed_terminal() -> None:
+    """One status change is one field replace at that terminal's index."""
+
+    prev = build_dashboard_snapshot([], _terms(("t1", "idle"), ("t2", "idle")), None)
+    curr = build_dashboard_snapshot([], _terms(("t1", "idle"), ("t2", "processing")), None)
+
+    assert diff_snapshot_by_id(prev, curr) == [
+        {"op": "replace", "path": "/terminals/1/status", "value": "processing"}
+    ]
+
+
+def test_diff_by_id_add_and_remove_round_trip() -> None:
+    prev = build_dashboard_snapshot(
+        [], _terms(("t1", "idle"), ("t2", "idle"), ("t3", "idle"), ("t4", "idle")), None
+    )
+    curr = build_dashboard_snapshot(
+        [], _terms(("t2", "idle"), ("t5", "processing"), ("t3", "done"), ("t4", "idle")), None
+    )
+
+    ops = diff_snapshot_by_id(prev, curr)
+
+    assert {"op": "remove", "path": "/terminals/0"} in ops
+    assert not any(op["path"] == "/terminals" for op in ops)
+    assert apply_patch(prev, ops) == curr
+
+
+def test_diff_by_id_reorder_falls_back_to_whole_replace() -> None:
+    prev = build_dashboard_snapshot([], _terms(("t1", "idle"), ("t2", "idle")), None)
+    curr = build_dashboard_snapshot([], _terms(("t2", "idle"), ("t1", "idle")), None)
+
+    ops = diff_snapshot_by_id(prev, curr)
+
+    assert ops == [{"op": "replace", "path": "/terminals", "value": curr["terminals"]}]
+    assert apply_patch(prev, ops) == curr
@@ -526,20 +526,59 @@ def test_br_sec_3_prune_removes_the_full_cascade(settings):
 
 
 def test_br_sec_3_sweep_continues_past_a_failing_delete(settings, monkeypatch):
-    """A best-effort sweep logs and continues if one delete_run raises."""
+    """A best-effort sweep logs and continues if one delete chunk fails."""
+    monkeypatch.setattr(workflow_journal, "_DELETE_CHUNK", 1)
     _seed_run("bad", started_at=_iso(60))
     _seed_run("good", started_at=_iso(50))
-    real_delete = workflow_journal.delete_run
-
-    def _flaky(run_id):
-        if run_id == "bad":
-            raise sqlite3.OperationalError("simulated delete failure")
-        return real_delete(run_id)
-
-    monkeypatch.setattr(workflow_journal, "delete_run", _flaky)
+    with sqlite3.connect(str(workflow_journal_db())) as conn:
+        conn.execute(
+            "CREATE TRIGGER fail_bad BEFORE DELETE ON workflow_run WHEN old.run_id = 'bad' "
+            "BEGIN SELECT RAISE(ABORT, 'simulated delete failure'); END"
+        )
     pruned = workflow_retention.sweep_runs(retention_days=30, retention_count=1000)
     assert pruned == 1  # only "good" counted; "bad" failed but did not abort the sweep
     assert workflow_journal.get_run("good") is None
+    # The failed chunk rolled back whole: "bad" keeps its events as well as its row.
+    assert workflow_journal.get_run("bad") is not None
+    assert workflow_journal.read_events("bad")
+
+
+def test_br_sec_3_sweep_deletes_in_chunks(settings, monkeypatch):
+    """Prune sets larger than a chunk go in several IN-list batches on one connection."""
+    monkeypatch.setattr(workflow_journal, "_DELETE_CHUNK", 3)
+    for i in range(10):
+        _seed_run(f"r{i}", started_at=_iso(i))
+    pruned = workflow_retention.sweep_runs(retention_days=3650, retention_count=2)
+    assert pruned == 8
+    assert [r.run_id for r in workflow_journal.list_runs()] == ["r0", "r1"]
+    for gone in range(2, 10):
+        assert workflow_journal.read_events(f"r{gone}") == []
+        assert workflow_journal.get_steps(f"r{gone}") == []
+
+
+def test_br_sec_3_sweep_returns_freed_pages(settings, tmp_path, monkeypatch):
+    """On an INCREMENTAL database (what init_db creates) the sweep leaves no free pages."""
+    from cli_agent_orchestrator.clients.database import _enable_incremental_auto_vacuum
+
+    monkeypatch.setattr("cli_agent_orchestrator.constants.DATABASE_FILE", tmp_path / "fresh.db")
+    _enable_incremental_auto_vacuum()
+    for i in range(50):
+        _seed_run(f"r{i}", started_at=_iso(i))
+    assert workflow_retention.sweep_runs(retention_days=0, retention_count=1) == 49
+    with sqlite3.connect(str(workflow_journal_db())) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_br_sec_3_prune_set_is_the_union_of_both_bounds(settings):
+    _seed_run("ancient", started_at=_iso(90))
+    for i in range(4):
+        _seed_run(f"recent{i}", started_at=_iso(i))
+    cutoff = workflow_retention._age_cutoff(30)
+    assert workflow_journal.list_prunable_run_ids(cutoff, 3) == ["recent3", "ancient"]
+    assert workflow_journal.list_prunable_run_ids(cutoff, 0) == ["ancient"]
+    assert workflow_journal.list_prunable_run_ids(None, 3) == ["recent3", "ancient"]
+    assert workflow_journal.list_prunable_run_ids(None, 0) == []
 
 
 # ===========================================================================
@@ -602,10 +641,10 @@ def test_retention_bounds_degrade_to_defaults_on_bad_value(settings):
 def test_sweep_is_a_noop_when_enumeration_fails(settings, monkeypatch):
     """A run-enumeration read failure degrades the sweep to 0, never raises."""
 
-    def _boom():
+    def _boom(cutoff, keep):
         raise sqlite3.OperationalError("db down")
 
-    monkeypatch.setattr(workflow_journal, "list_run_ids_by_age", _boom)
+    monkeypatch.setattr(workflow_journal, "list_prunable_run_ids", _boom)
     assert workflow_retention.sweep_runs(retention_days=1, retention_count=1) == 0
 
 
@@ -0,0 +1,187 @@
+"""Tests for the warm worktree pool (services/worktree_pool.py), against real git."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from pathlib import Path
+
+import pytest
+
+from cli_agent_orchestrator.services.worktree_pool import POOL_PREFIX, WorktreePool
+from cli_agent_orchestrator.services.worktree_service import (
+    branch_for,
+    create_worktree,
+    list_worktrees,
+    worktree_path_for,
+)
+
+
+def _git_available() -> bool:
+    try:
+        subprocess.run(["git", "--version"], capture_output=True, check=True, timeout=2)
+        return True
+    except (FileNotFoundError, subprocess.SubprocessError):
+        return False
+
+
+pytestmark = pytest.mark.skipif(not _git_available(), reason="git executable required")
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> str:
+    path = tmp_path / "repo"
+    path.mkdir()
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test")
+    (path / "README.md").write_text("hello\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "initial")
+    return _git(path, "rev-parse", "--show-toplevel")
+
+
+@pytest.fixture
+def pool():
+    p = WorktreePool(size=2, idle_ttl=600)
+    yield p
+    p.close()
+
+
+def _parked(repo: str) -> list[str]:
+    return [
+        str(entry["worktree"])
+        for entry in list_worktrees(repo)
+        if POOL_PREFIX in str(entry["worktree"])
+    ]
+
+
+def _branches(repo: str) -> list[str]:
+    return _git(Path(repo), "branch", "--format=%(refname:short)").splitlines()
+
+
+def test_first_acquire_is_cold_then_the_pool_is_warmed(pool, repo):
+    path = pool.acquire(repo, "term0001")
+    pool.join()
+
+    assert path == worktree_path_for(repo, "term0001")
+    assert _git(Path(path), "branch", "--show-current") == branch_for("term0001")
+    assert len(_parked(repo)) == 2
+    assert pool.stats()["misses"] == 1
+
+
+def test_warm_acquire_branches_at_current_head(pool, repo):
+    pool.acquire(repo, "term0001")
+    pool.join()
+    (Path(repo) / "NEW.md").write_text("new\n")
+    _git(Path(repo), "add", ".")
+    _git(Path(repo), "commit", "-q", "-m", "second")
+
+    path = pool.acquire(repo, "term0002")
+
+    assert path == worktree_path_for(repo, "term0002")
+    assert _git(Path(path), "branch", "--show-current") == branch_for("term0002")
+    assert _git(Path(path), "rev-parse", "HEAD") == _git(Path(repo), "rev-parse", "HEAD")
+    assert (Path(path) / "NEW.md").exists()
+    stats = pool.stats()
+    assert stats["hits"] == 1
+    assert stats["saved_seconds"] >= 0
+
+
+def test_release_scrubs_and_parks_the_worktree(pool, repo):
+    path = Path(create_worktree(repo, "term0001"))
+    (path / "README.md").write_text("dirty\n")
+    (path / "scratch.txt").write_text("untracked\n")
+    (path / "build").mkdir()
+
+    pool.release(repo, "term0001")
+    pool.join()
+
+    assert not path.exists()
+    assert branch_for("term0001") not in _branches(repo)
+    [parked] = _parked(repo)
+    assert parked.endswith(f"{POOL_PREFIX}term0001")
+    assert (Path(parked) / "README.md").read_text() == "hello\n"
+    assert sorted(p.name for p in Path(parked).iterdir()) == [".git", "README.md"]
+    assert pool.stats()["recycled"] == 1
+
+    # The recycled checkout is what the next spawn gets.
+    assert pool.acquire(repo, "term0002") == worktree_path_for(repo, "term0002")
+    assert pool.stats()["hits"] == 1
+
+
+def test_release_keeps_a_branch_with_unmerged_commits(pool, repo):
+    path = Path(pool.acquire(repo, "term0001"))
+    (path / "work.txt").write_text("result\n")
+    _git(path, "add", ".")
+    _git(path, "commit", "-q", "-m", "worker result")
+
+    pool.release(repo, "term0001")
+    pool.join()
+
+    assert branch_for("term0001") in _branches(repo)
+    assert not path.exists()
+
+
+def test_release_beyond_capacity_removes_the_worktree(pool, repo):
+    path = Path(pool.acquire(repo, "term0001"))
+    pool.join()  # two parked: the pool is full
+
+    pool.release(repo, "term0001")
+    pool.join()
+
+    assert not path.exists()
+    assert len(_parked(repo)) == 2
+    assert branch_for("term0001") not in _branches(repo)
+
+
+def test_shutdown_finishes_queued_recycles_and_removes_parked_worktrees(repo):
+    pool = WorktreePool(size=2, idle_ttl=600)
+    path = Path(pool.acquire(repo, "term0001"))
+    (path / "scratch.txt").write_text("untracked\n")
+
+    pool.release(repo, "term0001")  # still queued behind the refill
+    pool.shutdown()
+
+    assert not path.exists()
+    assert branch_for("term0001") not in _branches(repo)
+    assert _parked(repo) == []
+    assert pool.stats()["idle"] == 0
+
+
+def test_idle_worktrees_expire(repo):
+    pool = WorktreePool(size=2, idle_ttl=0.05)
+    try:
+        pool.acquire(repo, "term0001")
+        pool.join()
+        time.sleep(0.1)
+        pool._expire()
+
+        assert _parked(repo) == []
+        assert pool.stats()["expired"] == 2
+    finally:
+        pool.close()
+
+
+def test_parked_worktrees_from_an_earlier_pool_are_adopted(repo):
+    first = WorktreePool(size=2, idle_ttl=600)
+    first.acquire(repo, "term0001")
+    first.join()
+    first.close()
+    parked = sorted(_parked(repo))
+
+    second = WorktreePool(size=2, idle_ttl=600)
+    try:
+        path = second.acquire(repo, "term0002")  # adoption is queued, so this is cold
+        second.join()
+        assert path == worktree_path_for(repo, "term0002")
+        assert sorted(_parked(repo)) == parked
+        assert second.stats()["idle"] == 2
+    finally:
+        second.close()
@@ -65,7 +65,12 @@ def _click_leaves() -> set[str]:
     def walk(command: click.Command, path: tuple[str, ...] = ()) -> list[tuple[str, ...]]:
         if isinstance(command, click.Group):
             found: list[tuple[str, ...]] = []
-            for name, sub in command.commands.items():
+            # list_commands/get_command rather than ``.commands``: the top-level group loads
+            # its subcommands lazily, so ``.commands`` is empty until each one is resolved.
+            ctx = click.Context(command)
+            for name in command.list_commands(ctx):
+                sub = command.get_command(ctx, name)
+                assert sub is not None, name
                 found.extend(walk(sub, path + (name,)))
             return found
         return [path]
@@ -219,7 +219,12 @@ class TestListAgentProfiles:
         }
 
         def fake_scan(
-            directory, source_label, profiles, name_sources=None, dir_profiles_loadable=True
+            directory,
+            source_label,
+            profiles,
+            name_sources=None,
+            dir_profiles_loadable=True,
+            seen=None,
         ):
             if source_label == "local":
                 profiles["local-agent"] = {
@@ -273,7 +278,12 @@ class TestListAgentProfiles:
         )
 
         def fake_scan(
-            directory, source_label, profiles, name_sources=None, dir_profiles_loadable=True
+            directory,
+            source_label,
+            profiles,
+            name_sources=None,
+            dir_profiles_loadable=True,
+            seen=None,
         ):
             if source_label == "local":
                 # Mirror _scan_directory: record the source AND keep first-found.
@@ -388,7 +398,12 @@ class TestListAgentProfiles:
         scan_calls = []
 
         def track_scan(
-            directory, source_label, profiles, name_sources=None, dir_profiles_loadable=True
+            directory,
+            source_label,
+            profiles,
+            name_sources=None,
+            dir_profiles_loadable=True,
+            seen=None,
         ):
             scan_calls.append((str(directory), source_label))
             if str(directory) == "/custom/agents/dir1":
@@ -701,3 +716,170 @@ class TestGrokNativeWorkflowsParsing:
         profile = AgentProfile(name="grok-default", description="Grok agent")
 
         assert profile.grokNativeWorkflows is None
+
+
+class TestProfileCatalogCache:
+    """Profiles are re-parsed only when their (mtime, size) stamp changes."""
+
+    @pytest.fixture(autouse=True)
+    def _isolated_catalog(self, tmp_path, monkeypatch):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self.store = tmp_path / "agent-store"
+        self.store.mkdir()
+        monkeypatch.setattr(agent_profiles, "LOCAL_AGENT_STORE_DIR", self.store)
+        monkeypatch.setattr(
+            "cli_agent_orchestrator.services.settings_service.get_agent_dirs", lambda: {}
+        )
+        monkeypatch.setattr(
+            "cli_agent_orchestrator.services.settings_service.get_extra_agent_dirs", lambda: []
+        )
+        monkeypatch.setattr(
+            "cli_agent_orchestrator.services.settings_service.get_disabled_agent_dirs",
+            lambda: [],
+        )
+        monkeypatch.setattr(
+            "cli_agent_orchestrator.services.settings_service.SETTINGS_FILE",
+            tmp_path / "settings.json",
+        )
+        agent_profiles.clear_profile_cache()
+        yield
+        agent_profiles.clear_profile_cache()
+
+    def _write(self, name, description, age_s=60):
+        import os
+        import time
+
+        path = self.store / f"{name}.md"
+        path.write_text(f"---\nname: {name}\ndescription: {description}\n---\nPrompt")
+        stamp = time.time() - age_s
+        os.utime(path, (stamp, stamp))
+        os.utime(self.store, (stamp, stamp))
+        return path
+
+    def _local_names(self, profiles):
+        return {p["name"]: p for p in profiles if p["source"] == "local"}
+
+    def test_unchanged_profiles_are_not_reparsed(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        parse = MagicMock(wraps=agent_profiles._parse_profile_source)
+        with patch.object(agent_profiles, "_parse_profile_source", parse):
+            first = agent_profiles.list_agent_profiles()
+            calls_after_first = parse.call_count
+            second = agent_profiles.list_agent_profiles()
+
+        assert calls_after_first >= 1
+        assert parse.call_count == calls_after_first
+        assert first == second
+
+    def test_edited_profile_is_reparsed(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        assert self._local_names(agent_profiles.list_agent_profiles())["alpha"]["description"] == (
+            "First"
+        )
+
+        self._write("alpha", "Rewritten description", age_s=30)
+
+        profiles = self._local_names(agent_profiles.list_agent_profiles())
+        assert profiles["alpha"]["description"] == "Rewritten description"
+
+    def test_racily_recent_file_is_never_trusted(self):
+        """A file modified within the racy window is re-read on every call."""
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First", age_s=0)
+        parse = MagicMock(wraps=agent_profiles._parse_profile_source)
+        with patch.object(agent_profiles, "_parse_profile_source", parse):
+            agent_profiles.list_agent_profiles()
+            agent_profiles.list_agent_profiles()
+
+        alpha_calls = [c for c in parse.call_args_list if c.args[1] == "alpha"]
+        assert len(alpha_calls) == 2
+
+    def test_added_and_removed_profiles_are_seen(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        agent_profiles.list_agent_profiles()
+        self._write("beta", "Second", age_s=30)
+        assert {"alpha", "beta"} <= set(self._local_names(agent_profiles.list_agent_profiles()))
+
+        (self.store / "alpha.md").unlink()
+        assert "alpha" not in self._local_names(agent_profiles.list_agent_profiles())
+
+    def test_removed_profile_is_evicted_from_the_caches(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        self._write("beta", "Second")
+        agent_profiles.list_agent_profiles()
+        load_agent_profile("alpha")
+        assert any(key[1] == "alpha" for key in agent_profiles._scan_cache)
+        assert any(path.endswith("alpha.md") for path in agent_profiles._text_cache)
+
+        (self.store / "alpha.md").unlink()
+        agent_profiles.list_agent_profiles()
+
+        assert [
+            key[1] for key in agent_profiles._scan_cache if key[0].startswith(str(self.store))
+        ] == ["beta"]
+        assert not any(path.endswith("alpha.md") for path in agent_profiles._text_cache)
+
+    def test_returned_catalog_is_a_private_copy(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        self._local_names(agent_profiles.list_agent_profiles())["alpha"]["tags"].append("x")
+
+        assert self._local_names(agent_profiles.list_agent_profiles())["alpha"]["tags"] == []
+
+    def test_load_agent_profile_memoizes_parse_but_returns_copies(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        with patch.object(
+            agent_profiles.frontmatter, "loads", wraps=agent_profiles.frontmatter.loads
+        ) as loads:
+            first = load_agent_profile("alpha")
+            second = load_agent_profile("alpha")
+
+        assert loads.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_snapshot_serves_catalog_without_scanning(self):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+        agent_profiles.refresh_profile_catalog(max_age=60)
+        with patch.object(agent_profiles, "_scan_catalog") as scan:
+            profiles = agent_profiles.list_agent_profiles()
+
+        scan.assert_not_called()
+        assert "alpha" in self._local_names(profiles)
+
+    def test_snapshot_dropped_on_invalidate_settings_change_and_expiry(self, tmp_path):
+        from cli_agent_orchestrator.utils import agent_profiles
+
+        self._write("alpha", "First")
+
+        agent_profiles.refresh_profile_catalog(max_age=60)
+        agent_profiles.invalidate_profile_catalog()
+        with patch.object(agent_profiles, "_scan_catalog", return_value=[]) as scan:
+            agent_profiles.list_agent_profiles()
+        scan.assert_called_once()
+
+        agent_profiles.refresh_profile_catalog(max_age=60)
+        (tmp_path / "settings.json").write_text("{}")
+        with patch.object(agent_profiles, "_scan_catalog", return_value=[]) as scan:
+            agent_profiles.list_agent_profiles()
+        scan.assert_called_once()
+
+        agent_profiles.refresh_profile_catalog(max_age=0)
+        with patch.object(agent_profiles, "_scan_catalog", return_value=[]) as scan:
+            agent_profiles.list_agent_profiles()
+        scan.assert_called_once()
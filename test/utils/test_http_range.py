@@ -0,0 +1,47 @@
+"""Tests for HTTP Range / ETag helpers."""
+
+import pytest
+
+from cli_agent_orchestrator.utils.http_range import (
+    RangeNotSatisfiable,
+    etag_matches,
+    parse_byte_range,
+)
+
+
+class TestParseByteRange:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            ("bytes=0-9", (0, 10)),
+            ("bytes=90-", (90, 100)),
+            ("bytes=-10", (90, 100)),
+            ("bytes=-500", (0, 100)),
+            ("bytes=95-200", (95, 100)),
+            ("BYTES = 5 - 6", (5, 7)),
+        ],
+    )
+    def test_single_ranges_resolve_half_open(self, header, expected):
+        assert parse_byte_range(header, 100) == expected
+
+    @pytest.mark.parametrize(
+        "header", [None, "", "items=0-1", "bytes=abc", "bytes=0-1,5-6", "bytes=9-3", "bytes=-"]
+    )
+    def test_unsupported_or_malformed_means_whole_body(self, header):
+        assert parse_byte_range(header, 100) is None
+
+    @pytest.mark.parametrize(
+        "header, size", [("bytes=100-", 100), ("bytes=-0", 100), ("bytes=-5", 0)]
+    )
+    def test_unsatisfiable(self, header, size):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_byte_range(header, size)
+
+
+class TestEtagMatches:
+    def test_list_wildcard_and_weak_prefix(self):
+        assert etag_matches('"a", "b"', '"b"')
+        assert etag_matches("*", '"b"')
+        assert etag_matches('W/"b"', '"b"')
+        assert not etag_matches('"a"', '"b"')
+        assert not etag_matches(None, '"b"')
@@ -1,12 +1,15 @@
 """Tests for skill utilities."""
 
 import logging
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from cli_agent_orchestrator.models.skill import SkillMetadata
+from cli_agent_orchestrator.utils import skills
 from cli_agent_orchestrator.utils.skills import (
     build_skill_catalog,
     list_skills,
@@ -32,12 +35,14 @@ def _default_no_extra_skill_dirs(monkeypatch):
 
     Existing tests patch only ``SKILLS_DIR``; without this they would read the
     developer's real ``settings.json``. Tests that exercise extra dirs override
-    this via ``_use_skill_dirs``.
+    this via ``_use_skill_dirs``. Also starts every test with an empty skill
+    cache so a memoized catalog never hides a logged warning.
     """
     monkeypatch.setattr(
         "cli_agent_orchestrator.services.settings_service.get_extra_skill_dirs",
         lambda: [],
     )
+    skills.clear_skill_cache()
 
 
 def _use_skill_dirs(monkeypatch, global_dir, extra_dirs):
@@ -555,3 +560,76 @@ class TestBuildSkillCatalogFilter:
         assert "**ads-task**" in catalog
         warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
         assert warnings == []
+
+
+def _settle(*paths: Path) -> None:
+    """Backdate ``paths`` past the racy window so their stamps are trusted."""
+    past = time.time() - 60
+    for path in paths:
+        os.utime(path, (past, past))
+
+
+class TestSkillCache:
+    """Parsed skills, directory listings and catalogs are reused until files change."""
+
+    def test_unchanged_skill_files_are_parsed_once(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("cli_agent_orchestrator.utils.skills.SKILLS_DIR", tmp_path)
+        files = [_write_skill(tmp_path / n, n, f"{n} skill") for n in ("alpha", "beta")]
+        _settle(*files, *(f.parent for f in files), tmp_path)
+
+        with patch.object(skills, "_read_skill_file", wraps=skills._read_skill_file) as read:
+            for _ in range(5):
+                build_skill_catalog()
+                build_skill_catalog(["alpha"])
+                load_skill_content("alpha")
+
+        assert read.call_count == 2
+
+    def test_edited_skill_file_is_reparsed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("cli_agent_orchestrator.utils.skills.SKILLS_DIR", tmp_path)
+        skill_file = _write_skill(tmp_path / "alpha", "alpha", "old description", body="old")
+        _settle(skill_file, skill_file.parent, tmp_path)
+        assert "old description" in build_skill_catalog()
+
+        _write_skill(tmp_path / "alpha", "alpha", "new description", body="new body")
+
+        assert "new description" in build_skill_catalog()
+        assert load_skill_content("alpha") == "new body"
+
+    def test_added_skill_folders_and_files_are_found(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("cli_agent_orchestrator.utils.skills.SKILLS_DIR", tmp_path)
+        skill_file = _write_skill(tmp_path / "alpha", "alpha", "Alpha skill")
+        (tmp_path / "pending").mkdir()
+        _settle(skill_file, skill_file.parent, tmp_path / "pending", tmp_path)
+        assert [s.name for s in list_skills()] == ["alpha"]
+
+        # A SKILL.md appearing inside a listed folder does not bump the store's mtime.
+        _write_skill(tmp_path / "pending", "pending", "Pending skill")
+        _write_skill(tmp_path / "beta", "beta", "Beta skill")
+
+        assert [s.name for s in list_skills()] == ["alpha", "beta", "pending"]
+
+    def test_cached_invalid_global_skill_still_yields_to_a_valid_extra(self, tmp_path, monkeypatch):
+        global_dir = tmp_path / "global"
+        extra_dir = tmp_path / "extra"
+        bad = _write_skill(global_dir / "shared", "other-name", "Mismatched folder")
+        good = _write_skill(extra_dir / "shared", "shared", "From extra")
+        _settle(bad, good, bad.parent, good.parent, global_dir, extra_dir)
+        _use_skill_dirs(monkeypatch, global_dir, [extra_dir])
+
+        for _ in range(2):
+            assert load_skill_metadata("shared").description == "From extra"
+            assert "From extra" in build_skill_catalog()
+
+    def test_unmatched_filter_warning_is_logged_once_per_catalog(
+        self, tmp_path, monkeypatch, caplog
+    ):
+        monkeypatch.setattr("cli_agent_orchestrator.utils.skills.SKILLS_DIR", tmp_path)
+        skill_file = _write_skill(tmp_path / "alpha", "alpha", "Alpha skill")
+        _settle(skill_file, skill_file.parent, tmp_path)
+
+        with caplog.at_level(logging.WARNING, logger="cli_agent_orchestrator.utils.skills"):
+            first = build_skill_catalog(["alpha", "typo"])
+            assert build_skill_catalog(["typo", "alpha"]) == first
+
+        assert caplog.text.count("matched no installed skill") == 1
@@ -1,6 +1,37 @@
-"""Unit tests for strip_terminal_escapes."""
+"""Unit tests for strip_terminal_escapes and its incremental counterparts."""
 
-from cli_agent_orchestrator.utils.text import strip_terminal_escapes
+from hypothesis import given
+from hypothesis import strategies as st
+
+from cli_agent_orchestrator.utils.text import (
+    CleanLineBuffer,
+    IncrementalEscapeStripper,
+    strip_terminal_escapes,
+)
+
+# Fragments a TUI stream is built from: text, every escape class
+# strip_terminal_escapes treats specially, and bare control characters.
+_STREAM_PIECES = [
+    "abc",
+    "› ",
+    "✻ Worked",
+    "\x1b[1G",
+    "\x1b[3A",
+    "\x1b[46;1H",
+    "\x1b[5G",
+    "\x1b[2C",
+    "\x1b[38;5;246m",
+    "\x9b2K",
+    "\x1b]0;title\x07",
+    "\x1b]8;;http://x\x1b\\",
+    "\x1b(B",
+    "\x1b",
+    "\r\n",
+    "\r",
+    "\n",
+    "\t",
+    "\x07",
+]
 
 
 class TestStripTerminalEscapes:
@@ -42,3 +73,80 @@ class TestStripTerminalEscapes:
         """
         assert strip_terminal_escapes("hello\x1b[46;1H›") == "hello\n›"
         assert strip_terminal_escapes("a\x1b[1;1Hb") == "a\nb"
+
+
+def _chunked(stream: str, cuts: list) -> list:
+    bounds = sorted({0, len(stream), *(cut % (len(stream) + 1) for cut in cuts)})
+    return [stream[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+class TestIncrementalEscapeStripper:
+    """Chunk-by-chunk stripping must match stripping the whole stream once."""
+
+    def test_holds_back_sequence_split_across_chunks(self):
+        stripper = IncrementalEscapeStripper()
+        assert stripper.feed("hello\x1b[46") == "hello"
+        assert stripper.feed(";1H›") == "\n›"
+
+    def test_carriage_return_pairs_with_next_chunk_newline(self):
+        stripper = IncrementalEscapeStripper()
+        assert stripper.feed("a\r") == "a"
+        assert stripper.peek() == "\n"
+        assert stripper.feed("\nb") == "\nb"
+
+    def test_unterminated_osc_is_released_past_cap(self):
+        stripper = IncrementalEscapeStripper()
+        assert stripper.feed("\x1b]0;" + "t" * 5000) != ""
+
+    @given(
+        pieces=st.lists(st.sampled_from(_STREAM_PIECES), max_size=40),
+        cuts=st.lists(st.integers(min_value=0, max_value=10_000), max_size=10),
+    )
+    def test_matches_one_shot_strip(self, pieces, cuts):
+        stream = "".join(pieces)
+        stripper = IncrementalEscapeStripper()
+        cleaned = "".join(stripper.feed(chunk) for chunk in _chunked(stream, cuts))
+        assert cleaned + stripper.peek() == strip_terminal_escapes(stream)
+
+
+class TestCleanLineBuffer:
+    @given(
+        pieces=st.lists(st.sampled_from(_STREAM_PIECES), max_size=40),
+        cuts=st.lists(st.integers(min_value=0, max_value=10_000), max_size=10),
+        count=st.integers(min_value=1, max_value=12),
+    )
+    def test_tail_matches_split_of_one_shot_strip(self, pieces, cuts, count):
+        stream = "".join(pieces)
+        lines = CleanLineBuffer(max_raw=1_000_000)
+        for chunk in _chunked(stream, cuts):
+            lines.feed(chunk)
+
+        expected = strip_terminal_escapes(stream).split("\n")
+        assert list(lines.tail()) == expected
+        assert list(lines.tail(count)) == expected[-count:]
+
+    def test_tail_is_cached_until_next_feed(self):
+        lines = CleanLineBuffer(max_raw=1000)
+        lines.feed("one\ntwo\nthr")
+        assert lines.tail(2) is lines.tail(2)
+        assert lines.tail(2) == ("two", "thr")
+
+        lines.feed("ee\n")
+        assert lines.tail(2) == ("three", "")
+
+    def test_lines_evicted_with_the_raw_window(self):
+        """Lines leave the ring when their raw text leaves a ``max_raw`` window,
+        however much the escapes in that text shrank when cleaned."""
+        lines = CleanLineBuffer(max_raw=30)
+        for n in range(6):
+            lines.feed(f"\x1b[1;3{n}mline{n}\x1b[0m\n")  # 17 raw chars, 6 cleaned
+
+        # The last 30 raw chars hold the end of line4 and all of line5.
+        assert lines.tail() == ("line4", "line5", "")
+
+    def test_chunk_larger_than_window_is_cut_like_the_raw_buffer(self):
+        lines = CleanLineBuffer(max_raw=10)
+        lines.feed("old\n")
+        lines.feed("aaaa\nbbbb\ncccc\ndd")
+
+        assert lines.tail() == tuple(strip_terminal_escapes("bbbb\ncccc\ndd"[-10:]).split("\n"))
@@ -577,6 +577,8 @@ fn route(id: CommandId) -> Option<Route> {
         // ── `cao terminal *` ─────────────────────────────────────────────────────────────
         // HIDE: recovery-by-terminal-id tooling, not a launcher action.
         CommandId::TerminalRestore => None,
+        // HIDE: operator forensics over logged output, not a launcher action.
+        CommandId::TerminalSearch => None,
 
         // ── `cao workflow *` ─────────────────────────────────────────────────────────────
         //
@@ -2659,7 +2661,7 @@ mod tests {
             .count();
         assert_eq!(
             in_app, 24,
-            "the settled distribution is 24 IN-APP / 18 HANDOFF / 27 HIDE = 69; if this moved, \
+            "the settled distribution is 24 IN-APP / 18 HANDOFF / 28 HIDE = 70; if this moved, \
              the 23-route figure above needs re-deriving rather than adjusting"
         );
     }